@@ -6,18 +6,51 @@ Python to access the Norgate Data Updater (NDU) API.
 Architecture:
     WSL Python → subprocess → Windows Python (python.exe) → norgatedata → NDU
 
+Persistent Worker:
+    By default every call launches a fresh ``python.exe -c`` process. Call
+    start_persistent_worker() to route all calls through a single long-lived
+    worker process instead (see momo.data.worker), and stop_persistent_worker()
+    to shut it down. The worker is also stopped automatically at interpreter exit.
+    start_worker_pool() (or the worker_pool() context manager) installs a pool
+    of workers instead, so concurrent callers run side by side.
+
+Transports:
+    Results travel as JSON by default (execute_norgate_code()). The fetch_*
+    functions also accept transport="arrow", which returns DataFrames from
+    Windows Python as an Arrow IPC stream (execute_norgate_arrow()): no JSON
+    encoding and no date-string round trip. The arrow transport requires pyarrow
+    in Windows Python.
+
+Async API:
+    execute_norgate_code_async(), execute_norgate_arrow_async(),
+    fetch_price_data_async(), fetch_index_constituent_timeseries_async() and
+    fetch_watchlist_symbols_async() mirror the blocking functions for asyncio
+    callers. They launch python.exe with asyncio.create_subprocess_exec (or use
+    the persistent worker from a thread), limit concurrent calls with a
+    per-event-loop semaphore (set_async_concurrency()), and kill the child
+    process when the awaiting task is cancelled or times out.
+
 See docs/architecture/windows-python-bridge.md for detailed documentation.
 """
 
+import asyncio
+import atexit
+import inspect
 import json
 import subprocess
-from datetime import date
-from typing import Any
+import weakref
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Any, NoReturn
 
 import pandas as pd
+import pyarrow as pa  # type: ignore[import-untyped]
 import structlog
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_fixed
 
+from momo.data import worker_server
+from momo.data.worker import BridgeWorker, BridgeWorkerPool
 from momo.utils.exceptions import (
     NDUNotRunningError,
     NorgateBridgeError,
@@ -26,6 +59,168 @@ from momo.utils.exceptions import (
 
 logger = structlog.get_logger()
 
+# Active persistent worker or worker pool (None = one subprocess per call)
+_persistent_worker: BridgeWorker | BridgeWorkerPool | None = None
+
+# Result transports accepted by the fetch_* functions
+_TRANSPORTS = ("json", "arrow")
+
+# Maximum concurrent async bridge calls per event loop (see set_async_concurrency())
+_async_concurrency = 8
+_async_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def start_persistent_worker(
+    python_executable: str = "python.exe",
+    command: Sequence[str] | None = None,
+    startup_timeout: int = 30,
+) -> BridgeWorker | BridgeWorkerPool:
+    """Start a long-lived bridge worker and route all bridge calls through it.
+
+    After this call, execute_norgate_code() (and therefore every fetch_* function)
+    sends requests to the persistent worker instead of launching a new Windows
+    Python process per call. Calling it again while a worker is active returns
+    the existing worker.
+
+    Args:
+        python_executable: Windows Python executable (default: "python.exe")
+        command: Full launch command overriding python_executable (e.g. a fake
+            worker script for Linux tests)
+        startup_timeout: Seconds to wait for the worker to start (default: 30)
+
+    Returns:
+        The active BridgeWorker (or the active BridgeWorkerPool, if one is installed)
+
+    Raises:
+        WindowsPythonNotFoundError: python.exe not found in PATH
+        NorgateBridgeError: Worker failed to start (e.g. norgatedata not installed)
+
+    Example:
+        >>> start_persistent_worker()
+        >>> df = fetch_price_data("AAPL")  # No interpreter startup cost
+        >>> stop_persistent_worker()
+    """
+    global _persistent_worker
+
+    if _persistent_worker is not None:
+        return _persistent_worker
+
+    worker = BridgeWorker(
+        python_executable=python_executable,
+        command=command,
+        startup_timeout=startup_timeout,
+    )
+    worker.start()
+    _persistent_worker = worker
+    return worker
+
+
+def start_worker_pool(
+    size: int = 4,
+    python_executable: str = "python.exe",
+    command: Sequence[str] | None = None,
+    startup_timeout: int = 30,
+) -> BridgeWorker | BridgeWorkerPool:
+    """Route all bridge calls through a pool of persistent workers.
+
+    Like start_persistent_worker(), but up to ``size`` calls from different
+    threads run concurrently, each on its own Windows Python process. Workers
+    start lazily on first use. If a persistent worker or pool is already active,
+    it is returned unchanged.
+
+    Args:
+        size: Number of workers (default: 4)
+        python_executable: Windows Python executable (default: "python.exe")
+        command: Full launch command overriding python_executable
+        startup_timeout: Seconds to wait for each worker to start (default: 30)
+
+    Returns:
+        The active BridgeWorkerPool (or the already active worker)
+
+    Raises:
+        ValueError: size is not positive
+
+    Example:
+        >>> start_worker_pool(size=8)
+        >>> df = load_universe(symbols, start, end, "r3000_cp", max_workers=8)
+        >>> stop_persistent_worker()
+    """
+    global _persistent_worker
+
+    if _persistent_worker is not None:
+        return _persistent_worker
+
+    pool = BridgeWorkerPool(
+        size=size,
+        python_executable=python_executable,
+        command=command,
+        startup_timeout=startup_timeout,
+    )
+    _persistent_worker = pool
+    logger.info("bridge_worker_pool_started", size=size)
+    return pool
+
+
+@contextmanager
+def worker_pool(
+    size: int = 4,
+    python_executable: str = "python.exe",
+    command: Sequence[str] | None = None,
+    startup_timeout: int = 30,
+) -> Iterator[BridgeWorker | BridgeWorkerPool]:
+    """Context manager that runs a worker pool for the duration of a block.
+
+    If a persistent worker or pool is already active, it is reused and left
+    running on exit; otherwise a new pool is started and shut down on exit.
+
+    Args:
+        size: Number of workers (default: 4)
+        python_executable: Windows Python executable (default: "python.exe")
+        command: Full launch command overriding python_executable
+        startup_timeout: Seconds to wait for each worker to start (default: 30)
+
+    Yields:
+        The active BridgeWorkerPool (or the already active worker)
+
+    Example:
+        >>> with worker_pool(size=4):
+        ...     with ThreadPoolExecutor(max_workers=4) as executor:
+        ...         frames = list(executor.map(fetch_price_data, symbols))
+    """
+    if _persistent_worker is not None:
+        yield _persistent_worker
+        return
+
+    pool = start_worker_pool(
+        size=size,
+        python_executable=python_executable,
+        command=command,
+        startup_timeout=startup_timeout,
+    )
+    try:
+        yield pool
+    finally:
+        if _persistent_worker is pool:
+            stop_persistent_worker()
+
+
+def stop_persistent_worker() -> None:
+    """Shut down the persistent bridge worker (or worker pool), if one is active.
+
+    Subsequent bridge calls fall back to one subprocess per call. Idempotent.
+    """
+    global _persistent_worker
+
+    worker = _persistent_worker
+    _persistent_worker = None
+    if worker is not None:
+        worker.shutdown()
+
+
+atexit.register(stop_persistent_worker)
+
 
 @retry(
     stop=stop_after_attempt(3),
@@ -33,16 +228,27 @@ logger = structlog.get_logger()
     retry=retry_if_exception_type((ConnectionError, OSError)),
     reraise=True,
 )
-def execute_norgate_code(code: str, timeout: int = 30) -> Any:
+def execute_norgate_code(
+    code: str,
+    timeout: int = 30,
+    setup: str | None = None,
+    worker: BridgeWorker | BridgeWorkerPool | None = None,
+) -> Any:
     """Execute Python code via Windows Python and return parsed result.
 
     This function wraps Python code with JSON serialization and executes it
     via Windows Python (python.exe) using subprocess. Results are transferred
-    back to WSL Python via JSON.
+    back to WSL Python via JSON. If a worker is given, or a persistent worker
+    is active (see start_persistent_worker()), the code is evaluated by that
+    worker instead.
 
     Args:
         code: Python code to execute (must evaluate to a JSON-serializable result)
         timeout: Subprocess timeout in seconds (default: 30)
+        setup: Optional Python statements executed before code is evaluated
+            (e.g. helper function definitions for Windows-side loops)
+        worker: Worker or worker pool to evaluate the code on, taking precedence
+            over the persistent worker (default: None)
 
     Returns:
         Parsed result from executed code (deserialized from JSON)
@@ -60,69 +266,306 @@ def execute_norgate_code(code: str, timeout: int = 30) -> Any:
     """
     logger.info("executing_norgate_code", code_length=len(code))
 
-    # Construct wrapper code with JSON serialization
-    wrapper = f"""
+    if worker is None:
+        worker = _persistent_worker
+    if worker is not None:
+        return worker.execute(code, timeout=timeout, setup=setup)
+
+    result = _run_windows_python(_json_wrapper(code, setup), timeout=timeout, text=True)
+
+    # Check for errors in subprocess execution
+    if result.returncode != 0:
+        _raise_bridge_failure(result.stderr, result.stdout)
+
+    return _parse_json_output(result.stdout)
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_fixed(1),
+    retry=retry_if_exception_type((ConnectionError, OSError)),
+    reraise=True,
+)
+def execute_norgate_arrow(
+    code: str,
+    timeout: int = 30,
+    setup: str | None = None,
+    worker: BridgeWorker | BridgeWorkerPool | None = None,
+) -> pa.Table:
+    """Execute Python code via Windows Python and return the result as an Arrow table.
+
+    Binary counterpart of execute_norgate_code(): the code must evaluate to a
+    pandas DataFrame (or pyarrow Table), which Windows Python writes to the pipe
+    as an Arrow IPC stream. The stream is read back without copying the buffer,
+    and datetime columns arrive as timestamps rather than strings. The
+    DataFrame index is dropped, so code should call reset_index() first.
+
+    Requires pyarrow in Windows Python. If a worker is given, or a persistent
+    worker is active, the code is evaluated by that worker instead of a new
+    subprocess.
+
+    Args:
+        code: Python code evaluating to a pandas DataFrame or pyarrow Table
+        timeout: Subprocess timeout in seconds (default: 30)
+        setup: Optional Python statements executed before code is evaluated
+        worker: Worker or worker pool to evaluate the code on, taking precedence
+            over the persistent worker (default: None)
+
+    Returns:
+        pyarrow Table (schema metadata set on the Windows side is preserved)
+
+    Raises:
+        WindowsPythonNotFoundError: python.exe not found in PATH
+        NDUNotRunningError: Norgate Data Updater is not running
+        NorgateBridgeError: Other bridge errors (timeout, invalid Arrow stream, etc.)
+
+    Example:
+        >>> table = execute_norgate_arrow(
+        ...     'norgatedata.price_timeseries("AAPL", timeseriesformat="pandas-dataframe")'
+        ...     ".reset_index()"
+        ... )
+        >>> prices_df = table.to_pandas()
+    """
+    logger.info("executing_norgate_code", code_length=len(code), transport="arrow")
+
+    if worker is None:
+        worker = _persistent_worker
+    if worker is not None:
+        payload = worker.execute_arrow(code, timeout=timeout, setup=setup)
+    else:
+        result = _run_windows_python(_arrow_wrapper(code, setup), timeout=timeout, text=False)
+        if result.returncode != 0:
+            _raise_bridge_failure(
+                result.stderr.decode("utf-8", errors="replace"),
+                f"<{len(result.stdout)} bytes>",
+            )
+        payload = result.stdout
+
+    return _parse_arrow_payload(payload)
+
+
+def _json_wrapper(code: str, setup: str | None) -> str:
+    """Build the one-shot python.exe program that prints the result as JSON."""
+    return f"""
 import json
 import norgatedata
+{setup or ""}
 result = {code}
 print(json.dumps(result, default=str))
 """
 
+
+def _arrow_wrapper(code: str, setup: str | None) -> str:
+    """Build the one-shot python.exe program that writes the result as Arrow IPC."""
+    # Keep norgatedata INFO messages off the binary stream: reserve the
+    # original stdout for the Arrow payload and send fd 1 to stderr
+    return f"""
+import os
+import sys
+_momo_out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+sys.stdout = sys.stderr
+if sys.platform == "win32":
+    import msvcrt
+    msvcrt.setmode(_momo_out.fileno(), os.O_BINARY)
+import json
+from typing import Any
+import norgatedata
+{inspect.getsource(worker_server.arrow_ipc_bytes)}
+{setup or ""}
+result = {code}
+_momo_out.write(arrow_ipc_bytes(result))
+_momo_out.flush()
+"""
+
+
+def _parse_json_output(stdout: str) -> Any:
+    """Parse the JSON result printed on the last stdout line.
+
+    Raises:
+        NorgateBridgeError: Output does not end with a JSON line
+    """
+    # Parse JSON from last line (skip norgatedata INFO messages)
     try:
-        result = subprocess.run(
+        output_lines = stdout.strip().split("\n")
+        json_line = output_lines[-1]
+        parsed_result = json.loads(json_line)
+        logger.info("norgate_code_executed", success=True)
+        return parsed_result
+    except (json.JSONDecodeError, IndexError) as e:
+        logger.error("json_parse_failed", error=str(e), stdout=stdout)
+        raise NorgateBridgeError(f"Failed to parse bridge output: {e}\nOutput: {stdout}") from e
+
+
+def _parse_arrow_payload(payload: bytes) -> pa.Table:
+    """Read an Arrow IPC stream without copying the payload buffer.
+
+    Raises:
+        NorgateBridgeError: Payload is not a valid Arrow IPC stream
+    """
+    try:
+        table = pa.ipc.open_stream(pa.py_buffer(payload)).read_all()
+    except (pa.ArrowException, ValueError) as e:
+        logger.error("arrow_parse_failed", error=str(e), payload_bytes=len(payload))
+        raise NorgateBridgeError(f"Failed to parse Arrow bridge output: {e}") from e
+
+    logger.info("norgate_code_executed", success=True, rows=table.num_rows)
+    return table
+
+
+def _run_windows_python(
+    wrapper: str, timeout: int, text: bool
+) -> "subprocess.CompletedProcess[Any]":
+    """Run wrapper code with python.exe, mapping launch failures and timeouts.
+
+    Raises:
+        WindowsPythonNotFoundError: python.exe not found in PATH
+        NorgateBridgeError: Subprocess timed out
+    """
+    try:
+        return subprocess.run(
             ["python.exe", "-c", wrapper],
             capture_output=True,
-            text=True,
+            text=text,
             timeout=timeout,
         )
     except FileNotFoundError as e:
-        logger.error("windows_python_not_found")
-        raise WindowsPythonNotFoundError(
-            "Windows Python (python.exe) not found. Ensure Windows Python is "
-            "installed and in WSL PATH."
-        ) from e
+        raise _windows_python_not_found_error() from e
     except subprocess.TimeoutExpired as e:
-        logger.error("bridge_timeout", timeout=timeout)
-        raise NorgateBridgeError(
-            f"Bridge operation timed out after {timeout} seconds. " "Check if NDU is responding."
-        ) from e
+        raise _bridge_timeout_error(timeout) from e
 
-    # Check for errors in subprocess execution
-    if result.returncode != 0:
-        # Check for specific error patterns
-        if "NDU is not running" in result.stderr:
-            logger.error("ndu_not_running")
-            raise NDUNotRunningError(
-                "Norgate Data Updater is not running. Please start NDU on Windows "
-                "and ensure you're logged in."
-            )
 
-        # Check for norgatedata import errors
-        if "ModuleNotFoundError" in result.stderr and "norgatedata" in result.stderr:
-            logger.error("norgatedata_not_installed")
-            raise NorgateBridgeError(
-                "norgatedata package not found in Windows Python. "
-                "Install via: pip install norgatedata==1.0.74"
-            )
+def _windows_python_not_found_error() -> WindowsPythonNotFoundError:
+    logger.error("windows_python_not_found")
+    return WindowsPythonNotFoundError(
+        "Windows Python (python.exe) not found. Ensure Windows Python is "
+        "installed and in WSL PATH."
+    )
 
-        # Generic error
-        logger.error("bridge_execution_failed", stderr=result.stderr, stdout=result.stdout)
-        raise NorgateBridgeError(
-            f"Bridge execution failed:\nStderr: {result.stderr}\nStdout: {result.stdout}"
+
+def _bridge_timeout_error(timeout: float) -> NorgateBridgeError:
+    logger.error("bridge_timeout", timeout=timeout)
+    return NorgateBridgeError(
+        f"Bridge operation timed out after {timeout} seconds. " "Check if NDU is responding."
+    )
+
+
+def _raise_bridge_failure(stderr: str, stdout: str) -> NoReturn:
+    """Map a failed Windows Python run onto the bridge exception hierarchy.
+
+    Raises:
+        NDUNotRunningError: Norgate Data Updater is not running
+        NorgateBridgeError: norgatedata missing or any other execution error
+    """
+    # Check for specific error patterns
+    if "NDU is not running" in stderr:
+        logger.error("ndu_not_running")
+        raise NDUNotRunningError(
+            "Norgate Data Updater is not running. Please start NDU on Windows "
+            "and ensure you're logged in."
         )
 
-    # Parse JSON from last line (skip norgatedata INFO messages)
-    try:
-        output_lines = result.stdout.strip().split("\n")
-        json_line = output_lines[-1]
-        parsed_result = json.loads(json_line)
-        logger.info("norgate_code_executed", success=True)
-        return parsed_result
-    except (json.JSONDecodeError, IndexError) as e:
-        logger.error("json_parse_failed", error=str(e), stdout=result.stdout)
+    # Check for norgatedata import errors
+    if "ModuleNotFoundError" in stderr and "norgatedata" in stderr:
+        logger.error("norgatedata_not_installed")
         raise NorgateBridgeError(
-            f"Failed to parse bridge output: {e}\nOutput: {result.stdout}"
-        ) from e
+            "norgatedata package not found in Windows Python. "
+            "Install via: pip install norgatedata==1.0.74"
+        )
+
+    # Generic error
+    logger.error("bridge_execution_failed", stderr=stderr, stdout=stdout)
+    raise NorgateBridgeError(f"Bridge execution failed:\nStderr: {stderr}\nStdout: {stdout}")
+
+
+def _check_transport(transport: str) -> None:
+    """Raise ValueError for an unknown result transport."""
+    if transport not in _TRANSPORTS:
+        raise ValueError(f"transport must be one of {_TRANSPORTS}, got {transport!r}")
+
+
+def _result_frame(result: Any) -> pd.DataFrame:
+    """Convert a bridge result (JSON records or Arrow table) into a DataFrame.
+
+    Raises:
+        ValueError: Result is neither a list of records nor an Arrow table
+    """
+    if isinstance(result, pa.Table):
+        frame: pd.DataFrame = result.to_pandas()
+        return frame
+    if not isinstance(result, list):
+        raise ValueError(f"Expected list of records, got {type(result)}")
+    return pd.DataFrame(result)
+
+
+# norgatedata column name (lowercased) -> price schema column name
+_PRICE_COLUMN_MAPPING = {
+    "date": "date",
+    "symbol": "symbol",
+    "open": "open",
+    "high": "high",
+    "low": "low",
+    "close": "close",
+    "volume": "volume",
+    "unadjusted close": "unadjusted_close",
+    "dividend": "dividend",
+}
+
+# Price schema dtypes (date becomes the index)
+_PRICE_DTYPES = {
+    "open": "float64",
+    "high": "float64",
+    "low": "float64",
+    "close": "float64",
+    "volume": "int64",
+    "unadjusted_close": "float64",
+    "dividend": "float64",
+}
+
+
+def _normalize_price_frame(prices_df: pd.DataFrame, symbol: str | None = None) -> pd.DataFrame:
+    """Convert a raw norgatedata price frame into the bridge price schema.
+
+    Lowercases and renames norgatedata columns, selects the schema columns,
+    casts dtypes and moves ``date`` into the index.
+
+    Args:
+        prices_df: Raw price data with a Date column (index already reset)
+        symbol: Symbol to assign to every row; if None, the frame must already
+            contain a Symbol column (batched results)
+
+    Returns:
+        DataFrame indexed by date with columns: symbol, open, high, low, close,
+        volume, unadjusted_close, dividend
+
+    Raises:
+        KeyError: Required columns missing from the raw frame
+        ValueError: Values cannot be converted to schema dtypes
+        TypeError: Values cannot be converted to schema dtypes
+    """
+    # Normalize column names to lowercase and rename to match our schema
+    prices_df.columns = prices_df.columns.str.lower()
+    prices_df = prices_df.rename(columns=_PRICE_COLUMN_MAPPING)
+
+    if symbol is not None:
+        prices_df["symbol"] = symbol
+
+    # Select and reorder columns (include dividend and unadjusted_close)
+    prices_df = prices_df[["date", "symbol", *_PRICE_DTYPES]]
+
+    # Convert types (Arrow results usually arrive with the schema dtypes already)
+    mismatched = {
+        column: dtype for column, dtype in _PRICE_DTYPES.items() if prices_df[column].dtype != dtype
+    }
+    if mismatched:
+        prices_df = prices_df.astype(mismatched)
+    if not pd.api.types.is_datetime64_ns_dtype(prices_df["date"]):
+        prices_df = prices_df.assign(date=pd.to_datetime(prices_df["date"]))
+
+    # Set date as index
+    prices_df = prices_df.set_index("date")
+    prices_df.index.name = "date"
+    return prices_df
 
 
 def fetch_price_data(
@@ -131,6 +574,8 @@ def fetch_price_data(
     end_date: date | None = None,
     adjustment: str = "TOTALRETURN",
     timeout: int = 30,
+    transport: str = "json",
+    worker: BridgeWorker | BridgeWorkerPool | None = None,
 ) -> pd.DataFrame:
     """Fetch price data for a symbol via the Windows Python bridge.
 
@@ -155,11 +600,16 @@ def fetch_price_data(
         end_date: End date for price data (optional, defaults to most recent)
         adjustment: Price adjustment type - "TOTALRETURN" (default) or "CAPITAL"
         timeout: Subprocess timeout in seconds (default: 30)
+        transport: Result transport - "json" (default) or "arrow" (Arrow IPC
+            stream, avoids JSON encoding; requires pyarrow in Windows Python)
+        worker: Worker or worker pool to fetch on instead of the persistent
+            worker or a new subprocess (default: None)
 
     Returns:
         DataFrame with price data matching the schema above
 
     Raises:
+        ValueError: Unknown transport
         WindowsPythonNotFoundError: python.exe not found in PATH
         NDUNotRunningError: Norgate Data Updater is not running
         NorgateBridgeError: Bridge communication or data parsing errors
@@ -175,6 +625,8 @@ def fetch_price_data(
         2023-01-03   AAPL  125.07  125.27  124.17  125.07  112117471
         2023-01-04   AAPL  126.89  128.66  125.08  126.36   89113631
     """
+    _check_transport(transport)
+
     logger.info(
         "fetching_price_data",
         symbol=symbol,
@@ -183,6 +635,26 @@ def fetch_price_data(
         adjustment=adjustment,
     )
 
+    code = _price_data_code(symbol, start_date, end_date, adjustment, transport)
+
+    # Execute via bridge
+    result: Any
+    if transport == "arrow":
+        result = execute_norgate_arrow(code, timeout=timeout, worker=worker)
+    else:
+        result = execute_norgate_code(code, timeout=timeout, worker=worker)
+
+    return _parse_price_data(result, symbol)
+
+
+def _price_data_code(
+    symbol: str,
+    start_date: date | None,
+    end_date: date | None,
+    adjustment: str,
+    transport: str,
+) -> str:
+    """Build the norgatedata.price_timeseries() expression for one symbol."""
     # Construct norgatedata API call that returns DataFrame and serializes it
     # Use a function to encapsulate the logic and return the final result
     code_parts = [
@@ -204,78 +676,384 @@ def fetch_price_data(
 
     # Chain DataFrame operations to serialize for JSON transfer
     # Convert dates to ISO format strings for JSON compatibility
+    # (the Arrow transport sends the frame as-is, with timestamp dates)
     code_parts.append(".reset_index()")
-    code_parts.append(".assign(Date=lambda x: x['Date'].astype(str))")
-    code_parts.append(".to_dict('records')")
+    if transport == "json":
+        code_parts.append(".assign(Date=lambda x: x['Date'].astype(str))")
+        code_parts.append(".to_dict('records')")
     code_parts.append("))()")
 
-    code = "".join(code_parts)
+    return "".join(code_parts)
 
-    # Execute via bridge
-    result = execute_norgate_code(code, timeout=timeout)
 
+def _parse_price_data(result: Any, symbol: str) -> pd.DataFrame:
+    """Parse a price_timeseries() bridge result into the price schema.
+
+    Raises:
+        NorgateBridgeError: Result cannot be parsed
+    """
     # Parse result into DataFrame
-    # Result is a list of dicts from df.to_dict('records')
+    # Result is a list of dicts from df.to_dict('records') or an Arrow table
     try:
-        # Convert to DataFrame
-        if not isinstance(result, list):
-            raise ValueError(f"Expected list of records, got {type(result)}")
+        prices_df = _normalize_price_frame(_result_frame(result), symbol=symbol)
 
-        prices_df = pd.DataFrame(result)
+        logger.info("price_data_fetched", symbol=symbol, rows=len(prices_df))
+        return prices_df
 
-        # Normalize column names to lowercase
-        prices_df.columns = prices_df.columns.str.lower()
+    except (KeyError, ValueError, TypeError) as e:
+        logger.error("price_data_parse_failed", error=str(e), result_type=type(result))
+        raise NorgateBridgeError(f"Failed to parse price data from bridge: {e}") from e
 
-        # Rename norgatedata columns to match our schema
-        column_mapping = {
-            "date": "date",
-            "open": "open",
-            "high": "high",
-            "low": "low",
-            "close": "close",
-            "volume": "volume",
-            "unadjusted close": "unadjusted_close",
-            "dividend": "dividend",
-        }
-        prices_df = prices_df.rename(columns=column_mapping)
 
-        # Add symbol column
-        prices_df["symbol"] = symbol
+# Windows-side helpers for fetch_price_data_batch(): loop over symbols inside a
+# single execution and collect per-symbol errors instead of aborting the batch.
+# _momo_price_batch returns JSON records; _momo_price_batch_arrow returns one
+# Arrow table with the error map in its schema metadata.
+_PRICE_BATCH_SETUP = """
+def _momo_price_frames(symbols, start_date, end_date, adjustment):
+    frames = []
+    errors = {}
+    kwargs = {}
+    if start_date:
+        kwargs["start_date"] = start_date
+    if end_date:
+        kwargs["end_date"] = end_date
+    adjustment_type = getattr(norgatedata.StockPriceAdjustmentType, adjustment)
+    for symbol in symbols:
+        try:
+            df = norgatedata.price_timeseries(
+                symbol,
+                timeseriesformat="pandas-dataframe",
+                stock_price_adjustment_setting=adjustment_type,
+                **kwargs
+            )
+        except Exception as e:
+            if "NDU is not running" in str(e):
+                raise
+            errors[symbol] = type(e).__name__ + ": " + str(e)
+            continue
+        if df is None or len(df) == 0:
+            errors[symbol] = "No price data returned"
+            continue
+        frame = df.reset_index()
+        frame["Symbol"] = symbol
+        frames.append(frame)
+    return frames, errors
+
+
+def _momo_price_batch(symbols, start_date, end_date, adjustment):
+    frames, errors = _momo_price_frames(symbols, start_date, end_date, adjustment)
+    records = []
+    for frame in frames:
+        frame["Date"] = frame["Date"].astype(str)
+        records.extend(frame.to_dict("records"))
+    return {"records": records, "errors": errors}
+
+
+def _momo_price_batch_arrow(symbols, start_date, end_date, adjustment):
+    import pandas
+    import pyarrow
+
+    frames, errors = _momo_price_frames(symbols, start_date, end_date, adjustment)
+    if frames:
+        combined = pandas.concat(frames, ignore_index=True)
+        table = pyarrow.Table.from_pandas(combined, preserve_index=False)
+    else:
+        table = pyarrow.table({})
+    return table.replace_schema_metadata({"momo:errors": json.dumps(errors)})
+"""
 
-        # Select and reorder columns (include dividend and unadjusted_close)
-        required_columns = [
-            "date",
-            "symbol",
-            "open",
-            "high",
-            "low",
-            "close",
-            "volume",
-            "unadjusted_close",
-            "dividend",
-        ]
-        prices_df = prices_df[required_columns]
 
-        # Convert types
-        prices_df["date"] = pd.to_datetime(prices_df["date"])
-        prices_df["open"] = prices_df["open"].astype("float64")
-        prices_df["high"] = prices_df["high"].astype("float64")
-        prices_df["low"] = prices_df["low"].astype("float64")
-        prices_df["close"] = prices_df["close"].astype("float64")
-        prices_df["volume"] = prices_df["volume"].astype("int64")
-        prices_df["unadjusted_close"] = prices_df["unadjusted_close"].astype("float64")
-        prices_df["dividend"] = prices_df["dividend"].astype("float64")
+def fetch_price_data_batch(
+    symbols: Sequence[str],
+    start_date: date | None = None,
+    end_date: date | None = None,
+    adjustment: str = "TOTALRETURN",
+    batch_size: int = 100,
+    timeout: int = 300,
+    transport: str = "json",
+) -> tuple[pd.DataFrame, dict[str, str]]:
+    """Fetch price data for many symbols with one bridge round trip per batch.
 
-        # Set date as index
-        prices_df.set_index("date", inplace=True)
-        prices_df.index.name = "date"
+    Symbols are split into chunks of ``batch_size``; each chunk is fetched by a
+    single Windows-side execution that loops over its symbols. Per-symbol
+    failures (e.g. unknown symbol) are collected in an error map instead of
+    failing the whole batch.
 
-        logger.info("price_data_fetched", symbol=symbol, rows=len(prices_df))
-        return prices_df
+    DataFrame Schema (Output):
+        Same as fetch_price_data(): date index with columns symbol, open, high,
+        low, close, volume, unadjusted_close, dividend. Rows for all successfully
+        fetched symbols are concatenated in long format (symbol order preserved).
 
-    except (KeyError, ValueError, TypeError) as e:
-        logger.error("price_data_parse_failed", error=str(e), result_type=type(result))
-        raise NorgateBridgeError(f"Failed to parse price data from bridge: {e}") from e
+    Args:
+        symbols: Ticker symbols to fetch (e.g., ["AAPL", "MSFT"])
+        start_date: Start date for price data (optional, defaults to earliest available)
+        end_date: End date for price data (optional, defaults to most recent)
+        adjustment: Price adjustment type - "TOTALRETURN" (default) or "CAPITAL"
+        batch_size: Maximum symbols per bridge round trip (default: 100)
+        timeout: Timeout in seconds for each batch round trip (default: 300)
+        transport: Result transport - "json" (default) or "arrow" (see
+            fetch_price_data())
+
+    Returns:
+        Tuple of (prices_df, errors):
+            - prices_df: Long-format price data for all fetched symbols
+            - errors: Mapping of symbol -> error message for symbols that failed.
+              If a whole batch fails with a bridge error, every symbol of that
+              batch is reported with the batch error.
+
+    Raises:
+        ValueError: batch_size is not positive or unknown transport
+        WindowsPythonNotFoundError: python.exe not found in PATH
+        NDUNotRunningError: Norgate Data Updater is not running
+
+    Example:
+        >>> prices_df, errors = fetch_price_data_batch(
+        ...     ["AAPL", "MSFT", "XYZ"], start_date=date(2023, 1, 1), batch_size=50
+        ... )
+        >>> prices_df["symbol"].unique().tolist()
+        ['AAPL', 'MSFT']
+        >>> errors
+        {'XYZ': 'ValueError: Symbol XYZ not found'}
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    _check_transport(transport)
+
+    symbols = list(symbols)
+    batches = [symbols[i : i + batch_size] for i in range(0, len(symbols), batch_size)]
+
+    logger.info(
+        "fetching_price_data_batch",
+        symbols_count=len(symbols),
+        batch_count=len(batches),
+        batch_size=batch_size,
+        start_date=start_date,
+        end_date=end_date,
+        adjustment=adjustment,
+    )
+
+    frames: list[pd.DataFrame] = []
+    errors: dict[str, str] = {}
+
+    for batch_index, batch in enumerate(batches, start=1):
+        args = (
+            f"({batch!r}, "
+            f"{start_date.isoformat() if start_date else None!r}, "
+            f"{end_date.isoformat() if end_date else None!r}, "
+            f"{adjustment!r})"
+        )
+
+        result: Any
+        try:
+            if transport == "arrow":
+                result = execute_norgate_arrow(
+                    f"_momo_price_batch_arrow{args}", timeout=timeout, setup=_PRICE_BATCH_SETUP
+                )
+            else:
+                result = execute_norgate_code(
+                    f"_momo_price_batch{args}", timeout=timeout, setup=_PRICE_BATCH_SETUP
+                )
+        except (NDUNotRunningError, WindowsPythonNotFoundError):
+            raise
+        except NorgateBridgeError as e:
+            # Whole batch failed (timeout, crash) - report every symbol, keep going
+            logger.error(
+                "price_data_batch_failed",
+                batch_index=batch_index,
+                batch_count=len(batches),
+                error=str(e),
+            )
+            errors.update({symbol: str(e) for symbol in batch})
+            continue
+
+        try:
+            if isinstance(result, pa.Table):
+                metadata = result.schema.metadata or {}
+                raw_errors = json.loads(metadata.get(b"momo:errors", b"{}"))
+                if result.num_rows:
+                    frames.append(_normalize_price_frame(result.to_pandas()))
+            elif isinstance(result, dict):
+                raw_errors = result["errors"]
+                if result["records"]:
+                    frames.append(_normalize_price_frame(pd.DataFrame(result["records"])))
+            else:
+                raise ValueError(f"Expected batch result dict, got {type(result)}")
+
+            batch_errors = {str(k): str(v) for k, v in raw_errors.items()}
+        except (KeyError, ValueError, TypeError) as e:
+            logger.error("price_data_parse_failed", error=str(e), result_type=type(result))
+            batch_errors = {
+                symbol: f"Failed to parse price data from bridge: {e}" for symbol in batch
+            }
+
+        errors.update(batch_errors)
+        logger.info(
+            "price_data_batch_fetched",
+            batch_index=batch_index,
+            batch_count=len(batches),
+            symbols_count=len(batch),
+            failed_count=len(batch_errors),
+        )
+
+    if frames:
+        prices_df = pd.concat(frames, axis=0)
+    else:
+        prices_df = _normalize_price_frame(pd.DataFrame(columns=["date", "symbol", *_PRICE_DTYPES]))
+
+    logger.info(
+        "price_data_batch_complete",
+        symbols_count=len(symbols),
+        rows=len(prices_df),
+        failed_count=len(errors),
+    )
+    return prices_df, errors
+
+
+# Windows-side helper for fetch_price_status_batch(): one small call per symbol,
+# plus a one-day price_timeseries() call for symbols with a check date.
+# last_price_update_time() is optional in older norgatedata releases; naive
+# datetimes are local to the Windows box, so astimezone() attaches its UTC
+# offset before they cross the bridge.
+_PRICE_STATUS_SETUP = """
+def _momo_price_status(symbols, check_dates, adjustment):
+    rows = []
+    errors = {}
+    last_update = getattr(norgatedata, "last_price_update_time", None)
+    adjustment_type = getattr(norgatedata.StockPriceAdjustmentType, adjustment)
+    for symbol in symbols:
+        check_close = None
+        try:
+            last_quoted = norgatedata.last_quoted_date(symbol)
+            updated = last_update(symbol) if last_update is not None else None
+            check_date = check_dates.get(symbol)
+            if check_date:
+                df = norgatedata.price_timeseries(
+                    symbol,
+                    start_date=check_date,
+                    end_date=check_date,
+                    timeseriesformat="pandas-dataframe",
+                    stock_price_adjustment_setting=adjustment_type,
+                )
+                if df is not None and len(df) > 0:
+                    check_close = float(df["Close"].iloc[-1])
+        except Exception as e:
+            if "NDU is not running" in str(e):
+                raise
+            errors[symbol] = type(e).__name__ + ": " + str(e)
+            continue
+        rows.append([
+            symbol,
+            str(last_quoted)[:10] if last_quoted is not None else None,
+            updated.astimezone().isoformat() if updated is not None else None,
+            check_close,
+        ])
+    return {"rows": rows, "errors": errors}
+"""
+
+
+def fetch_price_status_batch(
+    symbols: Sequence[str],
+    batch_size: int = 500,
+    timeout: int = 60,
+    check_dates: Mapping[str, date] | None = None,
+    adjustment: str = "TOTALRETURN",
+) -> tuple[pd.DataFrame, dict[str, str]]:
+    """Fetch each symbol's last quoted date, and its close on a check date.
+
+    A cheap staleness probe with one round trip per batch. Without check_dates
+    no price data crosses the bridge. With check_dates, one close per symbol
+    does: comparing it with the cached close on the same date tells whether
+    Norgate has since rewritten the symbol's history (e.g. back-adjusted it
+    for a dividend). The last price update time is informational only: it moves
+    with every nightly update whether or not history changed.
+
+    DataFrame Schema (Output):
+        Columns:
+            - symbol (str): Ticker symbol
+            - last_quoted_date (datetime64[ns]): Last date with a quote (NaT if none)
+            - last_updated (datetime64[ns, UTC]): Last price data update (NaT if
+              unknown)
+            - check_close (float64): Close on the symbol's check date (NaN if no
+              check date was given or there is no quote on it)
+        Rows are in input symbol order; failed symbols have no row.
+
+    Args:
+        symbols: Ticker symbols to check
+        batch_size: Maximum symbols per bridge round trip (default: 500)
+        timeout: Timeout in seconds for each batch round trip (default: 60)
+        check_dates: Mapping of symbol -> date whose close to return (default:
+            None, no closes)
+        adjustment: Price adjustment of the check closes (default: "TOTALRETURN",
+            see fetch_price_data())
+
+    Returns:
+        Tuple of (status_df, errors):
+            - status_df: One row per successfully checked symbol
+            - errors: Mapping of symbol -> error message for symbols that failed
+
+    Raises:
+        ValueError: batch_size is not positive
+        WindowsPythonNotFoundError: python.exe not found in PATH
+        NDUNotRunningError: Norgate Data Updater is not running
+        NorgateBridgeError: A batch failed as a whole or could not be parsed
+
+    Example:
+        >>> status_df, errors = fetch_price_status_batch(
+        ...     ["AAPL", "MSFT"], check_dates={"AAPL": date(2024, 6, 14)}
+        ... )
+        >>> status_df
+          symbol last_quoted_date                last_updated  check_close
+        0   AAPL       2024-06-14 2024-06-15 04:12:00+00:00       212.49
+        1   MSFT       2024-06-14 2024-06-15 04:12:00+00:00          NaN
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+    symbols = list(symbols)
+    batches = [symbols[i : i + batch_size] for i in range(0, len(symbols), batch_size)]
+    check_dates = check_dates or {}
+
+    rows: list[list[Any]] = []
+    errors: dict[str, str] = {}
+    for batch in batches:
+        batch_checks = {
+            symbol: check_dates[symbol].isoformat() for symbol in batch if symbol in check_dates
+        }
+        result = execute_norgate_code(
+            f"_momo_price_status({batch!r}, {batch_checks!r}, {adjustment!r})",
+            timeout=timeout,
+            setup=_PRICE_STATUS_SETUP,
+        )
+        try:
+            rows.extend(
+                [str(symbol), quoted, updated, close]
+                for symbol, quoted, updated, close in result["rows"]
+            )
+            errors.update({str(k): str(v) for k, v in result["errors"].items()})
+        except (KeyError, ValueError, TypeError) as e:
+            logger.error("price_status_parse_failed", error=str(e), result_type=type(result))
+            raise NorgateBridgeError(f"Failed to parse price status from bridge: {e}") from e
+
+    status_df = pd.DataFrame(
+        rows, columns=["symbol", "last_quoted_date", "last_updated", "check_close"]
+    )
+    status_df["symbol"] = status_df["symbol"].astype(object)
+    status_df["last_quoted_date"] = pd.to_datetime(status_df["last_quoted_date"]).astype(
+        "datetime64[ns]"
+    )
+    status_df["last_updated"] = pd.to_datetime(status_df["last_updated"], utc=True).astype(
+        "datetime64[ns, UTC]"
+    )
+    status_df["check_close"] = status_df["check_close"].astype("float64")
+
+    logger.info(
+        "price_status_batch_fetched",
+        symbols_count=len(symbols),
+        batch_count=len(batches),
+        failed_count=len(errors),
+    )
+    return status_df, errors
 
 
 def fetch_index_constituent_timeseries(
@@ -284,6 +1062,7 @@ def fetch_index_constituent_timeseries(
     start_date: date | None = None,
     end_date: date | None = None,
     timeout: int = 30,
+    transport: str = "json",
 ) -> pd.DataFrame:
     """Fetch index constituent timeseries via Windows Python bridge.
 
@@ -303,6 +1082,8 @@ def fetch_index_constituent_timeseries(
         start_date: Start date for timeseries (optional, defaults to earliest available)
         end_date: End date for timeseries (optional, defaults to most recent)
         timeout: Subprocess timeout in seconds (default: 30)
+        transport: Result transport - "json" (default) or "arrow" (see
+            fetch_price_data())
 
     Returns:
         DataFrame with DatetimeIndex and 'index_constituent' column (0 or 1)
@@ -311,7 +1092,8 @@ def fetch_index_constituent_timeseries(
         WindowsPythonNotFoundError: python.exe not found in PATH
         NDUNotRunningError: Norgate Data Updater is not running
         NorgateBridgeError: Bridge communication or data parsing errors
-        ValueError: Invalid symbol or index name (raised by norgatedata API)
+        ValueError: Invalid symbol or index name (raised by norgatedata API),
+            or unknown transport
 
     Example:
         >>> from datetime import date
@@ -327,6 +1109,8 @@ def fetch_index_constituent_timeseries(
         2020-01-02                  1
         2020-01-03                  1
     """
+    _check_transport(transport)
+
     logger.info(
         "fetching_index_constituent_timeseries",
         symbol=symbol,
@@ -335,6 +1119,26 @@ def fetch_index_constituent_timeseries(
         end_date=end_date,
     )
 
+    code = _index_constituent_code(symbol, index_name, start_date, end_date, transport)
+
+    # Execute via bridge
+    result: Any
+    if transport == "arrow":
+        result = execute_norgate_arrow(code, timeout=timeout)
+    else:
+        result = execute_norgate_code(code, timeout=timeout)
+
+    return _parse_index_constituents(result, symbol, index_name)
+
+
+def _index_constituent_code(
+    symbol: str,
+    index_name: str,
+    start_date: date | None,
+    end_date: date | None,
+    transport: str,
+) -> str:
+    """Build the norgatedata.index_constituent_timeseries() expression."""
     # Construct norgatedata API call
     code_parts = [
         "(lambda: (",
@@ -351,23 +1155,25 @@ def fetch_index_constituent_timeseries(
 
     code_parts.append(")")
 
-    # Serialize DataFrame for JSON transfer
+    # Serialize DataFrame for JSON transfer (Arrow sends the frame as-is)
     code_parts.append(".reset_index()")
-    code_parts.append(".assign(Date=lambda x: x['Date'].astype(str))")
-    code_parts.append(".to_dict('records')")
+    if transport == "json":
+        code_parts.append(".assign(Date=lambda x: x['Date'].astype(str))")
+        code_parts.append(".to_dict('records')")
     code_parts.append("))()")
 
-    code = "".join(code_parts)
+    return "".join(code_parts)
 
-    # Execute via bridge
-    result = execute_norgate_code(code, timeout=timeout)
 
+def _parse_index_constituents(result: Any, symbol: str, index_name: str) -> pd.DataFrame:
+    """Parse an index_constituent_timeseries() bridge result.
+
+    Raises:
+        NorgateBridgeError: Result cannot be parsed
+    """
     # Parse result into DataFrame
     try:
-        if not isinstance(result, list):
-            raise ValueError(f"Expected list of records, got {type(result)}")
-
-        df = pd.DataFrame(result)
+        df = _result_frame(result)
 
         # Handle empty result (no constituent data available for symbol/date range)
         if df.empty:
@@ -420,6 +1226,276 @@ def fetch_index_constituent_timeseries(
         ) from e
 
 
+# Windows-side helpers for fetch_index_membership_batch() and
+# fetch_index_members_batch(): loop over symbols in a single execution and
+# collect per-symbol errors. _momo_membership_batch reduces each series to its
+# runs of 1s before sending anything back, so a 20-year series travels as a
+# handful of [symbol, start, end] rows; _momo_members_at applies the
+# get_index_constituents_at_date() rule (value on the last date on or before
+# the target, else the first value) and returns only the member symbols.
+_MEMBERSHIP_BATCH_SETUP = """
+def _momo_membership_series(symbols, index_name, start_date, end_date):
+    series = []
+    errors = {}
+    kwargs = {}
+    if start_date:
+        kwargs["start_date"] = start_date
+    if end_date:
+        kwargs["end_date"] = end_date
+    for symbol in symbols:
+        try:
+            df = norgatedata.index_constituent_timeseries(
+                symbol, index_name, timeseriesformat="pandas-dataframe", **kwargs
+            )
+        except Exception as e:
+            if "NDU is not running" in str(e):
+                raise
+            errors[symbol] = type(e).__name__ + ": " + str(e)
+            continue
+        if df is None or len(df) == 0:
+            series.append((symbol, [], []))
+            continue
+        days = [str(day)[:10] for day in df.index]
+        series.append((symbol, days, df["Index Constituent"].tolist()))
+    return series, errors
+
+
+def _momo_membership_batch(symbols, index_name, start_date, end_date):
+    series, errors = _momo_membership_series(symbols, index_name, start_date, end_date)
+    intervals = []
+    for symbol, days, flags in series:
+        start = None
+        for day, flag in zip(days, flags):
+            if flag and start is None:
+                start = day
+            elif not flag and start is not None:
+                intervals.append([symbol, start, day])
+                start = None
+        if start is not None:
+            intervals.append([symbol, start, None])
+    return {"intervals": intervals, "errors": errors}
+
+
+def _momo_members_at(symbols, index_name, start_date, end_date, target_date):
+    series, errors = _momo_membership_series(symbols, index_name, start_date, end_date)
+    members = []
+    empty = []
+    for symbol, days, flags in series:
+        if not days:
+            empty.append(symbol)
+            continue
+        prior = [flag for day, flag in zip(days, flags) if day <= target_date]
+        if (prior[-1] if prior else flags[0]):
+            members.append(symbol)
+    return {"members": members, "empty": empty, "errors": errors}
+"""
+
+
+def fetch_index_membership_batch(
+    symbols: Sequence[str],
+    index_name: str,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    batch_size: int = 100,
+    timeout: int = 300,
+) -> tuple[pd.DataFrame, dict[str, str]]:
+    """Fetch index membership spells for many symbols, one round trip per batch.
+
+    Each symbol's full index_constituent_timeseries() is fetched once and reduced
+    to its membership spells on the Windows side, so only interval rows cross
+    the bridge. Per-symbol failures (e.g. unknown symbol) are collected in an
+    error map.
+
+    Unlike fetch_price_data_batch(), a batch that fails as a whole raises: a
+    membership table with silently missing symbols would bias every universe
+    built from it.
+
+    DataFrame Schema (Output):
+        Columns:
+            - symbol (str): Ticker symbol
+            - start (datetime64[ns]): First trading date of the membership spell
+            - end (datetime64[ns]): First trading date after the spell on which
+              the symbol was no longer a member (exclusive), or NaT if the
+              symbol was still a member at the end of the fetched series
+        Rows are ordered by input symbol order, then start date. Symbols that
+        were never members have no rows.
+
+    Args:
+        symbols: Ticker symbols to check (e.g., ["AAPL", "MSFT"])
+        index_name: Name of index/watchlist (e.g., "Russell 1000 Current & Past")
+        start_date: Start of the membership series (optional, defaults to earliest)
+        end_date: End of the membership series (optional, defaults to most recent)
+        batch_size: Maximum symbols per bridge round trip (default: 100)
+        timeout: Timeout in seconds for each batch round trip (default: 300)
+
+    Returns:
+        Tuple of (intervals_df, errors):
+            - intervals_df: Membership spells of all successfully fetched symbols
+            - errors: Mapping of symbol -> error message for symbols that failed
+
+    Raises:
+        ValueError: batch_size is not positive
+        WindowsPythonNotFoundError: python.exe not found in PATH
+        NDUNotRunningError: Norgate Data Updater is not running
+        NorgateBridgeError: A batch failed as a whole or could not be parsed
+
+    Example:
+        >>> intervals_df, errors = fetch_index_membership_batch(
+        ...     ["AAPL", "XYZ"], "S&P 500", start_date=date(2000, 1, 1)
+        ... )
+        >>> intervals_df
+          symbol      start end
+        0   AAPL 2000-01-03 NaT
+        >>> errors
+        {'XYZ': 'ValueError: Symbol XYZ not found'}
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+    symbols = list(symbols)
+    batches = [symbols[i : i + batch_size] for i in range(0, len(symbols), batch_size)]
+
+    logger.info(
+        "fetching_index_membership_batch",
+        index_name=index_name,
+        symbols_count=len(symbols),
+        batch_count=len(batches),
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    rows: list[list[Any]] = []
+    errors: dict[str, str] = {}
+
+    for batch_index, batch in enumerate(batches, start=1):
+        args = (
+            f"({batch!r}, {index_name!r}, "
+            f"{start_date.isoformat() if start_date else None!r}, "
+            f"{end_date.isoformat() if end_date else None!r})"
+        )
+        result = execute_norgate_code(
+            f"_momo_membership_batch{args}", timeout=timeout, setup=_MEMBERSHIP_BATCH_SETUP
+        )
+
+        try:
+            batch_rows = [[str(s), str(start), end] for s, start, end in result["intervals"]]
+            batch_errors = {str(k): str(v) for k, v in result["errors"].items()}
+        except (KeyError, ValueError, TypeError) as e:
+            logger.error("index_membership_parse_failed", error=str(e), result_type=type(result))
+            raise NorgateBridgeError(f"Failed to parse index membership from bridge: {e}") from e
+
+        rows.extend(batch_rows)
+        errors.update(batch_errors)
+        logger.info(
+            "index_membership_batch_fetched",
+            batch_index=batch_index,
+            batch_count=len(batches),
+            symbols_count=len(batch),
+            interval_count=len(batch_rows),
+            failed_count=len(batch_errors),
+        )
+
+    intervals_df = pd.DataFrame(rows, columns=["symbol", "start", "end"])
+    intervals_df["symbol"] = intervals_df["symbol"].astype(object)
+    intervals_df["start"] = pd.to_datetime(intervals_df["start"]).astype("datetime64[ns]")
+    intervals_df["end"] = pd.to_datetime(intervals_df["end"]).astype("datetime64[ns]")
+
+    logger.info(
+        "index_membership_batch_complete",
+        index_name=index_name,
+        symbols_count=len(symbols),
+        interval_count=len(intervals_df),
+        failed_count=len(errors),
+    )
+    return intervals_df, errors
+
+
+def fetch_index_members_batch(
+    symbols: Sequence[str],
+    index_name: str,
+    target_date: date,
+    window_days: int = 5,
+    timeout: int = 300,
+) -> tuple[list[str], list[str], dict[str, str]]:
+    """Check index membership of many symbols at one date in one round trip.
+
+    Batched counterpart of checking each symbol with
+    fetch_index_constituent_timeseries() over target_date +/- window_days: a
+    single Windows-side execution loops over the symbols and applies the same
+    rule (membership on the last date on or before target_date, else on the
+    first date of the window). Per-symbol failures are collected in an error
+    map; a failure of the whole round trip raises.
+
+    Args:
+        symbols: Ticker symbols to check
+        index_name: Name of index/watchlist (e.g., "Russell 1000 Current & Past")
+        target_date: Date to check membership
+        window_days: Days fetched on each side of target_date (default: 5)
+        timeout: Timeout in seconds for the round trip (default: 300)
+
+    Returns:
+        Tuple of (members, empty, errors):
+            - members: Symbols that were members at target_date, in input order
+            - empty: Symbols without constituent data in the window
+            - errors: Mapping of symbol -> error message for symbols that failed
+
+    Raises:
+        WindowsPythonNotFoundError: python.exe not found in PATH
+        NDUNotRunningError: Norgate Data Updater is not running
+        NorgateBridgeError: The round trip failed or could not be parsed
+
+    Example:
+        >>> members, empty, errors = fetch_index_members_batch(
+        ...     ["AAPL", "MSFT", "XYZ"], "Russell 1000 Current & Past", date(2010, 1, 1)
+        ... )
+        >>> members
+        ['AAPL', 'MSFT']
+    """
+    symbols = list(symbols)
+    start_date = target_date - timedelta(days=window_days)
+    end_date = target_date + timedelta(days=window_days)
+    args = (
+        f"({symbols!r}, {index_name!r}, {start_date.isoformat()!r}, "
+        f"{end_date.isoformat()!r}, {target_date.isoformat()!r})"
+    )
+    result = execute_norgate_code(
+        f"_momo_members_at{args}", timeout=timeout, setup=_MEMBERSHIP_BATCH_SETUP
+    )
+
+    try:
+        members = [str(symbol) for symbol in result["members"]]
+        empty = [str(symbol) for symbol in result["empty"]]
+        errors = {str(k): str(v) for k, v in result["errors"].items()}
+    except (KeyError, ValueError, TypeError) as e:
+        logger.error("index_members_parse_failed", error=str(e), result_type=type(result))
+        raise NorgateBridgeError(f"Failed to parse index members from bridge: {e}") from e
+
+    logger.info(
+        "index_members_batch_fetched",
+        index_name=index_name,
+        target_date=target_date,
+        symbols_count=len(symbols),
+        members_count=len(members),
+        failed_count=len(errors),
+    )
+    return members, empty, errors
+
+
+def is_symbol_not_found(message: str) -> bool:
+    """Return whether a bridge error message reports an unknown symbol or index.
+
+    Such failures are data problems (skip the symbol), unlike timeouts or
+    crashes, which callers should raise.
+
+    Args:
+        message: Error message from an exception or a batch error map
+
+    Returns:
+        True if the message says the symbol (or index) was not found
+    """
+    return "not found" in message.lower()
+
+
 def fetch_watchlist_symbols(watchlist_name: str, timeout: int = 30) -> list[str]:
     """Fetch all symbols in a Norgate watchlist via Windows Python bridge.
 
@@ -454,6 +1530,15 @@ def fetch_watchlist_symbols(watchlist_name: str, timeout: int = 30) -> list[str]
     # Execute via bridge
     result = execute_norgate_code(code, timeout=timeout)
 
+    return _parse_watchlist_symbols(result, watchlist_name)
+
+
+def _parse_watchlist_symbols(result: Any, watchlist_name: str) -> list[str]:
+    """Parse a watchlist_symbols() bridge result.
+
+    Raises:
+        NorgateBridgeError: Result is not a list of symbols
+    """
     # Parse result
     try:
         if not isinstance(result, list):
@@ -503,3 +1588,265 @@ def check_ndu_status(timeout: int = 10) -> bool:
     except Exception as e:
         logger.warning("ndu_status_check_failed", error=str(e))
         return False
+
+
+def set_async_concurrency(limit: int) -> None:
+    """Set the maximum number of concurrent async bridge calls per event loop.
+
+    Applies to calls that start after this function returns; calls already
+    holding a slot finish normally.
+
+    Args:
+        limit: Maximum concurrent Windows Python executions (default limit: 8)
+
+    Raises:
+        ValueError: limit is not positive
+
+    Example:
+        >>> set_async_concurrency(16)
+        >>> frames = await asyncio.gather(*(fetch_price_data_async(s) for s in symbols))
+    """
+    global _async_concurrency
+
+    if limit < 1:
+        raise ValueError(f"limit must be positive, got {limit}")
+    _async_concurrency = limit
+    _async_semaphores.clear()
+
+
+def _async_semaphore() -> asyncio.Semaphore:
+    """Return the concurrency semaphore of the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _async_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(_async_concurrency)
+        _async_semaphores[loop] = semaphore
+    return semaphore
+
+
+async def _run_windows_python_async(wrapper: str, timeout: int) -> tuple[int, bytes, bytes]:
+    """Run wrapper code with python.exe without blocking the event loop.
+
+    The child process is killed if the call times out or the awaiting task is
+    cancelled.
+
+    Returns:
+        Tuple of (returncode, stdout bytes, stderr bytes)
+
+    Raises:
+        WindowsPythonNotFoundError: python.exe not found in PATH
+        NorgateBridgeError: Subprocess timed out
+    """
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "python.exe",
+            "-c",
+            wrapper,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError as e:
+        raise _windows_python_not_found_error() from e
+
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+    except TimeoutError as e:
+        await _kill_process(process)
+        raise _bridge_timeout_error(timeout) from e
+    except asyncio.CancelledError:
+        logger.info("bridge_call_cancelled", pid=process.pid)
+        await _kill_process(process)
+        raise
+
+    returncode = await process.wait()
+    return returncode, stdout, stderr
+
+
+async def _kill_process(process: asyncio.subprocess.Process) -> None:
+    """Kill a child process (if still running) and reap it."""
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass  # Exited between the check and the kill
+    await process.wait()
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_fixed(1),
+    retry=retry_if_exception_type((ConnectionError, OSError)),
+    reraise=True,
+)
+async def execute_norgate_code_async(code: str, timeout: int = 30, setup: str | None = None) -> Any:
+    """Async version of execute_norgate_code().
+
+    Runs python.exe via asyncio.create_subprocess_exec, so many calls can be in
+    flight without threads (bounded by set_async_concurrency()). Cancelling the
+    awaiting task kills the child process. If a persistent worker is active, the
+    request is sent to it from a worker thread instead; a cancelled request then
+    runs to completion in the worker but its result is discarded.
+
+    Args:
+        code: Python code to execute (must evaluate to a JSON-serializable result)
+        timeout: Subprocess timeout in seconds (default: 30)
+        setup: Optional Python statements executed before code is evaluated
+
+    Returns:
+        Parsed result from executed code (deserialized from JSON)
+
+    Raises:
+        WindowsPythonNotFoundError: python.exe not found in PATH
+        NDUNotRunningError: Norgate Data Updater is not running
+        NorgateBridgeError: Other bridge communication errors (timeout, JSON parse, etc.)
+
+    Example:
+        >>> version = await execute_norgate_code_async("norgatedata.version()")
+    """
+    logger.info("executing_norgate_code", code_length=len(code), mode="async")
+
+    async with _async_semaphore():
+        worker = _persistent_worker
+        if worker is not None:
+            return await asyncio.to_thread(worker.execute, code, timeout, setup)
+
+        returncode, stdout, stderr = await _run_windows_python_async(
+            _json_wrapper(code, setup), timeout=timeout
+        )
+
+    stdout_text = stdout.decode("utf-8", errors="replace")
+    if returncode != 0:
+        _raise_bridge_failure(stderr.decode("utf-8", errors="replace"), stdout_text)
+
+    return _parse_json_output(stdout_text)
+
+
+@retry(
+    stop=stop_after_attempt(3),
+    wait=wait_fixed(1),
+    retry=retry_if_exception_type((ConnectionError, OSError)),
+    reraise=True,
+)
+async def execute_norgate_arrow_async(
+    code: str, timeout: int = 30, setup: str | None = None
+) -> pa.Table:
+    """Async version of execute_norgate_arrow().
+
+    Same concurrency, cancellation and persistent worker behavior as
+    execute_norgate_code_async().
+
+    Args:
+        code: Python code evaluating to a pandas DataFrame or pyarrow Table
+        timeout: Subprocess timeout in seconds (default: 30)
+        setup: Optional Python statements executed before code is evaluated
+
+    Returns:
+        pyarrow Table
+
+    Raises:
+        WindowsPythonNotFoundError: python.exe not found in PATH
+        NDUNotRunningError: Norgate Data Updater is not running
+        NorgateBridgeError: Other bridge errors (timeout, invalid Arrow stream, etc.)
+    """
+    logger.info("executing_norgate_code", code_length=len(code), transport="arrow", mode="async")
+
+    async with _async_semaphore():
+        worker = _persistent_worker
+        if worker is not None:
+            payload = await asyncio.to_thread(worker.execute_arrow, code, timeout, setup)
+        else:
+            returncode, payload, stderr = await _run_windows_python_async(
+                _arrow_wrapper(code, setup), timeout=timeout
+            )
+            if returncode != 0:
+                _raise_bridge_failure(
+                    stderr.decode("utf-8", errors="replace"), f"<{len(payload)} bytes>"
+                )
+
+    return _parse_arrow_payload(payload)
+
+
+async def fetch_price_data_async(
+    symbol: str,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    adjustment: str = "TOTALRETURN",
+    timeout: int = 30,
+    transport: str = "json",
+) -> pd.DataFrame:
+    """Async version of fetch_price_data() (same arguments, schema and errors).
+
+    Example:
+        >>> frames = await asyncio.gather(
+        ...     *(fetch_price_data_async(symbol, start_date=date(2023, 1, 1)) for symbol in symbols)
+        ... )
+    """
+    _check_transport(transport)
+
+    logger.info(
+        "fetching_price_data",
+        symbol=symbol,
+        start_date=start_date,
+        end_date=end_date,
+        adjustment=adjustment,
+    )
+
+    code = _price_data_code(symbol, start_date, end_date, adjustment, transport)
+
+    result: Any
+    if transport == "arrow":
+        result = await execute_norgate_arrow_async(code, timeout=timeout)
+    else:
+        result = await execute_norgate_code_async(code, timeout=timeout)
+
+    return _parse_price_data(result, symbol)
+
+
+async def fetch_index_constituent_timeseries_async(
+    symbol: str,
+    index_name: str,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    timeout: int = 30,
+    transport: str = "json",
+) -> pd.DataFrame:
+    """Async version of fetch_index_constituent_timeseries() (same arguments, schema and errors).
+
+    Example:
+        >>> constituent_df = await fetch_index_constituent_timeseries_async(
+        ...     "AAPL", "Russell 3000", start_date=date(2020, 1, 1)
+        ... )
+    """
+    _check_transport(transport)
+
+    logger.info(
+        "fetching_index_constituent_timeseries",
+        symbol=symbol,
+        index_name=index_name,
+        start_date=start_date,
+        end_date=end_date,
+    )
+
+    code = _index_constituent_code(symbol, index_name, start_date, end_date, transport)
+
+    result: Any
+    if transport == "arrow":
+        result = await execute_norgate_arrow_async(code, timeout=timeout)
+    else:
+        result = await execute_norgate_code_async(code, timeout=timeout)
+
+    return _parse_index_constituents(result, symbol, index_name)
+
+
+async def fetch_watchlist_symbols_async(watchlist_name: str, timeout: int = 30) -> list[str]:
+    """Async version of fetch_watchlist_symbols() (same arguments, result and errors).
+
+    Example:
+        >>> symbols = await fetch_watchlist_symbols_async("Russell 1000 Current & Past")
+    """
+    logger.info("fetching_watchlist_symbols", watchlist_name=watchlist_name)
+
+    code = f'norgatedata.watchlist_symbols("{watchlist_name}")'
+    result = await execute_norgate_code_async(code, timeout=timeout)
+
+    return _parse_watchlist_symbols(result, watchlist_name)
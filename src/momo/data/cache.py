@@ -19,20 +19,198 @@ Schema Requirements (from docs/architecture/data-models.md):
         * volume: int64
         * unadjusted_close: float64
         * dividend: float64
+
+Superset Hits:
+    load_prices() falls back to any cached file for the same universe whose
+    momo:start_date/momo:end_date metadata covers the requested range. Only rows
+    inside the requested window are read, using a pyarrow filter on ``date``.
+
+Manifest:
+    Every universe cache file and symbol partition is recorded in a SQLite
+    manifest (momo.data.manifest) with its date range, symbols, row count, byte
+    size, created_at and schema_version:
+        data/cache/manifest.sqlite
+    Saves and invalidate() update it in one transaction each, under the file's
+    write lock. list_cached_ranges(), find_covering_range() and
+    get_partition_range() answer from the manifest instead of scanning the
+    directory or reading footers; list_cache_entries() exposes it. A missing
+    manifest is rebuilt from the directory on first use, and
+    rebuild_manifest() resynchronizes it after files were changed by hand.
+
+Symbol Partitions:
+    As an alternative to one file per universe and date range, prices can be
+    stored with one hive-style partition per symbol:
+        data/cache/prices/symbols/symbol={symbol}/prices.parquet
+    Symbols are URI-encoded in directory names. Each partition records the
+    date range it covers in its momo:start_date/momo:end_date metadata, and
+    universes are stored as plain symbol lists over the partitions:
+        data/cache/prices/universes/{universe}.json
+    Overlapping universes therefore share their symbols' data, and correcting
+    one symbol rewrites only its partition.
+
+Memory-Mapped Tier:
+    load_prices(..., mmap=True) reads an uncompressed Arrow IPC copy of an
+    exact-match cache file ({stem}.arrow) through a memory map, so repeated
+    loads are near-instant and processes share one copy via the page cache.
+
+Derived Files:
+    The mmap tier, and the wide panels and month-end datasets built by
+    momo.data.derived, are derived from one cache file. They are rebuilt on
+    demand and removed whenever that file is rewritten or invalidated (see
+    list_derived_files()).
+
+In-Memory LRU:
+    Frames returned by load_prices() (except mmap=True) are kept in a
+    byte-bounded in-process LRU (momo.data.frame_cache). Cached frames are
+    read-only; copy() a frame before modifying it.
+
+Compact Frames and Column Projection:
+    load_prices(..., compact=True) returns compact_prices() frames (float32
+    prices, int32 volume, categorical symbols); columns=[...] reads only the
+    requested column chunks. Cache files always use the full schema.
+
+Index Membership:
+    Point-in-time index membership is cached as one interval table per index
+    (one row per membership spell: symbol, index_name, start, end, sorted by
+    start), written by universe.build_membership():
+        data/cache/constituents/{index_name}.parquet
+    Index names are URI-encoded. The metadata records the covered date range
+    and every symbol that was checked, so symbols that were never members are
+    not refetched.
+
+Streaming Writes:
+    PriceWriter builds a universe cache file incrementally, one Parquet row
+    group per written frame (typically one symbol), so a universe larger than
+    memory can be cached without ever holding the full panel. See
+    loader.stream_universe_to_cache().
+
+Fetch Checkpoints:
+    load_universe(..., checkpoint=True) saves each fetched symbol as soon as it
+    arrives, so a rerun after a crash only fetches unfinished symbols:
+        data/cache/prices/checkpoints/{universe}_{start_date}_{end_date}/symbol={symbol}.parquet
+    Checkpoints are removed once the consolidated cache file has been written.
+
+Atomic Writes:
+    Cache files are written to a temporary file in the cache directory and then
+    renamed over the target, so readers never observe a partially written file.
+
+Concurrent Access:
+    Writers (saves, invalidate() and derived file builds) hold an advisory
+    exclusive lock (fcntl.flock, see write_lock()) on a per-file lock file
+    while they write:
+        data/cache/locks/{URI-encoded cache path}.lock
+    so parallel notebooks or sweep workers sharing one cache directory never
+    interleave writes to the same file. Readers take no lock: they open a file
+    once and read from that handle, so a concurrent rename or unlink leaves
+    them with the complete old file, and a file that disappears between lookup
+    and read is treated as a cache miss.
 """
 
+import fcntl
+import json
+import os
+import re
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import UTC, date, datetime
 from pathlib import Path
+from types import TracebackType
+from typing import IO
+from urllib.parse import quote, unquote
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.dataset as ds  # type: ignore[import-untyped]
 import pyarrow.parquet as pq  # type: ignore[import-untyped]
 import structlog
 
+from momo.data.frame_cache import FrameLRU
+from momo.data.manifest import CacheManifest, ManifestEntry
 from momo.utils.exceptions import CacheError
 
 logger = structlog.get_logger()
 
+# Price columns required by the cache schema, in canonical order
+PRICE_COLUMNS = ["open", "high", "low", "close", "volume", "unadjusted_close", "dividend"]
+
+# Compact in-memory dtypes (see compact_prices()); cache files keep the full schema
+COMPACT_DTYPES = {
+    "open": "float32",
+    "high": "float32",
+    "low": "float32",
+    "close": "float32",
+    "volume": "int32",
+    "unadjusted_close": "float32",
+    "dividend": "float32",
+}
+
+# Largest relative error compact_prices() accepts when narrowing a float column
+COMPACT_RTOL = 1e-6
+
+# Price adjustment of cache files without momo:adjustment metadata; the loader
+# always fetches Norgate's TOTALRETURN series (dividends folded into history)
+DEFAULT_ADJUSTMENT = "TOTALRETURN"
+
+# Columns of a cached index membership (interval) table
+MEMBERSHIP_COLUMNS = ["symbol", "index_name", "start", "end"]
+
+# Shared in-process cache of loaded frames (see configure_memory_cache())
+_memory_cache = FrameLRU()
+
+# Minimum seconds between two manifest accessed_at updates of one file
+TOUCH_INTERVAL = 60.0
+_last_touched: dict[Path, float] = {}
+
+# Seconds a writer waits for another process's lock on the same file
+LOCK_TIMEOUT = 300.0
+_LOCK_POLL_INTERVAL = 0.05
+
+
+def configure_memory_cache(max_bytes: int) -> None:
+    """Set the byte budget of the in-memory frame cache used by load_prices().
+
+    Args:
+        max_bytes: Byte budget (default 1 GiB); 0 disables in-memory caching
+
+    Raises:
+        ValueError: If max_bytes is negative
+
+    Examples:
+        >>> configure_memory_cache(4 * 1024**3)  # 4 GiB research box
+        >>> configure_memory_cache(0)  # Always read from disk
+    """
+    _memory_cache.resize(max_bytes)
+
+
+def memory_cache_stats() -> dict[str, int]:
+    """Return hit/miss/eviction counters of the in-memory frame cache.
+
+    Returns:
+        Dictionary with hits, misses, evictions, entries, bytes and max_bytes
+    """
+    return _memory_cache.stats()
+
+
+def clear_memory_cache() -> None:
+    """Drop all frames from the in-memory frame cache and reset its counters."""
+    _memory_cache.clear()
+
+
+def get_cache_root() -> Path:
+    """Return the root directory of the cache.
+
+    Every cache path (price files, partitions, manifest, locks, derived files)
+    is built from this root, so all of them move together.
+
+    Returns:
+        Path object: data/cache (relative to the working directory)
+    """
+    return Path("data") / "cache"
+
 
 def get_cache_path(universe: str, start_date: date, end_date: date) -> Path:
     """Generate consistent cache file path for given parameters.
@@ -51,10 +229,512 @@ def get_cache_path(universe: str, start_date: date, end_date: date) -> Path:
         Path('data/cache/prices/russell_1000_cp_2010-01-01_2020-12-31.parquet')
     """
     filename = f"{universe}_{start_date.isoformat()}_{end_date.isoformat()}.parquet"
-    return Path("data") / "cache" / "prices" / filename
+    return get_cache_root() / "prices" / filename
+
+
+def get_mmap_path(universe: str, start_date: date, end_date: date) -> Path:
+    """Generate the path of the memory-mapped Arrow tier of a cache file.
+
+    Args:
+        universe: Universe identifier (e.g., "russell_1000_cp")
+        start_date: Start date of price data range
+        end_date: End date of price data range
+
+    Returns:
+        Path next to get_cache_path() with an .arrow suffix
+
+    Examples:
+        >>> get_mmap_path("russell_1000_cp", date(2010, 1, 1), date(2020, 12, 31))
+        Path('data/cache/prices/russell_1000_cp_2010-01-01_2020-12-31.arrow')
+    """
+    return get_cache_path(universe, start_date, end_date).with_suffix(".arrow")
+
+
+def get_panel_dir(universe: str, start_date: date, end_date: date) -> Path:
+    """Generate the directory holding the wide panels derived from a cache file.
+
+    Panels themselves are built by momo.data.derived (see derived.get_panel_path()).
+
+    Args:
+        universe: Universe identifier (e.g., "russell_1000_cp")
+        start_date: Start date of the cache file's range
+        end_date: End date of the cache file's range
+
+    Returns:
+        Path: data/cache/panels/{universe}_{start_date}_{end_date}
+    """
+    stem = get_cache_path(universe, start_date, end_date).stem
+    return get_cache_root() / "panels" / stem
+
+
+def get_monthly_path(universe: str, start_date: date, end_date: date) -> Path:
+    """Generate the path of the month-end resampled dataset of a cache file.
+
+    The dataset itself is built by momo.data.derived (see derived.load_monthly()).
+
+    Args:
+        universe: Universe identifier (e.g., "russell_1000_cp")
+        start_date: Start date of the cache file's range
+        end_date: End date of the cache file's range
+
+    Returns:
+        Path: data/cache/monthly/{universe}_{start_date}_{end_date}.parquet
+
+    Examples:
+        >>> get_monthly_path("russell_1000_cp", date(2010, 1, 1), date(2020, 12, 31))
+        Path('data/cache/monthly/russell_1000_cp_2010-01-01_2020-12-31.parquet')
+    """
+    filename = get_cache_path(universe, start_date, end_date).name
+    return get_cache_root() / "monthly" / filename
+
+
+def list_derived_files(universe: str, start_date: date, end_date: date) -> list[Path]:
+    """List existing files derived from a cache file (mmap tier, panels, monthly data).
+
+    Derived files are rebuilt on demand and removed with their cache file.
+
+    Args:
+        universe: Universe identifier (e.g., "russell_1000_cp")
+        start_date: Start date of the cache file's range
+        end_date: End date of the cache file's range
+
+    Returns:
+        Paths of derived files that exist, sorted
+    """
+    paths = [get_mmap_path(universe, start_date, end_date)]
+    paths.append(get_monthly_path(universe, start_date, end_date))
+    panel_dir = get_panel_dir(universe, start_date, end_date)
+    if panel_dir.is_dir():
+        paths.extend(panel_dir.iterdir())
+    return sorted(path for path in paths if path.is_file())
+
+
+def _remove_derived(universe: str, start_date: date, end_date: date) -> None:
+    """Remove files derived from a cache file; callers hold the file's write lock."""
+    for path in list_derived_files(universe, start_date, end_date):
+        path.unlink(missing_ok=True)
+    try:
+        get_panel_dir(universe, start_date, end_date).rmdir()
+    except OSError:
+        # Missing, or a concurrent panel build just added a file
+        pass
+
+
+def list_cached_ranges(universe: str) -> list[tuple[date, date]]:
+    """List the date ranges cached for a universe.
+
+    Answered from the cache manifest (see list_cache_entries()).
+
+    Args:
+        universe: Universe identifier (e.g., "russell_1000_cp")
+
+    Returns:
+        List of (start_date, end_date) tuples, sorted by start then end date.
+        Empty list if nothing is cached.
+
+    Examples:
+        >>> list_cached_ranges("russell_1000_cp")
+        [(datetime.date(2010, 1, 1), datetime.date(2020, 12, 31))]
+    """
+    return [(entry.start_date, entry.end_date) for entry in list_cache_entries(universe)]
+
+
+def read_cache_metadata(path: Path) -> dict[str, str]:
+    """Read the momo:* metadata of a cache file without loading its data.
+
+    Only the Parquet footer is read, so this is cheap even for large files.
+
+    Args:
+        path: Path to a cache Parquet file
+
+    Returns:
+        Dictionary of momo:* metadata keys to values (empty if none are present)
+
+    Raises:
+        CacheError: If the file cannot be read as Parquet
+    """
+    try:
+        schema = pq.read_schema(path)
+    except (OSError, pa.ArrowException) as e:
+        raise CacheError(f"Cannot read cache metadata from {path}: {e}") from e
+
+    metadata = schema.metadata or {}
+    return {
+        key.decode(): value.decode() for key, value in metadata.items() if key.startswith(b"momo:")
+    }
+
+
+def find_covering_range(
+    universe: str, start_date: date, end_date: date
+) -> tuple[date, date] | None:
+    """Find the smallest cached range whose metadata covers the requested range.
+
+    Candidates come from the cache manifest, which records each file's
+    momo:start_date/momo:end_date metadata, so no footer is read.
+
+    Args:
+        universe: Universe identifier (e.g., "russell_1000_cp")
+        start_date: Requested start date
+        end_date: Requested end date
+
+    Returns:
+        (start_date, end_date) of the covering cache file, or None if no cached
+        file covers the requested range
+
+    Examples:
+        >>> find_covering_range("russell_1000_cp", date(2015, 1, 1), date(2018, 12, 31))
+        (datetime.date(2010, 1, 1), datetime.date(2020, 12, 31))
+    """
+    best: tuple[date, date] | None = None
+    for cached_start, cached_end in list_cached_ranges(universe):
+        if cached_start > start_date or cached_end < end_date:
+            continue
+        if best is None or (cached_end - cached_start) < (best[1] - best[0]):
+            best = (cached_start, cached_end)
+
+    return best
+
+
+def get_manifest_path() -> Path:
+    """Return the path of the cache manifest database.
+
+    Returns:
+        Path object: data/cache/manifest.sqlite
+    """
+    return get_cache_root() / "manifest.sqlite"
+
+
+def _manifest() -> CacheManifest:
+    """Return the cache manifest, building it from the cache directory if missing."""
+    manifest = CacheManifest(get_manifest_path())
+    if not manifest.exists():
+        rebuild_manifest()
+    return manifest
+
+
+def list_cache_entries(universe: str | None = None) -> list[ManifestEntry]:
+    """List universe cache files recorded in the manifest.
+
+    Entries whose file has disappeared (e.g., deleted by hand) are dropped
+    from the manifest and not returned.
+
+    Args:
+        universe: Universe identifier, or None for every universe
+
+    Returns:
+        Manifest entries sorted by universe, start date and end date
+
+    Examples:
+        >>> total = sum(entry.byte_size for entry in list_cache_entries())
+    """
+    return _existing_entries("universe", universe)
+
+
+def list_partition_entries() -> list[ManifestEntry]:
+    """List symbol partitions recorded in the manifest.
+
+    Like list_cache_entries(), entries whose file has disappeared are dropped.
+
+    Returns:
+        Manifest entries sorted by symbol
+    """
+    return _existing_entries("partition", None)
+
+
+def _existing_entries(kind: str, name: str | None) -> list[ManifestEntry]:
+    """Manifest entries of a kind whose file exists, dropping the others."""
+    manifest = _manifest()
+    entries = []
+    for entry in manifest.entries(kind=kind, name=name):
+        if entry.path.exists():
+            entries.append(entry)
+        else:
+            manifest.remove(entry.path)
+            logger.info("manifest_entry_dropped", path=str(entry.path), reason="file_not_found")
+    return entries
+
+
+def get_cache_entry(universe: str, start_date: date, end_date: date) -> ManifestEntry | None:
+    """Return the manifest entry of a universe cache file, or None if not cached.
+
+    Args:
+        universe: Universe identifier (e.g., "russell_1000_cp")
+        start_date: Start date of price data range
+        end_date: End date of price data range
+    """
+    return _manifest().get(get_cache_path(universe, start_date, end_date))
+
+
+def _record_entry(
+    path: Path,
+    kind: str,
+    name: str,
+    df: pd.DataFrame | None,
+    metadata: dict[str, str],
+    symbols: list[str] | None = None,
+    row_count: int | None = None,
+) -> None:
+    """Record a freshly written cache file in the manifest (caller holds its write lock)."""
+    if df is not None:
+        symbols = df.index.get_level_values("symbol").unique().tolist()
+        row_count = len(df)
+    _manifest().record(
+        ManifestEntry(
+            path=path,
+            kind=kind,
+            name=name,
+            start_date=date.fromisoformat(metadata["momo:start_date"]),
+            end_date=date.fromisoformat(metadata["momo:end_date"]),
+            symbols=symbols or [],
+            row_count=row_count or 0,
+            byte_size=path.stat().st_size,
+            created_at=metadata["momo:created_at"],
+            schema_version=metadata["momo:schema_version"],
+        )
+    )
+
+
+def _touch(*paths: Path) -> None:
+    """Record a read of cache files in the manifest (throttled by TOUCH_INTERVAL)."""
+    now = time.monotonic()
+    due = [
+        path for path in paths if now - _last_touched.get(path, -TOUCH_INTERVAL) >= TOUCH_INTERVAL
+    ]
+    if not due:
+        return
+    for path in due:
+        _last_touched[path] = now
+    _manifest().touch(due, datetime.now(UTC).isoformat())
+
+
+def rebuild_manifest() -> int:
+    """Rebuild the cache manifest by scanning the cache directory.
+
+    Reads the footer and symbol column of every universe cache file and symbol
+    partition. Files that cannot be read, or whose momo:* metadata disagrees
+    with their file name, are skipped with a warning.
+
+    Returns:
+        Number of entries recorded
+    """
+    entries: list[ManifestEntry] = []
+    cache_dir = get_cache_root() / "prices"
+    name_pattern = re.compile(r"^(.+)_(\d{4}-\d{2}-\d{2})_(\d{4}-\d{2}-\d{2})\.parquet$")
+
+    if cache_dir.exists():
+        for path in sorted(cache_dir.iterdir()):
+            match = name_pattern.match(path.name)
+            if match is None:
+                continue
+            universe = match.group(1)
+            expected = {
+                "momo:universe": universe,
+                "momo:start_date": match.group(2),
+                "momo:end_date": match.group(3),
+            }
+            entry = _scan_entry(path, "universe", universe, expected)
+            if entry is not None:
+                entries.append(entry)
+
+    partition_root = get_partition_root()
+    if partition_root.exists():
+        for path in sorted(partition_root.glob("symbol=*/prices.parquet")):
+            symbol = unquote(path.parent.name.removeprefix("symbol="))
+            entry = _scan_entry(path, "partition", symbol, {"momo:symbol": symbol})
+            if entry is not None:
+                entries.append(entry)
+
+    CacheManifest(get_manifest_path()).replace_all(entries)
+    logger.info("manifest_rebuilt", entries=len(entries))
+    return len(entries)
+
+
+def _scan_entry(path: Path, kind: str, name: str, expected: dict[str, str]) -> ManifestEntry | None:
+    """Build a manifest entry from a cache file on disk (see rebuild_manifest())."""
+    try:
+        metadata = read_cache_metadata(path)
+        if any(metadata.get(key) != value for key, value in expected.items()):
+            logger.warning("manifest_metadata_mismatch", path=str(path), metadata=metadata)
+            return None
+        parquet_file = pq.ParquetFile(path)
+        if kind == "partition":
+            symbols = [name]
+        else:
+            symbol_column = parquet_file.read(columns=["symbol"]).column("symbol")
+            symbols = symbol_column.unique().to_pylist()
+        return ManifestEntry(
+            path=path,
+            kind=kind,
+            name=name,
+            start_date=date.fromisoformat(metadata["momo:start_date"]),
+            end_date=date.fromisoformat(metadata["momo:end_date"]),
+            symbols=symbols,
+            row_count=parquet_file.metadata.num_rows,
+            byte_size=path.stat().st_size,
+            created_at=metadata.get("momo:created_at", ""),
+            schema_version=metadata.get("momo:schema_version", ""),
+        )
+    except (CacheError, OSError, KeyError, ValueError, pa.ArrowException) as e:
+        logger.warning("manifest_entry_unreadable", path=str(path), error=str(e))
+        return None
+
+
+def get_partition_root() -> Path:
+    """Return the root directory of the per-symbol partition store.
+
+    Returns:
+        Path object: data/cache/prices/symbols
+    """
+    return get_cache_root() / "prices" / "symbols"
+
+
+def get_partition_path(symbol: str) -> Path:
+    """Generate the Parquet file path of a symbol's partition.
+
+    Args:
+        symbol: Ticker symbol (e.g., "AAPL")
+
+    Returns:
+        Path object: data/cache/prices/symbols/symbol={symbol}/prices.parquet,
+        with the symbol URI-encoded so any ticker is a valid directory name
+
+    Examples:
+        >>> get_partition_path("BRK.B")
+        Path('data/cache/prices/symbols/symbol=BRK.B/prices.parquet')
+    """
+    return get_partition_root() / f"symbol={quote(symbol, safe='')}" / "prices.parquet"
+
+
+def get_universe_path(universe: str) -> Path:
+    """Generate the path of a universe's symbol list in the partition store.
+
+    Args:
+        universe: Universe identifier (e.g., "russell_1000_cp")
+
+    Returns:
+        Path object: data/cache/prices/universes/{universe}.json
+    """
+    return get_cache_root() / "prices" / "universes" / f"{universe}.json"
+
+
+def get_lock_path(path: Path) -> Path:
+    """Generate the advisory lock file path guarding writes to a cache file.
+
+    Args:
+        path: Cache file path (e.g., from get_cache_path())
+
+    Returns:
+        Path object: data/cache/locks/{path}.lock, with the path URI-encoded
+
+    Examples:
+        >>> get_lock_path(Path("data/cache/prices/sp500_2020-01-01_2020-12-31.parquet"))
+        Path('data/cache/locks/data%2Fcache%2Fprices%2Fsp500_2020-01-01_2020-12-31.parquet.lock')
+    """
+    return get_cache_root() / "locks" / f"{quote(path.as_posix(), safe='')}.lock"
+
+
+@contextmanager
+def write_lock(path: Path, timeout: float | None = None) -> Iterator[None]:
+    """Hold the exclusive advisory lock of a cache file (see get_lock_path()).
+
+    Lock files are left in place after release; removing them would let two
+    writers lock different inodes.
+
+    Raises:
+        CacheError: If the lock is not acquired within timeout seconds
+            (default: LOCK_TIMEOUT)
+    """
+    lock_path = get_lock_path(path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + (LOCK_TIMEOUT if timeout is None else timeout)
+
+    with open(lock_path, "a") as lock_file:
+        while True:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise CacheError(f"Timed out waiting for cache write lock on {path}") from None
+                time.sleep(_LOCK_POLL_INTERVAL)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def write_table_atomic(table: pa.Table, path: Path, file_format: str = "parquet") -> None:
+    """Write a table file atomically (temporary file + rename).
+
+    Args:
+        table: PyArrow Table to write
+        path: Final file path (parent directory must exist)
+        file_format: "parquet" (snappy compressed) or "arrow" (uncompressed
+            Arrow IPC file, suitable for memory mapping)
+
+    Raises:
+        OSError: Write or rename failed (the temporary file is removed)
+
+    Note:
+        Callers writing shared cache files hold write_lock(path) around this.
+    """
+    temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        if file_format == "arrow":
+            with (
+                pa.OSFile(str(temp_path), "wb") as sink,
+                pa.ipc.new_file(sink, table.schema) as writer,
+            ):
+                writer.write_table(table)
+        else:
+            pq.write_table(table, temp_path, compression="snappy")
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _read_mmap(path: Path, columns: list[str] | None = None) -> pd.DataFrame:
+    """Read an Arrow IPC file through a memory map without copying columns.
+
+    split_blocks=True keeps one pandas block per column, so numeric columns
+    without nulls wrap the mapped buffers directly (and are read-only).
+    """
+    source = pa.memory_map(str(path))
+    table = pa.ipc.open_file(source).read_all()
+    if columns is not None:
+        table = table.select([*columns, "date", "symbol"])
+    return table.to_pandas(split_blocks=True)
+
+
+def check_price_columns(columns: list[str] | None) -> None:
+    """Reject column projections naming columns outside the price schema.
+
+    Args:
+        columns: Requested price columns, or None for all columns
+
+    Raises:
+        ValueError: If columns is empty or contains unknown column names
+    """
+    if columns is None:
+        return
+    if not columns:
+        raise ValueError("columns must name at least one price column")
+    unknown = [column for column in columns if column not in PRICE_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown price columns: {unknown}. Expected a subset of {PRICE_COLUMNS}")
+
+
+def _with_metadata(table: pa.Table, metadata: dict[str, str]) -> pa.Table:
+    """Return the table with momo:* metadata merged into its schema metadata."""
+    existing_metadata = table.schema.metadata or {}
+    encoded_metadata = {k.encode(): v.encode() for k, v in metadata.items()}
+    return table.replace_schema_metadata({**existing_metadata, **encoded_metadata})
 
 
-def _validate_price_schema(df: pd.DataFrame) -> None:
+def _validate_price_schema(
+    df: pd.DataFrame, compact: bool = False, columns: list[str] | None = None
+) -> None:
     """Validate DataFrame schema matches expected price data structure.
 
     This function performs comprehensive schema validation:
@@ -65,6 +745,10 @@ def _validate_price_schema(df: pd.DataFrame) -> None:
 
     Args:
         df: DataFrame to validate
+        compact: If True, also accept the compact dtypes of compact_prices()
+            (float32 prices, int32 volume) for in-memory frames (default: False)
+        columns: Required price columns for projected frames (default: all
+            PRICE_COLUMNS)
 
     Raises:
         CacheError: If validation fails with detailed error message:
@@ -77,22 +761,15 @@ def _validate_price_schema(df: pd.DataFrame) -> None:
         - Index: MultiIndex with names ['date', 'symbol']
         - Index levels: (datetime64[ns], object for strings)
         - Columns: open, high, low, close, volume, unadjusted_close, dividend
-        - Dtypes: float64 for prices/dividends, int64 for volume
+        - Dtypes: float64 for prices/dividends, int64 for volume (compact:
+          float32/int32 also accepted, symbol level may be categorical)
     """
     # Check 1: DataFrame must not be empty
     if len(df) == 0:
         raise CacheError("Cannot cache empty DataFrame (0 rows)")
 
     # Check 2: Required columns must be present
-    required_columns = {
-        "open",
-        "high",
-        "low",
-        "close",
-        "volume",
-        "unadjusted_close",
-        "dividend",
-    }
+    required_columns = set(PRICE_COLUMNS if columns is None else columns)
     actual_columns = set(df.columns)
     missing_columns = required_columns - actual_columns
 
@@ -115,7 +792,11 @@ def _validate_price_schema(df: pd.DataFrame) -> None:
 
     dtype_mismatches = []
     for col, expected_dtype in expected_dtypes.items():
+        if col not in required_columns:
+            continue
         actual_dtype = str(df[col].dtype)
+        if compact and actual_dtype == COMPACT_DTYPES[col]:
+            continue
         if actual_dtype != expected_dtype:
             dtype_mismatches.append(f"{col}: expected {expected_dtype}, got {actual_dtype}")
 
@@ -140,7 +821,97 @@ def _validate_price_schema(df: pd.DataFrame) -> None:
         )
 
 
-def save_prices(df: pd.DataFrame, universe: str, start_date: date, end_date: date) -> Path:
+def compact_prices(df: pd.DataFrame, rtol: float = COMPACT_RTOL) -> pd.DataFrame:
+    """Convert a price frame to the compact in-memory representation.
+
+    Float price columns become float32 and volume becomes int32 where the
+    values fit: a float column whose float32 values deviate from the originals
+    by more than rtol (relative) anywhere, overflow or underflow, and a volume
+    column outside the int32 range, keep their full dtype (logged). The symbol
+    index level becomes categorical, so materialized symbol arrays
+    (get_level_values, reset_index) are integer codes rather than Python
+    strings. The result passes _validate_price_schema(..., compact=True).
+
+    Args:
+        df: Price data with MultiIndex (date, symbol) and any subset of
+            PRICE_COLUMNS
+        rtol: Largest accepted relative error per value (default: COMPACT_RTOL;
+            float32 rounds to about 6e-8)
+
+    Returns:
+        New DataFrame with compact dtypes (df is not modified)
+
+    Raises:
+        CacheError: If the result fails schema validation
+
+    Examples:
+        >>> compact_df = compact_prices(prices_df)
+        >>> compact_df.memory_usage(deep=True).sum() / prices_df.memory_usage(deep=True).sum()
+        0.52
+    """
+    price_columns = [column for column in df.columns if column in COMPACT_DTYPES]
+    converted: dict[str, npt.NDArray[np.generic]] = {}
+    kept: list[str] = []
+    for column in price_columns:
+        values = df[column].to_numpy()
+        target = np.dtype(COMPACT_DTYPES[column])
+        if values.dtype == target:
+            continue
+        if target.kind == "i":
+            limits = np.iinfo(target)
+            fits = len(values) == 0 or (values.min() >= limits.min and values.max() <= limits.max)
+            narrowed = values.astype(target) if fits else None
+        else:
+            narrowed = values.astype(target)
+            with np.errstate(over="ignore", invalid="ignore"):
+                error = np.abs(narrowed.astype(values.dtype) - values)
+            exact = (narrowed == values) | np.isnan(values)
+            fits = bool(np.all(exact | (error <= rtol * np.abs(values))))
+        if fits and narrowed is not None:
+            converted[column] = narrowed
+        else:
+            kept.append(column)
+
+    if kept:
+        logger.warning("compact_dtype_kept", columns=kept, rtol=rtol)
+
+    compact_df = df.assign(**converted)
+    if isinstance(compact_df.index, pd.MultiIndex) and "symbol" in compact_df.index.names:
+        symbol_level = compact_df.index.names.index("symbol")
+        symbols = compact_df.index.levels[symbol_level]
+        compact_df.index = compact_df.index.set_levels(
+            pd.CategoricalIndex(symbols, categories=symbols), level=symbol_level
+        )
+
+    _validate_price_schema(compact_df, compact=True, columns=price_columns)
+    return compact_df
+
+
+def order_like_fetch(df: pd.DataFrame, symbols: list[str]) -> pd.DataFrame:
+    """Order rows like a universe fetch: by position in symbols, then by date.
+
+    Cache files written from merged or refreshed frames use this layout so they
+    match the file a single fetch of the same symbols would have written.
+
+    Args:
+        df: Price data with MultiIndex (date, symbol); every symbol must be in symbols
+        symbols: Symbol order to follow (e.g. the fetch's input symbols)
+
+    Returns:
+        df with its rows reordered
+    """
+    symbol_order = {symbol: i for i, symbol in enumerate(symbols)}
+    symbol_rank = df.index.get_level_values("symbol").map(symbol_order)
+    return df.iloc[np.lexsort((df.index.get_level_values("date"), symbol_rank))]
+
+
+def save_prices(
+    df: pd.DataFrame,
+    universe: str,
+    start_date: date,
+    end_date: date,
+    adjustment: str = DEFAULT_ADJUSTMENT,
+) -> Path:
     """Save price DataFrame to Parquet cache with validation and metadata.
 
     This function validates the DataFrame schema and writes it to a Parquet file
@@ -154,12 +925,15 @@ def save_prices(df: pd.DataFrame, universe: str, start_date: date, end_date: dat
         universe: Universe identifier (e.g., "russell_1000_cp")
         start_date: Start date of price data range
         end_date: End date of price data range
+        adjustment: Norgate price adjustment of df (default: "TOTALRETURN",
+            see bridge.fetch_price_data())
 
     Returns:
         Path to the saved Parquet file
 
     Raises:
-        CacheError: If schema validation fails or write operation encounters errors
+        CacheError: If schema validation fails, write operation encounters errors
+            or another writer holds the file's lock for longer than LOCK_TIMEOUT
 
     Schema Requirements:
         See _validate_price_schema() for detailed validation rules.
@@ -173,6 +947,8 @@ def save_prices(df: pd.DataFrame, universe: str, start_date: date, end_date: dat
         - momo:end_date: End date in ISO format
         - momo:created_at: UTC timestamp in ISO format
         - momo:schema_version: Schema version (currently "1.0")
+        - momo:adjustment: Price adjustment (e.g. "TOTALRETURN"); derived total
+          returns only add dividends back for non-TOTALRETURN prices
 
     Examples:
         >>> prices_df = load_from_api(symbols, start_date, end_date)
@@ -193,42 +969,67 @@ def save_prices(df: pd.DataFrame, universe: str, start_date: date, end_date: dat
         "momo:end_date": end_date.isoformat(),
         "momo:created_at": datetime.now(UTC).isoformat(),
         "momo:schema_version": "1.0",
+        "momo:adjustment": adjustment,
     }
 
     # Convert DataFrame to PyArrow Table with custom metadata
-    table = pa.Table.from_pandas(df)
-
-    # Merge custom metadata with existing schema metadata
-    existing_metadata = table.schema.metadata or {}
-    encoded_metadata = {k.encode(): v.encode() for k, v in metadata.items()}
-    combined_metadata = {**existing_metadata, **encoded_metadata}
+    table = _with_metadata(pa.Table.from_pandas(df), metadata)
 
-    # Create new schema with updated metadata
-    schema_with_metadata = table.schema.with_metadata(combined_metadata)
+    # Write to Parquet with pyarrow engine and snappy compression (atomic replace)
+    with write_lock(cache_path):
+        write_table_atomic(table, cache_path)
+        _record_entry(cache_path, "universe", universe, df, metadata)
 
-    # Replace table schema with metadata-enhanced schema
-    table = table.cast(schema_with_metadata)
-
-    # Write to Parquet with pyarrow engine and snappy compression
-    pq.write_table(table, cache_path, compression="snappy")
+        # Files derived from the previous file (mmap tier, panels, monthly) are now stale
+        _remove_derived(universe, start_date, end_date)
 
     return cache_path
 
 
-def load_prices(universe: str, start_date: date, end_date: date) -> pd.DataFrame | None:
+def load_prices(
+    universe: str,
+    start_date: date,
+    end_date: date,
+    mmap: bool = False,
+    columns: list[str] | None = None,
+    compact: bool = False,
+) -> pd.DataFrame | None:
     """Load price DataFrame from Parquet cache if it exists.
 
     This function checks if a cached Parquet file exists for the given parameters
     and loads it if present. The MultiIndex structure is preserved during loading.
 
+    If there is no exact match, the smallest cached file for the same universe
+    whose metadata covers the requested range is used instead (see
+    find_covering_range()). Only rows with dates inside [start_date, end_date]
+    are read from that file.
+
+    Loaded frames are served from the in-process LRU while their source file
+    is unchanged (see configure_memory_cache()). Returned frames have read-only
+    column arrays; copy() them before modifying values in place.
+
     Args:
         universe: Universe identifier (e.g., "russell_1000_cp")
         start_date: Start date of price data range
         end_date: End date of price data range
+        mmap: If True, serve an exact match from the memory-mapped Arrow tier,
+            building it from the Parquet file on first use (default: False).
+            Numeric columns of the returned frame are read-only views of the
+            mapped file; copy() the frame before modifying it in place.
+            Superset hits are always read from Parquet.
+        columns: Price columns to read, in the order to return them (default:
+            all columns). Only these column chunks are read from disk.
+        compact: If True, return the compact in-memory representation (see
+            compact_prices()); the in-memory LRU then holds the compact frame
+            (default: False). With mmap=True the narrowed columns are copies,
+            no longer backed by the mapped file.
 
     Returns:
-        Price DataFrame with MultiIndex (date, symbol) if cache exists,
-        None if cache file does not exist
+        Price DataFrame with MultiIndex (date, symbol) if an exact or covering
+        cache file exists, None otherwise
+
+    Raises:
+        ValueError: If columns names a column outside the price schema
 
     Examples:
         >>> prices_df = load_prices("russell_1000_cp", date(2010, 1, 1), date(2020, 12, 31))
@@ -239,16 +1040,638 @@ def load_prices(universe: str, start_date: date, end_date: date) -> pd.DataFrame
         ...     # Cache hit - use cached data
         ...     print(f"Loaded {len(prices_df)} rows from cache")
     """
+    check_price_columns(columns)
     cache_path = get_cache_path(universe, start_date, end_date)
 
-    # Return None if cache doesn't exist
-    if not cache_path.exists():
+    # Each file is opened once and read through that handle, so a concurrent
+    # save (rename) or invalidate (unlink) cannot swap it out mid-read; a file
+    # removed before it is opened is treated as missing
+    if mmap and cache_path.exists():
+        mmap_path = get_mmap_path(universe, start_date, end_date)
+        try:
+            df = _load_mmap_tier(cache_path, mmap_path, columns)
+            _touch(cache_path)
+            return compact_prices(df) if compact else df
+        except FileNotFoundError:
+            logger.info("cache_file_vanished", path=str(cache_path))
+
+    try:
+        with open(cache_path, "rb") as source:
+            key = _memory_cache_key(source, cache_path, start_date, end_date, columns, compact)
+            _touch(cache_path)
+            cached_df = _memory_cache.get(key)
+            if cached_df is not None:
+                return cached_df
+
+            # Load from Parquet using pyarrow engine (preserves MultiIndex)
+            df = pd.read_parquet(source, engine="pyarrow", columns=columns)
+            return _memory_cache.put(key, compact_prices(df) if compact else df)
+    except FileNotFoundError:
+        pass
+
+    # Fall back to a cached superset of the requested range
+    covering = find_covering_range(universe, start_date, end_date)
+    if covering is None:
+        return None
+
+    superset_path = get_cache_path(universe, *covering)
+    try:
+        with open(superset_path, "rb") as source:
+            key = _memory_cache_key(source, superset_path, start_date, end_date, columns, compact)
+            _touch(superset_path)
+            cached_df = _memory_cache.get(key)
+            if cached_df is not None:
+                return cached_df
+
+            table = pq.read_table(
+                source,
+                columns=columns,
+                filters=[
+                    ("date", ">=", pd.Timestamp(start_date)),
+                    ("date", "<=", pd.Timestamp(end_date)),
+                ],
+                use_pandas_metadata=True,
+            )
+    except FileNotFoundError:
+        logger.info("cache_file_vanished", path=str(superset_path))
+        return None
+    df = table.to_pandas()
+
+    logger.info(
+        "cache_superset_hit",
+        universe=universe,
+        start_date=start_date.isoformat(),
+        end_date=end_date.isoformat(),
+        cached_start_date=covering[0].isoformat(),
+        cached_end_date=covering[1].isoformat(),
+        rows=len(df),
+    )
+
+    return _memory_cache.put(key, compact_prices(df) if compact else df)
+
+
+def _memory_cache_key(
+    source: IO[bytes],
+    path: Path,
+    start_date: date,
+    end_date: date,
+    columns: list[str] | None,
+    compact: bool = False,
+) -> tuple[object, ...]:
+    """Build the in-memory cache key: source file identity plus requested range/columns/dtypes.
+
+    The identity comes from the open handle (fstat), so it always describes the
+    file actually being read even if path is replaced concurrently.
+    """
+    stat = os.fstat(source.fileno())
+    # Atomic rewrites create a new inode, so st_ino changes even within one mtime tick
+    return (
+        str(path.resolve()),
+        stat.st_ino,
+        stat.st_mtime_ns,
+        stat.st_size,
+        start_date,
+        end_date,
+        None if columns is None else tuple(columns),
+        compact,
+    )
+
+
+def _load_mmap_tier(
+    cache_path: Path, mmap_path: Path, columns: list[str] | None = None
+) -> pd.DataFrame:
+    """Load a cache file via its memory-mapped tier, (re)building the tier if stale."""
+    if not _mmap_tier_fresh(cache_path, mmap_path):
+        # Under the cache file's lock, so a concurrent save cannot slip an
+        # older tier in after removing the stale one
+        with write_lock(cache_path):
+            if not _mmap_tier_fresh(cache_path, mmap_path):
+                write_table_atomic(pq.read_table(cache_path), mmap_path, file_format="arrow")
+                logger.info("mmap_tier_written", path=str(mmap_path))
+    return _read_mmap(mmap_path, columns)
+
+
+def _mmap_tier_fresh(cache_path: Path, mmap_path: Path) -> bool:
+    """Return True if the mmap tier exists and is not older than its cache file."""
+    try:
+        return mmap_path.stat().st_mtime >= cache_path.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+
+def save_symbol_prices(
+    df: pd.DataFrame,
+    symbol: str,
+    start_date: date,
+    end_date: date,
+    adjustment: str = DEFAULT_ADJUSTMENT,
+) -> Path:
+    """Save one symbol's prices as its partition in the per-symbol store.
+
+    The partition is replaced as a whole (atomically), so start_date/end_date
+    must describe the full range the new data covers.
+
+    Args:
+        df: Price data with MultiIndex (date, symbol) containing only ``symbol``
+        symbol: Ticker symbol the partition belongs to
+        start_date: Start date of the range the data covers
+        end_date: End date of the range the data covers
+        adjustment: Norgate price adjustment of df (default: "TOTALRETURN")
+
+    Returns:
+        Path to the saved partition file
+
+    Raises:
+        CacheError: If schema validation fails or df contains other symbols
+
+    Metadata:
+        Same keys as save_prices(), with momo:symbol in place of momo:universe.
+
+    Examples:
+        >>> save_symbol_prices(aapl_df, "AAPL", date(2010, 1, 1), date(2020, 12, 31))
+    """
+    _validate_price_schema(df)
+
+    other_symbols = set(df.index.get_level_values("symbol").unique()) - {symbol}
+    if other_symbols:
+        raise CacheError(
+            f"Partition for {symbol!r} contains other symbols: {sorted(other_symbols)}"
+        )
+
+    partition_path = get_partition_path(symbol)
+    partition_path.parent.mkdir(parents=True, exist_ok=True)
+
+    metadata = {
+        "momo:symbol": symbol,
+        "momo:start_date": start_date.isoformat(),
+        "momo:end_date": end_date.isoformat(),
+        "momo:created_at": datetime.now(UTC).isoformat(),
+        "momo:schema_version": "1.0",
+        "momo:adjustment": adjustment,
+    }
+
+    # The symbol lives in the partition directory name, not in the file
+    table = _with_metadata(pa.Table.from_pandas(df.droplevel("symbol")), metadata)
+    with write_lock(partition_path):
+        write_table_atomic(table, partition_path)
+        _record_entry(partition_path, "partition", symbol, df, metadata)
+
+    return partition_path
+
+
+def get_partition_range(symbol: str) -> tuple[date, date] | None:
+    """Return the date range covered by a symbol's partition.
+
+    Answered from the cache manifest, so no partition footer is read.
+
+    Args:
+        symbol: Ticker symbol
+
+    Returns:
+        (start_date, end_date) recorded for the partition, or None if the
+        partition is not cached
+    """
+    entry = _manifest().get(get_partition_path(symbol))
+    if entry is None or not entry.path.exists():
+        return None
+    return entry.start_date, entry.end_date
+
+
+def load_symbol_prices(
+    symbols: list[str],
+    start_date: date,
+    end_date: date,
+    columns: list[str] | None = None,
+) -> pd.DataFrame | None:
+    """Assemble a price frame for symbols from the per-symbol partition store.
+
+    Partitions are read as one pyarrow dataset, filtered on date, so only the
+    requested rows are materialized. Symbols without a partition are skipped;
+    callers should check coverage with get_partition_range() first.
+
+    Args:
+        symbols: Ticker symbols to load
+        start_date: Start date of the requested range
+        end_date: End date of the requested range
+        columns: Price columns to read (default: all columns)
+
+    Returns:
+        Price DataFrame with MultiIndex (date, symbol), rows ordered by the
+        input symbol order and then by date, or None if no symbol has a partition
+
+    Raises:
+        ValueError: If columns names a column outside the price schema
+
+    Examples:
+        >>> df = load_symbol_prices(["AAPL", "MSFT"], date(2015, 1, 1), date(2018, 12, 31))
+    """
+    check_price_columns(columns)
+    partition_paths = [path for path in map(get_partition_path, symbols) if path.exists()]
+    if not partition_paths:
         return None
+    _touch(*partition_paths)
+    paths = [str(path) for path in partition_paths]
+
+    dataset = ds.dataset(
+        paths,
+        format="parquet",
+        partitioning=ds.partitioning(pa.schema([("symbol", pa.string())]), flavor="hive"),
+        partition_base_dir=str(get_partition_root()),
+    )
+    table = dataset.to_table(
+        columns=None if columns is None else [*columns, "date", "symbol"],
+        filter=(ds.field("date") >= pd.Timestamp(start_date))
+        & (ds.field("date") <= pd.Timestamp(end_date)),
+    )
+    df = table.to_pandas().set_index("symbol", append=True)
 
-    # Load from Parquet using pyarrow engine (preserves MultiIndex)
-    df = pd.read_parquet(cache_path, engine="pyarrow")
+    return order_like_fetch(df, symbols)
 
-    return df
+
+def save_universe_symbols(universe: str, symbols: list[str]) -> Path:
+    """Record a universe as a symbol list over the partition store.
+
+    Args:
+        universe: Universe identifier (e.g., "russell_1000_cp")
+        symbols: Member symbols, in the order frames should be assembled
+
+    Returns:
+        Path to the saved symbol list
+    """
+    universe_path = get_universe_path(universe)
+    universe_path.parent.mkdir(parents=True, exist_ok=True)
+
+    temp_path = universe_path.with_name(f".{universe_path.name}.{uuid.uuid4().hex}.tmp")
+    with write_lock(universe_path):
+        try:
+            temp_path.write_text(json.dumps({"universe": universe, "symbols": symbols}))
+            os.replace(temp_path, universe_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    return universe_path
+
+
+def load_universe_symbols(universe: str) -> list[str] | None:
+    """Load a universe's symbol list from the partition store.
+
+    Args:
+        universe: Universe identifier (e.g., "russell_1000_cp")
+
+    Returns:
+        Member symbols, or None if the universe has not been recorded
+    """
+    universe_path = get_universe_path(universe)
+    if not universe_path.exists():
+        return None
+    symbols: list[str] = json.loads(universe_path.read_text())["symbols"]
+    return symbols
+
+
+def get_membership_path(index_name: str) -> Path:
+    """Generate the path of an index's cached membership interval table.
+
+    Args:
+        index_name: Name of index (e.g., "Russell 1000 Current & Past")
+
+    Returns:
+        Path object: data/cache/constituents/{index_name}.parquet, with the
+        index name URI-encoded so any name is a valid file name
+
+    Examples:
+        >>> get_membership_path("S&P 500")
+        Path('data/cache/constituents/S%26P%20500.parquet')
+    """
+    return get_cache_root() / "constituents" / f"{quote(index_name, safe='')}.parquet"
+
+
+def save_membership(
+    intervals_df: pd.DataFrame,
+    index_name: str,
+    start_date: date,
+    end_date: date,
+    symbols: list[str],
+) -> Path:
+    """Save an index membership interval table, replacing any cached table.
+
+    Args:
+        intervals_df: Membership spells with columns symbol, index_name, start
+            and end (see universe.build_membership())
+        index_name: Name of index the spells belong to
+        start_date: Start date of the range the table covers
+        end_date: End date of the range the table covers
+        symbols: Every symbol that was checked, including those without spells
+
+    Returns:
+        Path to the saved table
+
+    Raises:
+        CacheError: If intervals_df lacks a spell column or holds spells of
+            another index
+
+    Metadata:
+        momo:index_name, momo:start_date, momo:end_date, momo:symbols (JSON
+        list), momo:created_at and momo:schema_version.
+    """
+    missing = set(MEMBERSHIP_COLUMNS) - set(intervals_df.columns)
+    if missing:
+        raise CacheError(f"Membership table is missing columns: {sorted(missing)}")
+    other_indexes = set(intervals_df["index_name"].unique()) - {index_name}
+    if other_indexes:
+        raise CacheError(
+            f"Membership table for {index_name!r} contains other indexes: {sorted(other_indexes)}"
+        )
+
+    membership_path = get_membership_path(index_name)
+    membership_path.parent.mkdir(parents=True, exist_ok=True)
+
+    metadata = {
+        "momo:index_name": index_name,
+        "momo:start_date": start_date.isoformat(),
+        "momo:end_date": end_date.isoformat(),
+        "momo:symbols": json.dumps(symbols),
+        "momo:created_at": datetime.now(UTC).isoformat(),
+        "momo:schema_version": "1.0",
+    }
+    table = pa.Table.from_pandas(intervals_df[MEMBERSHIP_COLUMNS], preserve_index=False)
+    with write_lock(membership_path):
+        write_table_atomic(_with_metadata(table, metadata), membership_path)
+
+    logger.info(
+        "membership_saved",
+        index_name=index_name,
+        interval_count=len(intervals_df),
+        path=str(membership_path),
+    )
+    return membership_path
+
+
+def load_membership(index_name: str) -> tuple[pd.DataFrame, dict[str, str]] | None:
+    """Load an index's cached membership interval table.
+
+    Args:
+        index_name: Name of index (e.g., "Russell 1000 Current & Past")
+
+    Returns:
+        Tuple of (intervals_df, metadata) with the momo:* metadata written by
+        save_membership(), or None if nothing is cached for the index
+
+    Raises:
+        CacheError: If the cached file cannot be read
+    """
+    membership_path = get_membership_path(index_name)
+    if not membership_path.exists():
+        return None
+
+    metadata = read_cache_metadata(membership_path)
+    try:
+        intervals_df = pq.read_table(membership_path).to_pandas()
+    except (OSError, pa.ArrowException) as e:
+        raise CacheError(f"Cannot read membership table from {membership_path}: {e}") from e
+    return intervals_df, metadata
+
+
+class PriceWriter:
+    """Streaming sink that writes a universe cache file one frame at a time.
+
+    Each write() appends the frame as its own Parquet row group, so only the
+    frame being written is held in memory. The file is assembled under a
+    temporary name and renamed over the cache path on close(), like
+    save_prices(); if the block exits with an exception the partial file is
+    discarded and any existing cache file is left untouched.
+
+    The result is the same file save_prices() would write for the
+    concatenation of the frames, and load_prices() reads it as usual.
+
+    Attributes:
+        path: Final cache file path (see get_cache_path())
+        rows: Rows written so far
+        row_groups: Row groups (frames) written so far
+
+    Example:
+        >>> with PriceWriter("russell_1000_cp", start_date, end_date) as writer:
+        ...     for symbol_df in loader.iter_universe(symbols, start_date, end_date):
+        ...         writer.write(symbol_df)
+    """
+
+    def __init__(
+        self,
+        universe: str,
+        start_date: date,
+        end_date: date,
+        adjustment: str = DEFAULT_ADJUSTMENT,
+    ) -> None:
+        """Prepare a writer for the cache file of universe and date range.
+
+        Args:
+            universe: Universe identifier (e.g., "russell_1000_cp")
+            start_date: Start date of price data range
+            end_date: End date of price data range
+            adjustment: Norgate price adjustment of the frames (default:
+                "TOTALRETURN", see save_prices())
+        """
+        self.universe = universe
+        self.start_date = start_date
+        self.end_date = end_date
+        self.path = get_cache_path(universe, start_date, end_date)
+        self.rows = 0
+        self.row_groups = 0
+        self._symbols: dict[str, None] = {}
+        self._temp_path = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}.tmp")
+        self._writer: pq.ParquetWriter | None = None
+        self._metadata = {
+            "momo:universe": universe,
+            "momo:start_date": start_date.isoformat(),
+            "momo:end_date": end_date.isoformat(),
+            "momo:created_at": datetime.now(UTC).isoformat(),
+            "momo:schema_version": "1.0",
+            "momo:adjustment": adjustment,
+        }
+
+    def __enter__(self) -> "PriceWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Append a price frame (typically one symbol) as one row group.
+
+        Args:
+            df: Price data with MultiIndex (date, symbol) and the cache schema
+
+        Raises:
+            CacheError: If schema validation fails or the frame's columns differ
+                from the frames written before
+        """
+        _validate_price_schema(df)
+        table = pa.Table.from_pandas(df)
+
+        if self._writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            schema = _with_metadata(table, self._metadata).schema
+            self._writer = pq.ParquetWriter(self._temp_path, schema, compression="snappy")
+        elif not table.schema.equals(self._writer.schema, check_metadata=False):
+            raise CacheError(
+                f"Frame schema differs from earlier frames:\n{table.schema}\n"
+                f"expected:\n{self._writer.schema}"
+            )
+
+        self._writer.write_table(table)
+        self.rows += len(df)
+        self.row_groups += 1
+        self._symbols.update(dict.fromkeys(df.index.get_level_values("symbol").unique()))
+
+    def close(self) -> Path:
+        """Finish the file and move it into place atomically.
+
+        Returns:
+            Path to the saved Parquet file
+
+        Raises:
+            CacheError: If no frame was written or the file's write lock times out
+        """
+        if self._writer is None:
+            raise CacheError("Cannot cache empty DataFrame (0 rows)")
+        try:
+            self._writer.close()
+            with write_lock(self.path):
+                os.replace(self._temp_path, self.path)
+                _record_entry(
+                    self.path,
+                    "universe",
+                    self.universe,
+                    None,
+                    self._metadata,
+                    symbols=list(self._symbols),
+                    row_count=self.rows,
+                )
+                # Files derived from the previous file (mmap tier, panels, monthly) are now stale
+                _remove_derived(self.universe, self.start_date, self.end_date)
+        except BaseException:
+            self._temp_path.unlink(missing_ok=True)
+            raise
+        logger.info(
+            "price_stream_saved",
+            universe=self.universe,
+            rows=self.rows,
+            row_groups=self.row_groups,
+            path=str(self.path),
+        )
+        return self.path
+
+    def abort(self) -> None:
+        """Discard everything written so far (the cache file is not touched)."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._temp_path.unlink(missing_ok=True)
+
+
+def get_checkpoint_dir(universe: str, start_date: date, end_date: date) -> Path:
+    """Generate the directory holding fetch checkpoints of a universe cache file.
+
+    Args:
+        universe: Universe identifier (e.g., "russell_1000_cp")
+        start_date: Start date of price data range
+        end_date: End date of price data range
+
+    Returns:
+        Path object: data/cache/prices/checkpoints/{universe}_{start_date}_{end_date}
+
+    Examples:
+        >>> get_checkpoint_dir("russell_1000_cp", date(2010, 1, 1), date(2020, 12, 31))
+        Path('data/cache/prices/checkpoints/russell_1000_cp_2010-01-01_2020-12-31')
+    """
+    cache_path = get_cache_path(universe, start_date, end_date)
+    return cache_path.parent / "checkpoints" / cache_path.stem
+
+
+def save_checkpoint(
+    df: pd.DataFrame, universe: str, start_date: date, end_date: date, symbol: str
+) -> Path:
+    """Save one fetched symbol as a checkpoint of an unfinished universe fetch.
+
+    Checkpoints are written atomically, so a fetch that dies mid-write leaves
+    either a complete checkpoint or none.
+
+    Args:
+        df: Price data with MultiIndex (date, symbol) containing only ``symbol``
+        universe: Universe identifier of the fetch
+        start_date: Start date of the fetch
+        end_date: End date of the fetch
+        symbol: Ticker symbol the checkpoint belongs to
+
+    Returns:
+        Path to the saved checkpoint file
+
+    Raises:
+        CacheError: If schema validation fails
+    """
+    _validate_price_schema(df)
+
+    checkpoint_dir = get_checkpoint_dir(universe, start_date, end_date)
+    checkpoint_dir.mkdir(parents=True, exist_ok=True)
+    checkpoint_path = checkpoint_dir / f"symbol={quote(symbol, safe='')}.parquet"
+    write_table_atomic(pa.Table.from_pandas(df), checkpoint_path)
+    return checkpoint_path
+
+
+def load_checkpoints(
+    universe: str, start_date: date, end_date: date, symbols: list[str]
+) -> dict[str, pd.DataFrame]:
+    """Load the checkpoints left by an unfinished fetch of a universe.
+
+    Args:
+        universe: Universe identifier of the fetch
+        start_date: Start date of the fetch
+        end_date: End date of the fetch
+        symbols: Symbols to look up
+
+    Returns:
+        Dictionary of symbol to price DataFrame (MultiIndex (date, symbol)) for
+        each symbol with a readable checkpoint; unreadable checkpoints are
+        skipped, so those symbols are fetched again
+    """
+    checkpoint_dir = get_checkpoint_dir(universe, start_date, end_date)
+    if not checkpoint_dir.exists():
+        return {}
+
+    checkpoints: dict[str, pd.DataFrame] = {}
+    for symbol in symbols:
+        checkpoint_path = checkpoint_dir / f"symbol={quote(symbol, safe='')}.parquet"
+        if not checkpoint_path.exists():
+            continue
+        try:
+            checkpoints[symbol] = pd.read_parquet(checkpoint_path, engine="pyarrow")
+        except (OSError, pa.ArrowException) as e:
+            logger.warning("checkpoint_unreadable", symbol=symbol, error=str(e))
+    return checkpoints
+
+
+def clear_checkpoints(universe: str, start_date: date, end_date: date) -> None:
+    """Remove all checkpoints of a universe fetch (idempotent).
+
+    Args:
+        universe: Universe identifier of the fetch
+        start_date: Start date of the fetch
+        end_date: End date of the fetch
+    """
+    checkpoint_dir = get_checkpoint_dir(universe, start_date, end_date)
+    if not checkpoint_dir.exists():
+        return
+    for path in checkpoint_dir.iterdir():
+        path.unlink(missing_ok=True)
+    checkpoint_dir.rmdir()
 
 
 def invalidate(universe: str, start_date: date, end_date: date) -> None:
@@ -277,9 +1700,20 @@ def invalidate(universe: str, start_date: date, end_date: date) -> None:
     """
     cache_path = get_cache_path(universe, start_date, end_date)
 
-    # Delete cache file if it exists (idempotent - no error if missing)
-    if cache_path.exists():
-        cache_path.unlink()
+    with write_lock(cache_path):
+        # Derived files (mmap tier, panels, monthly data) go with the cache file
+        _remove_derived(universe, start_date, end_date)
+
+        # Delete cache file if it exists (idempotent - no error if missing).
+        # Readers that already opened it keep reading the unlinked file.
+        try:
+            cache_path.unlink()
+            removed = True
+        except FileNotFoundError:
+            removed = False
+        _manifest().remove(cache_path)
+
+    if removed:
         logger.info(
             "cache_invalidated",
             universe=universe,
@@ -295,3 +1729,30 @@ def invalidate(universe: str, start_date: date, end_date: date) -> None:
             end_date=end_date.isoformat(),
             reason="file_not_found",
         )
+
+
+def invalidate_partition(symbol: str) -> None:
+    """Remove a symbol's partition from the per-symbol store (idempotent).
+
+    Universes recorded over the partition store keep listing the symbol; the
+    next partitioned load refetches it.
+
+    Args:
+        symbol: Ticker symbol
+    """
+    partition_path = get_partition_path(symbol)
+
+    with write_lock(partition_path):
+        try:
+            partition_path.unlink()
+            partition_path.parent.rmdir()
+            removed = True
+        except FileNotFoundError:
+            removed = False
+        except OSError:
+            # Directory not empty (stray files); the partition itself is gone
+            removed = True
+        _manifest().remove(partition_path)
+
+    if removed:
+        logger.info("partition_invalidated", symbol=symbol, path=str(partition_path))
@@ -0,0 +1,472 @@
+"""Files derived from universe cache files: wide panels and month-end data.
+
+Signal code rarely wants the long (date, symbol) frame that momo.data.cache
+stores. This module derives the two shapes it does want from a universe cache
+file, persists them next to the cache and serves them on later loads. It is
+built on the cache's public API: derived files live under the cache root, are
+rebuilt under the source file's write lock, and are removed by the cache
+whenever their source file is rewritten or invalidated (cache.list_derived_files()).
+Each derived file records the momo:created_at of the file it was built from
+and is rebuilt if that no longer matches the manifest.
+
+Wide Panels:
+    load_panel() serves one price field (e.g. ``close``, or a ``total_return``
+    index) as a date x symbol matrix: a C-contiguous float64 array with rows on
+    a trading calendar's days (default "NYSE") and one column per symbol, NaN
+    where a symbol has no row. Panels are stored as uncompressed NumPy archives:
+        data/cache/panels/{universe}_{start_date}_{end_date}/{field}_{calendar}.npz
+    so signal code skips the unstack after every load.
+
+Month-End Resampling:
+    load_monthly() serves a universe cache file resampled to calendar months,
+    the frequency the momentum pipeline runs at: per symbol and month the
+    month-end close, the monthly total return and the number of trading days
+    with data. It is materialized once per cache file as:
+        data/cache/monthly/{universe}_{start_date}_{end_date}.parquet
+
+Example:
+    >>> from momo.data import derived
+    >>> panel = derived.load_panel("sp500", date(2010, 1, 1), date(2020, 12, 31))
+    >>> monthly_df = derived.load_monthly("sp500", date(2010, 1, 1), date(2020, 12, 31))
+"""
+
+import os
+import uuid
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from urllib.parse import quote
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import pyarrow as pa  # type: ignore[import-untyped]
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+import structlog
+
+from momo.data import cache
+from momo.data.manifest import ManifestEntry
+from momo.data.trading_calendar import TradingCalendar, get_calendar
+from momo.utils.exceptions import CacheError
+
+logger = structlog.get_logger()
+
+# Fields load_panel() can serve: float price columns plus a total return index
+PANEL_FIELDS = ["open", "high", "low", "close", "unadjusted_close", "dividend", "total_return"]
+
+# Columns of the month-end resampled dataset (see load_monthly())
+MONTHLY_COLUMNS = ["close", "total_return", "trading_days"]
+
+
+def get_panel_path(
+    universe: str,
+    start_date: date,
+    end_date: date,
+    field: str,
+    calendar: TradingCalendar | str = "NYSE",
+) -> Path:
+    """Generate the path of a wide panel derived from a cache file.
+
+    Args:
+        universe: Universe identifier (e.g., "russell_1000_cp")
+        start_date: Start date of the cache file's range
+        end_date: End date of the cache file's range
+        field: Panel field (one of PANEL_FIELDS)
+        calendar: Trading calendar (or registered name) the rows are aligned to
+
+    Returns:
+        Path: data/cache/panels/{universe}_{start_date}_{end_date}/{field}_{calendar}.npz
+        (calendar name URI-encoded)
+
+    Examples:
+        >>> get_panel_path("russell_1000_cp", date(2010, 1, 1), date(2020, 12, 31), "close")
+        Path('data/cache/panels/russell_1000_cp_2010-01-01_2020-12-31/close_NYSE.npz')
+    """
+    calendar_name = get_calendar(calendar).name
+    return (
+        cache.get_panel_dir(universe, start_date, end_date)
+        / f"{field}_{quote(calendar_name, safe='')}.npz"
+    )
+
+
+@dataclass(frozen=True)
+class PricePanel:
+    """Wide date x symbol matrix of one price field.
+
+    Attributes:
+        field: Panel field (one of PANEL_FIELDS)
+        dates: Trading days of the rows (DatetimeIndex named "date")
+        symbols: Symbols of the columns, in cache file order
+        values: C-contiguous float64 array of shape (len(dates), len(symbols));
+            NaN where a symbol has no row on a date
+
+    Example:
+        >>> panel = load_panel("sp500", date(2010, 1, 1), date(2020, 12, 31))
+        >>> monthly_returns = panel.values[21:] / panel.values[:-21] - 1.0
+        >>> panel.to_frame().loc["2020-12-31", "AAPL"]
+    """
+
+    field: str
+    dates: pd.DatetimeIndex
+    symbols: list[str]
+    values: npt.NDArray[np.float64]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the panel as a DataFrame (date index, one column per symbol)."""
+        return pd.DataFrame(self.values, index=self.dates, columns=pd.Index(self.symbols))
+
+
+def build_panel(
+    df: pd.DataFrame,
+    field: str,
+    start_date: date,
+    end_date: date,
+    calendar: TradingCalendar | str = "NYSE",
+    adjustment: str = cache.DEFAULT_ADJUSTMENT,
+) -> PricePanel:
+    """Pivot a long price frame into a calendar-aligned wide panel.
+
+    Rows are the calendar's trading days from start_date to end_date; rows of
+    df on other dates are dropped (and logged). The ``total_return`` field is a
+    per-symbol index starting at 1.0 on the symbol's first row, compounding
+    daily gross returns. TOTALRETURN closes already have dividends folded into
+    history, so their gross return is close / previous close; for any other
+    adjustment it is (close + dividend) / previous close, i.e. with each
+    dividend reinvested at the close of its ex-date.
+
+    Args:
+        df: Price data with MultiIndex (date, symbol); needs the field's column
+            (close, plus dividend for total_return of non-TOTALRETURN prices)
+        field: Panel field (one of PANEL_FIELDS)
+        start_date: First calendar day of the panel
+        end_date: Last calendar day of the panel
+        calendar: Trading calendar (or registered name) to align rows to
+        adjustment: Norgate price adjustment of df (default: "TOTALRETURN";
+            the momo:adjustment of its cache file)
+
+    Returns:
+        PricePanel with columns in order of first appearance in df
+
+    Raises:
+        ValueError: If field is not one of PANEL_FIELDS
+    """
+    if field not in PANEL_FIELDS:
+        raise ValueError(f"Unknown panel field: {field!r}. Expected one of {PANEL_FIELDS}")
+
+    # Same unit as the cache's date level, so panel and long frame align exactly
+    dates = get_calendar(calendar).trading_days(start_date, end_date).as_unit("ns")
+    codes, symbols = pd.factorize(df.index.get_level_values("symbol"))
+    if field == "total_return":
+        reinvest = adjustment != "TOTALRETURN"
+        field_values = _total_return_index(df, codes, reinvest_dividends=reinvest)
+    else:
+        field_values = df[field].to_numpy(dtype="float64")
+
+    rows = dates.get_indexer(df.index.get_level_values("date"))
+    on_calendar = rows >= 0
+    if not on_calendar.all():
+        logger.warning(
+            "panel_rows_off_calendar",
+            field=field,
+            rows=int((~on_calendar).sum()),
+            calendar=get_calendar(calendar).name,
+        )
+
+    values = np.full((len(dates), len(symbols)), np.nan)
+    values[rows[on_calendar], codes[on_calendar]] = field_values[on_calendar]
+    return PricePanel(field=field, dates=dates, symbols=[str(s) for s in symbols], values=values)
+
+
+def _total_return_index(
+    df: pd.DataFrame, codes: npt.NDArray[np.intp], reinvest_dividends: bool
+) -> npt.NDArray[np.float64]:
+    """Total return index per symbol, aligned with df's rows.
+
+    reinvest_dividends adds each dividend back to its ex-date close; leave it
+    off for TOTALRETURN closes, which already include dividends.
+    """
+    order = np.lexsort((df.index.get_level_values("date"), codes))
+    close = df["close"].to_numpy(dtype="float64")[order]
+    sorted_codes = codes[order]
+
+    numerator = close[1:]
+    if reinvest_dividends:
+        numerator = numerator + df["dividend"].to_numpy(dtype="float64")[order][1:]
+    gross = np.ones(len(order))
+    same_symbol = sorted_codes[1:] == sorted_codes[:-1]
+    gross[1:] = np.where(same_symbol, numerator / close[:-1], 1.0)
+    index = pd.Series(gross).groupby(sorted_codes).cumprod().to_numpy()
+
+    result = np.empty(len(order))
+    result[order] = index
+    return result
+
+
+def load_panel(
+    universe: str,
+    start_date: date,
+    end_date: date,
+    field: str = "close",
+    calendar: TradingCalendar | str = "NYSE",
+) -> PricePanel | None:
+    """Load a wide date x symbol panel of one field from the cache.
+
+    The panel is derived from the cache file load_prices() would read (exact
+    match or smallest covering range) and persisted next to the cache, so
+    repeated loads read one contiguous array instead of pivoting the long
+    frame. A missing or stale panel is (re)built from the cache file under the
+    file's write lock. Rows are sliced to [start_date, end_date].
+
+    Args:
+        universe: Universe identifier (e.g., "russell_1000_cp")
+        start_date: Start date of price data range
+        end_date: End date of price data range
+        field: Panel field (one of PANEL_FIELDS, default: "close")
+        calendar: Trading calendar (or registered name) to align rows to
+            (default: "NYSE")
+
+    Returns:
+        PricePanel, or None if no cache file covers the range
+
+    Raises:
+        ValueError: If field is not one of PANEL_FIELDS
+        CacheError: If the cache file's write lock times out
+
+    Examples:
+        >>> panel = load_panel("sp500", date(2010, 1, 1), date(2020, 12, 31))
+        >>> panel.values.shape
+        (2769, 503)
+    """
+    if field not in PANEL_FIELDS:
+        raise ValueError(f"Unknown panel field: {field!r}. Expected one of {PANEL_FIELDS}")
+
+    covering = cache.find_covering_range(universe, start_date, end_date)
+    if covering is None:
+        return None
+
+    cache_path = cache.get_cache_path(universe, *covering)
+    panel_path = get_panel_path(universe, *covering, field, calendar)
+    panel = _read_panel(panel_path, field, cache.get_cache_entry(universe, *covering))
+    if panel is None:
+        # Under the cache file's lock, so the panel matches the file it records
+        with cache.write_lock(cache_path):
+            entry = cache.get_cache_entry(universe, *covering)
+            panel = _read_panel(panel_path, field, entry)
+            if panel is None:
+                adjustment = _adjustment(cache_path)
+                columns = [field]
+                if field == "total_return":
+                    columns = ["close"] if adjustment == "TOTALRETURN" else ["close", "dividend"]
+                df = cache.load_prices(universe, *covering, columns=columns)
+                if entry is None or df is None:
+                    return None
+                panel = build_panel(df, field, *covering, calendar=calendar, adjustment=adjustment)
+                _write_panel_atomic(panel, panel_path, entry.created_at)
+                logger.info("panel_written", path=str(panel_path), shape=panel.values.shape)
+
+    if covering == (start_date, end_date):
+        return panel
+    # Row slices of a C-contiguous array stay contiguous (no copy)
+    first = panel.dates.searchsorted(pd.Timestamp(start_date), "left")
+    last = panel.dates.searchsorted(pd.Timestamp(end_date), "right")
+    return PricePanel(
+        field=field,
+        dates=panel.dates[first:last],
+        symbols=panel.symbols,
+        values=panel.values[first:last],
+    )
+
+
+def _adjustment(cache_path: Path) -> str:
+    """Price adjustment a cache file was written with (see cache.save_prices())."""
+    try:
+        metadata = cache.read_cache_metadata(cache_path)
+    except CacheError:
+        # Removed since the lookup; the caller's load then finds nothing
+        return cache.DEFAULT_ADJUSTMENT
+    return metadata.get("momo:adjustment", cache.DEFAULT_ADJUSTMENT)
+
+
+def _read_panel(panel_path: Path, field: str, entry: ManifestEntry | None) -> PricePanel | None:
+    """Read a persisted panel, or None if it is missing or built from another file version."""
+    try:
+        with np.load(panel_path, allow_pickle=False) as archive:
+            if entry is None or str(archive["source_created_at"]) != entry.created_at:
+                return None
+            return PricePanel(
+                field=field,
+                dates=pd.DatetimeIndex(archive["dates"].astype("datetime64[ns]"), name="date"),
+                symbols=archive["symbols"].tolist(),
+                values=archive["values"],
+            )
+    except FileNotFoundError:
+        return None
+
+
+def _write_panel_atomic(panel: PricePanel, path: Path, source_created_at: str) -> None:
+    """Write a panel as an uncompressed .npz file atomically (temporary file + rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(temp_path, "wb") as sink:
+            np.savez(
+                sink,
+                values=panel.values,
+                dates=panel.dates.to_numpy(dtype="datetime64[ns]"),
+                symbols=np.array(panel.symbols, dtype=str),
+                source_created_at=np.array(source_created_at),
+            )
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def build_monthly(df: pd.DataFrame, adjustment: str = cache.DEFAULT_ADJUSTMENT) -> pd.DataFrame:
+    """Resample a long daily price frame to calendar months, per symbol.
+
+    DataFrame Schema (Output):
+        Index:
+            - MultiIndex (date: datetime64[ns], symbol: str), where date is the
+              calendar month end (e.g. 2020-02-29), sorted by date and then by
+              order of first appearance of the symbol in df
+        Columns:
+            - close (float64): Close on the symbol's last trading day of the month
+            - total_return (float64): Return from the previous month-end close;
+              NaN for the symbol's first month. For TOTALRETURN closes this is
+              the month-end close ratio (dividends are already in the closes);
+              for other adjustments each dividend is reinvested at the close of
+              its ex-date (the same compounding as the ``total_return`` panel)
+            - trading_days (int64): Daily rows of the symbol in the month
+
+    The first and last month of the range may be partial; trading_days shows
+    how many days they hold.
+
+    Args:
+        df: Price data with MultiIndex (date, symbol) and a close column (plus
+            dividend for non-TOTALRETURN prices)
+        adjustment: Norgate price adjustment of df (default: "TOTALRETURN";
+            the momo:adjustment of its cache file)
+
+    Returns:
+        Month-end DataFrame (schema above); one row per symbol and month with data
+    """
+    codes, symbols = pd.factorize(df.index.get_level_values("symbol"))
+    dates = df.index.get_level_values("date")
+    close = df["close"].to_numpy(dtype="float64")
+    if adjustment == "TOTALRETURN":
+        # Month-end close ratios are the total return
+        index = close
+    else:
+        index = _total_return_index(df, codes, reinvest_dividends=True)
+    daily = pd.DataFrame(
+        {
+            "code": codes,
+            "date": dates + pd.offsets.MonthEnd(0),
+            "day": dates,
+            "close": close,
+            "index": index,
+        }
+    ).sort_values(["code", "day"], kind="stable")
+
+    grouped = daily.groupby(["code", "date"], sort=True)
+    monthly = grouped.agg(
+        close=("close", "last"), index=("index", "last"), trading_days=("day", "size")
+    )
+    previous_index = monthly["index"].groupby(level="code").shift(1)
+    monthly["total_return"] = monthly["index"] / previous_index - 1.0
+
+    monthly = monthly.reset_index().sort_values(["date", "code"], kind="stable")
+    return pd.DataFrame(
+        {
+            "close": monthly["close"].to_numpy(),
+            "total_return": monthly["total_return"].to_numpy(),
+            "trading_days": monthly["trading_days"].to_numpy(dtype="int64"),
+        },
+        index=pd.MultiIndex.from_arrays(
+            [
+                pd.DatetimeIndex(monthly["date"]).as_unit("ns"),
+                pd.Index(symbols, dtype=object).take(monthly["code"].to_numpy()),
+            ],
+            names=["date", "symbol"],
+        ),
+    )
+
+
+def load_monthly(universe: str, start_date: date, end_date: date) -> pd.DataFrame | None:
+    """Load the month-end resampled dataset of a universe from the cache.
+
+    The dataset is derived from the cache file load_prices() would read (exact
+    match or smallest covering range) and materialized next to the cache on
+    first use, so monthly pipelines never resample daily data again. A missing
+    or stale dataset is (re)built under the cache file's write lock. Only months
+    overlapping [start_date, end_date] are returned; their values are computed
+    over the whole cache file, so a month cut by start_date or end_date still
+    reports its full close, return and trading-day count.
+
+    Args:
+        universe: Universe identifier (e.g., "russell_1000_cp")
+        start_date: Start date of price data range
+        end_date: End date of price data range
+
+    Returns:
+        Month-end DataFrame (see build_monthly()), or None if no cache file
+        covers the range
+
+    Raises:
+        CacheError: If the cache file's write lock times out
+
+    Examples:
+        >>> monthly_df = load_monthly("sp500", date(2010, 1, 1), date(2020, 12, 31))
+        >>> momentum = monthly_df["total_return"].unstack("symbol")
+    """
+    covering = cache.find_covering_range(universe, start_date, end_date)
+    if covering is None:
+        return None
+
+    cache_path = cache.get_cache_path(universe, *covering)
+    monthly_path = cache.get_monthly_path(universe, *covering)
+    monthly_df = _read_monthly(monthly_path, cache.get_cache_entry(universe, *covering))
+    if monthly_df is None:
+        # Under the cache file's lock, so the dataset matches the file it records
+        with cache.write_lock(cache_path):
+            entry = cache.get_cache_entry(universe, *covering)
+            monthly_df = _read_monthly(monthly_path, entry)
+            if monthly_df is None:
+                adjustment = _adjustment(cache_path)
+                columns = ["close"] if adjustment == "TOTALRETURN" else ["close", "dividend"]
+                df = cache.load_prices(universe, *covering, columns=columns)
+                if entry is None or df is None:
+                    return None
+                monthly_df = build_monthly(df, adjustment=adjustment)
+                table = pa.Table.from_pandas(monthly_df)
+                table = table.replace_schema_metadata(
+                    {
+                        **(table.schema.metadata or {}),
+                        b"momo:source_created_at": entry.created_at.encode(),
+                    }
+                )
+                monthly_path.parent.mkdir(parents=True, exist_ok=True)
+                cache.write_table_atomic(table, monthly_path)
+                logger.info("monthly_written", path=str(monthly_path), rows=len(monthly_df))
+
+    if covering == (start_date, end_date):
+        return monthly_df
+    months = monthly_df.index.get_level_values("date")
+    first_month = pd.Timestamp(start_date) + pd.offsets.MonthEnd(0)
+    last_month = pd.Timestamp(end_date) + pd.offsets.MonthEnd(0)
+    return monthly_df[(months >= first_month) & (months <= last_month)]
+
+
+def _read_monthly(monthly_path: Path, entry: ManifestEntry | None) -> pd.DataFrame | None:
+    """Read a monthly dataset, or None if it is missing or built from another file version."""
+    try:
+        with open(monthly_path, "rb") as source:
+            table = pq.read_table(source)
+    except FileNotFoundError:
+        return None
+    metadata = table.schema.metadata or {}
+    source_created_at = metadata.get(b"momo:source_created_at", b"").decode()
+    if entry is None or source_created_at != entry.created_at:
+        return None
+    return table.to_pandas()
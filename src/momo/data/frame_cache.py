@@ -0,0 +1,178 @@
+"""In-process LRU cache for loaded price frames.
+
+This module keeps recently loaded DataFrames in memory so that repeated
+cache.load_prices() calls in a research session skip Parquet decoding. The
+cache is bounded by a byte budget and evicts least recently used frames first.
+
+Read-Only Frames:
+    Cached frames are stored with read-only column arrays and handed out as
+    shallow copies. Callers can add, drop or reassign columns on the frame they
+    receive, but in-place value edits (df.loc[...] = x) raise ValueError instead
+    of silently corrupting the cached object. Use df.copy() for a writable frame.
+
+Keys:
+    Keys are chosen by the caller. cache.load_prices() includes the source
+    file's resolved path, inode, mtime and size (read with fstat from the
+    open handle) plus the requested range and columns. Cache files are
+    rewritten atomically by renaming a new file over the old one, so the inode
+    changes on every rewrite even when mtime and size do not: a rewritten
+    cache file never serves a stale frame.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+
+import pandas as pd
+import structlog
+
+logger = structlog.get_logger()
+
+# Default byte budget for the shared frame cache (1 GiB)
+DEFAULT_MAX_BYTES = 1 << 30
+
+
+class FrameLRU:
+    """Byte-bounded, thread-safe LRU cache of read-only DataFrames.
+
+    Attributes:
+        max_bytes: Byte budget; 0 disables caching
+        hits: Number of get() calls that found a frame
+        misses: Number of get() calls that found nothing
+        evictions: Number of frames evicted to stay within max_bytes
+
+    Example:
+        >>> lru = FrameLRU(max_bytes=512 * 1024**2)
+        >>> df = lru.put(("sp500", path, mtime_ns), pd.read_parquet(path))
+        >>> lru.get(("sp500", path, mtime_ns)) is not None
+        True
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Create an empty cache.
+
+        Args:
+            max_bytes: Byte budget (default: 1 GiB); 0 disables caching
+
+        Raises:
+            ValueError: If max_bytes is negative
+        """
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must be non-negative, got {max_bytes}")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, tuple[pd.DataFrame, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def current_bytes(self) -> int:
+        """Total size of the cached frames in bytes."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> pd.DataFrame | None:
+        """Return a read-only view of the cached frame, or None on a miss.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Shallow copy of the cached frame (read-only column arrays), or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0].copy(deep=False)
+
+    def put(self, key: Hashable, df: pd.DataFrame) -> pd.DataFrame:
+        """Cache a frame and return a read-only view of it.
+
+        The frame's column arrays are frozen in place (no copy), so the caller
+        should not keep using ``df`` itself for in-place edits. Frames larger
+        than the whole budget are returned read-only but not cached.
+
+        Args:
+            key: Cache key
+            df: Frame to cache
+
+        Returns:
+            Shallow copy of the cached frame (read-only column arrays)
+        """
+        frozen = _freeze(df)
+        size = int(frozen.memory_usage(index=True, deep=True).sum())
+
+        with self._lock:
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+
+            if size <= self.max_bytes:
+                self._entries[key] = (frozen, size)
+                self._bytes += size
+                self._evict_locked()
+
+        return frozen.copy(deep=False)
+
+    def resize(self, max_bytes: int) -> None:
+        """Change the byte budget, evicting frames as needed.
+
+        Args:
+            max_bytes: New byte budget; 0 disables caching and empties the cache
+
+        Raises:
+            ValueError: If max_bytes is negative
+        """
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must be non-negative, got {max_bytes}")
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict_locked()
+
+    def clear(self) -> None:
+        """Drop every cached frame and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return cache counters.
+
+        Returns:
+            Dictionary with hits, misses, evictions, entries, bytes and max_bytes
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _evict_locked(self) -> None:
+        """Evict least recently used frames until within budget (lock held)."""
+        while self._bytes > self.max_bytes and self._entries:
+            key, (_, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+            logger.debug("frame_cache_evicted", key=str(key), bytes=size)
+
+
+def _freeze(df: pd.DataFrame) -> pd.DataFrame:
+    """Rebuild df over read-only views of its column arrays (no data copy)."""
+    columns = {}
+    for name in df.columns:
+        values = df[name].to_numpy()
+        values.flags.writeable = False
+        columns[name] = values
+    return pd.DataFrame(columns, index=df.index, copy=False)
@@ -8,16 +8,42 @@ The loader implements a cache-first strategy:
 2. If cache exists (and not force_refresh), return cached data
 3. If cache misses (or force_refresh=True), fetch from bridge and save to cache
 
+With incremental=True, a cache miss first looks for an older cached range of
+the same universe and only fetches the missing tail of each symbol (see
+load_universe()).
+
+With revalidate=True, a cache hit is first checked against Norgate's last
+quoted date of each cached symbol and its close on the symbol's last cached
+date (one small bridge call per batch of symbols) and only symbols whose data
+changed are refetched (see load_universe()).
+
+With partitioned=True, prices are kept in the per-symbol partition store
+instead (see momo.data.cache): each symbol is cached once, whatever universes
+it belongs to, and only symbols whose partition is missing or does not cover
+the requested range are fetched.
+
+For universes too large to hold in memory twice, iter_universe() yields one
+symbol's frame at a time and stream_universe_to_cache() appends each frame to
+the cache file as it arrives (see cache.PriceWriter).
+
 See docs/architecture/components.md for detailed component specification.
 """
 
-from datetime import date
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from itertools import islice
+from pathlib import Path
 from time import perf_counter
 
+import numpy as np
 import pandas as pd
 import structlog
 
 from momo.data import bridge, cache
+from momo.data.trading_calendar import get_calendar
+from momo.data.worker import BridgeWorker, BridgeWorkerPool
 from momo.utils.exceptions import (
     NDUNotRunningError,
     NorgateBridgeError,
@@ -33,6 +59,16 @@ def load_universe(
     end_date: date,
     universe: str,
     force_refresh: bool = False,
+    batch_size: int | None = None,
+    transport: str = "json",
+    max_workers: int | None = None,
+    incremental: bool = False,
+    partitioned: bool = False,
+    mmap: bool = False,
+    columns: list[str] | None = None,
+    checkpoint: bool = False,
+    revalidate: bool = False,
+    compact: bool = False,
 ) -> pd.DataFrame:
     """Load price data for a universe of symbols with cache-first orchestration.
 
@@ -62,12 +98,61 @@ def load_universe(
         end_date: End date for price data range
         universe: Universe identifier for cache naming (e.g., "russell_1000_cp")
         force_refresh: If True, bypass cache and fetch fresh data (default: False)
+        batch_size: If set, fetch symbols in batches of this size with one bridge
+            round trip per batch (bridge.fetch_price_data_batch). If None (default),
+            fetch one symbol per bridge call.
+        transport: Bridge result transport - "json" (default) or "arrow"
+            (Arrow IPC stream, see bridge.fetch_price_data)
+        max_workers: If set, fetch up to this many symbols concurrently, each on
+            its own bridge worker of a pool (bridge.worker_pool). If None
+            (default), fetch sequentially. Cannot be combined with batch_size.
+        incremental: If True and the exact range is not cached, extend the most
+            recent cached range of this universe that starts on or before
+            start_date: only rows after each symbol's last cached date (and
+            symbols missing from the cache) are fetched, then the merged data is
+            cached for the requested range (default: False). Ignored when
+            force_refresh=True.
+        partitioned: If True, use the per-symbol partition store instead of one
+            cache file per universe and date range. Symbols whose partition
+            already covers the range are read from it; missing or stale
+            partitions are refetched over the union of their cached range and
+            the requested one (default: False). incremental is ignored, and
+            force_refresh refetches every requested symbol.
+        mmap: If True, serve cache hits from the memory-mapped Arrow tier (see
+            cache.load_prices). Numeric columns of such frames are read-only
+            (default: False). Freshly fetched data is returned as usual.
+        columns: Price columns to return, e.g. ["close"] for a momentum signal
+            (default: all columns). Cache hits read only these column chunks;
+            fetches still retrieve and cache every column.
+        checkpoint: If True, save each fetched symbol as a checkpoint as soon as
+            it arrives (see cache.save_checkpoint) and reuse checkpoints left by
+            an earlier, interrupted run of the same universe and range, so only
+            unfinished symbols are fetched (default: False). Checkpoints are
+            removed once the cache file is written; with force_refresh=True,
+            leftover checkpoints are discarded before fetching. Ignored for
+            cache hits and incremental or partitioned loads.
+        revalidate: If True, check the cache file that would serve the request
+            against Norgate before reading it (bridge.fetch_price_status_batch):
+            a cached symbol is stale if Norgate has quotes after its last cached
+            date (within the file's range), or if Norgate's close on that date
+            no longer matches the cached close (corrections, back-adjustments
+            rewrite history). Only
+            stale symbols are refetched, over the file's whole range, and the
+            file is rewritten (default: False). Ignored when force_refresh=True
+            and for partitioned loads.
+        compact: If True, return the compact in-memory representation
+            (cache.compact_prices): float32 prices, int32 volume and a
+            categorical symbol level, about half the memory (default: False).
+            Columns that would lose precision keep their full dtype; the cache
+            itself always stores the full schema.
 
     Returns:
         DataFrame with price data for all symbols, MultiIndex (date, symbol)
 
     Raises:
-        ValueError: If all symbols fail to fetch (logs partial failures as warnings)
+        ValueError: If all symbols fail to fetch (logs partial failures as warnings),
+            if max_workers is not positive or combined with batch_size, or if
+            columns names a column outside the price schema
         CacheError: If cache save operation fails
 
     Note on Error Handling:
@@ -88,16 +173,63 @@ def load_universe(
         ['open', 'high', 'low', 'close', 'volume', 'unadjusted_close', 'dividend']
 
     Note:
-        This implementation uses sequential single-symbol fetching. Batch
-        fetching optimization is deferred to a future story for improved
-        performance (~10x speedup expected).
+        By default symbols are fetched one bridge call at a time. Pass batch_size
+        to fetch many symbols per Windows-side execution, which removes the
+        per-call subprocess overhead (~10x speedup expected for large universes).
+        Alternatively pass max_workers to fetch symbols in parallel over a bounded
+        pool of bridge workers; results keep the input symbol order either way.
+
+        Frames served from the cache have read-only column arrays (they may be
+        shared with the in-memory cache, see cache.load_prices); call copy()
+        before modifying values in place.
+
+        With checkpoint=True, a run that dies partway (NDU restart, bridge
+        timeout) can simply be repeated. Repeat it without force_refresh:
+        a forced refresh discards the checkpoints and fetches every symbol.
+
+        Incremental refresh appends new rows to previously fetched history.
+        Norgate back-adjusts TOTALRETURN/CAPITAL prices when a dividend or split
+        occurs, so periodically run with force_refresh=True to re-base history.
     """
+    if max_workers is not None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        if batch_size is not None:
+            raise ValueError("max_workers and batch_size cannot be combined")
+    cache.check_price_columns(columns)
+
+    if partitioned:
+        partitioned_df = _load_partitioned(
+            symbols=symbols,
+            start_date=start_date,
+            end_date=end_date,
+            universe=universe,
+            force_refresh=force_refresh,
+            batch_size=batch_size,
+            transport=transport,
+            max_workers=max_workers,
+            columns=columns,
+        )
+        return cache.compact_prices(partitioned_df) if compact else partitioned_df
+
     # Step 1: Try cache first (unless force_refresh)
     if not force_refresh:
+        if revalidate:
+            _revalidate_cached(
+                universe=universe,
+                start_date=start_date,
+                end_date=end_date,
+                batch_size=batch_size,
+                transport=transport,
+                max_workers=max_workers,
+            )
         cached_df = cache.load_prices(
             universe=universe,
             start_date=start_date,
             end_date=end_date,
+            mmap=mmap,
+            columns=columns,
+            compact=compact,
         )
         if cached_df is not None:
             logger.info(
@@ -116,6 +248,19 @@ def load_universe(
             end_date=end_date.isoformat(),
             symbols_count=len(symbols),
         )
+
+        if incremental:
+            refreshed_df = _refresh_incremental(
+                symbols=symbols,
+                start_date=start_date,
+                end_date=end_date,
+                universe=universe,
+                batch_size=batch_size,
+                transport=transport,
+                max_workers=max_workers,
+            )
+            if refreshed_df is not None:
+                return _project(refreshed_df, columns, compact)
     else:
         # Force refresh - log and proceed to fetch
         logger.info(
@@ -138,50 +283,36 @@ def load_universe(
         universe=universe,
     )
 
-    # Step 3: Fetch data for each symbol sequentially
-    # Note: Batch optimization deferred to future story
-    symbol_dfs: list[pd.DataFrame] = []
-    failed_symbols: list[tuple[str, Exception]] = []
-
-    for i, symbol in enumerate(symbols, start=1):
-        logger.info(
-            "fetching_symbol",
-            symbol=symbol,
-            index=i,
-            total=len(symbols),
-            start_date=start_date.isoformat(),
-            end_date=end_date.isoformat(),
+    # Step 3: Fetch data for each symbol (sequentially, in parallel or in bridge batches)
+    if checkpoint:
+        if force_refresh:
+            # Checkpoints hold symbols fetched by an earlier run, possibly days ago
+            cache.clear_checkpoints(universe, start_date, end_date)
+        symbol_dfs, failed_symbols = _fetch_checkpointed(
+            symbols=symbols,
+            start_date=start_date,
+            end_date=end_date,
+            universe=universe,
+            batch_size=batch_size,
+            transport=transport,
+            max_workers=max_workers,
+        )
+    else:
+        symbol_dfs, failed_symbols = _fetch_symbols(
+            symbols=symbols,
+            start_date=start_date,
+            end_date=end_date,
+            batch_size=batch_size,
+            transport=transport,
+            max_workers=max_workers,
         )
-
-        try:
-            symbol_df = bridge.fetch_price_data(
-                symbol=symbol,
-                start_date=start_date,
-                end_date=end_date,
-                adjustment="TOTALRETURN",
-                timeout=30,
-            )
-            symbol_dfs.append(symbol_df)
-        except (
-            NDUNotRunningError,
-            WindowsPythonNotFoundError,
-            NorgateBridgeError,
-        ) as e:
-            logger.error(
-                "symbol_fetch_failed",
-                symbol=symbol,
-                error=str(e),
-                error_type=type(e).__name__,
-            )
-            failed_symbols.append((symbol, e))
-            continue  # Continue fetching remaining symbols
 
     # Log partial failure if some symbols failed
     if failed_symbols:
         logger.warning(
             "partial_fetch_failure",
             failed_count=len(failed_symbols),
-            successful_count=len(symbol_dfs),
+            successful_count=len(symbols) - len(failed_symbols),
             failed_symbols=[sym for sym, _ in failed_symbols],
             total_requested=len(symbols),
         )
@@ -220,6 +351,9 @@ def load_universe(
         start_date=start_date,
         end_date=end_date,
     )
+    if checkpoint:
+        # The consolidated file is in place; the checkpoints are now redundant
+        cache.clear_checkpoints(universe, start_date, end_date)
 
     # Log completion with duration
     elapsed = perf_counter() - start_time
@@ -231,4 +365,775 @@ def load_universe(
         duration=elapsed,
     )
 
+    return _project(combined_df, columns, compact)
+
+
+def _project(df: pd.DataFrame, columns: list[str] | None, compact: bool) -> pd.DataFrame:
+    """Apply load_universe()'s column projection and compact representation to fetched data."""
+    if columns is not None:
+        df = df[columns]
+    return cache.compact_prices(df) if compact else df
+
+
+def iter_universe(
+    symbols: list[str],
+    start_date: date,
+    end_date: date,
+    transport: str = "json",
+    max_workers: int | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Fetch a universe from the bridge, yielding one symbol's frame at a time.
+
+    Streaming counterpart of the fetch step of load_universe(): frames are
+    yielded in input symbol order as they arrive, so only the frames in flight
+    are held in memory instead of the whole panel. Failed symbols are logged
+    and skipped. The cache is neither read nor written (see
+    stream_universe_to_cache()).
+
+    Args:
+        symbols: List of ticker symbols to fetch
+        start_date: Start date for price data range
+        end_date: End date for price data range
+        transport: Bridge result transport - "json" (default) or "arrow"
+        max_workers: If set, fetch up to this many symbols concurrently over a
+            bridge worker pool; at most max_workers frames are buffered ahead of
+            the consumer. If None (default), fetch sequentially.
+
+    Yields:
+        Price DataFrame of one symbol with MultiIndex (date, symbol)
+
+    Raises:
+        ValueError: If max_workers is not positive
+
+    Example:
+        >>> for symbol_df in iter_universe(symbols, date(2000, 1, 1), date(2020, 12, 31)):
+        ...     process(symbol_df)
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be positive, got {max_workers}")
+
+    items = enumerate(symbols, start=1)
+
+    if max_workers is None:
+        fetch_one = _symbol_fetcher(len(symbols), start_date, end_date, transport)
+        outcomes: Iterator[pd.DataFrame | Exception] = map(fetch_one, items)
+        yield from _symbol_frames(symbols, outcomes)
+        return
+
+    # The pool stays local to this generator: installing a process-wide worker
+    # (bridge.worker_pool) would route unrelated bridge calls through it while
+    # the consumer holds the stream open
+    with (
+        BridgeWorkerPool(size=max_workers) as pool,
+        ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="momo-fetch") as executor,
+    ):
+        fetch_one = _symbol_fetcher(len(symbols), start_date, end_date, transport, worker=pool)
+        # Keep a bounded window of fetches in flight, consumed in symbol order
+        pending = deque(executor.submit(fetch_one, item) for item in islice(items, max_workers))
+
+        def drain() -> Iterator[pd.DataFrame | Exception]:
+            while pending:
+                outcome = pending.popleft().result()
+                next_item = next(items, None)
+                if next_item is not None:
+                    pending.append(executor.submit(fetch_one, next_item))
+                yield outcome
+
+        try:
+            yield from _symbol_frames(symbols, drain())
+        finally:
+            # Consumer stopped early: don't start the remaining fetches
+            for future in pending:
+                future.cancel()
+
+
+def _symbol_frames(
+    symbols: list[str], outcomes: Iterator[pd.DataFrame | Exception]
+) -> Iterator[pd.DataFrame]:
+    """Turn per-symbol fetch outcomes into (date, symbol) frames, logging failures."""
+    failed_symbols: list[str] = []
+    for symbol, outcome in zip(symbols, outcomes, strict=False):
+        if isinstance(outcome, Exception):
+            failed_symbols.append(symbol)
+            continue
+        yield outcome.set_index("symbol", append=True)
+
+    if failed_symbols:
+        logger.warning(
+            "partial_fetch_failure",
+            failed_count=len(failed_symbols),
+            successful_count=len(symbols) - len(failed_symbols),
+            failed_symbols=failed_symbols,
+            total_requested=len(symbols),
+        )
+
+
+def stream_universe_to_cache(
+    symbols: list[str],
+    start_date: date,
+    end_date: date,
+    universe: str,
+    transport: str = "json",
+    max_workers: int | None = None,
+) -> Path:
+    """Fetch a universe and write it to the cache without holding the full panel.
+
+    Each symbol's frame from iter_universe() is appended to a cache.PriceWriter
+    as its own Parquet row group, so peak memory is roughly one symbol's frame
+    (plus max_workers frames in flight) rather than twice the final panel. The
+    resulting cache file is the one load_universe() would write for the same
+    arguments, and load_universe()/cache.load_prices() serve it afterwards.
+
+    Args:
+        symbols: List of ticker symbols to fetch
+        start_date: Start date for price data range
+        end_date: End date for price data range
+        universe: Universe identifier for cache naming (e.g., "russell_3000_cp")
+        transport: Bridge result transport - "json" (default) or "arrow"
+        max_workers: Concurrent fetches over a bridge worker pool (None = sequential)
+
+    Returns:
+        Path to the written cache file
+
+    Raises:
+        ValueError: If no symbols are given or every symbol fails to fetch (no
+            cache file is written), or if max_workers is not positive
+        CacheError: If a frame fails schema validation or the write fails
+
+    Example:
+        >>> path = stream_universe_to_cache(
+        ...     symbols, date(1995, 1, 1), date(2024, 12, 31), "russell_3000_cp"
+        ... )
+        >>> df = load_universe(symbols, date(1995, 1, 1), date(2024, 12, 31), "russell_3000_cp",
+        ...                    columns=["close"])
+    """
+    if not symbols:
+        raise ValueError("No symbols provided to stream_universe_to_cache")
+
+    start_time = perf_counter()
+    logger.info(
+        "streaming_universe",
+        symbols_count=len(symbols),
+        start_date=start_date.isoformat(),
+        end_date=end_date.isoformat(),
+        universe=universe,
+    )
+
+    with cache.PriceWriter(universe, start_date, end_date) as writer:
+        for symbol_df in iter_universe(symbols, start_date, end_date, transport, max_workers):
+            writer.write(symbol_df)
+        if writer.row_groups == 0:
+            raise ValueError(f"All {len(symbols)} symbols failed to fetch")
+
+    logger.info(
+        "universe_streamed",
+        universe=universe,
+        symbols_count=len(symbols),
+        fetched_count=writer.row_groups,
+        rows=writer.rows,
+        duration=perf_counter() - start_time,
+    )
+    return writer.path
+
+
+def _fetch_checkpointed(
+    symbols: list[str],
+    start_date: date,
+    end_date: date,
+    universe: str,
+    batch_size: int | None,
+    transport: str,
+    max_workers: int | None,
+) -> tuple[list[pd.DataFrame], list[tuple[str, Exception]]]:
+    """Checkpointed variant of _fetch_symbols() for one universe cache file.
+
+    Symbols with a checkpoint from an earlier run are loaded from it; the rest
+    are fetched and checkpointed one by one as they arrive. Frames are returned
+    in input symbol order, shaped like bridge frames (date index, symbol column).
+    """
+    checkpoints = cache.load_checkpoints(universe, start_date, end_date, symbols)
+    remaining = [symbol for symbol in symbols if symbol not in checkpoints]
+    logger.info(
+        "checkpoint_resume",
+        universe=universe,
+        checkpointed_count=len(checkpoints),
+        remaining_count=len(remaining),
+    )
+
+    frames = {symbol: df.reset_index("symbol") for symbol, df in checkpoints.items()}
+
+    def save(symbol_df: pd.DataFrame) -> None:
+        indexed_df = symbol_df.set_index("symbol", append=True)
+        for symbol, partition_df in indexed_df.groupby(level="symbol", sort=False):
+            cache.save_checkpoint(partition_df, universe, start_date, end_date, str(symbol))
+
+    fetched_dfs: list[pd.DataFrame] = []
+    failed_symbols: list[tuple[str, Exception]] = []
+    if remaining:
+        fetched_dfs, failed_symbols = _fetch_symbols(
+            symbols=remaining,
+            start_date=start_date,
+            end_date=end_date,
+            batch_size=batch_size,
+            transport=transport,
+            max_workers=max_workers,
+            on_fetched=save,
+        )
+    for fetched_df in fetched_dfs:
+        for symbol, symbol_df in fetched_df.groupby("symbol", sort=False):
+            frames[str(symbol)] = symbol_df
+
+    symbol_dfs = [frames[symbol] for symbol in symbols if symbol in frames]
+    return symbol_dfs, failed_symbols
+
+
+def _refresh_incremental(
+    symbols: list[str],
+    start_date: date,
+    end_date: date,
+    universe: str,
+    batch_size: int | None,
+    transport: str,
+    max_workers: int | None,
+) -> pd.DataFrame | None:
+    """Extend an older cached range of the universe up to end_date.
+
+    Fetches only rows after each symbol's last cached date (symbols not in the
+    cache are fetched from start_date), merges them into the cached frame and
+    saves the result for (start_date, end_date). The superseded cache file is
+    removed when it starts on start_date. If a tail fetch fails, the symbol
+    keeps its cached rows.
+
+    Returns:
+        Merged DataFrame with MultiIndex (date, symbol), or None if there is no
+        usable cached range (caller falls back to a full fetch)
+
+    Raises:
+        ValueError: If every symbol missing from the cache fails to fetch and
+            no cached symbol remains
+        CacheError: If cache save operation fails
+    """
+    base_range = _find_incremental_base(universe, start_date, end_date)
+    if base_range is None:
+        logger.info("incremental_base_missing", universe=universe, end_date=end_date.isoformat())
+        return None
+
+    base_start, base_end = base_range
+    base_df = cache.load_prices(universe=universe, start_date=base_start, end_date=base_end)
+    if base_df is None:
+        return None
+
+    start_time = perf_counter()
+
+    # Restrict the cached frame to the requested symbols and start date
+    dates = base_df.index.get_level_values("date")
+    symbol_level = base_df.index.get_level_values("symbol")
+    base_df = base_df[(dates >= pd.Timestamp(start_date)) & symbol_level.isin(symbols)]
+
+    # Fetch start per symbol: day after its last cached date, or start_date if new
+    last_dates = base_df.index.to_frame(index=False).groupby("symbol")["date"].max()
+    fetch_starts: dict[date, list[str]] = {}
+    for symbol in symbols:
+        if symbol in last_dates.index:
+            fetch_start = last_dates[symbol].date() + timedelta(days=1)
+        else:
+            fetch_start = start_date
+        if fetch_start <= end_date:
+            fetch_starts.setdefault(fetch_start, []).append(symbol)
+
+    logger.info(
+        "incremental_refresh_started",
+        universe=universe,
+        base_start_date=base_start.isoformat(),
+        base_end_date=base_end.isoformat(),
+        end_date=end_date.isoformat(),
+        cached_symbols=len(last_dates),
+        symbols_to_fetch=sum(len(group) for group in fetch_starts.values()),
+        fetch_groups=len(fetch_starts),
+    )
+
+    # Fetch each group of symbols sharing a fetch start date
+    tail_dfs: list[pd.DataFrame] = []
+    failed_symbols: list[tuple[str, Exception]] = []
+    for fetch_start, group in sorted(fetch_starts.items()):
+        group_dfs, group_failures = _fetch_symbols(
+            symbols=group,
+            start_date=fetch_start,
+            end_date=end_date,
+            batch_size=batch_size,
+            transport=transport,
+            max_workers=max_workers,
+        )
+        tail_dfs.extend(group_dfs)
+        for symbol, error in group_failures:
+            if symbol in last_dates.index:
+                # No new rows (or a transient failure): keep the cached history
+                logger.warning("incremental_tail_fetch_failed", symbol=symbol, error=str(error))
+            else:
+                failed_symbols.append((symbol, error))
+
+    if failed_symbols:
+        logger.warning(
+            "partial_fetch_failure",
+            failed_count=len(failed_symbols),
+            successful_count=len(symbols) - len(failed_symbols),
+            failed_symbols=[sym for sym, _ in failed_symbols],
+            total_requested=len(symbols),
+        )
+
+    frames = [base_df]
+    if tail_dfs:
+        frames.append(pd.concat(tail_dfs, axis=0).set_index("symbol", append=True))
+    combined_df = pd.concat(frames, axis=0)
+    if combined_df.empty:
+        raise ValueError(
+            f"All {len(symbols)} symbols failed to fetch. "
+            f"Failed symbols: {[sym for sym, _ in failed_symbols]}"
+        )
+
+    combined_df = combined_df[~combined_df.index.duplicated(keep="last")]
+    combined_df = cache.order_like_fetch(combined_df, symbols)
+
+    cache.save_prices(
+        df=combined_df,
+        universe=universe,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    if base_start == start_date:
+        # The new file covers everything the old one did
+        cache.invalidate(universe, base_start, base_end)
+
+    logger.info(
+        "incremental_refresh_complete",
+        universe=universe,
+        appended_rows=len(combined_df) - len(base_df),
+        rows=len(combined_df),
+        duration=perf_counter() - start_time,
+    )
+    return combined_df
+
+
+def _revalidate_cached(
+    universe: str,
+    start_date: date,
+    end_date: date,
+    batch_size: int | None,
+    transport: str,
+    max_workers: int | None,
+) -> None:
+    """Refresh the symbols Norgate has updated since the covering cache file was written.
+
+    The file load_prices() would serve (the smallest covering range) is checked
+    with one price status probe per batch of its symbols. A symbol is stale if
+    Norgate has quotes after its last cached date, or if Norgate's close on its
+    last cached date differs from the cached close: back-adjusted history moves
+    every earlier close, so one date is enough to detect it. Stale symbols are
+    refetched over the file's range and the file is rewritten with the same
+    symbols and layout; if a refetch fails, the symbol keeps its cached rows.
+    Symbols the probe cannot resolve are left as cached. Does nothing on a cache
+    miss or when no symbol is stale.
+
+    Raises:
+        NDUNotRunningError: If Norgate Data Updater is not running
+        NorgateBridgeError: If the status probe fails as a whole
+        CacheError: If cache save operation fails
+    """
+    covering_range = cache.find_covering_range(universe, start_date, end_date)
+    if covering_range is None:
+        return
+    entry = cache.get_cache_entry(universe, *covering_range)
+    if entry is None or not entry.symbols:
+        return
+
+    start_time = perf_counter()
+    file_start, file_end = covering_range
+    cached_df = cache.load_prices(universe=universe, start_date=file_start, end_date=file_end)
+    if cached_df is None:
+        return
+    # Each symbol's last cached row: its date is the probe's check date
+    last_rows = cached_df["close"].reset_index().groupby("symbol", sort=False).last()
+    last_cached = last_rows["date"]
+    last_close = last_rows["close"]
+
+    status_df, probe_errors = bridge.fetch_price_status_batch(
+        entry.symbols,
+        check_dates={symbol: day.date() for symbol, day in last_cached.items()},
+        adjustment="TOTALRETURN",
+    )
+    if probe_errors:
+        logger.warning(
+            "revalidation_probe_failed",
+            universe=universe,
+            failed_symbols=sorted(probe_errors),
+        )
+
+    # Quotes can only reach the file's last NYSE trading day, not a weekend or
+    # holiday end date
+    file_days = get_calendar("NYSE").trading_days(file_start, file_end)
+    last_trading_day = file_days[-1] if len(file_days) else pd.Timestamp(file_start)
+
+    stale: list[str] = []
+    for symbol, last_quoted, check_close in status_df[
+        ["symbol", "last_quoted_date", "check_close"]
+    ].itertuples(index=False):
+        if pd.isna(last_quoted) or last_quoted.date() < file_start:
+            continue
+        expected_last = min(last_quoted, last_trading_day)
+        cached_last = last_cached.get(symbol)
+        new_quotes = cached_last is None or cached_last < expected_last
+        # A missing close on a date we hold a quote for is rewritten history too
+        rewritten = cached_last is not None and not np.isclose(
+            check_close, last_close[symbol], rtol=1e-9, atol=0.0
+        )
+        if new_quotes or rewritten:
+            stale.append(symbol)
+
+    logger.info(
+        "cache_revalidated",
+        universe=universe,
+        start_date=file_start.isoformat(),
+        end_date=file_end.isoformat(),
+        symbols_count=len(entry.symbols),
+        stale_count=len(stale),
+        duration=perf_counter() - start_time,
+    )
+    if not stale:
+        return
+
+    fresh_dfs, failed_symbols = _fetch_symbols(
+        symbols=stale,
+        start_date=file_start,
+        end_date=file_end,
+        batch_size=batch_size,
+        transport=transport,
+        max_workers=max_workers,
+    )
+    for symbol, error in failed_symbols:
+        logger.warning("revalidation_refetch_failed", symbol=symbol, error=str(error))
+    if not fresh_dfs:
+        return
+
+    # Replace the refetched symbols' rows wholesale: adjusted history may have shifted
+    fresh_df = pd.concat(fresh_dfs, axis=0).set_index("symbol", append=True)
+    refreshed = fresh_df.index.get_level_values("symbol").unique()
+    kept_df = cached_df[~cached_df.index.get_level_values("symbol").isin(refreshed)]
+    combined_df = pd.concat([kept_df, fresh_df], axis=0)
+
+    combined_df = cache.order_like_fetch(combined_df, entry.symbols)
+
+    cache.save_prices(
+        df=combined_df,
+        universe=universe,
+        start_date=file_start,
+        end_date=file_end,
+    )
+    logger.info(
+        "revalidation_refresh_complete",
+        universe=universe,
+        refreshed_symbols=len(refreshed),
+        rows=len(combined_df),
+        duration=perf_counter() - start_time,
+    )
+
+
+def _load_partitioned(
+    symbols: list[str],
+    start_date: date,
+    end_date: date,
+    universe: str,
+    force_refresh: bool,
+    batch_size: int | None,
+    transport: str,
+    max_workers: int | None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Load a universe from the per-symbol partition store, refreshing stale partitions.
+
+    A partition is stale if it does not cover [start_date, end_date]. It is then
+    refetched over the union of its cached range and the requested range, so
+    partitions only ever grow. If a refetch fails, the symbol keeps whatever
+    rows its existing partition has.
+
+    Returns:
+        DataFrame with MultiIndex (date, symbol) in input symbol order
+
+    Raises:
+        ValueError: If no symbols are given or none has data after fetching
+        CacheError: If a partition save fails
+    """
+    if not symbols:
+        raise ValueError("No symbols provided to load_universe")
+
+    start_time = perf_counter()
+
+    # Group stale symbols by the range their partition must be refetched over
+    cached_ranges: dict[str, tuple[date, date]] = {}
+    fetch_ranges: dict[tuple[date, date], list[str]] = {}
+    for symbol in symbols:
+        cached_range = cache.get_partition_range(symbol)
+        if cached_range is None:
+            fetch_range = (start_date, end_date)
+        else:
+            cached_ranges[symbol] = cached_range
+            cached_start, cached_end = cached_range
+            if not force_refresh and cached_start <= start_date and end_date <= cached_end:
+                continue
+            fetch_range = (min(cached_start, start_date), max(cached_end, end_date))
+        fetch_ranges.setdefault(fetch_range, []).append(symbol)
+
+    logger.info(
+        "partition_load_started",
+        universe=universe,
+        start_date=start_date.isoformat(),
+        end_date=end_date.isoformat(),
+        symbols_count=len(symbols),
+        symbols_to_fetch=sum(len(group) for group in fetch_ranges.values()),
+        force_refresh=force_refresh,
+    )
+
+    fetched_count = 0
+    failed_symbols: list[tuple[str, Exception]] = []
+    for (fetch_start, fetch_end), group in sorted(fetch_ranges.items()):
+        group_dfs, group_failures = _fetch_symbols(
+            symbols=group,
+            start_date=fetch_start,
+            end_date=fetch_end,
+            batch_size=batch_size,
+            transport=transport,
+            max_workers=max_workers,
+        )
+        for group_df in group_dfs:
+            symbol_df = group_df.set_index("symbol", append=True)
+            for symbol, partition_df in symbol_df.groupby(level="symbol", sort=False):
+                cache.save_symbol_prices(partition_df, str(symbol), fetch_start, fetch_end)
+                fetched_count += 1
+        for symbol, error in group_failures:
+            if symbol in cached_ranges:
+                logger.warning("partition_refresh_failed", symbol=symbol, error=str(error))
+            else:
+                failed_symbols.append((symbol, error))
+
+    if failed_symbols:
+        logger.warning(
+            "partial_fetch_failure",
+            failed_count=len(failed_symbols),
+            successful_count=len(symbols) - len(failed_symbols),
+            failed_symbols=[sym for sym, _ in failed_symbols],
+            total_requested=len(symbols),
+        )
+
+    combined_df = cache.load_symbol_prices(symbols, start_date, end_date, columns)
+    if combined_df is None or combined_df.empty:
+        raise ValueError(
+            f"All {len(symbols)} symbols failed to fetch. "
+            f"Failed symbols: {[sym for sym, _ in failed_symbols]}"
+        )
+
+    cache.save_universe_symbols(universe, symbols)
+
+    logger.info(
+        "partition_load_complete",
+        universe=universe,
+        symbols_count=len(symbols),
+        fetched_count=fetched_count,
+        rows=len(combined_df),
+        duration=perf_counter() - start_time,
+    )
     return combined_df
+
+
+def _find_incremental_base(
+    universe: str, start_date: date, end_date: date
+) -> tuple[date, date] | None:
+    """Pick the cached range to extend: starts on/before start_date, ends before end_date.
+
+    Returns the candidate with the latest end date (then latest start), or None.
+    """
+    candidates = [
+        (cached_start, cached_end)
+        for cached_start, cached_end in cache.list_cached_ranges(universe)
+        if cached_start <= start_date <= cached_end < end_date
+    ]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda cached_range: (cached_range[1], cached_range[0]))
+
+
+def _fetch_symbols(
+    symbols: list[str],
+    start_date: date,
+    end_date: date,
+    batch_size: int | None = None,
+    transport: str = "json",
+    max_workers: int | None = None,
+    on_fetched: Callable[[pd.DataFrame], None] | None = None,
+) -> tuple[list[pd.DataFrame], list[tuple[str, Exception]]]:
+    """Fetch price data for symbols via the bridge, collecting per-symbol failures.
+
+    Args:
+        symbols: Ticker symbols to fetch
+        start_date: Start date for price data range
+        end_date: End date for price data range
+        batch_size: Symbols per bridge round trip (None = one call per symbol)
+        transport: Bridge result transport ("json" or "arrow")
+        max_workers: Concurrent fetches over a bridge worker pool (None = sequential)
+        on_fetched: Called with each fetched frame as soon as it arrives (from
+            worker threads when max_workers is set). With batch_size, symbols
+            are then fetched one batch per bridge call so each batch is handed
+            over before the next starts.
+
+    Returns:
+        Tuple of (symbol_dfs, failed_symbols):
+            - symbol_dfs: Fetched DataFrames (date index, symbol column)
+            - failed_symbols: (symbol, exception) pairs in symbol order
+    """
+    if batch_size is not None:
+        if on_fetched is None:
+            return _fetch_symbols_batched(symbols, start_date, end_date, batch_size, transport)
+        symbol_dfs: list[pd.DataFrame] = []
+        failed_symbols: list[tuple[str, Exception]] = []
+        for i in range(0, len(symbols), batch_size):
+            batch_dfs, batch_failures = _fetch_symbols_batched(
+                symbols[i : i + batch_size], start_date, end_date, batch_size, transport
+            )
+            for batch_df in batch_dfs:
+                on_fetched(batch_df)
+            symbol_dfs.extend(batch_dfs)
+            failed_symbols.extend(batch_failures)
+        return symbol_dfs, failed_symbols
+
+    fetch_one = _symbol_fetcher(len(symbols), start_date, end_date, transport, on_fetched)
+
+    items = list(enumerate(symbols, start=1))
+    if max_workers is None:
+        outcomes = [fetch_one(item) for item in items]
+    else:
+        # Each thread checks out its own bridge worker; map() keeps symbol order
+        with (
+            bridge.worker_pool(size=max_workers),
+            ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="momo-fetch"
+            ) as executor,
+        ):
+            outcomes = list(executor.map(fetch_one, items))
+
+    symbol_dfs = []
+    failed_symbols = []
+    for symbol, outcome in zip(symbols, outcomes, strict=True):
+        if isinstance(outcome, Exception):
+            failed_symbols.append((symbol, outcome))
+        else:
+            symbol_dfs.append(outcome)
+
+    return symbol_dfs, failed_symbols
+
+
+def _symbol_fetcher(
+    total: int,
+    start_date: date,
+    end_date: date,
+    transport: str,
+    on_fetched: Callable[[pd.DataFrame], None] | None = None,
+    worker: BridgeWorker | BridgeWorkerPool | None = None,
+) -> Callable[[tuple[int, str]], pd.DataFrame | Exception]:
+    """Build the per-symbol fetch used by _fetch_symbols() and iter_universe().
+
+    The returned function takes (position, symbol) and returns the bridge frame
+    (after passing it to on_fetched, if given), or the bridge exception (already
+    logged) so callers can continue. Fetches run on worker if given, otherwise
+    on the persistent bridge worker or a new subprocess.
+    """
+
+    def fetch_one(item: tuple[int, str]) -> pd.DataFrame | Exception:
+        i, symbol = item
+        logger.info(
+            "fetching_symbol",
+            symbol=symbol,
+            index=i,
+            total=total,
+            start_date=start_date.isoformat(),
+            end_date=end_date.isoformat(),
+        )
+
+        try:
+            symbol_df: pd.DataFrame = bridge.fetch_price_data(
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+                adjustment="TOTALRETURN",
+                timeout=30,
+                transport=transport,
+                worker=worker,
+            )
+        except (
+            NDUNotRunningError,
+            WindowsPythonNotFoundError,
+            NorgateBridgeError,
+        ) as e:
+            logger.error(
+                "symbol_fetch_failed",
+                symbol=symbol,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            return e  # Continue fetching remaining symbols
+
+        if on_fetched is not None:
+            on_fetched(symbol_df)
+        return symbol_df
+
+    return fetch_one
+
+
+def _fetch_symbols_batched(
+    symbols: list[str],
+    start_date: date,
+    end_date: date,
+    batch_size: int,
+    transport: str = "json",
+) -> tuple[list[pd.DataFrame], list[tuple[str, Exception]]]:
+    """Batched variant of _fetch_symbols() built on bridge.fetch_price_data_batch()."""
+    symbol_dfs: list[pd.DataFrame] = []
+    failed_symbols: list[tuple[str, Exception]] = []
+
+    try:
+        batch_df, errors = bridge.fetch_price_data_batch(
+            symbols=symbols,
+            start_date=start_date,
+            end_date=end_date,
+            adjustment="TOTALRETURN",
+            batch_size=batch_size,
+            transport=transport,
+        )
+    except (
+        NDUNotRunningError,
+        WindowsPythonNotFoundError,
+        NorgateBridgeError,
+    ) as e:
+        # Environment-level failure: every symbol fails with the same error
+        for symbol in symbols:
+            logger.error(
+                "symbol_fetch_failed",
+                symbol=symbol,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            failed_symbols.append((symbol, e))
+        return symbol_dfs, failed_symbols
+
+    if not batch_df.empty:
+        symbol_dfs.append(batch_df)
+
+    for symbol in symbols:
+        if symbol in errors:
+            error = NorgateBridgeError(errors[symbol])
+            logger.error(
+                "symbol_fetch_failed",
+                symbol=symbol,
+                error=str(error),
+                error_type=type(error).__name__,
+            )
+            failed_symbols.append((symbol, error))
+
+    return symbol_dfs, failed_symbols
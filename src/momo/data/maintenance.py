@@ -0,0 +1,301 @@
+"""Size-budgeted eviction and compaction of the Parquet price cache.
+
+Every distinct date range passed to loader.load_universe() writes its own
+cache file, so data/cache/prices/ grows without bound on long-running research
+boxes. This module keeps it in check using the cache manifest
+(momo.data.manifest), so no Parquet footer is read to decide what to remove.
+
+Compaction:
+    compact() merges cache files of a universe whose date ranges overlap (and
+    that hold the same symbols) into one file covering their union. Files that
+    merely touch are left alone: with no shared rows there is nothing to check
+    that they were adjusted alike. TOTALRETURN prices are back-adjusted as of
+    the fetch, so files fetched at different times can disagree; a run of files
+    is merged only if every row they share agrees within OVERLAP_RTOL, otherwise
+    it is skipped rather than spliced into a file with a seam. Runs mixing price
+    adjustments (momo:adjustment) are skipped too. Where files agree, rows of
+    the most recently created file win. The superseded files are invalidated;
+    load_prices() serves their ranges from the merged file as superset hits.
+
+Eviction:
+    evict_to_budget() removes least recently used cache files (universe files
+    and symbol partitions) until the cache fits a byte budget. Recency is the
+    manifest's accessed_at, refreshed by cache reads, falling back to
+    created_at for files never read. Derived files (memory-mapped tiers, wide
+    panels) count towards the budget and are removed with their Parquet file.
+
+Reports:
+    Both functions (and run_maintenance()) return a dictionary with
+    files_removed, bytes_before, bytes_after and bytes_reclaimed.
+
+Example:
+    >>> from momo.data import maintenance
+    >>> report = maintenance.run_maintenance(max_bytes=20 * 1024**3)
+    >>> print(f"Reclaimed {report['bytes_reclaimed'] / 1e9:.1f} GB")
+"""
+
+import numpy as np
+import pandas as pd
+import structlog
+
+from momo.data import cache
+from momo.data.manifest import ManifestEntry
+
+logger = structlog.get_logger()
+
+# Relative tolerance for prices that overlapping files both hold
+OVERLAP_RTOL = 1e-9
+
+
+def _entries() -> list[ManifestEntry]:
+    """All universe files and symbol partitions in the manifest."""
+    return cache.list_cache_entries() + cache.list_partition_entries()
+
+
+def _entry_bytes(entry: ManifestEntry) -> int:
+    """Bytes used by an entry's file plus its derived files (mmap tier, panels)."""
+    size = entry.byte_size
+    if entry.kind == "universe":
+        derived = cache.list_derived_files(entry.name, entry.start_date, entry.end_date)
+        size += sum(path.stat().st_size for path in derived)
+    return size
+
+
+def _remove(entry: ManifestEntry) -> None:
+    """Remove an entry's file (and derived files) through the cache API."""
+    if entry.kind == "universe":
+        cache.invalidate(entry.name, entry.start_date, entry.end_date)
+    else:
+        cache.invalidate_partition(entry.name)
+
+
+def _report(files_removed: int, bytes_before: int, bytes_after: int) -> dict[str, int]:
+    return {
+        "files_removed": files_removed,
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "bytes_reclaimed": bytes_before - bytes_after,
+    }
+
+
+def cache_usage() -> dict[str, int]:
+    """Return the number of cache files and the bytes they use.
+
+    Returns:
+        Dictionary with files and bytes (Parquet files plus derived files)
+    """
+    entries = _entries()
+    return {"files": len(entries), "bytes": sum(map(_entry_bytes, entries))}
+
+
+def evict_to_budget(max_bytes: int, dry_run: bool = False) -> dict[str, int]:
+    """Evict least recently used cache files until the cache fits max_bytes.
+
+    Args:
+        max_bytes: Byte budget for universe files, partitions and derived files
+        dry_run: If True, only report what would be removed (default: False)
+
+    Returns:
+        Report dictionary (see module docstring)
+
+    Raises:
+        ValueError: If max_bytes is negative
+    """
+    if max_bytes < 0:
+        raise ValueError(f"max_bytes must be non-negative, got {max_bytes}")
+
+    entries = sorted(_entries(), key=lambda entry: entry.last_used)
+    bytes_before = sum(map(_entry_bytes, entries))
+    total = bytes_before
+    removed = 0
+    for entry in entries:
+        if total <= max_bytes:
+            break
+        size = _entry_bytes(entry)
+        if not dry_run:
+            _remove(entry)
+        logger.info(
+            "cache_evicted",
+            path=str(entry.path),
+            bytes=size,
+            last_used=entry.last_used,
+            dry_run=dry_run,
+        )
+        total -= size
+        removed += 1
+
+    return _report(removed, bytes_before, total)
+
+
+def _clusters(entries: list[ManifestEntry]) -> list[list[ManifestEntry]]:
+    """Group one universe's entries into runs of overlapping ranges.
+
+    Only entries with the same symbols are merged, so a merged file never
+    claims symbols for dates they were not fetched for.
+    """
+    by_symbols: dict[frozenset[str], list[ManifestEntry]] = {}
+    for entry in entries:
+        by_symbols.setdefault(frozenset(entry.symbols), []).append(entry)
+
+    clusters: list[list[ManifestEntry]] = []
+    for group in by_symbols.values():
+        group.sort(key=lambda entry: (entry.start_date, entry.end_date))
+        current = [group[0]]
+        current_end = group[0].end_date
+        for entry in group[1:]:
+            if entry.start_date <= current_end:
+                current.append(entry)
+                current_end = max(current_end, entry.end_date)
+            else:
+                clusters.append(current)
+                current = [entry]
+                current_end = entry.end_date
+        clusters.append(current)
+    return [cluster for cluster in clusters if len(cluster) > 1]
+
+
+def _adjustments(cluster: list[ManifestEntry]) -> set[str]:
+    """Price adjustments (momo:adjustment) of a cluster's files."""
+    return {
+        cache.read_cache_metadata(entry.path).get("momo:adjustment", cache.DEFAULT_ADJUSTMENT)
+        for entry in cluster
+    }
+
+
+def _read_cluster(cluster: list[ManifestEntry]) -> list[pd.DataFrame]:
+    """Read a cluster's files, oldest first."""
+    ordered = sorted(cluster, key=lambda entry: entry.created_at)
+    return [pd.read_parquet(entry.path, engine="pyarrow") for entry in ordered]
+
+
+def _frames_agree(frames: list[pd.DataFrame]) -> bool:
+    """Return True if the files agree, within OVERLAP_RTOL, on every row they share."""
+    seen = frames[0]
+    for df in frames[1:]:
+        shared = seen.index.intersection(df.index)
+        if len(shared):
+            columns = seen.select_dtypes("number").columns.intersection(df.columns)
+            before = seen.loc[shared, columns].to_numpy(dtype=np.float64)
+            after = df.loc[shared, columns].to_numpy(dtype=np.float64)
+            if not np.allclose(before, after, rtol=OVERLAP_RTOL, atol=0.0, equal_nan=True):
+                return False
+        seen = pd.concat([seen, df.loc[df.index.difference(seen.index)]])
+    return True
+
+
+def _merge(universe: str, cluster: list[ManifestEntry], frames: list[pd.DataFrame]) -> None:
+    """Write the union of a cluster's files as one file and invalidate the rest.
+
+    frames are the cluster's files as returned by _read_cluster().
+    """
+    start_date = min(entry.start_date for entry in cluster)
+    end_date = max(entry.end_date for entry in cluster)
+
+    # Oldest first, so keep="last" lets the newest file win on overlapping rows
+    combined_df = pd.concat(frames)
+    combined_df = combined_df[~combined_df.index.duplicated(keep="last")]
+
+    newest = max(cluster, key=lambda entry: entry.created_at)
+    combined_df = cache.order_like_fetch(combined_df, newest.symbols)
+
+    (adjustment,) = _adjustments(cluster)
+    target = cache.save_prices(combined_df, universe, start_date, end_date, adjustment=adjustment)
+    for entry in cluster:
+        if entry.path != target:
+            cache.invalidate(universe, entry.start_date, entry.end_date)
+
+
+def compact(universe: str | None = None, dry_run: bool = False) -> dict[str, int]:
+    """Merge overlapping cache files of each universe into one file.
+
+    A run of files is skipped if its merged range is already cached under a
+    file with different symbols, or if the files disagree on rows they share
+    (see module docstring).
+
+    Args:
+        universe: Universe to compact, or None for every universe
+        dry_run: If True, only report what would be merged (default: False)
+
+    Returns:
+        Report dictionary (see module docstring); files_removed counts the
+        superseded files
+
+    Raises:
+        CacheError: If writing a merged file fails (its inputs are kept)
+    """
+    entries = cache.list_cache_entries(universe)
+    bytes_before = sum(map(_entry_bytes, entries))
+
+    by_universe: dict[str, list[ManifestEntry]] = {}
+    for entry in entries:
+        by_universe.setdefault(entry.name, []).append(entry)
+
+    removed = 0
+    for name, universe_entries in by_universe.items():
+        paths = {entry.path for entry in universe_entries}
+        for cluster in _clusters(universe_entries):
+            start_date = min(entry.start_date for entry in cluster)
+            end_date = max(entry.end_date for entry in cluster)
+            target = cache.get_cache_path(name, start_date, end_date)
+            cluster_paths = {entry.path for entry in cluster}
+            if target in paths and target not in cluster_paths:
+                logger.warning(
+                    "compaction_skipped", universe=name, path=str(target), reason="target_exists"
+                )
+                continue
+            if len(_adjustments(cluster)) > 1:
+                logger.warning(
+                    "compaction_skipped",
+                    universe=name,
+                    files=[str(entry.path) for entry in cluster],
+                    reason="adjustment_mismatch",
+                )
+                continue
+            frames = _read_cluster(cluster)
+            if not _frames_agree(frames):
+                logger.warning(
+                    "compaction_skipped",
+                    universe=name,
+                    files=[str(entry.path) for entry in cluster],
+                    reason="overlap_mismatch",
+                )
+                continue
+
+            logger.info(
+                "cache_compacting",
+                universe=name,
+                start_date=start_date.isoformat(),
+                end_date=end_date.isoformat(),
+                files=[str(entry.path) for entry in cluster],
+                dry_run=dry_run,
+            )
+            if not dry_run:
+                _merge(name, cluster, frames)
+            removed += len(cluster_paths - {target})
+
+    if dry_run:
+        return _report(removed, bytes_before, bytes_before)
+    bytes_after = sum(map(_entry_bytes, cache.list_cache_entries(universe)))
+    return _report(removed, bytes_before, bytes_after)
+
+
+def run_maintenance(max_bytes: int, universe: str | None = None) -> dict[str, int]:
+    """Compact the cache, then evict least recently used files down to max_bytes.
+
+    Args:
+        max_bytes: Byte budget (see evict_to_budget())
+        universe: Restrict compaction to one universe (eviction is always global)
+
+    Returns:
+        Combined report dictionary (see module docstring)
+    """
+    bytes_before = cache_usage()["bytes"]
+    compacted = compact(universe)
+    evicted = evict_to_budget(max_bytes)
+    report = _report(
+        compacted["files_removed"] + evicted["files_removed"],
+        bytes_before,
+        evicted["bytes_after"],
+    )
+    logger.info("cache_maintenance_complete", **report)
+    return report
@@ -0,0 +1,245 @@
+"""SQLite manifest of the Parquet price cache.
+
+The manifest records one row per cache file so that the cache can be listed,
+searched for covering ranges and checked for staleness without opening any
+Parquet footer or scanning the cache directory. momo.data.cache keeps it in
+sync: every save records an entry and invalidate() removes it, each in a single
+SQLite transaction.
+
+Location:
+    data/cache/manifest.sqlite
+
+Entries:
+    kind is "universe" for {universe}_{start}_{end}.parquet files (name is the
+    universe) and "partition" for per-symbol partitions (name is the symbol).
+    Dates are ISO strings, so they compare correctly as text.
+
+Concurrency:
+    Every operation opens its own connection, so a CacheManifest can be shared
+    between threads. SQLite's file locking serializes writers across processes
+    (busy writers are waited for up to BUSY_TIMEOUT seconds). The schema is
+    written once, when the database file is created, not on every connection.
+
+Access Times:
+    accessed_at is refreshed by cache reads (at most once a minute per file and
+    process, see cache.load_prices()) and drives LRU eviction in
+    momo.data.maintenance.
+
+Drift:
+    A process dying between a file rename and its manifest update, or files
+    copied into the cache directory by hand, leave the manifest out of date.
+    cache.rebuild_manifest() rescans the directory and replaces all entries.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+# Seconds to wait for another connection's write transaction
+BUSY_TIMEOUT = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    symbols TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    byte_size INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    schema_version TEXT NOT NULL,
+    accessed_at TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS entries_by_name ON entries (kind, name, start_date, end_date);
+"""
+
+_COLUMNS = (
+    "path, kind, name, start_date, end_date, symbols, row_count, byte_size, "
+    "created_at, schema_version, accessed_at"
+)
+_INSERT = f"INSERT OR REPLACE INTO entries ({_COLUMNS}) VALUES ({', '.join('?' * 11)})"
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """One cache file as recorded in the manifest.
+
+    Attributes:
+        path: Cache file path (as returned by the cache path helpers)
+        kind: "universe" or "partition"
+        name: Universe identifier or symbol
+        start_date: Start of the covered date range
+        end_date: End of the covered date range
+        symbols: Symbols contained in the file
+        row_count: Number of rows
+        byte_size: File size in bytes
+        created_at: momo:created_at of the file (UTC ISO timestamp)
+        schema_version: momo:schema_version of the file
+        accessed_at: UTC ISO timestamp of the last recorded read ("" if never
+            read since it was recorded)
+    """
+
+    path: Path
+    kind: str
+    name: str
+    start_date: date
+    end_date: date
+    symbols: list[str]
+    row_count: int
+    byte_size: int
+    created_at: str
+    schema_version: str
+    accessed_at: str = ""
+
+    @property
+    def last_used(self) -> str:
+        """Timestamp of the last read, or of creation if never read (for LRU)."""
+        return self.accessed_at or self.created_at
+
+    def _row(self) -> tuple[object, ...]:
+        return (
+            self.path.as_posix(),
+            self.kind,
+            self.name,
+            self.start_date.isoformat(),
+            self.end_date.isoformat(),
+            json.dumps(self.symbols),
+            self.row_count,
+            self.byte_size,
+            self.created_at,
+            self.schema_version,
+            self.accessed_at,
+        )
+
+    @classmethod
+    def _from_row(cls, row: tuple[object, ...]) -> "ManifestEntry":
+        path, kind, name, start, end, symbols, rows, size, created_at, version, accessed_at = row
+        return cls(
+            path=Path(str(path)),
+            kind=str(kind),
+            name=str(name),
+            start_date=date.fromisoformat(str(start)),
+            end_date=date.fromisoformat(str(end)),
+            symbols=json.loads(str(symbols)),
+            row_count=int(str(rows)),
+            byte_size=int(str(size)),
+            created_at=str(created_at),
+            schema_version=str(version),
+            accessed_at=str(accessed_at),
+        )
+
+
+class CacheManifest:
+    """Transactional index of cache files stored in one SQLite database.
+
+    Attributes:
+        path: SQLite database file
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._ready = False
+
+    def exists(self) -> bool:
+        """Return True if the database has been created."""
+        return self.path.exists()
+
+    def _create(self) -> None:
+        """Create the database with its schema unless it already exists.
+
+        The schema is written to a temporary file that is then hard-linked
+        into place, so other processes never open a database without tables
+        (a concurrent creator simply wins the race).
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".sqlite.tmp")
+        os.close(fd)
+        try:
+            with closing(sqlite3.connect(tmp_name)) as conn:
+                conn.executescript(_SCHEMA)
+            try:
+                os.link(tmp_name, self.path)
+            except FileExistsError:
+                pass
+        finally:
+            os.unlink(tmp_name)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection and run the block in one transaction (commit or roll back)."""
+        if not self._ready:
+            if not self.path.exists():
+                self._create()
+            self._ready = True
+        with closing(sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)) as conn:
+            with conn:
+                yield conn
+
+    def record(self, entry: ManifestEntry) -> None:
+        """Insert or replace the entry of entry.path."""
+        with self._transaction() as conn:
+            conn.execute(_INSERT, entry._row())
+
+    def remove(self, path: Path) -> bool:
+        """Delete the entry of path.
+
+        Returns:
+            True if an entry was removed
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM entries WHERE path = ?", (path.as_posix(),))
+            return cursor.rowcount > 0
+
+    def touch(self, paths: Iterable[Path], accessed_at: str) -> None:
+        """Set the accessed_at timestamp of the entries of paths (unrecorded paths are ignored)."""
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE entries SET accessed_at = ? WHERE path = ?",
+                [(accessed_at, path.as_posix()) for path in paths],
+            )
+
+    def replace_all(self, entries: Iterable[ManifestEntry]) -> None:
+        """Replace every entry with entries, atomically."""
+        rows = [entry._row() for entry in entries]
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM entries")
+            conn.executemany(_INSERT, rows)
+
+    def get(self, path: Path) -> ManifestEntry | None:
+        """Return the entry of path, or None if it is not recorded."""
+        with self._transaction() as conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM entries WHERE path = ?", (path.as_posix(),)
+            ).fetchone()
+        return None if row is None else ManifestEntry._from_row(row)
+
+    def entries(self, kind: str | None = None, name: str | None = None) -> list[ManifestEntry]:
+        """List entries, optionally restricted to one kind and name.
+
+        Returns:
+            Entries sorted by kind, name, start date and end date
+        """
+        clauses: list[str] = []
+        params: list[str] = []
+        if kind is not None:
+            clauses.append("kind = ?")
+            params.append(kind)
+        if name is not None:
+            clauses.append("name = ?")
+            params.append(name)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._transaction() as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM entries{where} "
+                "ORDER BY kind, name, start_date, end_date",
+                params,
+            ).fetchall()
+        return [ManifestEntry._from_row(row) for row in rows]
@@ -0,0 +1,251 @@
+"""Trading calendars for business-day arithmetic over price data.
+
+This module provides exchange calendars (weekmask plus holiday table) backed by
+numpy business-day routines, so trading-day counts over millions of date pairs
+run as single vectorized calls (np.busday_count) instead of building a
+DatetimeIndex per pair.
+
+Built-in Calendars:
+    - "NYSE": Monday-Friday, excluding NYSE full-day holidays from 1971 through
+      2099 (rule-based table, including presidential Election Days through
+      1980, plus historical special closures such as 2001-09-11 to
+      2001-09-14 and Hurricane Sandy). Early closes count as trading days.
+    - "weekdays": Monday-Friday with no holidays (plain pandas "B" frequency).
+
+Custom Calendars:
+    Create a TradingCalendar with your own holidays/weekmask and register it
+    with register_calendar() to make it available by name.
+
+Example:
+    >>> from datetime import date
+    >>> nyse = get_calendar("NYSE")
+    >>> nyse.count_trading_days(date(2020, 7, 2), date(2020, 7, 7))
+    array(2)  # July 3 (observed Independence Day) and the weekend are skipped
+    >>> custom = TradingCalendar("LSE-lite", holidays=[date(2020, 12, 25)])
+    >>> register_calendar(custom)
+"""
+
+from collections.abc import Iterable
+from datetime import date, timedelta
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+# Scalar dates or arrays of dates accepted by TradingCalendar methods
+DatesLike = date | npt.ArrayLike
+
+# Years covered by the built-in NYSE holiday table
+NYSE_FIRST_YEAR = 1971
+NYSE_LAST_YEAR = 2099
+
+# Unscheduled full-day NYSE closures since 1971
+NYSE_SPECIAL_CLOSURES = [
+    date(1972, 12, 28),  # President Truman funeral
+    date(1973, 1, 25),  # President Johnson funeral
+    date(1977, 7, 14),  # New York City blackout
+    date(1985, 9, 27),  # Hurricane Gloria
+    date(1994, 4, 27),  # President Nixon funeral
+    date(2001, 9, 11),  # September 11 attacks
+    date(2001, 9, 12),
+    date(2001, 9, 13),
+    date(2001, 9, 14),
+    date(2004, 6, 11),  # President Reagan funeral
+    date(2007, 1, 2),  # President Ford funeral
+    date(2012, 10, 29),  # Hurricane Sandy
+    date(2012, 10, 30),
+    date(2018, 12, 5),  # President George H. W. Bush funeral
+    date(2025, 1, 9),  # President Carter funeral
+]
+
+
+class TradingCalendar:
+    """Exchange calendar: a weekmask plus a table of full-day holidays.
+
+    All counting methods accept scalars or arrays of dates and are vectorized
+    via numpy's business-day routines.
+
+    Attributes:
+        name: Calendar name used by the registry (e.g., "NYSE")
+        weekmask: Trading weekdays as a numpy weekmask (e.g., "1111100")
+        holidays: Sorted unique holidays as datetime64[D]
+
+    Example:
+        >>> cal = TradingCalendar("weekdays")
+        >>> cal.is_trading_day(date(2020, 1, 4))  # Saturday
+        array(False)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        holidays: Iterable[date] = (),
+        weekmask: str = "1111100",
+    ) -> None:
+        """Create a calendar.
+
+        Args:
+            name: Calendar name
+            holidays: Full-day closures falling on trading weekdays
+            weekmask: Trading weekdays, Monday first, in numpy weekmask syntax
+                (default: "1111100" = Monday-Friday)
+        """
+        self.name = name
+        self.weekmask = weekmask
+        self.holidays: npt.NDArray[np.datetime64] = np.unique(
+            np.array(list(holidays), dtype="datetime64[D]")
+        )
+        self._busdaycal = np.busdaycalendar(weekmask=weekmask, holidays=self.holidays)
+
+    def __repr__(self) -> str:
+        return f"TradingCalendar({self.name!r}, holidays={len(self.holidays)})"
+
+    def is_trading_day(self, dates: DatesLike) -> npt.NDArray[np.bool_]:
+        """Return whether each date is a trading day.
+
+        Args:
+            dates: Date, datetime64 or array of either
+
+        Returns:
+            Boolean array with the shape of ``dates``
+        """
+        return np.is_busday(_as_days(dates), busdaycal=self._busdaycal)
+
+    def count_trading_days(self, start: DatesLike, end: DatesLike) -> npt.NDArray[np.int64]:
+        """Count trading days in the half-open range [start, end), elementwise.
+
+        Args:
+            start: Range start date(s)
+            end: Range end date(s) (exclusive)
+
+        Returns:
+            Integer array of trading-day counts (negative if end < start)
+        """
+        return np.busday_count(_as_days(start), _as_days(end), busdaycal=self._busdaycal)
+
+    def trading_days(self, start: date, end: date) -> pd.DatetimeIndex:
+        """Return all trading days from start to end, inclusive.
+
+        Args:
+            start: First date
+            end: Last date
+
+        Returns:
+            DatetimeIndex of trading days named "date"
+        """
+        days = np.arange(
+            np.datetime64(start, "D"), np.datetime64(end, "D") + np.timedelta64(1, "D")
+        )
+        return pd.DatetimeIndex(days[self.is_trading_day(days)], name="date")
+
+
+def _as_days(dates: DatesLike) -> npt.NDArray[np.datetime64]:
+    """Convert dates, Timestamps or datetime64 values to datetime64[D]."""
+    if isinstance(dates, pd.Index | pd.Series):
+        dates = dates.to_numpy(dtype="datetime64[ns]")
+    return np.asarray(dates, dtype="datetime64[D]")
+
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7  # noqa: E741 - standard algorithm name
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th given weekday (Monday=0) of a month; n=-1 for the last one."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _observed(holiday: date) -> date:
+    """Saturday holidays are observed on Friday, Sunday holidays on Monday."""
+    if holiday.weekday() == 5:
+        return holiday - timedelta(days=1)
+    if holiday.weekday() == 6:
+        return holiday + timedelta(days=1)
+    return holiday
+
+
+def nyse_holidays(first_year: int = NYSE_FIRST_YEAR, last_year: int = NYSE_LAST_YEAR) -> list[date]:
+    """Generate NYSE full-day holidays for a range of years.
+
+    Args:
+        first_year: First year to generate (default: 1971)
+        last_year: Last year to generate, inclusive (default: 2099)
+
+    Returns:
+        Sorted list of holiday dates, including special closures in range
+    """
+    holidays: list[date] = []
+    for year in range(first_year, last_year + 1):
+        # New Year's Day: Sunday moves to Monday; Saturday is not observed
+        new_year = date(year, 1, 1)
+        if new_year.weekday() != 5:
+            holidays.append(_observed(new_year))
+        if year >= 1998:
+            holidays.append(_nth_weekday(year, 1, 0, 3))  # Martin Luther King Jr. Day
+        holidays.append(_nth_weekday(year, 2, 0, 3))  # Washington's Birthday
+        holidays.append(_easter(year) - timedelta(days=2))  # Good Friday
+        holidays.append(_nth_weekday(year, 5, 0, -1))  # Memorial Day
+        if year >= 2022:
+            holidays.append(_observed(date(year, 6, 19)))  # Juneteenth
+        holidays.append(_observed(date(year, 7, 4)))  # Independence Day
+        holidays.append(_nth_weekday(year, 9, 0, 1))  # Labor Day
+        if year <= 1980 and year % 4 == 0:
+            # Presidential Election Day (Tuesday after the first Monday in November)
+            holidays.append(_nth_weekday(year, 11, 0, 1) + timedelta(days=1))
+        holidays.append(_nth_weekday(year, 11, 3, 4))  # Thanksgiving
+        holidays.append(_observed(date(year, 12, 25)))  # Christmas
+
+    holidays.extend(d for d in NYSE_SPECIAL_CLOSURES if first_year <= d.year <= last_year)
+    return sorted(set(holidays))
+
+
+_calendars: dict[str, TradingCalendar] = {
+    "NYSE": TradingCalendar("NYSE", holidays=nyse_holidays()),
+    "weekdays": TradingCalendar("weekdays"),
+}
+
+
+def register_calendar(calendar: TradingCalendar) -> None:
+    """Make a calendar available to get_calendar() under its name.
+
+    Args:
+        calendar: Calendar to register (replaces any calendar with the same name)
+    """
+    _calendars[calendar.name] = calendar
+
+
+def get_calendar(calendar: "TradingCalendar | str") -> TradingCalendar:
+    """Resolve a calendar name (or pass a TradingCalendar through).
+
+    Args:
+        calendar: Registered calendar name (e.g., "NYSE") or TradingCalendar
+
+    Returns:
+        TradingCalendar
+
+    Raises:
+        ValueError: If the name is not registered
+    """
+    if isinstance(calendar, TradingCalendar):
+        return calendar
+    try:
+        return _calendars[calendar]
+    except KeyError:
+        raise ValueError(
+            f"Unknown trading calendar {calendar!r}. Available: {sorted(_calendars)}"
+        ) from None
@@ -0,0 +1,367 @@
+"""Point-in-time universe construction from index membership.
+
+validation.get_index_constituents_at_date() makes one bridge call per symbol
+per target date, which is fine for a single date but costs hours for monthly
+rebalancing over decades. This module instead fetches each symbol's full
+membership series once and keeps it as an interval store.
+
+Membership Intervals:
+    build_membership() fetches the membership series of every symbol in
+    batches (bridge.fetch_index_membership_batch(), one Windows-side loop per
+    batch) and reduces them to one row per membership spell:
+        symbol, index_name, start (first member date), end (first non-member
+        date, exclusive)
+    Rows are persisted sorted by start under data/cache/constituents/ (see
+    cache.save_membership()), so later runs need no bridge at all.
+
+Lookups:
+    IndexMembership indexes the spells in a centered interval tree flattened
+    into sorted numpy arrays. members_at(date) and members_between(a, b) walk
+    one or two root-to-leaf paths, binary-searching each node, so they cost
+    O(log n + k) for n spells and k results. matrix() answers "who was a member"
+    for a whole list of dates at once as a date x symbol boolean frame.
+
+    A date that is not a trading day takes the membership of the prior trading
+    day, like get_index_constituents_at_date().
+
+Example:
+    >>> membership = build_membership(
+    ...     "Russell 1000 Current & Past", date(2000, 1, 1), date(2020, 12, 31)
+    ... )
+    >>> membership.members_at(date(2008, 6, 30))  # ~1000 symbols
+    >>> month_ends = pd.date_range("2000-01-31", "2020-12-31", freq="ME")
+    >>> matrix = membership.matrix(month_ends)  # 252 dates x ~3000 symbols
+"""
+
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import structlog
+
+from momo.data import bridge, cache
+from momo.utils.exceptions import CacheError, NorgateBridgeError
+
+logger = structlog.get_logger()
+
+# Lookup dates: a list of dates or any array-like of datetime values
+LookupDates = Sequence[date] | npt.ArrayLike
+
+
+class _SpellTree:
+    """Centered interval tree over half-open [start, end) spells, stored as arrays.
+
+    Each node keeps the spells that contain its center twice, ordered by start
+    and by end, as slices of two flat arrays. Because those spells all contain
+    the center, a query date left of the center hits exactly a prefix of the
+    start-ordered slice and a date right of it a suffix of the end-ordered
+    slice, so every node costs one binary search.
+
+    Spell bounds are integer day numbers (datetime64[D] as int64).
+    """
+
+    def __init__(self, starts: npt.NDArray[np.int64], ends: npt.NDArray[np.int64]) -> None:
+        self.centers: list[int] = []
+        self.lefts: list[int] = []
+        self.rights: list[int] = []
+        self.offsets: list[int] = [0]
+        by_start: list[npt.NDArray[np.intp]] = []
+        by_end: list[npt.NDArray[np.intp]] = []
+
+        def build(ids: npt.NDArray[np.intp]) -> int:
+            if len(ids) == 0:
+                return -1
+            # The median start is contained by its own spell, so no node is empty
+            center = int(np.sort(starts[ids])[len(ids) // 2])
+            here = ids[(starts[ids] <= center) & (ends[ids] > center)]
+
+            node = len(self.centers)
+            self.centers.append(center)
+            self.lefts.append(-1)
+            self.rights.append(-1)
+            self.offsets.append(self.offsets[-1] + len(here))
+            by_start.append(here[np.argsort(starts[here], kind="stable")])
+            by_end.append(here[np.argsort(ends[here], kind="stable")])
+
+            self.lefts[node] = build(ids[ends[ids] <= center])
+            self.rights[node] = build(ids[starts[ids] > center])
+            return node
+
+        # Empty spells contain no date and would not shrink the recursion
+        build(np.flatnonzero(ends > starts))
+
+        empty = np.empty(0, dtype=np.intp)
+        self.by_start = np.concatenate(by_start) if by_start else empty
+        self.by_end = np.concatenate(by_end) if by_end else empty
+        self.start_keys = starts[self.by_start]
+        self.end_keys = ends[self.by_end]
+
+    def _prefix_to(self, node: int, day: int) -> npt.NDArray[np.intp]:
+        """Spells of node starting on or before day."""
+        lo, hi = self.offsets[node], self.offsets[node + 1]
+        cut = lo + int(np.searchsorted(self.start_keys[lo:hi], day, side="right"))
+        return self.by_start[lo:cut]
+
+    def _suffix_after(self, node: int, day: int) -> npt.NDArray[np.intp]:
+        """Spells of node ending after day."""
+        lo, hi = self.offsets[node], self.offsets[node + 1]
+        cut = lo + int(np.searchsorted(self.end_keys[lo:hi], day, side="right"))
+        return self.by_end[cut:hi]
+
+    def stab(self, day: int) -> npt.NDArray[np.intp]:
+        """Return ids of the spells containing day (start <= day < end)."""
+        found = [self.by_start[:0]]
+        node = 0 if self.centers else -1
+        while node >= 0:
+            if day < self.centers[node]:
+                found.append(self._prefix_to(node, day))
+                node = self.lefts[node]
+            else:
+                found.append(self._suffix_after(node, day))
+                node = self.rights[node]
+        return np.concatenate(found)
+
+    def overlap(self, first: int, last: int) -> npt.NDArray[np.intp]:
+        """Return ids of the spells containing any day of [first, last]."""
+        found = [self.by_start[:0]]
+        pending = [0] if self.centers else []
+        while pending:
+            node = pending.pop()
+            center = self.centers[node]
+            if last < center:
+                found.append(self._prefix_to(node, last))
+                children = [self.lefts[node]]
+            elif first >= center:
+                found.append(self._suffix_after(node, first))
+                children = [self.rights[node]]
+            else:
+                # Every spell of the node contains center, which is in range
+                found.append(self.by_start[self.offsets[node] : self.offsets[node + 1]])
+                children = [self.lefts[node], self.rights[node]]
+            pending.extend(child for child in children if child >= 0)
+        return np.concatenate(found)
+
+
+def _day_number(day: date) -> int:
+    """Convert a date (or Timestamp) to its datetime64[D] day number."""
+    return int(np.datetime64(pd.Timestamp(day).date(), "D").astype(np.int64))
+
+
+@dataclass(frozen=True, eq=False)
+class IndexMembership:
+    """Membership spells of an index over a covered date range.
+
+    Attributes:
+        index_name: Name of index (e.g., "Russell 1000 Current & Past")
+        start_date: First date lookups may ask about
+        end_date: Last date lookups may ask about
+        intervals: Membership spells with columns symbol, index_name, start and
+            end (exclusive), in any row order
+    """
+
+    index_name: str
+    start_date: date
+    end_date: date
+    intervals: pd.DataFrame
+    _tree: _SpellTree = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        starts = self.intervals["start"].to_numpy(dtype="datetime64[D]").astype(np.int64)
+        ends = self.intervals["end"].to_numpy(dtype="datetime64[D]").astype(np.int64)
+        object.__setattr__(self, "_tree", _SpellTree(starts, ends))
+
+    @property
+    def symbols(self) -> list[str]:
+        """Symbols with at least one membership spell, sorted."""
+        return sorted(self.intervals["symbol"].unique())
+
+    def members_at(self, target_date: date) -> list[str]:
+        """Return the members at a date.
+
+        Args:
+            target_date: Date to look up
+
+        Returns:
+            Sorted member symbols
+
+        Raises:
+            ValueError: If target_date lies outside start_date..end_date
+        """
+        self._check_covered([target_date])
+        spells = self._tree.stab(_day_number(target_date))
+        return sorted(set(self.intervals["symbol"].to_numpy()[spells]))
+
+    def members_between(self, first_date: date, last_date: date) -> list[str]:
+        """Return the symbols that were members on any date of a range.
+
+        Args:
+            first_date: First date of the range
+            last_date: Last date of the range (inclusive)
+
+        Returns:
+            Sorted symbols with membership overlapping first_date..last_date
+
+        Raises:
+            ValueError: If first_date is after last_date or either lies outside
+                start_date..end_date
+        """
+        if first_date > last_date:
+            raise ValueError(f"first_date {first_date} is after last_date {last_date}")
+        self._check_covered([first_date, last_date])
+        spells = self._tree.overlap(_day_number(first_date), _day_number(last_date))
+        return sorted(set(self.intervals["symbol"].to_numpy()[spells]))
+
+    def matrix(self, dates: LookupDates) -> pd.DataFrame:
+        """Return membership of every symbol at each date.
+
+        Args:
+            dates: Dates to look up (dates, Timestamps or datetime64 values)
+
+        Returns:
+            Boolean DataFrame indexed by date (named "date") with one column per
+            symbol in ``symbols``
+
+        Raises:
+            ValueError: If a date lies outside start_date..end_date
+        """
+        days = pd.DatetimeIndex(np.asarray(dates, dtype="datetime64[D]"), name="date")
+        self._check_covered(days)
+
+        codes, symbols = pd.factorize(self.intervals["symbol"], sort=True)
+        columns = pd.Index(symbols, dtype=object)
+        if len(columns) == 0 or len(days) == 0:
+            return pd.DataFrame(False, index=days, columns=columns)
+
+        # (dates x spells) containment test, then OR the spells of each symbol
+        day_values = days.to_numpy()[:, None]
+        active = (self.intervals["start"].to_numpy() <= day_values) & (
+            day_values < self.intervals["end"].to_numpy()
+        )
+        order = np.argsort(codes, kind="stable")
+        group_starts = np.searchsorted(codes[order], np.arange(len(columns)))
+        member = np.logical_or.reduceat(active[:, order], group_starts, axis=1)
+        return pd.DataFrame(member, index=days, columns=columns)
+
+    def _check_covered(self, dates: LookupDates) -> None:
+        """Raise ValueError if any date lies outside start_date..end_date."""
+        days = pd.DatetimeIndex(np.asarray(dates, dtype="datetime64[D]"))
+        outside = (days < pd.Timestamp(self.start_date)) | (days > pd.Timestamp(self.end_date))
+        if outside.any():
+            raise ValueError(
+                f"Dates {[d.date() for d in days[outside]][:5]} are outside the membership "
+                f"range {self.start_date} to {self.end_date} of {self.index_name!r}"
+            )
+
+
+def build_membership(
+    index_name: str,
+    start_date: date,
+    end_date: date,
+    symbols: list[str] | None = None,
+    force_refresh: bool = False,
+    batch_size: int = 100,
+    timeout: int = 300,
+) -> IndexMembership:
+    """Build (or load from cache) the membership spells of an index.
+
+    The cached table is reused when it covers the requested date range and
+    every requested symbol. Otherwise the membership series of all requested
+    symbols is fetched once in batches and the cached table is replaced.
+
+    Args:
+        index_name: Name of index (e.g., "Russell 1000 Current & Past")
+        start_date: First date lookups will ask about
+        end_date: Last date lookups will ask about
+        symbols: Symbols to check (default: every symbol of the index watchlist)
+        force_refresh: Ignore the cached table and refetch (default: False)
+        batch_size: Maximum symbols per bridge round trip (default: 100)
+        timeout: Timeout in seconds for each bridge round trip (default: 300)
+
+    Returns:
+        IndexMembership covering start_date..end_date for the requested symbols
+
+    Raises:
+        NorgateBridgeError: Bridge communication errors, or a symbol failed
+            for a reason other than "not found"
+
+    Note:
+        Symbols the bridge reports as not found (or invalid) are skipped with a
+        warning and treated as never being members, matching
+        get_index_constituents_at_date().
+    """
+    if symbols is None:
+        symbols = bridge.fetch_watchlist_symbols(watchlist_name=index_name, timeout=timeout)
+
+    if not force_refresh:
+        membership = _load_cached_membership(index_name, start_date, end_date, symbols)
+        if membership is not None:
+            return membership
+
+    intervals_df, errors = bridge.fetch_index_membership_batch(
+        symbols,
+        index_name,
+        start_date=start_date,
+        end_date=end_date,
+        batch_size=batch_size,
+        timeout=timeout,
+    )
+
+    for symbol, error in errors.items():
+        # Same split as get_index_constituents_at_date(): unknown symbols are
+        # skipped, anything else is a real bridge failure
+        if not bridge.is_symbol_not_found(error):
+            raise NorgateBridgeError(f"Membership check failed for {symbol}: {error}")
+    if errors:
+        logger.warning(
+            "membership_symbols_skipped",
+            index_name=index_name,
+            skipped_count=len(errors),
+            skipped=sorted(errors)[:10],
+        )
+
+    # Spells still open at the end of the series last through end_date
+    intervals_df["end"] = intervals_df["end"].fillna(pd.Timestamp(end_date + timedelta(days=1)))
+    intervals_df.insert(1, "index_name", index_name)
+    intervals_df = intervals_df.sort_values(["start", "end", "symbol"], ignore_index=True)
+
+    cache.save_membership(intervals_df, index_name, start_date, end_date, symbols)
+    logger.info(
+        "membership_built",
+        index_name=index_name,
+        symbols_count=len(symbols),
+        interval_count=len(intervals_df),
+    )
+    return IndexMembership(index_name, start_date, end_date, intervals_df)
+
+
+def _load_cached_membership(
+    index_name: str, start_date: date, end_date: date, symbols: list[str]
+) -> IndexMembership | None:
+    """Return the cached membership if it covers the range and symbols."""
+    try:
+        cached = cache.load_membership(index_name)
+    except CacheError as e:
+        logger.warning("membership_cache_unreadable", index_name=index_name, error=str(e))
+        return None
+    if cached is None:
+        return None
+
+    intervals_df, metadata = cached
+    try:
+        covered = (
+            date.fromisoformat(metadata["momo:start_date"]) <= start_date
+            and date.fromisoformat(metadata["momo:end_date"]) >= end_date
+            and set(symbols) <= set(json.loads(metadata["momo:symbols"]))
+        )
+    except (KeyError, ValueError):
+        covered = False
+    if not covered:
+        return None
+
+    logger.info("membership_cache_hit", index_name=index_name)
+    requested = intervals_df[intervals_df["symbol"].isin(symbols)].reset_index(drop=True)
+    return IndexMembership(index_name, start_date, end_date, requested)
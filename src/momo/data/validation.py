@@ -74,21 +74,97 @@ Example Usage:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date as date_type
 from datetime import timedelta
-from typing import cast
+from typing import Any, cast
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 import structlog
 
-from momo.data.bridge import fetch_index_constituent_timeseries, fetch_watchlist_symbols
+from momo.data.bridge import (
+    fetch_index_constituent_timeseries,
+    fetch_index_members_batch,
+    fetch_watchlist_symbols,
+    is_symbol_not_found,
+    worker_pool,
+)
+from momo.data.trading_calendar import TradingCalendar, get_calendar
 from momo.utils.exceptions import NorgateBridgeError
 
 logger = structlog.get_logger()
 
 
-def _check_missing_values(prices_df: pd.DataFrame) -> dict[str, int]:
+@dataclass(frozen=True)
+class _SortedPanel:
+    """Index arrays of a price panel, sorted once by (symbol, date).
+
+    Built by _sort_panel() and shared by all validation checks, so a full
+    validation sorts the panel a single time and never copies the frame. Only
+    the columns a check needs are gathered into sorted order (see column()).
+
+    Attributes:
+        symbols: Unique symbols in order of first appearance
+        row_codes: Symbol code of every row, in input row order
+        order: Permutation sorting input rows by (symbol code, date)
+        codes: Symbol code per sorted row
+        dates: Date per sorted row (datetime64[ns])
+        same_symbol: For sorted rows 1..n-1, whether the row belongs to the same
+            symbol as the row before it
+    """
+
+    symbols: list[str]
+    row_codes: npt.NDArray[np.intp]
+    order: npt.NDArray[np.intp]
+    codes: npt.NDArray[np.intp]
+    dates: npt.NDArray[np.datetime64]
+    same_symbol: npt.NDArray[np.bool_]
+
+    def column(self, prices_df: pd.DataFrame, name: str) -> npt.NDArray[Any]:
+        """Return a column's values in sorted row order."""
+        values: npt.NDArray[Any] = prices_df[name].to_numpy()[self.order]
+        return values
+
+    def last_rows(self) -> npt.NDArray[np.intp]:
+        """Return the sorted position of each symbol's last (latest) row."""
+        is_last = np.ones(len(self.codes), dtype=bool)
+        is_last[:-1] = ~self.same_symbol
+        return np.flatnonzero(is_last)
+
+
+def _sort_panel(prices_df: pd.DataFrame) -> _SortedPanel | None:
+    """Sort a (date, symbol) MultiIndex panel's index once for vectorized checks.
+
+    Args:
+        prices_df: Price data with MultiIndex (date, symbol)
+
+    Returns:
+        _SortedPanel, or None if prices_df does not have a MultiIndex
+    """
+    if not isinstance(prices_df.index, pd.MultiIndex):
+        return None
+
+    row_codes, uniques = pd.factorize(prices_df.index.get_level_values("symbol"))
+    row_dates = prices_df.index.get_level_values("date").to_numpy()
+    order = np.lexsort((row_dates, row_codes))
+    codes = row_codes[order]
+
+    return _SortedPanel(
+        symbols=list(uniques),
+        row_codes=row_codes,
+        order=order,
+        codes=codes,
+        dates=row_dates[order],
+        same_symbol=codes[1:] == codes[:-1],
+    )
+
+
+def _check_missing_values(
+    prices_df: pd.DataFrame, panel: _SortedPanel | None = None
+) -> dict[str, int]:
     """Detect missing values (NaN) in critical OHLC price columns.
 
     Scans the DataFrame for NaN values in open, high, low, and close columns,
@@ -96,6 +172,7 @@ def _check_missing_values(prices_df: pd.DataFrame) -> dict[str, int]:
 
     Args:
         prices_df: Price data with MultiIndex (date, symbol) and OHLC columns
+        panel: Pre-sorted panel from _sort_panel() (built if None)
 
     Returns:
         dict[str, int]: Mapping of ticker symbol -> total NaN count across OHLC columns.
@@ -112,57 +189,58 @@ def _check_missing_values(prices_df: pd.DataFrame) -> dict[str, int]:
             - close: float64
 
     Note:
-        This function preserves input DataFrame immutability by using df.copy().
+        The input DataFrame is neither modified nor copied (ADR-004). NaN flags
+        are counted per ticker with a single bincount per column.
     """
-    df = prices_df.copy()  # Preserve input immutability (ADR-004)
-
     result: dict[str, int] = {}
 
-    # Get unique symbols from MultiIndex
-    if isinstance(df.index, pd.MultiIndex):
-        symbols = df.index.get_level_values("symbol").unique().tolist()
-    else:
+    panel = panel if panel is not None else _sort_panel(prices_df)
+    if panel is None:
         return result  # Empty result for non-MultiIndex
 
-    # Check each ticker for NaN values in OHLC columns
-    for ticker in symbols:
-        # Extract data for this ticker using MultiIndex slicing
-        ticker_data = df.loc[(slice(None), ticker), :]
-
-        # Count NaN values across all critical OHLC columns
-        nan_count = (
-            ticker_data["open"].isna().sum()
-            + ticker_data["high"].isna().sum()
-            + ticker_data["low"].isna().sum()
-            + ticker_data["close"].isna().sum()
+    # Count NaN values per ticker across all critical OHLC columns
+    nan_counts = np.zeros(len(panel.symbols), dtype=np.int64)
+    for column in ("open", "high", "low", "close"):
+        is_nan = pd.isna(prices_df[column].to_numpy())
+        nan_counts += np.bincount(panel.row_codes[is_nan], minlength=len(panel.symbols))
+
+    # Only include tickers with at least one NaN
+    for code in np.flatnonzero(nan_counts):
+        ticker = panel.symbols[code]
+        nan_count = int(nan_counts[code])
+        result[ticker] = nan_count
+        logger.warning(
+            "Missing data detected",
+            layer="data",
+            operation="_check_missing_values",
+            ticker=ticker,
+            nan_count=nan_count,
         )
 
-        # Only include tickers with at least one NaN
-        if nan_count > 0:
-            result[ticker] = nan_count
-            logger.warning(
-                "Missing data detected",
-                layer="data",
-                operation="_check_missing_values",
-                ticker=ticker,
-                nan_count=nan_count,
-            )
-
     return result
 
 
 def _check_date_gaps(
-    prices_df: pd.DataFrame, threshold_days: int = 10
+    prices_df: pd.DataFrame,
+    threshold_days: int = 10,
+    panel: _SortedPanel | None = None,
+    calendar: TradingCalendar | str = "NYSE",
 ) -> dict[str, list[tuple[date_type, date_type]]]:
     """Detect suspicious date gaps in price time series data.
 
-    Identifies gaps of 10 or more business days in each ticker's time series,
-    which may indicate missing data or data quality issues. Uses pandas business
-    day logic to avoid false positives from weekends.
+    Identifies gaps of 10 or more trading days in each ticker's time series,
+    which may indicate missing data or data quality issues. Uses an exchange
+    trading calendar to avoid false positives from weekends and holidays.
 
     Args:
         prices_df: Price data with MultiIndex (date, symbol) and OHLC columns
-        threshold_days: Minimum business days gap to flag as suspicious (default: 10)
+        threshold_days: Minimum trading days gap to flag as suspicious (default: 10).
+            A gap is the number of trading days after the last date before the gap
+            up to and including the first date after it, so consecutive trading
+            days have a gap of 1.
+        panel: Pre-sorted panel from _sort_panel() (built if None)
+        calendar: Trading calendar or registered calendar name (default: "NYSE",
+            see momo.data.trading_calendar; "weekdays" ignores holidays)
 
     Returns:
         dict[str, list[tuple[date_type, date_type]]]: Mapping of ticker symbol ->
@@ -176,66 +254,57 @@ def _check_date_gaps(
         Columns:
             - Any columns (only index used for gap detection)
 
+    Raises:
+        ValueError: If calendar names an unregistered calendar
+
     Note:
-        This function uses pandas business day logic (freq='B') to count weekdays only.
-        It does NOT use NYSE holiday calendar, so may flag single-day market holidays
-        as suspicious if they extend a weekend to create >= 10 business days gap.
-        For most practical purposes, this limitation is acceptable as 10-day threshold
-        is well above typical holiday closures (1-2 days).
+        Gap sizes for all consecutive date pairs of all tickers are computed at
+        once with np.busday_count over the calendar's holiday table. Because
+        exchange holidays are not counted, thresholds well below 10 days can be
+        used without flagging holiday weekends.
     """
-    df = prices_df.copy()  # Preserve input immutability (ADR-004)
-
     result: dict[str, list[tuple[date_type, date_type]]] = {}
+    trading_calendar = get_calendar(calendar)
 
-    # Get unique symbols from MultiIndex
-    if isinstance(df.index, pd.MultiIndex):
-        symbols = df.index.get_level_values("symbol").unique().tolist()
-    else:
+    panel = panel if panel is not None else _sort_panel(prices_df)
+    if panel is None:
         return result  # Empty result for non-MultiIndex
 
-    # Check each ticker for date gaps
-    for ticker in symbols:
-        # Extract dates for this ticker using MultiIndex slicing
-        ticker_data = df.loc[(slice(None), ticker), :]
-        ticker_dates = ticker_data.index.get_level_values("date").unique().sort_values()
-
-        if len(ticker_dates) < 2:
-            continue  # Skip tickers with single date (no gaps possible)
-
-        gaps: list[tuple[date_type, date_type]] = []
-
-        # Check consecutive date pairs for suspicious gaps
-        for i in range(len(ticker_dates) - 1):
-            date_before = ticker_dates[i]
-            date_after = ticker_dates[i + 1]
-
-            # Count business days between dates using pandas business day calendar
-            # This automatically excludes weekends from the count
-            business_days = pd.bdate_range(start=date_before, end=date_after, freq="B")
-            gap_size = len(business_days) - 1  # -1 because bdate_range includes both endpoints
-
-            # Flag gaps >= threshold_days business days
-            if gap_size >= threshold_days:
-                gaps.append((date_before.date(), date_after.date()))
-                logger.warning(
-                    "Date gap detected",
-                    layer="data",
-                    operation="_check_date_gaps",
-                    ticker=ticker,
-                    gap_start=date_before.date(),
-                    gap_end=date_after.date(),
-                    gap_business_days=gap_size,
-                )
-
-        # Only include tickers with at least one gap
-        if gaps:
-            result[ticker] = gaps
+    # Consecutive distinct dates of the same ticker (duplicate dates are skipped)
+    days = panel.dates.astype("datetime64[D]")
+    is_pair = panel.same_symbol & (days[1:] != days[:-1])
+    pair_positions = np.flatnonzero(is_pair)
+    days_before = days[pair_positions]
+    days_after = days[pair_positions + 1]
+
+    # Trading days in (date_before, date_after], all pairs in one vectorized call
+    one_day = np.timedelta64(1, "D")
+    gap_sizes = trading_calendar.count_trading_days(days_before + one_day, days_after + one_day)
+
+    # Flag gaps >= threshold_days trading days (sorted by ticker, then date)
+    for i in np.flatnonzero(gap_sizes >= threshold_days):
+        ticker = panel.symbols[panel.codes[pair_positions[i]]]
+        date_before = days_before[i].astype(date_type)
+        date_after = days_after[i].astype(date_type)
+        result.setdefault(ticker, []).append((date_before, date_after))
+        logger.warning(
+            "Date gap detected",
+            layer="data",
+            operation="_check_date_gaps",
+            ticker=ticker,
+            gap_start=date_before,
+            gap_end=date_after,
+            gap_business_days=int(gap_sizes[i]),
+            calendar=trading_calendar.name,
+        )
 
     return result
 
 
 def _check_adjustment_consistency(
-    prices_df: pd.DataFrame, threshold_pct: float = 0.40
+    prices_df: pd.DataFrame,
+    threshold_pct: float = 0.40,
+    panel: _SortedPanel | None = None,
 ) -> list[str]:
     """Detect suspected adjustment factor inconsistencies in price data.
 
@@ -247,6 +316,7 @@ def _check_adjustment_consistency(
         prices_df: Price data with MultiIndex (date, symbol) and OHLC columns
         threshold_pct: Percentage change threshold for flagging suspicious jumps
             (default: 0.40 = 40%)
+        panel: Pre-sorted panel from _sort_panel() (built if None)
 
     Returns:
         list[str]: List of ticker symbols with suspected adjustment issues.
@@ -272,27 +342,29 @@ def _check_adjustment_consistency(
         - Stocks with undocumented corporate actions
         Use ValidationReport context to manually review flagged tickers.
     """
-    df = prices_df.copy()  # Preserve input immutability (ADR-004)
-
     result: list[str] = []
 
-    # Get unique symbols from MultiIndex
-    if isinstance(df.index, pd.MultiIndex):
-        symbols = df.index.get_level_values("symbol").unique().tolist()
-    else:
+    panel = panel if panel is not None else _sort_panel(prices_df)
+    if panel is None:
         return result  # Empty result for non-MultiIndex
 
-    # Check each ticker for adjustment issues
-    for ticker in symbols:
-        # Extract data for this ticker using MultiIndex slicing
-        ticker_data = df.loc[(slice(None), ticker), :]
+    close = panel.column(prices_df, "close")
+    dividend = panel.column(prices_df, "dividend")
+
+    # Check 1: Negative prices (always invalid)
+    negative = np.zeros(len(panel.symbols), dtype=bool)
+    negative[panel.codes[close < 0]] = True
 
-        # Sort by date to ensure chronological order for pct_change calculation
-        ticker_data = ticker_data.sort_index()
+    # Check 2: Large day-over-day jumps without dividend, within each ticker
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct_changes = close[1:] / close[:-1] - 1
+    is_jump = panel.same_symbol & (np.abs(pct_changes) > threshold_pct) & (dividend[1:] == 0.0)
+    jump_positions = np.flatnonzero(is_jump) + 1
+    jump_codes, first_jumps = np.unique(panel.codes[jump_positions], return_index=True)
+    first_jump_by_code = dict(zip(jump_codes.tolist(), jump_positions[first_jumps], strict=True))
 
-        # Check 1: Negative prices (always invalid)
-        negative_prices = ticker_data["close"] < 0
-        if negative_prices.any():
+    for code, ticker in enumerate(panel.symbols):
+        if negative[code]:
             result.append(ticker)
             logger.warning(
                 "Negative price detected",
@@ -301,29 +373,18 @@ def _check_adjustment_consistency(
                 ticker=ticker,
                 issue_type="negative_price",
             )
-            continue  # Skip further checks if already flagged
-
-        # Check 2: Large price jumps without dividend
-        # Calculate day-over-day percentage change in close price
-        pct_changes = ticker_data["close"].pct_change(fill_method=None)
-
-        # Find dates where |pct_change| > threshold AND dividend == 0
-        # Large jumps with dividend are likely justified (dividend payout or split with dividend)
-        suspicious_jumps = (pct_changes.abs() > threshold_pct) & (ticker_data["dividend"] == 0.0)
-
-        if suspicious_jumps.any():
+        elif code in first_jump_by_code:
             result.append(ticker)
-            # Get the first suspicious jump for logging
-            first_jump_idx = suspicious_jumps[suspicious_jumps].index[0]
-            jump_date = first_jump_idx[0]  # Extract date from MultiIndex tuple
-            jump_pct = pct_changes.loc[first_jump_idx]
+            # Log the first suspicious jump
+            position = first_jump_by_code[code]
+            jump_pct = pct_changes[position - 1]
             logger.warning(
                 "Suspicious price jump detected",
                 layer="data",
                 operation="_check_adjustment_consistency",
                 ticker=ticker,
                 issue_type="large_jump_no_dividend",
-                jump_date=jump_date,
+                jump_date=pd.Timestamp(panel.dates[position]),
                 jump_pct=f"{jump_pct * 100:.2f}%",
                 threshold_pct=f"{threshold_pct * 100:.0f}%",
             )
@@ -336,6 +397,8 @@ def get_index_constituents_at_date(
     target_date: date_type,
     symbols: list[str] | None = None,
     timeout: int = 300,
+    batch_size: int | None = None,
+    max_workers: int | None = None,
 ) -> list[str]:
     """Get list of symbols that were index members at a specific date.
 
@@ -349,13 +412,19 @@ def get_index_constituents_at_date(
         target_date: Date to check membership (datetime.date object)
         symbols: Optional list of symbols to check (if None, retrieves all from watchlist)
         timeout: Bridge timeout in seconds (default: 300s for full universe)
+        batch_size: If set, check symbols in chunks of this size with one
+            Windows-side loop per chunk instead of one bridge call per symbol
+        max_workers: If set, check chunks concurrently over a pool of this many
+            bridge workers (batch_size defaults to 100 when only this is set)
 
     Returns:
-        list[str]: List of ticker symbols that were index members at target_date.
-            Returns empty list if no constituents found or all symbols fail.
+        list[str]: List of ticker symbols that were index members at target_date,
+            in input (or watchlist) order. Returns empty list if no constituents
+            found or all symbols fail.
 
     Raises:
-        ValueError: Invalid index name (index not found in Norgate database)
+        ValueError: Invalid index name (index not found in Norgate database),
+            or batch_size/max_workers not positive
         NorgateBridgeError: Bridge communication errors or timeouts
 
     Example:
@@ -375,13 +444,27 @@ def get_index_constituents_at_date(
         ... )
         >>> print(filtered)
         ['AAPL', 'MSFT']  # XYZ was not in index
+        >>>
+        >>> # Whole watchlist in chunks of 200, four chunks at a time
+        >>> constituents = get_index_constituents_at_date(
+        ...     "Russell 3000 Current & Past", date(2010, 1, 1), batch_size=200, max_workers=4
+        ... )
 
     Note:
         - Use "Current & Past" index names to include delisted securities
         - Uses narrow date window (±5 days) to minimize bridge data transfer
         - Invalid symbols are skipped with warning (not raised as errors)
-        - Performance: ~7ms per symbol check via bridge (~7s for 1000 symbols)
+        - Performance: ~7ms per symbol check via bridge (~7s for 1000 symbols);
+          batch_size/max_workers remove the per-call overhead and return the
+          same list with the same skip/raise behavior
+        - For many target dates, use universe.build_membership(), which fetches
+          each symbol's membership series once
     """
+    if batch_size is not None and batch_size < 1:
+        raise ValueError(f"batch_size must be positive, got {batch_size}")
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be positive, got {max_workers}")
+
     logger.info(
         "Getting index constituents at date",
         layer="data",
@@ -407,6 +490,30 @@ def get_index_constituents_at_date(
             symbol_count=len(symbols),
         )
 
+    if batch_size is None and max_workers is None:
+        constituents = _check_constituents_serially(index_name, target_date, symbols, timeout)
+    else:
+        constituents = _check_constituents_batched(
+            index_name, target_date, symbols, timeout, batch_size or 100, max_workers
+        )
+
+    logger.info(
+        "Index constituents retrieved",
+        layer="data",
+        operation="get_index_constituents_at_date",
+        index_name=index_name,
+        target_date=target_date,
+        total_checked=len(symbols) if symbols else 0,
+        constituents_found=len(constituents),
+    )
+
+    return constituents
+
+
+def _check_constituents_serially(
+    index_name: str, target_date: date_type, symbols: list[str], timeout: int
+) -> list[str]:
+    """Check index membership one bridge call per symbol (±5 day window)."""
     constituents: list[str] = []
 
     # Use narrow date window (±5 days) to minimize data transfer
@@ -478,8 +585,7 @@ def get_index_constituents_at_date(
         except NorgateBridgeError as e:
             # Check if this is an invalid symbol/index error (should skip)
             # vs a real bridge communication error (should raise)
-            error_message = str(e).lower()
-            if "not found" in error_message or "not found" in error_message:
+            if is_symbol_not_found(str(e)):
                 # Invalid symbol/index - log warning and skip
                 logger.warning(
                     "Constituent check failed",
@@ -503,23 +609,94 @@ def get_index_constituents_at_date(
                 )
                 raise
 
-    logger.info(
-        "Index constituents retrieved",
-        layer="data",
-        operation="get_index_constituents_at_date",
-        index_name=index_name,
-        target_date=target_date,
-        total_checked=len(symbols) if symbols else 0,
-        constituents_found=len(constituents),
-    )
-
     return constituents
 
 
+def _check_constituents_batched(
+    index_name: str,
+    target_date: date_type,
+    symbols: list[str],
+    timeout: int,
+    batch_size: int,
+    max_workers: int | None,
+) -> list[str]:
+    """Batched variant of _check_constituents_serially() on fetch_index_members_batch().
+
+    Each chunk of symbols is resolved by one Windows-side loop; with max_workers,
+    chunks run concurrently over a bridge worker pool. Per-symbol errors get the
+    same treatment as in the serial check: "not found" is skipped, anything
+    else is raised. Members are returned in input symbol order.
+    """
+    chunks = [symbols[i : i + batch_size] for i in range(0, len(symbols), batch_size)]
+
+    def check(chunk: list[str]) -> tuple[list[str], list[str], dict[str, str]]:
+        try:
+            return fetch_index_members_batch(chunk, index_name, target_date, timeout=timeout)
+        except NorgateBridgeError as e:
+            # Whole round trip failed (timeout, crash) - same as a serial bridge error
+            logger.error(
+                "Bridge error during constituent check",
+                layer="data",
+                operation="get_index_constituents_at_date",
+                index_name=index_name,
+                symbol_count=len(chunk),
+                error=str(e),
+            )
+            raise
+
+    if max_workers is None:
+        results = [check(chunk) for chunk in chunks]
+    else:
+        # Each thread checks out its own bridge worker; map() keeps chunk order
+        with (
+            worker_pool(size=max_workers),
+            ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="momo-constituents"
+            ) as executor,
+        ):
+            results = list(executor.map(check, chunks))
+
+    members: set[str] = set()
+    for chunk_members, empty, errors in results:
+        for symbol in empty:
+            logger.warning(
+                "No constituent data for symbol, skipping",
+                layer="data",
+                operation="get_index_constituents_at_date",
+                symbol=symbol,
+                index_name=index_name,
+                target_date=target_date,
+            )
+        for symbol, error in errors.items():
+            if is_symbol_not_found(error):
+                logger.warning(
+                    "Constituent check failed",
+                    layer="data",
+                    operation="get_index_constituents_at_date",
+                    symbol=symbol,
+                    index_name=index_name,
+                    error=error,
+                )
+                continue
+            logger.error(
+                "Bridge error during constituent check",
+                layer="data",
+                operation="get_index_constituents_at_date",
+                symbol=symbol,
+                index_name=index_name,
+                error=error,
+            )
+            raise NorgateBridgeError(f"Constituent check failed for {symbol}: {error}")
+        members.update(chunk_members)
+
+    return [symbol for symbol in symbols if symbol in members]
+
+
 def check_delisting_status(
     prices_df: pd.DataFrame,
     query_end_date: date_type | None = None,
     threshold_days: int = 30,
+    panel: _SortedPanel | None = None,
 ) -> dict[str, date_type]:
     """Detect delisted tickers by identifying time series ending before query date.
 
@@ -532,6 +709,8 @@ def check_delisting_status(
         prices_df: Price data with MultiIndex (date, symbol) and OHLC columns
         query_end_date: Expected end date for active securities (default: max date in DataFrame)
         threshold_days: Minimum days before query_end_date to flag as delisted (default: 30)
+        panel: Pre-sorted panel from _sort_panel() (built if None); used by
+            validate_prices() to share one sort across all checks
 
     Returns:
         dict[str, date_type]: Mapping of ticker symbol -> last trading date.
@@ -564,49 +743,36 @@ def check_delisting_status(
         >>> print(delistings)
         {'ENRN': datetime.date(2001, 12, 2)}
     """
-    df = prices_df.copy()  # Preserve input immutability (ADR-004)
-
     result: dict[str, date_type] = {}
 
-    # Get unique symbols from MultiIndex
-    if isinstance(df.index, pd.MultiIndex):
-        symbols = df.index.get_level_values("symbol").unique().tolist()
-        dates = df.index.get_level_values("date")
-    else:
-        return result  # Empty result for non-MultiIndex
+    panel = panel if panel is not None else _sort_panel(prices_df)
+    if panel is None or len(panel.codes) == 0:
+        return result  # Empty result for non-MultiIndex or empty frame
 
     # Use max date in DataFrame if query_end_date not specified
+    last_rows = panel.last_rows()
+    last_days = panel.dates[last_rows].astype("datetime64[D]")
     if query_end_date is None:
-        query_end_date = dates.max().date()
-
-    # Check each ticker's last trading date
-    for ticker in symbols:
-        # Extract dates for this ticker using MultiIndex slicing
-        ticker_data = df.loc[(slice(None), ticker), :]
-        ticker_dates = ticker_data.index.get_level_values("date")
-
-        if len(ticker_dates) == 0:
-            continue  # Skip tickers with no data
-
-        # Get last trading date for this ticker
-        last_date = ticker_dates.max().date()
-
-        # Calculate gap between last date and query end date
-        gap_days = (query_end_date - last_date).days
-
-        # Flag as delisted if gap exceeds threshold
-        if gap_days > threshold_days:
-            result[ticker] = last_date
-            logger.warning(
-                "Delisting detected",
-                layer="data",
-                operation="check_delisting_status",
-                ticker=ticker,
-                last_trading_date=last_date,
-                query_end_date=query_end_date,
-                gap_days=gap_days,
-                threshold_days=threshold_days,
-            )
+        query_end_date = last_days.max().astype(date_type)
+
+    # Gap between each ticker's last trading date and the query end date
+    gap_days = (np.datetime64(query_end_date, "D") - last_days).astype(np.int64)
+
+    # Flag as delisted if gap exceeds threshold
+    for i in np.flatnonzero(gap_days > threshold_days):
+        ticker = panel.symbols[panel.codes[last_rows[i]]]
+        last_date = last_days[i].astype(date_type)
+        result[ticker] = last_date
+        logger.warning(
+            "Delisting detected",
+            layer="data",
+            operation="check_delisting_status",
+            ticker=ticker,
+            last_trading_date=last_date,
+            query_end_date=query_end_date,
+            gap_days=int(gap_days[i]),
+            threshold_days=threshold_days,
+        )
 
     return result
 
@@ -693,7 +859,12 @@ class ValidationReport:
         return "\n".join(lines)
 
 
-def validate_prices(prices_df: pd.DataFrame, check_delistings: bool = True) -> ValidationReport:
+def validate_prices(
+    prices_df: pd.DataFrame,
+    check_delistings: bool = True,
+    calendar: TradingCalendar | str = "NYSE",
+    gap_threshold_days: int = 10,
+) -> ValidationReport:
     """Validate price data quality with comprehensive checks.
 
     Performs validation checks on price DataFrame including:
@@ -705,6 +876,8 @@ def validate_prices(prices_df: pd.DataFrame, check_delistings: bool = True) -> V
     Args:
         prices_df: Price data with MultiIndex (date, symbol) and OHLC columns
         check_delistings: If True, run delisting detection (default: True)
+        calendar: Trading calendar for date gap detection (default: "NYSE")
+        gap_threshold_days: Minimum trading days gap to flag (default: 10)
 
     Returns:
         ValidationReport: Comprehensive validation results with issue summary
@@ -729,6 +902,10 @@ def validate_prices(prices_df: pd.DataFrame, check_delistings: bool = True) -> V
         Delisting detection uses a heuristic: tickers with data ending > 30 days
         before the DataFrame's max date are flagged as delisted. This is useful
         for historical backtests with "Current & Past" watchlists.
+
+        The panel index is sorted once by (symbol, date) and all four checks run
+        as array operations over that shared sort, without copying the input or
+        slicing it per ticker.
     """
     logger.info("Starting price data validation", layer="data", operation="validate_prices")
 
@@ -746,22 +923,27 @@ def validate_prices(prices_df: pd.DataFrame, check_delistings: bool = True) -> V
 
     total_tickers = len(symbols)
 
-    # Perform validation checks
+    # Perform validation checks over one shared sort of the panel (no copies)
+    panel = _sort_panel(prices_df)
+
     # Check for missing values (NaN) in OHLC columns
-    missing_data_counts = _check_missing_values(prices_df)
+    missing_data_counts = _check_missing_values(prices_df, panel=panel)
 
-    # Check for date gaps (>= 10 business days)
-    date_gaps = _check_date_gaps(prices_df)
+    # Check for date gaps (>= gap_threshold_days trading days)
+    date_gaps = _check_date_gaps(
+        prices_df, threshold_days=gap_threshold_days, panel=panel, calendar=calendar
+    )
 
     # Check for adjustment consistency issues (negative prices, large jumps)
-    adjustment_issues = _check_adjustment_consistency(prices_df)
+    adjustment_issues = _check_adjustment_consistency(prices_df, panel=panel)
 
     # Check for delisting events (optional)
     if check_delistings:
         # check_delisting_status returns dict[str, date_type],
         # which is compatible with dict[str, date_type | None]
         delisting_events: dict[str, date_type | None] = cast(
-            dict[str, date_type | None], check_delisting_status(prices_df, query_end_date=end_date)
+            dict[str, date_type | None],
+            check_delisting_status(prices_df, query_end_date=end_date, panel=panel),
         )
     else:
         delisting_events = {}
@@ -0,0 +1,579 @@
+"""Persistent Windows Python worker for the Norgate bridge.
+
+This module keeps a single long-lived Windows Python process running and sends
+it framed requests over stdin/stdout, instead of launching ``python.exe -c`` for
+every bridge call. The Windows side is implemented in ``momo.data.worker_server``,
+whose source is shipped to Windows Python at startup.
+
+Architecture:
+    WSL Python → BridgeWorker → stdin/stdout frames → worker_server (python.exe)
+        → norgatedata → NDU
+
+Lifecycle:
+    - start(): Launch the worker and wait for its hello frame
+    - execute(): Evaluate an expression and return the JSON-decoded result
+    - execute_arrow(): Evaluate an expression producing a DataFrame and return
+      it as Arrow IPC stream bytes (no JSON encoding)
+    - ping(): Health check (round trip without touching NDU)
+    - restart on crash: A dead worker is relaunched on the next request
+    - shutdown(): Send a shutdown frame, falling back to kill after a grace period
+
+The worker is normally used through ``momo.data.bridge.start_persistent_worker()``,
+which routes ``execute_norgate_code()`` and all ``fetch_*`` functions through it.
+BridgeWorkerPool runs several workers side by side so concurrent callers (e.g.
+``load_universe(max_workers=...)``) do not queue behind a single process; use it
+via ``momo.data.bridge.start_worker_pool()`` or ``momo.data.bridge.worker_pool()``.
+For Linux testing, pass ``command=[sys.executable, "-u", "<fake worker script>"]``.
+"""
+
+import collections
+import inspect
+import json
+import os
+import queue
+import selectors
+import subprocess
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from types import TracebackType
+from typing import Any
+
+import structlog
+
+from momo.data import worker_server
+from momo.utils.exceptions import (
+    BridgeWorkerCrashedError,
+    NDUNotRunningError,
+    NorgateBridgeError,
+    WindowsPythonNotFoundError,
+)
+
+logger = structlog.get_logger()
+
+# Number of worker stderr lines kept for diagnostics
+_STDERR_TAIL_LINES = 50
+
+
+class BridgeWorker:
+    """Long-lived Windows Python process serving framed bridge requests.
+
+    A BridgeWorker serializes requests with an internal lock, so it is safe to
+    share between threads (requests are processed one at a time).
+
+    Attributes:
+        command: Command line used to launch the worker process
+        startup_timeout: Seconds to wait for the worker hello frame
+        restart_count: Number of times the worker was relaunched after a crash or timeout
+
+    Example:
+        >>> with BridgeWorker() as worker:
+        ...     version = worker.execute("norgatedata.version()")
+        ...     assert worker.ping()
+    """
+
+    def __init__(
+        self,
+        python_executable: str = "python.exe",
+        command: Sequence[str] | None = None,
+        startup_timeout: int = 30,
+    ) -> None:
+        """Configure the worker (the process is started lazily).
+
+        Args:
+            python_executable: Windows Python executable (default: "python.exe")
+            command: Full launch command overriding python_executable (e.g. a fake
+                worker script for Linux tests)
+            startup_timeout: Seconds to wait for the worker hello frame (default: 30)
+        """
+        if command is None:
+            source = inspect.getsource(worker_server)
+            command = [python_executable, "-u", "-c", source]
+        self.command: list[str] = list(command)
+        self.startup_timeout = startup_timeout
+        self.restart_count = 0
+
+        self._process: subprocess.Popen[bytes] | None = None
+        self._buffer = bytearray()
+        self._next_id = 1
+        self._restart_pending = False
+        self._lock = threading.Lock()
+        self._stderr_tail: collections.deque[str] = collections.deque(maxlen=_STDERR_TAIL_LINES)
+        self._stderr_thread: threading.Thread | None = None
+
+    def __enter__(self) -> "BridgeWorker":
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.shutdown()
+
+    @property
+    def pid(self) -> int | None:
+        """Process id of the running worker, or None if not running."""
+        return self._process.pid if self.is_alive() and self._process is not None else None
+
+    def is_alive(self) -> bool:
+        """Return True if the worker process is running."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        """Launch the worker process and wait for its hello frame.
+
+        Does nothing if the worker is already running.
+
+        Raises:
+            WindowsPythonNotFoundError: Worker executable not found
+            NorgateBridgeError: Worker failed to start (norgatedata missing, timeout)
+        """
+        with self._lock:
+            self._start_locked()
+
+    def execute(self, code: str, timeout: int = 30, setup: str | None = None) -> Any:
+        """Evaluate a Python expression in the worker and return the parsed result.
+
+        The worker namespace contains ``json`` and ``norgatedata``. If ``setup``
+        is given, it is executed (as statements) in the same namespace before
+        ``code`` is evaluated.
+
+        Args:
+            code: Python expression to evaluate (must produce a JSON-serializable result)
+            timeout: Seconds to wait for the response (default: 30)
+            setup: Optional Python statements to execute before evaluating code
+
+        Returns:
+            JSON-decoded result of the expression
+
+        Raises:
+            WindowsPythonNotFoundError: Worker executable not found
+            NDUNotRunningError: Norgate Data Updater is not running
+            BridgeWorkerCrashedError: Worker exited before responding (retryable)
+            NorgateBridgeError: Timeout or error raised by the evaluated code
+        """
+        request: dict[str, Any] = {"op": "eval", "code": code}
+        if setup:
+            request["setup"] = setup
+        return self._request(request, timeout)
+
+    def execute_arrow(self, code: str, timeout: int = 30, setup: str | None = None) -> bytes:
+        """Evaluate an expression producing a DataFrame and return Arrow IPC bytes.
+
+        The worker serializes the result with ``worker_server.arrow_ipc_bytes()``
+        (index dropped), so the expression should reset_index() first. Requires
+        pyarrow in Windows Python.
+
+        Args:
+            code: Python expression evaluating to a pandas DataFrame or pyarrow Table
+            timeout: Seconds to wait for the response (default: 30)
+            setup: Optional Python statements to execute before evaluating code
+
+        Returns:
+            Arrow IPC stream bytes (read with ``pyarrow.ipc.open_stream``)
+
+        Raises:
+            WindowsPythonNotFoundError: Worker executable not found
+            NDUNotRunningError: Norgate Data Updater is not running
+            BridgeWorkerCrashedError: Worker exited before responding (retryable)
+            NorgateBridgeError: Timeout or error raised by the evaluated code
+        """
+        request: dict[str, Any] = {"op": "eval_arrow", "code": code}
+        if setup:
+            request["setup"] = setup
+        payload = self._request(request, timeout)
+        if not isinstance(payload, bytes):
+            raise NorgateBridgeError(
+                "Bridge worker protocol error: expected binary Arrow payload, "
+                f"got {type(payload)}"
+            )
+        return payload
+
+    def ping(self, timeout: int = 5) -> bool:
+        """Health check: return True if the worker answers a ping in time.
+
+        Starts (or restarts) the worker if needed. Never raises.
+
+        Args:
+            timeout: Seconds to wait for the pong response (default: 5)
+
+        Returns:
+            True if the worker is healthy, False otherwise
+        """
+        try:
+            return bool(self._request({"op": "ping"}, timeout) == "pong")
+        except Exception as e:
+            logger.warning("bridge_worker_ping_failed", error=str(e))
+            return False
+
+    def restart(self) -> None:
+        """Stop the worker (killing it if necessary) and start a fresh one."""
+        with self._lock:
+            self._kill_locked()
+            self.restart_count += 1
+            logger.info("bridge_worker_restarting", restart_count=self.restart_count)
+            self._start_locked()
+            self._restart_pending = False
+
+    def shutdown(self, timeout: int = 5) -> None:
+        """Shut the worker down cleanly, killing it if it does not exit in time.
+
+        Idempotent: does nothing if the worker is not running.
+
+        Args:
+            timeout: Seconds to wait for a graceful exit (default: 5)
+        """
+        with self._lock:
+            process = self._process
+            if process is None:
+                return
+
+            if process.poll() is None:
+                try:
+                    self._send({"id": self._take_id(), "op": "shutdown"})
+                    process.wait(timeout=timeout)
+                except (OSError, ValueError, subprocess.TimeoutExpired):
+                    logger.warning("bridge_worker_shutdown_timeout", pid=process.pid)
+
+            self._kill_locked()
+            logger.info("bridge_worker_stopped", pid=process.pid)
+
+    def _request(self, message: dict[str, Any], timeout: int) -> Any:
+        """Send a request and wait for the matching response (serialized).
+
+        Returns the JSON result, or the raw payload frame for binary responses.
+        """
+        with self._lock:
+            self._ensure_running_locked()
+            request_id = self._take_id()
+            message = {"id": request_id, **message}
+
+            try:
+                self._send(message)
+            except (BrokenPipeError, ConnectionResetError, ValueError) as e:
+                self._handle_crash_locked()
+                raise BridgeWorkerCrashedError(
+                    f"Bridge worker exited before accepting request: {e}"
+                    f"{self._stderr_summary()}"
+                ) from e
+
+            deadline = time.monotonic() + timeout
+            binary: bytes | None = None
+            try:
+                response = self._read_message(deadline=deadline)
+                if response.get("ok") and response.get("binary"):
+                    binary = self._read_frame(deadline=deadline)
+            except TimeoutError as e:
+                # Worker is in an unknown state - kill it; next request restarts it
+                logger.error("bridge_timeout", timeout=timeout)
+                self._kill_locked()
+                self._restart_pending = True
+                raise NorgateBridgeError(
+                    f"Bridge operation timed out after {timeout} seconds. "
+                    "Check if NDU is responding."
+                ) from e
+            except EOFError as e:
+                self._handle_crash_locked()
+                raise BridgeWorkerCrashedError(
+                    f"Bridge worker exited unexpectedly: {e}{self._stderr_summary()}"
+                ) from e
+
+        if response.get("id") != request_id:
+            raise NorgateBridgeError(
+                f"Bridge worker protocol error: expected response id {request_id}, "
+                f"got {response.get('id')}"
+            )
+
+        if not response.get("ok"):
+            self._raise_worker_error(response)
+
+        if binary is not None:
+            return binary
+        return response.get("result")
+
+    def _ensure_running_locked(self) -> None:
+        """Start the worker if needed, restarting it after a crash or timeout."""
+        if self._process is not None and self._process.poll() is not None:
+            logger.warning(
+                "bridge_worker_crashed",
+                returncode=self._process.returncode,
+                stderr_tail=list(self._stderr_tail)[-5:],
+            )
+            self._kill_locked()
+            self._restart_pending = True
+
+        if self._restart_pending:
+            self.restart_count += 1
+            logger.info("bridge_worker_restarting", restart_count=self.restart_count)
+        self._start_locked()
+        self._restart_pending = False
+
+    def _start_locked(self) -> None:
+        if self.is_alive():
+            return
+
+        logger.info("bridge_worker_starting", executable=self.command[0])
+        try:
+            process = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        except FileNotFoundError as e:
+            logger.error("windows_python_not_found")
+            raise WindowsPythonNotFoundError(
+                "Windows Python (python.exe) not found. Ensure Windows Python is "
+                "installed and in WSL PATH."
+            ) from e
+
+        self._process = process
+        self._buffer.clear()
+        self._stderr_tail.clear()
+        self._stderr_thread = threading.Thread(
+            target=self._drain_stderr, args=(process,), daemon=True
+        )
+        self._stderr_thread.start()
+
+        try:
+            hello = self._read_message(deadline=time.monotonic() + self.startup_timeout)
+        except (TimeoutError, EOFError) as e:
+            self._kill_locked()
+            raise NorgateBridgeError(
+                f"Bridge worker failed to start: {e}{self._stderr_summary()}"
+            ) from e
+
+        if not hello.get("ok"):
+            self._kill_locked()
+            if hello.get("error_type") == "ModuleNotFoundError" and "norgatedata" in str(
+                hello.get("error")
+            ):
+                logger.error("norgatedata_not_installed")
+                raise NorgateBridgeError(
+                    "norgatedata package not found in Windows Python. "
+                    "Install via: pip install norgatedata==1.0.74"
+                )
+            raise NorgateBridgeError(f"Bridge worker failed to start: {hello.get('error')}")
+
+        logger.info("bridge_worker_started", pid=hello.get("pid"), protocol=hello.get("protocol"))
+
+    def _kill_locked(self) -> None:
+        """Terminate the worker process (if any) and release its pipes."""
+        process = self._process
+        if process is None:
+            return
+        if process.poll() is None:
+            process.kill()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            logger.warning("bridge_worker_kill_timeout", pid=process.pid)
+        for stream in (process.stdin, process.stdout):
+            if stream is not None:
+                try:
+                    stream.close()
+                except OSError:
+                    pass
+        self._process = None
+        self._buffer.clear()
+
+    def _handle_crash_locked(self) -> None:
+        logger.error("bridge_worker_died", stderr_tail=list(self._stderr_tail)[-5:])
+        self._kill_locked()
+        self._restart_pending = True
+
+    def _take_id(self) -> int:
+        request_id = self._next_id
+        self._next_id += 1
+        return request_id
+
+    def _send(self, message: dict[str, Any]) -> None:
+        assert self._process is not None and self._process.stdin is not None
+        worker_server.write_frame(self._process.stdin, json.dumps(message).encode("utf-8"))
+
+    def _read_frame(self, deadline: float) -> bytes:
+        header = self._read_exact(worker_server.FRAME_HEADER.size, deadline)
+        (length,) = worker_server.FRAME_HEADER.unpack(header)
+        return self._read_exact(length, deadline)
+
+    def _read_message(self, deadline: float) -> dict[str, Any]:
+        payload = self._read_frame(deadline)
+        try:
+            message: dict[str, Any] = json.loads(payload)
+        except json.JSONDecodeError as e:
+            logger.error("json_parse_failed", error=str(e))
+            raise NorgateBridgeError(f"Failed to parse bridge worker response: {e}") from e
+        return message
+
+    def _read_exact(self, size: int, deadline: float) -> bytes:
+        """Read exactly ``size`` bytes from worker stdout before ``deadline``.
+
+        Raises:
+            TimeoutError: Deadline passed before enough bytes arrived
+            EOFError: Worker closed stdout
+        """
+        assert self._process is not None and self._process.stdout is not None
+        # Read the raw fd (not the BufferedReader) so select() sees every byte
+        fd = self._process.stdout.fileno()
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(fd, selectors.EVENT_READ)
+            while len(self._buffer) < size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(timeout=remaining):
+                    raise TimeoutError("No response from bridge worker within deadline")
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    raise EOFError("Bridge worker closed its stdout")
+                self._buffer.extend(chunk)
+
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+    def _drain_stderr(self, process: subprocess.Popen[bytes]) -> None:
+        """Keep the stderr pipe empty, remembering the last lines for diagnostics."""
+        if process.stderr is None:
+            return
+        with process.stderr:
+            for raw_line in process.stderr:
+                self._stderr_tail.append(raw_line.decode("utf-8", errors="replace").rstrip())
+
+    def _stderr_summary(self) -> str:
+        if not self._stderr_tail:
+            return ""
+        return "\nStderr: " + "\n".join(self._stderr_tail)
+
+    def _raise_worker_error(self, response: dict[str, Any]) -> None:
+        """Map a worker error response onto the bridge exception hierarchy."""
+        error = str(response.get("error", ""))
+        details = str(response.get("traceback") or error)
+
+        if "NDU is not running" in details:
+            logger.error("ndu_not_running")
+            raise NDUNotRunningError(
+                "Norgate Data Updater is not running. Please start NDU on Windows "
+                "and ensure you're logged in."
+            )
+
+        logger.error("bridge_execution_failed", error_type=response.get("error_type"), error=error)
+        raise NorgateBridgeError(f"Bridge execution failed:\nStderr: {details}")
+
+
+class BridgeWorkerPool:
+    """Bounded pool of BridgeWorkers for concurrent bridge requests.
+
+    Each request checks out an idle worker, blocking until one is available, so
+    at most ``size`` requests run in Windows Python at once. Workers are started
+    lazily on their first request, and a crashed worker is relaunched by its next
+    request (see BridgeWorker). The pool exposes the same execute/execute_arrow/
+    ping/shutdown interface as a single BridgeWorker.
+
+    Attributes:
+        size: Number of workers (maximum concurrent requests)
+
+    Example:
+        >>> with BridgeWorkerPool(size=4) as pool:
+        ...     with ThreadPoolExecutor(max_workers=4) as executor:
+        ...         versions = list(executor.map(pool.execute, ["norgatedata.version()"] * 8))
+    """
+
+    def __init__(
+        self,
+        size: int = 4,
+        python_executable: str = "python.exe",
+        command: Sequence[str] | None = None,
+        startup_timeout: int = 30,
+    ) -> None:
+        """Configure the pool (workers are started lazily).
+
+        Args:
+            size: Number of workers (default: 4)
+            python_executable: Windows Python executable (default: "python.exe")
+            command: Full launch command overriding python_executable
+            startup_timeout: Seconds to wait for each worker hello frame (default: 30)
+
+        Raises:
+            ValueError: size is not positive
+        """
+        if size < 1:
+            raise ValueError(f"size must be positive, got {size}")
+
+        self.size = size
+        self._workers = [
+            BridgeWorker(
+                python_executable=python_executable,
+                command=command,
+                startup_timeout=startup_timeout,
+            )
+            for _ in range(size)
+        ]
+        self._idle: queue.Queue[BridgeWorker] = queue.Queue()
+        for worker in self._workers:
+            self._idle.put(worker)
+
+    def __enter__(self) -> "BridgeWorkerPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.shutdown()
+
+    @property
+    def restart_count(self) -> int:
+        """Total number of worker relaunches across the pool."""
+        return sum(worker.restart_count for worker in self._workers)
+
+    def alive_count(self) -> int:
+        """Return the number of worker processes currently running."""
+        return sum(1 for worker in self._workers if worker.is_alive())
+
+    def start(self) -> None:
+        """Start every worker eagerly (otherwise they start on first use).
+
+        Raises:
+            WindowsPythonNotFoundError: Worker executable not found
+            NorgateBridgeError: A worker failed to start
+        """
+        for worker in self._workers:
+            worker.start()
+
+    def execute(self, code: str, timeout: int = 30, setup: str | None = None) -> Any:
+        """Evaluate an expression on an idle worker (see BridgeWorker.execute())."""
+        with self._checkout() as worker:
+            return worker.execute(code, timeout=timeout, setup=setup)
+
+    def execute_arrow(self, code: str, timeout: int = 30, setup: str | None = None) -> bytes:
+        """Evaluate a DataFrame expression on an idle worker (see BridgeWorker.execute_arrow())."""
+        with self._checkout() as worker:
+            return worker.execute_arrow(code, timeout=timeout, setup=setup)
+
+    def ping(self, timeout: int = 5) -> bool:
+        """Health check one idle worker. Never raises."""
+        with self._checkout() as worker:
+            return worker.ping(timeout=timeout)
+
+    def shutdown(self, timeout: int = 5) -> None:
+        """Shut down every worker. Idempotent.
+
+        Args:
+            timeout: Seconds to wait for each worker to exit gracefully (default: 5)
+        """
+        for worker in self._workers:
+            worker.shutdown(timeout=timeout)
+
+    @contextmanager
+    def _checkout(self) -> Iterator[BridgeWorker]:
+        worker = self._idle.get()
+        try:
+            yield worker
+        finally:
+            self._idle.put(worker)
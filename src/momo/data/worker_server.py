@@ -0,0 +1,251 @@
+"""Windows-side entry point for the persistent Norgate bridge worker.
+
+This module runs inside Windows Python (python.exe). Its source is sent to
+Windows Python via ``python.exe -u -c <source>`` by ``momo.data.worker``, so it
+must only depend on the standard library plus norgatedata (imported at startup).
+
+Protocol:
+    Every message is a frame: a 4-byte big-endian unsigned length followed by a
+    UTF-8 JSON payload of that length.
+
+    1. On startup the worker sends a hello frame:
+       {"op": "hello", "ok": true, "protocol": 1, "pid": 1234}
+       or, if norgatedata cannot be imported:
+       {"op": "hello", "ok": false, "error_type": "...", "error": "..."}
+    2. The client sends request frames:
+       {"id": 1, "op": "eval", "code": "<expression>", "setup": "<statements>"}
+       {"id": 2, "op": "eval_arrow", "code": "<expression>", "setup": "<statements>"}
+       {"id": 3, "op": "ping"}
+       {"id": 4, "op": "shutdown"}
+    3. The worker replies with one response frame per request:
+       {"id": 1, "ok": true, "result": <JSON value>}
+       {"id": 1, "ok": false, "error_type": "...", "error": "...", "traceback": "..."}
+
+       A successful eval_arrow response is {"id": 2, "ok": true, "binary": true}
+       followed by a second frame holding the result as an Arrow IPC stream
+       (see arrow_ipc_bytes()). pyarrow is only imported for eval_arrow requests.
+
+    The worker exits on a shutdown request or when stdin reaches EOF.
+
+Stdout Isolation:
+    norgatedata prints INFO messages to stdout, which would corrupt the frame
+    stream. The worker duplicates the original stdout file descriptor for the
+    protocol and redirects fd 1 (and sys.stdout) to stderr before importing
+    norgatedata.
+"""
+
+import json
+import os
+import struct
+import sys
+import traceback
+from typing import IO, Any
+
+PROTOCOL_VERSION = 1
+
+# Frame header: 4-byte big-endian unsigned payload length
+FRAME_HEADER = struct.Struct(">I")
+
+
+def write_frame(stream: IO[bytes], payload: bytes) -> None:
+    """Write a single length-prefixed frame and flush the stream.
+
+    Args:
+        stream: Binary output stream (worker stdout or client stdin pipe)
+        payload: Frame payload bytes
+    """
+    stream.write(FRAME_HEADER.pack(len(payload)))
+    stream.write(payload)
+    stream.flush()
+
+
+def read_frame(stream: IO[bytes]) -> bytes | None:
+    """Read a single length-prefixed frame from a blocking stream.
+
+    Args:
+        stream: Binary input stream
+
+    Returns:
+        Frame payload bytes, or None if the stream is at EOF before a new frame
+
+    Raises:
+        EOFError: Stream ended in the middle of a frame
+    """
+    header = _read_exact(stream, FRAME_HEADER.size)
+    if header is None:
+        return None
+    (length,) = FRAME_HEADER.unpack(header)
+    payload = _read_exact(stream, length)
+    if payload is None:
+        raise EOFError(f"Stream closed while reading {length}-byte frame")
+    return payload
+
+
+def _read_exact(stream: IO[bytes], size: int) -> bytes | None:
+    """Read exactly ``size`` bytes, returning None on immediate EOF."""
+    chunks: list[bytes] = []
+    remaining = size
+    while remaining > 0:
+        chunk = stream.read(remaining)
+        if not chunk:
+            if remaining == size and size > 0:
+                return None
+            raise EOFError(f"Stream closed after {size - remaining} of {size} bytes")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _encode(message: dict[str, Any]) -> bytes:
+    """Encode a response message as JSON bytes (non-JSON values via str)."""
+    return json.dumps(message, default=str).encode("utf-8")
+
+
+def arrow_ipc_bytes(result: Any) -> bytes:
+    """Serialize a DataFrame (or pyarrow Table) as an Arrow IPC stream.
+
+    The DataFrame index is dropped, so callers should reset_index() first to
+    keep the date column. Datetime columns travel as Arrow timestamps, not strings.
+
+    This function is also embedded in the one-shot subprocess wrapper built by
+    ``momo.data.bridge``, so it must stay self-contained.
+
+    Args:
+        result: pandas DataFrame or pyarrow Table
+
+    Returns:
+        Arrow IPC stream bytes
+    """
+    import pyarrow  # type: ignore[import-untyped]
+
+    if isinstance(result, pyarrow.Table):
+        table = result
+    else:
+        table = pyarrow.Table.from_pandas(result, preserve_index=False)
+
+    sink = pyarrow.BufferOutputStream()
+    with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return bytes(sink.getvalue().to_pybytes())
+
+
+def handle_request(
+    request: dict[str, Any], namespace: dict[str, Any]
+) -> tuple[dict[str, Any], bytes | None]:
+    """Execute a single request against the worker namespace.
+
+    Args:
+        request: Decoded request message
+        namespace: Globals shared across requests (contains json and norgatedata)
+
+    Returns:
+        Tuple of (successful response message without request id, binary payload
+        to send as a second frame or None)
+
+    Raises:
+        ValueError: Unknown operation
+        Exception: Any exception raised by the evaluated code
+    """
+    op = request.get("op")
+
+    if op == "ping":
+        return {"ok": True, "result": "pong"}, None
+
+    if op in ("eval", "eval_arrow"):
+        setup = request.get("setup")
+        if setup:
+            exec(setup, namespace)
+        result = eval(request["code"], namespace)
+        if op == "eval_arrow":
+            return {"ok": True, "binary": True}, arrow_ipc_bytes(result)
+        return {"ok": True, "result": result}, None
+
+    raise ValueError(f"Unknown bridge worker operation: {op!r}")
+
+
+def serve(stdin: IO[bytes], stdout: IO[bytes], namespace: dict[str, Any]) -> None:
+    """Serve framed requests until shutdown or EOF.
+
+    Args:
+        stdin: Binary request stream
+        stdout: Binary response stream (protocol channel only)
+        namespace: Globals shared across requests
+    """
+    while True:
+        payload = read_frame(stdin)
+        if payload is None:
+            return  # Client closed the pipe
+
+        request = json.loads(payload)
+        request_id = request.get("id")
+
+        if request.get("op") == "shutdown":
+            write_frame(stdout, _encode({"id": request_id, "ok": True, "result": None}))
+            return
+
+        binary = None
+        try:
+            response, binary = handle_request(request, namespace)
+            response["id"] = request_id
+            data = _encode(response)
+        except Exception as e:
+            binary = None
+            data = _encode(
+                {
+                    "id": request_id,
+                    "ok": False,
+                    "error_type": type(e).__name__,
+                    "error": str(e),
+                    "traceback": traceback.format_exc(),
+                }
+            )
+
+        write_frame(stdout, data)
+        if binary is not None:
+            write_frame(stdout, binary)
+
+
+def main() -> None:
+    """Start the worker: isolate stdout, import norgatedata, then serve."""
+    stdin = sys.stdin.buffer
+
+    # Reserve the original stdout for the protocol and send fd 1 to stderr
+    protocol_fd = os.dup(sys.stdout.fileno())
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    sys.stdout = sys.stderr
+
+    if sys.platform == "win32":
+        # Windows pipes default to text mode, which would translate b"\n"
+        import msvcrt
+
+        msvcrt.setmode(stdin.fileno(), os.O_BINARY)
+        msvcrt.setmode(protocol_fd, os.O_BINARY)
+
+    stdout = os.fdopen(protocol_fd, "wb")
+
+    try:
+        import norgatedata
+    except ImportError as e:
+        write_frame(
+            stdout,
+            _encode(
+                {
+                    "op": "hello",
+                    "ok": False,
+                    "error_type": type(e).__name__,
+                    "error": str(e),
+                }
+            ),
+        )
+        return
+
+    namespace: dict[str, Any] = {"json": json, "norgatedata": norgatedata}
+    write_frame(
+        stdout,
+        _encode({"op": "hello", "ok": True, "protocol": PROTOCOL_VERSION, "pid": os.getpid()}),
+    )
+    serve(stdin, stdout, namespace)
+
+
+if __name__ == "__main__":
+    main()
@@ -52,6 +52,23 @@ class NDUNotRunningError(NorgateBridgeError):
     pass
 
 
+class BridgeWorkerCrashedError(NorgateBridgeError, ConnectionError):
+    """Persistent bridge worker exited while a request was in flight.
+
+    Raised when the long-lived Windows Python worker process dies or closes
+    its pipes before returning a response. The error also derives from
+    ConnectionError so the bridge's retry policy treats it as transient; the
+    next attempt restarts the worker automatically.
+
+    Examples of scenarios:
+    - Windows Python crashed or was killed mid-request
+    - NDU restart tore down the worker's norgatedata session
+    - Worker stdout closed unexpectedly (broken pipe)
+    """
+
+    pass
+
+
 class WindowsPythonNotFoundError(BridgeError):
     """Windows Python executable not found.
 
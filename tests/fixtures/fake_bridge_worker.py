@@ -0,0 +1,151 @@
+"""Fake bridge worker for testing the persistent worker protocol on Linux.
+
+Installs an in-memory stand-in for the ``norgatedata`` package and then runs the
+real worker loop from ``momo.data.worker_server``. Launch it in place of
+``python.exe``:
+
+    BridgeWorker(command=[sys.executable, "-u", "tests/fixtures/fake_bridge_worker.py"])
+
+Fake data:
+    - price_timeseries(): Deterministic business-day OHLCV data (2020-01-01 to
+      2020-03-31 unless dates are given). Close = 100 + day number.
+    - index_constituent_timeseries(): Symbols in MEMBERSHIP are members between
+      the listed dates; every other symbol is never a member.
+    - watchlist_symbols(): WATCHLIST for any watchlist name.
+    - last_quoted_date(): DEFAULT_END's last business day for every symbol.
+    - last_price_update_time(): LAST_UPDATE (naive local time) for every symbol.
+
+Special symbols:
+    - "CRASH": Worker process exits immediately (simulates a crash)
+    - "NDUDOWN": Raises an error mentioning "NDU is not running"
+    - "SLOW": Sleeps 10 seconds (simulates a hung NDU call)
+    - "BAD*": Raises ValueError("Symbol ... not found")
+"""
+
+import datetime
+import enum
+import os
+import sys
+import time
+import types
+
+import pandas as pd
+
+DEFAULT_START = "2020-01-01"
+DEFAULT_END = "2020-03-31"
+
+# symbol -> (first member date, last member date)
+MEMBERSHIP = {
+    "AAPL": ("2000-01-01", "2099-12-31"),
+    "MSFT": ("2000-01-01", "2099-12-31"),
+    "EXIT": ("2000-01-01", "2020-02-14"),
+    "JOIN": ("2020-02-18", "2099-12-31"),
+}
+
+WATCHLIST = ["AAPL", "MSFT", "EXIT", "JOIN", "NEVER"]
+
+# Naive local time, as norgatedata returns it
+LAST_UPDATE = datetime.datetime(2020, 4, 1, 6, 30)  # noqa: DTZ001
+
+
+class StockPriceAdjustmentType(enum.Enum):
+    NONE = 0
+    CAPITAL = 1
+    CAPITALSPECIAL = 2
+    TOTALRETURN = 3
+
+
+def _check_symbol(symbol: str) -> None:
+    if symbol == "CRASH":
+        os._exit(3)
+    if symbol == "NDUDOWN":
+        raise RuntimeError("NDU is not running")
+    if symbol == "SLOW":
+        time.sleep(10)
+    if symbol.startswith("BAD"):
+        raise ValueError(f"Symbol {symbol} not found")
+
+
+def price_timeseries(
+    symbol: str,
+    start_date: str = DEFAULT_START,
+    end_date: str = DEFAULT_END,
+    timeseriesformat: str = "pandas-dataframe",
+    stock_price_adjustment_setting: StockPriceAdjustmentType = (
+        StockPriceAdjustmentType.TOTALRETURN
+    ),
+) -> pd.DataFrame:
+    _check_symbol(symbol)
+    dates = pd.bdate_range(start_date, end_date, name="Date")
+    day = pd.Series(range(len(dates)), index=dates, dtype="float64")
+    close = 100.0 + day
+    return pd.DataFrame(
+        {
+            "Open": close - 0.5,
+            "High": close + 1.0,
+            "Low": close - 1.0,
+            "Close": close,
+            "Volume": (1_000_000 + day * 1000).astype("int64"),
+            "Turnover": close * 1_000_000,
+            "Unadjusted Close": close * 2,
+            "Dividend": 0.0,
+        },
+        index=dates,
+    )
+
+
+def index_constituent_timeseries(
+    symbol: str,
+    index_name: str,
+    timeseriesformat: str = "pandas-dataframe",
+    start_date: str = DEFAULT_START,
+    end_date: str = DEFAULT_END,
+) -> pd.DataFrame:
+    _check_symbol(symbol)
+    dates = pd.bdate_range(start_date, end_date, name="Date")
+    first, last = MEMBERSHIP.get(symbol, ("2100-01-01", "2100-01-01"))
+    member = (dates >= pd.Timestamp(first)) & (dates <= pd.Timestamp(last))
+    return pd.DataFrame({"Index Constituent": member.astype("int64")}, index=dates)
+
+
+def watchlist_symbols(watchlist_name: str) -> list[str]:
+    return list(WATCHLIST)
+
+
+def last_quoted_date(symbol: str) -> datetime.date:
+    _check_symbol(symbol)
+    return pd.bdate_range(DEFAULT_START, DEFAULT_END)[-1].date()
+
+
+def last_price_update_time(symbol: str) -> datetime.datetime:
+    _check_symbol(symbol)
+    return LAST_UPDATE
+
+
+def version() -> str:
+    return "1.0.74-fake"
+
+
+def databases() -> list[str]:
+    return ["US Equities", "US Equities Delisted"]
+
+
+fake_norgatedata = types.ModuleType("norgatedata")
+for _name, _value in list(globals().items()):
+    if _name in {
+        "StockPriceAdjustmentType",
+        "price_timeseries",
+        "index_constituent_timeseries",
+        "watchlist_symbols",
+        "last_quoted_date",
+        "last_price_update_time",
+        "version",
+        "databases",
+    }:
+        setattr(fake_norgatedata, _name, _value)
+sys.modules["norgatedata"] = fake_norgatedata
+
+if __name__ == "__main__":
+    from momo.data import worker_server
+
+    worker_server.main()
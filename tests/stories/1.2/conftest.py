@@ -0,0 +1,69 @@
+"""Shared fixtures for Story 1.2 test suite.
+
+Provides a fake persistent bridge worker so worker protocol tests run on Linux
+without Windows Python or NDU, and an environment in which one-shot bridge
+wrappers can be executed by the current interpreter against a fake norgatedata.
+"""
+
+import os
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from momo.data import bridge
+from momo.data.worker import BridgeWorker
+
+# Stand-in norgatedata module that prints to stdout on import, like the real one
+FAKE_NORGATEDATA_MODULE = """
+import sys
+
+import fake_bridge_worker
+
+print("INFO: norgatedata stdout noise")
+sys.modules[__name__] = fake_bridge_worker.fake_norgatedata
+"""
+
+
+@pytest.fixture
+def fake_worker_command(project_root: Path) -> list[str]:
+    """Command that launches the fake bridge worker with the current interpreter.
+
+    Returns:
+        Launch command for tests/fixtures/fake_bridge_worker.py
+    """
+    script = project_root / "tests" / "fixtures" / "fake_bridge_worker.py"
+    return [sys.executable, "-u", str(script)]
+
+
+@pytest.fixture
+def fake_worker(fake_worker_command: list[str]) -> Iterator[BridgeWorker]:
+    """Started BridgeWorker backed by the fake worker script (shut down after test)."""
+    worker = BridgeWorker(command=fake_worker_command, startup_timeout=30)
+    worker.start()
+    yield worker
+    worker.shutdown()
+
+
+@pytest.fixture
+def persistent_fake_worker(fake_worker_command: list[str]) -> Iterator[BridgeWorker]:
+    """Fake worker installed as the bridge's persistent worker (stopped after test)."""
+    worker = bridge.start_persistent_worker(command=fake_worker_command)
+    yield worker
+    bridge.stop_persistent_worker()
+
+
+@pytest.fixture
+def fake_norgatedata_env(tmp_path: Path, project_root: Path) -> dict[str, str]:
+    """Environment where ``import norgatedata`` loads the fake norgatedata module.
+
+    Use it to run bridge wrapper programs with sys.executable in place of
+    python.exe.
+
+    Returns:
+        Copy of os.environ with PYTHONPATH pointing at the fake module
+    """
+    (tmp_path / "norgatedata.py").write_text(FAKE_NORGATEDATA_MODULE)
+    fixtures_dir = project_root / "tests" / "fixtures"
+    return {**os.environ, "PYTHONPATH": os.pathsep.join([str(tmp_path), str(fixtures_dir)])}
@@ -0,0 +1,53 @@
+"""Test ID: 1.2-UNIT-012
+
+Story: 1.2 - Integrate Norgate Data API via Windows Python Bridge
+Priority: P0
+Test Level: Unit
+Risk Coverage: PERF-001 (Interpreter startup per bridge call)
+
+Description:
+Verify the persistent BridgeWorker serves multiple framed requests from a single
+long-lived process, answers health checks, and shuts down cleanly.
+"""
+
+import pytest
+
+from momo.data.worker import BridgeWorker
+
+
+@pytest.mark.p0
+@pytest.mark.unit
+def test_1_2_unit_012(fake_worker: BridgeWorker) -> None:
+    """Test ID: 1.2-UNIT-012
+
+    Verify persistent worker round trips, health check and clean shutdown.
+
+    Steps:
+    1. Start fake worker (fixture)
+    2. Execute several expressions and verify JSON-decoded results
+    3. Verify all requests were served by the same process
+    4. Verify ping() health check succeeds
+    5. Shut down and verify the process exited
+
+    Expected: One process serves every request; shutdown is clean and idempotent
+    """
+    # Step 2: Round trips
+    pid = fake_worker.pid
+    assert pid is not None, "Worker should be running after start()"
+    assert fake_worker.execute("2 + 2") == 4
+    assert fake_worker.execute("{'a': [1, 2]}") == {"a": [1, 2]}
+    assert fake_worker.execute("norgatedata.version()") == "1.0.74-fake"
+
+    # Setup statements run in the worker namespace before evaluation
+    assert fake_worker.execute("double(21)", setup="def double(x):\n    return 2 * x") == 42
+
+    # Step 3: Same process served all requests
+    assert fake_worker.pid == pid, "Requests should reuse the same worker process"
+
+    # Step 4: Health check
+    assert fake_worker.ping() is True
+
+    # Step 5: Clean shutdown (idempotent)
+    fake_worker.shutdown()
+    assert not fake_worker.is_alive()
+    fake_worker.shutdown()
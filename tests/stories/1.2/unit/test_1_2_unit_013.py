@@ -0,0 +1,68 @@
+"""Test ID: 1.2-UNIT-013
+
+Story: 1.2 - Integrate Norgate Data API via Windows Python Bridge
+Priority: P0
+Test Level: Unit
+Risk Coverage: TECH-001 (Subprocess communication failure)
+
+Description:
+Verify the persistent worker maps crashes, NDU errors and timeouts onto the
+bridge exception hierarchy and restarts itself on the next request.
+"""
+
+import pytest
+
+from momo.data.worker import BridgeWorker
+from momo.utils.exceptions import (
+    BridgeWorkerCrashedError,
+    NDUNotRunningError,
+    NorgateBridgeError,
+)
+
+
+@pytest.mark.p0
+@pytest.mark.unit
+def test_1_2_unit_013(fake_worker: BridgeWorker) -> None:
+    """Test ID: 1.2-UNIT-013
+
+    Verify crash/timeout recovery and error mapping of the persistent worker.
+
+    Steps:
+    1. Trigger a worker crash mid-request, verify BridgeWorkerCrashedError
+       (retryable: also a ConnectionError)
+    2. Verify next request restarts the worker transparently
+    3. Trigger "NDU is not running", verify NDUNotRunningError
+    4. Trigger a hung call with a short timeout, verify timeout NorgateBridgeError
+    5. Verify worker recovers after the timeout
+
+    Expected: Every failure surfaces as a bridge exception; worker self-heals
+    """
+    first_pid = fake_worker.pid
+
+    # Step 1: Crash mid-request
+    with pytest.raises(BridgeWorkerCrashedError) as crash_info:
+        fake_worker.execute('norgatedata.price_timeseries("CRASH")')
+    assert isinstance(crash_info.value, ConnectionError), "Crash must be retryable"
+
+    # Step 2: Transparent restart
+    assert fake_worker.execute("1 + 1") == 2
+    assert fake_worker.pid != first_pid
+    assert fake_worker.restart_count == 1
+
+    # Step 3: NDU not running
+    with pytest.raises(NDUNotRunningError):
+        fake_worker.execute('norgatedata.price_timeseries("NDUDOWN")')
+
+    # Other Windows-side errors keep the traceback for callers that inspect it
+    with pytest.raises(NorgateBridgeError) as exc_info:
+        fake_worker.execute('norgatedata.price_timeseries("BADSYM")')
+    assert "not found" in str(exc_info.value)
+
+    # Step 4: Timeout
+    with pytest.raises(NorgateBridgeError) as timeout_info:
+        fake_worker.execute('norgatedata.price_timeseries("SLOW")', timeout=1)
+    assert "timed out" in str(timeout_info.value)
+
+    # Step 5: Recovery
+    assert fake_worker.execute("3 * 3") == 9
+    assert fake_worker.restart_count == 2
@@ -0,0 +1,70 @@
+"""Test ID: 1.2-UNIT-014
+
+Story: 1.2 - Integrate Norgate Data API via Windows Python Bridge
+Priority: P0
+Test Level: Unit
+Risk Coverage: PERF-001 (Interpreter startup per bridge call)
+
+Description:
+Verify execute_norgate_code() and fetch_price_data() keep their signatures and
+results when routed through the persistent worker, without spawning a
+subprocess per call.
+"""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from momo.data import bridge
+from momo.data.worker import BridgeWorker
+
+
+@pytest.mark.p0
+@pytest.mark.unit
+def test_1_2_unit_014(persistent_fake_worker: BridgeWorker) -> None:
+    """Test ID: 1.2-UNIT-014
+
+    Verify bridge functions run on top of the persistent worker.
+
+    Steps:
+    1. Install fake worker as persistent worker (fixture)
+    2. Patch subprocess.run to detect per-call subprocesses
+    3. Call execute_norgate_code() and fetch_price_data()
+    4. Verify results and that subprocess.run was never called
+    5. Stop the persistent worker and verify it shut down
+
+    Expected: Existing bridge API works unchanged over the worker
+    """
+    with patch("momo.data.bridge.subprocess.run") as mock_run:
+        assert bridge.execute_norgate_code("2 + 2") == 4
+        assert bridge.check_ndu_status() is True
+
+        prices_df = bridge.fetch_price_data(
+            "AAPL", start_date=date(2020, 1, 1), end_date=date(2020, 1, 31)
+        )
+
+        mock_run.assert_not_called()
+
+    # Same schema as the subprocess path
+    assert prices_df.index.name == "date"
+    assert list(prices_df.columns) == [
+        "symbol",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+        "unadjusted_close",
+        "dividend",
+    ]
+    assert len(prices_df) == 23  # Weekdays in January 2020 (fake data ignores holidays)
+    assert prices_df["close"].iloc[0] == 100.0
+    assert str(prices_df["volume"].dtype) == "int64"
+
+    # Starting again returns the active worker
+    assert bridge.start_persistent_worker() is persistent_fake_worker
+
+    # Step 5: Stop
+    bridge.stop_persistent_worker()
+    assert not persistent_fake_worker.is_alive()
@@ -0,0 +1,96 @@
+"""Test ID: 1.2-UNIT-015
+
+Story: 1.2 - Integrate Norgate Data API via Windows Python Bridge
+Priority: P1
+Test Level: Unit
+Risk Coverage: PERF-002 (One bridge round trip per symbol)
+
+Description:
+Verify fetch_price_data_batch() chunks symbols by batch_size, sends one
+Windows-side loop per chunk, and combines results into a single long-format
+frame plus a per-symbol error map.
+"""
+
+from datetime import date
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from momo.data.bridge import fetch_price_data_batch
+from momo.utils.exceptions import NorgateBridgeError
+
+
+def _records(symbol: str) -> list[dict[str, Any]]:
+    return [
+        {
+            "Date": day,
+            "Open": 10.0,
+            "High": 11.0,
+            "Low": 9.0,
+            "Close": 10.5,
+            "Volume": 1000,
+            "Unadjusted Close": 21.0,
+            "Dividend": 0.0,
+            "Symbol": symbol,
+        }
+        for day in ("2023-01-03", "2023-01-04")
+    ]
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_2_unit_015() -> None:
+    """Test ID: 1.2-UNIT-015
+
+    Verify batched fetch chunking, code generation and result assembly.
+
+    Steps:
+    1. Mock execute_norgate_code() to return batch results per chunk
+    2. Fetch 5 symbols with batch_size=2 (3 round trips)
+    3. Verify each call carries the Windows-side helper and its chunk of symbols
+    4. Verify long-format frame, dtypes and symbol order
+    5. Verify per-symbol errors, including a whole-chunk bridge failure
+
+    Expected: One round trip per chunk; failures isolated per symbol
+    """
+    responses = [
+        {"records": _records("AAPL"), "errors": {"BAD": "ValueError: Symbol BAD not found"}},
+        NorgateBridgeError("Bridge operation timed out after 300 seconds."),
+        {"records": _records("MSFT"), "errors": {}},
+    ]
+
+    with patch("momo.data.bridge.execute_norgate_code", side_effect=responses) as mock_execute:
+        prices_df, errors = fetch_price_data_batch(
+            ["AAPL", "BAD", "GOOGL", "AMZN", "MSFT"],
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 1, 31),
+            batch_size=2,
+        )
+
+    # Step 3: One call per chunk with helper setup and chunk symbols
+    assert mock_execute.call_count == 3
+    first_code = mock_execute.call_args_list[0][0][0]
+    assert (
+        first_code
+        == "_momo_price_batch(['AAPL', 'BAD'], '2023-01-01', '2023-01-31', 'TOTALRETURN')"
+    )
+    assert "['MSFT']" in mock_execute.call_args_list[2][0][0]
+    for call in mock_execute.call_args_list:
+        assert "def _momo_price_batch" in call.kwargs["setup"]
+
+    # Step 4: Long-format frame in symbol order
+    assert prices_df.index.name == "date"
+    assert prices_df["symbol"].tolist() == ["AAPL", "AAPL", "MSFT", "MSFT"]
+    assert str(prices_df["volume"].dtype) == "int64"
+    assert str(prices_df["unadjusted_close"].dtype) == "float64"
+    assert str(prices_df.index.dtype) == "datetime64[ns]"
+
+    # Step 5: Error map
+    assert set(errors) == {"BAD", "GOOGL", "AMZN"}
+    assert "not found" in errors["BAD"]
+    assert "timed out" in errors["GOOGL"]
+
+    # Invalid batch size is rejected before any bridge call
+    with pytest.raises(ValueError, match="batch_size"):
+        fetch_price_data_batch(["AAPL"], batch_size=0)
@@ -0,0 +1,48 @@
+"""Test ID: 1.2-UNIT-016
+
+Story: 1.2 - Integrate Norgate Data API via Windows Python Bridge
+Priority: P1
+Test Level: Unit
+Risk Coverage: PERF-002 (One bridge round trip per symbol)
+
+Description:
+Verify fetch_price_data_batch() runs its Windows-side loop end to end through
+the (fake) persistent worker, matching fetch_price_data() output per symbol.
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from momo.data import bridge
+from momo.data.worker import BridgeWorker
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_2_unit_016(persistent_fake_worker: BridgeWorker) -> None:
+    """Test ID: 1.2-UNIT-016
+
+    Verify batched fetch through the fake worker.
+
+    Steps:
+    1. Install fake worker as persistent worker (fixture)
+    2. Fetch a batch containing a valid, an unknown and another valid symbol
+    3. Verify unknown symbol is reported in the error map only
+    4. Verify each symbol's rows equal a single-symbol fetch_price_data() call
+
+    Expected: Batched and single-symbol fetches produce identical data
+    """
+    start, end = date(2020, 1, 1), date(2020, 1, 15)
+
+    prices_df, errors = bridge.fetch_price_data_batch(
+        ["AAPL", "BADSYM", "MSFT"], start_date=start, end_date=end, batch_size=10
+    )
+
+    assert list(errors) == ["BADSYM"]
+    assert "not found" in errors["BADSYM"]
+    assert prices_df["symbol"].unique().tolist() == ["AAPL", "MSFT"]
+
+    single_df = bridge.fetch_price_data("MSFT", start_date=start, end_date=end)
+    pd.testing.assert_frame_equal(prices_df[prices_df["symbol"] == "MSFT"], single_df)
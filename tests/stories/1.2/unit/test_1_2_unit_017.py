@@ -0,0 +1,72 @@
+"""Test ID: 1.2-UNIT-017
+
+Story: 1.2 - Integrate Norgate Data API via Windows Python Bridge
+Priority: P1
+Test Level: Unit
+Risk Coverage: PERF-003 (JSON encode/decode dominates large transfers)
+
+Description:
+Verify the Arrow IPC transport returns the same DataFrames as the JSON
+transport for single-symbol, batched and index constituent fetches through the
+(fake) persistent worker.
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from momo.data import bridge
+from momo.data.worker import BridgeWorker
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_2_unit_017(persistent_fake_worker: BridgeWorker) -> None:
+    """Test ID: 1.2-UNIT-017
+
+    Verify Arrow and JSON transports produce identical frames.
+
+    Steps:
+    1. Install fake worker as persistent worker (fixture)
+    2. Fetch AAPL prices with transport="json" and transport="arrow"
+    3. Fetch a batch (with an unknown symbol) with both transports
+    4. Fetch index constituents with both transports
+    5. Verify frames and error maps are identical; invalid transport rejected
+
+    Expected: transport="arrow" is a drop-in replacement for JSON
+    """
+    start, end = date(2020, 1, 1), date(2020, 3, 31)
+
+    # Step 2: Single symbol
+    json_df = bridge.fetch_price_data("AAPL", start_date=start, end_date=end)
+    arrow_df = bridge.fetch_price_data("AAPL", start_date=start, end_date=end, transport="arrow")
+    pd.testing.assert_frame_equal(arrow_df, json_df)
+    assert str(arrow_df.index.dtype) == "datetime64[ns]"
+
+    # Step 3: Batch with per-symbol error carried in Arrow schema metadata
+    json_batch, json_errors = bridge.fetch_price_data_batch(
+        ["AAPL", "BADSYM", "MSFT"], start_date=start, end_date=end
+    )
+    arrow_batch, arrow_errors = bridge.fetch_price_data_batch(
+        ["AAPL", "BADSYM", "MSFT"], start_date=start, end_date=end, transport="arrow"
+    )
+    pd.testing.assert_frame_equal(arrow_batch, json_batch)
+    assert arrow_errors == json_errors
+    assert list(arrow_errors) == ["BADSYM"]
+
+    # Batch where every symbol fails: empty frame, errors still reported
+    empty_batch, empty_errors = bridge.fetch_price_data_batch(["BAD1"], transport="arrow")
+    assert empty_batch.empty
+    assert list(empty_errors) == ["BAD1"]
+
+    # Step 4: Index constituents
+    json_members = bridge.fetch_index_constituent_timeseries("EXIT", "S&P 500", start, end)
+    arrow_members = bridge.fetch_index_constituent_timeseries(
+        "EXIT", "S&P 500", start, end, transport="arrow"
+    )
+    pd.testing.assert_frame_equal(arrow_members, json_members)
+
+    # Step 5: Unknown transport
+    with pytest.raises(ValueError, match="transport"):
+        bridge.fetch_price_data("AAPL", transport="msgpack")
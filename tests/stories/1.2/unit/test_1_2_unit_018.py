@@ -0,0 +1,68 @@
+"""Test ID: 1.2-UNIT-018
+
+Story: 1.2 - Integrate Norgate Data API via Windows Python Bridge
+Priority: P1
+Test Level: Unit
+Risk Coverage: PERF-003 (JSON encode/decode dominates large transfers)
+
+Description:
+Verify the one-shot subprocess path of execute_norgate_arrow(): the generated
+wrapper keeps norgatedata stdout noise off the binary stream and errors map
+onto the bridge exception hierarchy. The wrapper is executed for real with the
+current interpreter and a fake norgatedata module in place of python.exe.
+"""
+
+import subprocess
+import sys
+from datetime import date
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from momo.data import bridge
+from momo.utils.exceptions import NDUNotRunningError
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_2_unit_018(fake_norgatedata_env: dict[str, str]) -> None:
+    """Test ID: 1.2-UNIT-018
+
+    Verify the Arrow subprocess wrapper end to end.
+
+    Steps:
+    1. Use a fake norgatedata module that prints to stdout on import (fixture)
+    2. Redirect python.exe to the current interpreter with the fake on PYTHONPATH
+    3. Fetch prices with transport="arrow" (no persistent worker)
+    4. Verify rows, dtypes and that stdout noise did not corrupt the stream
+    5. Verify "NDU is not running" maps to NDUNotRunningError
+
+    Expected: Arrow transport works without a persistent worker
+    """
+    real_run = subprocess.run
+
+    def run_with_local_python(cmd: list[str], **kwargs: Any) -> Any:
+        assert cmd[0] == "python.exe"
+        assert kwargs["text"] is False
+        return real_run([sys.executable, *cmd[1:]], env=fake_norgatedata_env, **kwargs)
+
+    with patch("momo.data.bridge.subprocess.run", side_effect=run_with_local_python) as mock_run:
+        prices_df = bridge.fetch_price_data(
+            "AAPL",
+            start_date=date(2020, 1, 1),
+            end_date=date(2020, 1, 31),
+            transport="arrow",
+        )
+
+        with pytest.raises(NDUNotRunningError):
+            bridge.execute_norgate_arrow(
+                'norgatedata.price_timeseries("NDUDOWN").reset_index()', timeout=30
+            )
+
+    assert mock_run.call_count == 2
+    assert len(prices_df) == 23  # Business days in January 2020 (fake data)
+    assert (prices_df["symbol"] == "AAPL").all()
+    assert str(prices_df.index.dtype) == "datetime64[ns]"
+    assert str(prices_df["volume"].dtype) == "int64"
+    assert prices_df["close"].iloc[0] == 100.0
@@ -0,0 +1,73 @@
+"""Test ID: 1.2-UNIT-019
+
+Story: 1.2 - Integrate Norgate Data API via Windows Python Bridge
+Priority: P1
+Test Level: Unit
+Risk Coverage: PERF-001 (Sequential bridge calls for large universes)
+
+Description:
+Verify BridgeWorkerPool runs concurrent requests on separate (fake) worker
+processes, starts workers lazily, and that bridge.worker_pool() installs the
+pool for the duration of a block only.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from momo.data import bridge
+from momo.data.worker import BridgeWorkerPool
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_2_unit_019(fake_worker_command: list[str]) -> None:
+    """Test ID: 1.2-UNIT-019
+
+    Verify worker pool concurrency and lifecycle.
+
+    Steps:
+    1. Create a pool of 3 fake workers and verify nothing is started yet
+    2. Run 3 requests that each sleep 1 second from 3 threads
+    3. Verify they overlapped (elapsed well under 3 seconds) on 3 distinct processes
+    4. Use bridge.worker_pool() and verify bridge calls route through the pool
+    5. Verify the pool is uninstalled and shut down on exit
+
+    Expected: Requests run in parallel, one per worker process
+    """
+    with pytest.raises(ValueError, match="size"):
+        BridgeWorkerPool(size=0)
+
+    # Step 1: Lazy start
+    pool = BridgeWorkerPool(size=3, command=fake_worker_command)
+    assert pool.alive_count() == 0
+
+    try:
+        pool.start()  # Pay startup cost outside the timed section
+        code = "(__import__('time').sleep(1), __import__('os').getpid())[1]"
+
+        # Step 2: Concurrent requests
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            pids = list(executor.map(lambda _: pool.execute(code), range(3)))
+        elapsed = time.perf_counter() - started
+
+        # Step 3: Overlap on distinct processes
+        assert elapsed < 2.5, f"Requests did not run concurrently ({elapsed:.2f}s)"
+        assert len(set(pids)) == 3
+        assert pool.ping()
+    finally:
+        pool.shutdown()
+    assert pool.alive_count() == 0
+
+    # Step 4: Context manager installs the pool for bridge calls
+    with bridge.worker_pool(size=2, command=fake_worker_command) as active:
+        assert bridge._persistent_worker is active
+        assert isinstance(active, BridgeWorkerPool)
+        assert bridge.execute_norgate_code("norgatedata.version()") == "1.0.74-fake"
+        assert active.alive_count() == 1  # Only the worker that served the call
+
+    # Step 5: Uninstalled and shut down
+    assert bridge._persistent_worker is None
+    assert active.alive_count() == 0
@@ -0,0 +1,109 @@
+"""Test ID: 1.2-UNIT-020
+
+Story: 1.2 - Integrate Norgate Data API via Windows Python Bridge
+Priority: P1
+Test Level: Unit
+Risk Coverage: PERF-004 (Blocking subprocess calls in async services)
+
+Description:
+Verify the async bridge API on the one-shot subprocess path: concurrency is
+bounded by set_async_concurrency(), cancellation and timeouts kill the child
+process, and results match the blocking API. Wrappers run for real with the
+current interpreter and a fake norgatedata module in place of python.exe.
+"""
+
+import asyncio
+import sys
+from collections.abc import Iterator
+from datetime import date
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from momo.data import bridge
+from momo.utils.exceptions import NorgateBridgeError
+
+
+@pytest.fixture
+def restore_async_concurrency() -> Iterator[None]:
+    """Reset the async concurrency limit after the test."""
+    yield
+    bridge.set_async_concurrency(8)
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_2_unit_020(
+    fake_norgatedata_env: dict[str, str], restore_async_concurrency: None
+) -> None:
+    """Test ID: 1.2-UNIT-020
+
+    Verify async subprocess execution, concurrency limit, cancellation and timeout.
+
+    Steps:
+    1. Redirect python.exe to the current interpreter, tracking live child processes
+    2. Gather 6 price/watchlist/constituent fetches with concurrency limit 2
+    3. Verify results and that at most 2 children ran at once
+    4. Cancel a long-running call and verify its child process was killed
+    5. Let a call time out and verify NorgateBridgeError and a killed child
+
+    Expected: Async API overlaps calls without threads and never leaks processes
+    """
+    real_exec = asyncio.create_subprocess_exec
+    processes: list[asyncio.subprocess.Process] = []
+    max_running = 0
+
+    async def exec_with_local_python(program: str, *args: Any, **kwargs: Any) -> Any:
+        nonlocal max_running
+        assert program == "python.exe"
+        process = await real_exec(sys.executable, *args, env=fake_norgatedata_env, **kwargs)
+        processes.append(process)
+        # Earlier children are reaped before their semaphore slot is released
+        max_running = max(max_running, sum(p.returncode is None for p in processes))
+        return process
+
+    async def scenario() -> None:
+        bridge.set_async_concurrency(2)
+        start, end = date(2020, 1, 1), date(2020, 1, 31)
+
+        # Step 2: Overlapping fetches
+        results = await asyncio.gather(
+            *(
+                bridge.fetch_price_data_async(symbol, start_date=start, end_date=end)
+                for symbol in ["AAPL", "MSFT", "EXIT", "JOIN"]
+            ),
+            bridge.fetch_watchlist_symbols_async("S&P 500"),
+            bridge.fetch_index_constituent_timeseries_async("EXIT", "S&P 500", start, end),
+        )
+
+        # Step 3: Results and concurrency bound
+        assert [len(df) for df in results[:4]] == [23, 23, 23, 23]
+        assert results[0]["symbol"].iloc[0] == "AAPL"
+        assert results[4] == ["AAPL", "MSFT", "EXIT", "JOIN", "NEVER"]
+        assert results[5]["index_constituent"].sum() == 23
+        assert max_running == 2
+
+        # Step 4: Cancellation kills the child
+        task = asyncio.create_task(
+            bridge.execute_norgate_code_async("__import__('time').sleep(30)", timeout=60)
+        )
+        while len(processes) < 7:
+            await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert processes[6].returncode is not None and processes[6].returncode < 0
+
+        # Step 5: Timeout kills the child
+        with pytest.raises(NorgateBridgeError, match="timed out after 1 seconds"):
+            await bridge.execute_norgate_code_async("__import__('time').sleep(30)", timeout=1)
+        assert processes[7].returncode is not None and processes[7].returncode < 0
+
+    with patch(
+        "momo.data.bridge.asyncio.create_subprocess_exec", side_effect=exec_with_local_python
+    ):
+        asyncio.run(asyncio.wait_for(scenario(), timeout=60))
+
+    with pytest.raises(ValueError, match="limit"):
+        bridge.set_async_concurrency(0)
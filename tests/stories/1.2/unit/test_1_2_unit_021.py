@@ -0,0 +1,65 @@
+"""Test ID: 1.2-UNIT-021
+
+Story: 1.2 - Integrate Norgate Data API via Windows Python Bridge
+Priority: P1
+Test Level: Unit
+Risk Coverage: PERF-004 (Blocking subprocess calls in async services)
+
+Description:
+Verify the async bridge API routes through an active persistent worker and
+returns the same results as the blocking API, for both transports.
+"""
+
+import asyncio
+from datetime import date
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from momo.data import bridge
+from momo.data.worker import BridgeWorker
+from momo.utils.exceptions import NDUNotRunningError
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_2_unit_021(persistent_fake_worker: BridgeWorker) -> None:
+    """Test ID: 1.2-UNIT-021
+
+    Verify async API over the persistent worker.
+
+    Steps:
+    1. Install fake worker as persistent worker (fixture)
+    2. Fetch prices (JSON and Arrow), constituents and watchlist asynchronously
+    3. Verify no subprocess is launched and results equal the blocking API
+    4. Verify bridge errors propagate with the same exception types
+
+    Expected: Async variants are drop-in replacements for the blocking functions
+    """
+    start, end = date(2020, 1, 1), date(2020, 2, 28)
+
+    async def scenario() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, list[str]]:
+        return await asyncio.gather(
+            bridge.fetch_price_data_async("AAPL", start_date=start, end_date=end),
+            bridge.fetch_price_data_async(
+                "AAPL", start_date=start, end_date=end, transport="arrow"
+            ),
+            bridge.fetch_index_constituent_timeseries_async("JOIN", "S&P 500", start, end),
+            bridge.fetch_watchlist_symbols_async("S&P 500"),
+        )
+
+    with patch("momo.data.bridge.asyncio.create_subprocess_exec") as mock_exec:
+        json_df, arrow_df, members_df, watchlist = asyncio.run(scenario())
+        mock_exec.assert_not_called()
+
+    expected_df = bridge.fetch_price_data("AAPL", start_date=start, end_date=end)
+    pd.testing.assert_frame_equal(json_df, expected_df)
+    pd.testing.assert_frame_equal(arrow_df, expected_df)
+    pd.testing.assert_frame_equal(
+        members_df, bridge.fetch_index_constituent_timeseries("JOIN", "S&P 500", start, end)
+    )
+    assert watchlist == bridge.fetch_watchlist_symbols("S&P 500")
+
+    with pytest.raises(NDUNotRunningError):
+        asyncio.run(bridge.fetch_price_data_async("NDUDOWN"))
@@ -0,0 +1,70 @@
+"""Test ID: 1.2-UNIT-022
+
+Story: 1.2 - Integrate Norgate Data API via Windows Python Bridge
+Priority: P1
+Test Level: Unit
+Risk Coverage: PERF-005 (Per-symbol, per-date constituent checks)
+
+Description:
+Verify fetch_index_membership_batch() reduces each symbol's membership series
+to membership spells on the Windows side, collects per-symbol errors, and
+agrees with fetch_index_constituent_timeseries().
+"""
+
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from momo.data import bridge
+from momo.data.worker import BridgeWorker
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_2_unit_022(persistent_fake_worker: BridgeWorker) -> None:
+    """Test ID: 1.2-UNIT-022
+
+    Verify batched membership spells through the (fake) persistent worker.
+
+    Steps:
+    1. Install fake worker as persistent worker (fixture)
+    2. Fetch spells for members, a leaver, a joiner, a non-member and a bad symbol
+    3. Verify spell boundaries and the error map
+    4. Verify spells match the per-symbol constituent timeseries
+
+    Expected: One spell row per membership run; unknown symbols reported, not raised
+    """
+    start, end = date(2020, 1, 1), date(2020, 3, 31)
+    symbols = ["AAPL", "EXIT", "JOIN", "NEVER", "BADSYM"]
+
+    # Step 2: Two batches
+    intervals_df, errors = bridge.fetch_index_membership_batch(
+        symbols, "S&P 500", start_date=start, end_date=end, batch_size=3
+    )
+
+    # Step 3: Spell boundaries (end is the first non-member trading date)
+    expected = pd.DataFrame(
+        {
+            "symbol": ["AAPL", "EXIT", "JOIN"],
+            "start": pd.to_datetime(["2020-01-01", "2020-01-01", "2020-02-18"]),
+            "end": pd.to_datetime([None, "2020-02-17", None]),
+        }
+    )
+    pd.testing.assert_frame_equal(intervals_df, expected)
+    assert list(errors) == ["BADSYM"]
+    assert "not found" in errors["BADSYM"]
+
+    # Step 4: Same membership as the per-symbol timeseries
+    for symbol in ["AAPL", "EXIT", "JOIN", "NEVER"]:
+        series = bridge.fetch_index_constituent_timeseries(symbol, "S&P 500", start, end)
+        spells = intervals_df[intervals_df["symbol"] == symbol]
+        member = pd.Series(0, index=series.index, dtype="int64")
+        for spell_start, spell_end in zip(spells["start"], spells["end"], strict=True):
+            if pd.isna(spell_end):
+                spell_end = pd.Timestamp.max
+            member[(series.index >= spell_start) & (series.index < spell_end)] = 1
+        pd.testing.assert_series_equal(member, series["index_constituent"], check_names=False)
+
+    with pytest.raises(ValueError, match="batch_size"):
+        bridge.fetch_index_membership_batch(symbols, "S&P 500", batch_size=0)
@@ -0,0 +1,81 @@
+"""Test ID: 1.2-UNIT-023
+
+Story: 1.2 - Integrate Norgate Data API via Windows Python Bridge
+Priority: P1
+Test Level: Unit
+Risk Coverage: PERF-005 (Per-symbol, per-date constituent checks)
+
+Description:
+Verify the batched, parallel mode of get_index_constituents_at_date() returns
+the same list as the per-symbol mode, with the same skip and raise semantics.
+"""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from momo.data import bridge
+from momo.data.validation import get_index_constituents_at_date
+from momo.data.worker import BridgeWorker
+from momo.utils.exceptions import NDUNotRunningError, NorgateBridgeError
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_2_unit_023(persistent_fake_worker: BridgeWorker) -> None:
+    """Test ID: 1.2-UNIT-023
+
+    Verify batched constituent checks match serial checks through the fake worker.
+
+    Steps:
+    1. Install fake worker as persistent worker (fixture)
+    2. Resolve the whole watchlist plus an unknown symbol serially and batched
+       (chunks of 2, two threads) around EXIT leaving and JOIN joining
+    3. Verify identical lists and one bridge round trip per chunk
+    4. Verify NDU-down and non-"not found" per-symbol errors raise in batched mode
+
+    Expected: Batched mode is a drop-in replacement for the serial loop
+    """
+    symbols = [*bridge.fetch_watchlist_symbols("S&P 500"), "BADSYM"]
+    execute = bridge.execute_norgate_code
+
+    # Step 2/3: Friday, Saturday after EXIT's last day, and JOIN's first day
+    for target in [date(2020, 2, 14), date(2020, 2, 15), date(2020, 2, 18)]:
+        serial = get_index_constituents_at_date("S&P 500", target, symbols=symbols)
+
+        with patch("momo.data.bridge.execute_norgate_code", side_effect=execute) as spy:
+            batched = get_index_constituents_at_date(
+                "S&P 500", target, symbols=symbols, batch_size=2, max_workers=2
+            )
+        assert batched == serial
+        assert spy.call_count == 3
+
+    assert serial == ["AAPL", "MSFT", "JOIN"]
+
+    # Watchlist mode (symbols=None)
+    assert get_index_constituents_at_date(
+        "S&P 500", date(2020, 2, 14), batch_size=3
+    ) == get_index_constituents_at_date("S&P 500", date(2020, 2, 14))
+
+    # Step 4: Raise semantics
+    with pytest.raises(NDUNotRunningError):
+        get_index_constituents_at_date(
+            "S&P 500", date(2020, 2, 14), symbols=["AAPL", "NDUDOWN"], batch_size=10
+        )
+
+    transport_error: tuple[list[str], list[str], dict[str, str]] = (
+        ["AAPL"],
+        [],
+        {"MSFT": "OSError: pipe closed"},
+    )
+    with (
+        patch("momo.data.validation.fetch_index_members_batch", return_value=transport_error),
+        pytest.raises(NorgateBridgeError, match="MSFT"),
+    ):
+        get_index_constituents_at_date(
+            "S&P 500", date(2020, 2, 14), symbols=["AAPL", "MSFT"], batch_size=10
+        )
+
+    with pytest.raises(ValueError, match="batch_size"):
+        get_index_constituents_at_date("S&P 500", date(2020, 2, 14), batch_size=0)
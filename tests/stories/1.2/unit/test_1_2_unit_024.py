@@ -0,0 +1,71 @@
+"""Test ID: 1.2-UNIT-024
+
+Story: 1.2 - Integrate Norgate Data API via Windows Python Bridge
+Priority: P1
+Test Level: Unit
+Risk Coverage: PERF-006 (Refetching whole cached ranges to detect staleness)
+
+Description:
+Verify fetch_price_status_batch() returns each symbol's last quoted date, last
+update time and requested check-date close in one round trip per batch.
+"""
+
+from datetime import date, datetime
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from momo.data import bridge
+from momo.data.worker import BridgeWorker
+from momo.utils.exceptions import NDUNotRunningError
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_2_unit_024(persistent_fake_worker: BridgeWorker) -> None:
+    """Test ID: 1.2-UNIT-024
+
+    Verify the batched price status probe through the fake worker.
+
+    Steps:
+    1. Install fake worker as persistent worker (fixture)
+    2. Probe two good symbols and one unknown symbol in batches of 2, asking
+       for AAPL's close on one date
+    3. Verify schema, values, per-symbol errors and one round trip per batch
+    4. Verify NDU-down raises
+
+    Expected: Status rows for good symbols, errors for bad ones
+    """
+    execute = bridge.execute_norgate_code
+    with patch("momo.data.bridge.execute_norgate_code", side_effect=execute) as spy:
+        status_df, errors = bridge.fetch_price_status_batch(
+            ["AAPL", "BADSYM", "MSFT"], batch_size=2, check_dates={"AAPL": date(2020, 3, 31)}
+        )
+
+    # Step 3: Schema and values
+    assert spy.call_count == 2
+    columns = ["symbol", "last_quoted_date", "last_updated", "check_close"]
+    assert list(status_df.columns) == columns
+    assert status_df["symbol"].tolist() == ["AAPL", "MSFT"]
+    assert (status_df["last_quoted_date"] == pd.Timestamp("2020-03-31")).all()
+    assert str(status_df["last_updated"].dtype) == "datetime64[ns, UTC]"
+    expected_update = pd.Timestamp(datetime(2020, 4, 1, 6, 30).astimezone())
+    assert (status_df["last_updated"] == expected_update).all()
+    # The fake's close is 100 on the first day of the requested range
+    assert status_df["check_close"].iloc[0] == 100.0
+    assert pd.isna(status_df["check_close"].iloc[1])
+    assert list(errors) == ["BADSYM"]
+    assert "not found" in errors["BADSYM"]
+
+    # Empty input makes no round trip
+    empty_df, empty_errors = bridge.fetch_price_status_batch([])
+    assert empty_df.empty and empty_errors == {}
+    assert list(empty_df.columns) == columns
+
+    # Step 4: NDU down
+    with pytest.raises(NDUNotRunningError):
+        bridge.fetch_price_status_batch(["AAPL", "NDUDOWN"])
+
+    with pytest.raises(ValueError, match="batch_size"):
+        bridge.fetch_price_status_batch(["AAPL"], batch_size=0)
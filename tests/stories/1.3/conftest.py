@@ -3,11 +3,15 @@
 This module provides common test fixtures for data loading and Parquet caching tests.
 """
 
+from datetime import date
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 import pytest
 
+from momo.utils.exceptions import NorgateBridgeError
+
 
 @pytest.fixture
 def sample_price_df() -> pd.DataFrame:
@@ -74,15 +78,78 @@ def invalid_schema_dfs(sample_price_df: pd.DataFrame) -> dict[str, pd.DataFrame]
 
 
 @pytest.fixture
-def temp_cache_dir(tmp_path: Path) -> Path:
-    """Temporary cache directory using pytest tmp_path fixture.
+def temp_cache_dir(cache_workdir: Path) -> Path:
+    """Temporary cache directory under an isolated working directory.
 
     Args:
-        tmp_path: Pytest built-in temporary directory fixture
+        cache_workdir: Temporary working directory (see ``cache_workdir``)
 
     Returns:
         Path to isolated cache directory for testing (data/cache/prices/)
     """
-    cache_dir = tmp_path / "data" / "cache" / "prices"
+    cache_dir = cache_workdir / "data" / "cache" / "prices"
     cache_dir.mkdir(parents=True, exist_ok=True)
     return cache_dir
+
+
+class FakePriceSource:
+    """Deterministic stand-in for bridge.fetch_price_data() over business days.
+
+    Prices depend only on (symbol, date), so any two fetches of overlapping
+    ranges agree row for row. Symbols starting with "BAD" raise
+    NorgateBridgeError, as do ranges without business days (like the bridge
+    does for empty Norgate results).
+
+    Attributes:
+        calls: (symbol, start_date, end_date) of every fetch, in call order
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, date | None, date | None]] = []
+
+    def __call__(
+        self,
+        symbol: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        **kwargs: Any,
+    ) -> pd.DataFrame:
+        self.calls.append((symbol, start_date, end_date))
+        if symbol.startswith("BAD"):
+            raise NorgateBridgeError(f"Symbol {symbol} not found")
+
+        dates = pd.bdate_range(start_date or "2020-01-01", end_date or "2020-12-31", name="date")
+        if len(dates) == 0:
+            raise NorgateBridgeError("Failed to parse price data from bridge: 'date'")
+
+        close = 100.0 + sum(map(ord, symbol)) % 50 + dates.dayofyear.to_numpy(dtype="float64")
+        return pd.DataFrame(
+            {
+                "symbol": symbol,
+                "open": close - 0.5,
+                "high": close + 1.0,
+                "low": close - 1.0,
+                "close": close,
+                "volume": (dates.dayofyear.to_numpy() * 1000).astype("int64"),
+                "unadjusted_close": close * 2,
+                "dividend": 0.0,
+            },
+            index=dates,
+        )
+
+
+@pytest.fixture
+def fake_price_source() -> FakePriceSource:
+    """Fresh FakePriceSource to use as bridge.fetch_price_data side effect."""
+    return FakePriceSource()
+
+
+@pytest.fixture
+def cache_workdir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Run the test from tmp_path so data/cache/ is created in isolation.
+
+    Returns:
+        Temporary working directory
+    """
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
@@ -16,7 +16,6 @@ Expected: Cache load completes in <50ms (establishes performance baseline)
 import time
 from datetime import date
 from pathlib import Path
-from unittest.mock import patch
 
 import pandas as pd
 import pytest
@@ -62,25 +61,19 @@ def test_1_3_int_005_cache_load_performance(temp_cache_dir: Path) -> None:
     # Step 2: Save dataset to cache
     universe = "perf_test_cache"
 
-    # Patch get_cache_path to use temp directory
-    def mock_get_cache_path(universe_param: str, start_date: date, end_date: date) -> Path:
-        filename = f"{universe_param}_{start_date.isoformat()}_{end_date.isoformat()}.parquet"
-        return temp_cache_dir / filename
-
-    with patch("momo.data.cache.get_cache_path", side_effect=mock_get_cache_path):
-        save_prices(sample_df, universe=universe, start_date=start, end_date=end)
-
-        # Step 3: Measure cache load time (5 iterations to get stable measurement)
-        load_times = []
-        for _ in range(5):
-            start_time = time.perf_counter()
-            loaded_df = load_prices(universe=universe, start_date=start, end_date=end)
-            end_time = time.perf_counter()
-            load_times.append((end_time - start_time) * 1000)  # Convert to milliseconds
-
-            # Sanity check: verify data loaded correctly
-            assert loaded_df is not None
-            assert len(loaded_df) == len(sample_df)
+    save_prices(sample_df, universe=universe, start_date=start, end_date=end)
+
+    # Step 3: Measure cache load time (5 iterations to get stable measurement)
+    load_times = []
+    for _ in range(5):
+        start_time = time.perf_counter()
+        loaded_df = load_prices(universe=universe, start_date=start, end_date=end)
+        end_time = time.perf_counter()
+        load_times.append((end_time - start_time) * 1000)  # Convert to milliseconds
+
+        # Sanity check: verify data loaded correctly
+        assert loaded_df is not None
+        assert len(loaded_df) == len(sample_df)
 
     # Step 4: Assert average load time < 50ms
     avg_load_time = sum(load_times) / len(load_times)
@@ -18,7 +18,6 @@ Note: This test requires NDU running on Windows. It will skip gracefully if NDU
 import time
 from datetime import date
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
@@ -48,26 +47,17 @@ def test_1_3_int_006_api_fetch_baseline(temp_cache_dir: Path) -> None:
     universe = "perf_test_api"
 
     # Step 2: Fetch fresh data via bridge (bypass cache)
-    # Patch get_cache_path to use temp directory
-    def mock_get_cache_path(universe_param: str, start_date: date, end_date: date) -> Path:
-        filename = f"{universe_param}_{start_date.isoformat()}_{end_date.isoformat()}.parquet"
-        return temp_cache_dir / filename
-
     try:
-        with (
-            patch("momo.data.cache.get_cache_path", side_effect=mock_get_cache_path),
-            patch("momo.data.loader.cache.get_cache_path", side_effect=mock_get_cache_path),
-        ):
-            # Step 3: Measure fetch time
-            start_time = time.perf_counter()
-            result_df = load_universe(
-                symbols=test_symbols,
-                start_date=start,
-                end_date=end,
-                universe=universe,
-                force_refresh=True,  # Force bridge calls
-            )
-            end_time = time.perf_counter()
+        # Step 3: Measure fetch time
+        start_time = time.perf_counter()
+        result_df = load_universe(
+            symbols=test_symbols,
+            start_date=start,
+            end_date=end,
+            universe=universe,
+            force_refresh=True,  # Force bridge calls
+        )
+        end_time = time.perf_counter()
 
         fetch_time_ms = (end_time - start_time) * 1000
 
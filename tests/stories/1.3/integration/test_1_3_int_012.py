@@ -0,0 +1,74 @@
+"""Test ID: 1.3-INT-012
+
+Integration test for incremental (append-only) cache refresh in load_universe().
+"""
+
+from datetime import date
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from momo.data import cache
+from momo.data.loader import load_universe
+
+
+@pytest.mark.p1
+@pytest.mark.integration
+def test_1_3_int_012_incremental_refresh(fake_price_source: Any, cache_workdir: Path) -> None:
+    """Test ID: 1.3-INT-012
+
+    Verify incremental refresh fetches only missing tails and matches a full fetch.
+
+    Steps:
+    1. Cache January 2020 for AAPL and MSFT
+    2. Request through 2020-02-14 with incremental=True, adding GOOGL and BADSYM
+    3. Verify only tails were fetched for cached symbols, full range for new ones
+    4. Verify merged result equals a full (non-incremental) fetch
+    5. Verify the old cache file was replaced by the extended range
+    6. Verify a symbol whose tail fetch fails keeps its cached rows
+
+    Expected: Only missing rows are fetched; result is identical to a full rebuild
+    """
+    start = date(2020, 1, 1)
+
+    with patch("momo.data.loader.bridge.fetch_price_data", side_effect=fake_price_source):
+        # Step 1: Initial cache
+        load_universe(["AAPL", "MSFT"], start, date(2020, 1, 31), "inc")
+
+        # Step 2: Incremental extension
+        fake_price_source.calls.clear()
+        result_df = load_universe(
+            ["AAPL", "MSFT", "GOOGL", "BADSYM"],
+            start,
+            date(2020, 2, 14),
+            "inc",
+            incremental=True,
+        )
+
+        # Step 3: Tail-only fetches
+        assert sorted(fake_price_source.calls) == [
+            ("AAPL", date(2020, 2, 1), date(2020, 2, 14)),
+            ("BADSYM", start, date(2020, 2, 14)),
+            ("GOOGL", start, date(2020, 2, 14)),
+            ("MSFT", date(2020, 2, 1), date(2020, 2, 14)),
+        ]
+
+        # Step 4: Same as full fetch
+        expected_df = load_universe(
+            ["AAPL", "MSFT", "GOOGL"], start, date(2020, 2, 14), "full", force_refresh=True
+        )
+        pd.testing.assert_frame_equal(result_df, expected_df)
+
+        # Step 5: Cache file replaced
+        assert cache.list_cached_ranges("inc") == [(start, date(2020, 2, 14))]
+
+        # Step 6: Weekend-only tail has no rows - cached rows are kept
+        fake_price_source.calls.clear()
+        weekend_df = load_universe(
+            ["AAPL", "MSFT", "GOOGL"], start, date(2020, 2, 16), "inc", incremental=True
+        )
+        assert [call[1] for call in fake_price_source.calls] == [date(2020, 2, 15)] * 3
+        pd.testing.assert_frame_equal(weekend_df, expected_df)
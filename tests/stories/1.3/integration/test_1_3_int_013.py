@@ -0,0 +1,80 @@
+"""Test ID: 1.3-INT-013
+
+Integration test for the per-symbol partitioned store in load_universe().
+"""
+
+from datetime import date
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from momo.data import cache
+from momo.data.loader import load_universe
+
+
+@pytest.mark.p1
+@pytest.mark.integration
+def test_1_3_int_013_partitioned_universe_store(
+    fake_price_source: Any, cache_workdir: Path
+) -> None:
+    """Test ID: 1.3-INT-013
+
+    Verify overlapping universes share partitions and only stale ones are refetched.
+
+    Steps:
+    1. Load universe "a" (AAPL, BRK.B) partitioned for January 2020
+    2. Load universe "b" (BRK.B, GOOGL, BADSYM) over a sub-range
+    3. Verify only GOOGL and BADSYM were fetched and the result matches a
+       monolithic fetch
+    4. Extend universe "a" to February: verify partitions are refetched over the
+       union range and no monolithic cache file is written
+    5. Verify universes are stored as symbol lists
+
+    Expected: Each symbol is fetched once per range extension, whatever universe
+    """
+    january = (date(2020, 1, 1), date(2020, 1, 31))
+
+    with patch("momo.data.loader.bridge.fetch_price_data", side_effect=fake_price_source):
+        # Step 1: First universe populates partitions
+        load_universe(["AAPL", "BRK.B"], *january, "a", partitioned=True)
+        assert cache.get_partition_range("BRK.B") == january
+
+        # Step 2: Overlapping universe
+        fake_price_source.calls.clear()
+        result_df = load_universe(
+            ["BRK.B", "GOOGL", "BADSYM"],
+            date(2020, 1, 6),
+            date(2020, 1, 17),
+            "b",
+            partitioned=True,
+        )
+
+        # Step 3: Shared partition served from cache
+        assert fake_price_source.calls == [
+            ("GOOGL", date(2020, 1, 6), date(2020, 1, 17)),
+            ("BADSYM", date(2020, 1, 6), date(2020, 1, 17)),
+        ]
+        expected_df = load_universe(
+            ["BRK.B", "GOOGL"], date(2020, 1, 6), date(2020, 1, 17), "full", force_refresh=True
+        )
+        pd.testing.assert_frame_equal(result_df, expected_df)
+
+        # Step 4: Stale partitions grow to the union range
+        fake_price_source.calls.clear()
+        extended_df = load_universe(
+            ["AAPL", "BRK.B"], date(2020, 1, 15), date(2020, 2, 14), "a", partitioned=True
+        )
+        assert fake_price_source.calls == [
+            ("AAPL", date(2020, 1, 1), date(2020, 2, 14)),
+            ("BRK.B", date(2020, 1, 1), date(2020, 2, 14)),
+        ]
+        assert cache.get_partition_range("AAPL") == (date(2020, 1, 1), date(2020, 2, 14))
+        assert extended_df.index.get_level_values("date").min() == pd.Timestamp("2020-01-15")
+        assert cache.list_cached_ranges("a") == []
+
+        # Step 5: Universe symbol lists
+        assert cache.load_universe_symbols("a") == ["AAPL", "BRK.B"]
+        assert cache.load_universe_symbols("b") == ["BRK.B", "GOOGL", "BADSYM"]
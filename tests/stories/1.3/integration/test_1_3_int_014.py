@@ -0,0 +1,81 @@
+"""Test ID: 1.3-INT-014
+
+Integration test for checkpointed, resumable universe fetches in load_universe().
+"""
+
+from datetime import date
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from momo.data import cache
+from momo.data.loader import load_universe
+
+
+@pytest.mark.p1
+@pytest.mark.integration
+def test_1_3_int_014_checkpointed_resume(fake_price_source: Any, cache_workdir: Path) -> None:
+    """Test ID: 1.3-INT-014
+
+    Verify an interrupted checkpointed fetch resumes with only unfinished symbols.
+
+    Steps:
+    1. Kill a checkpointed fetch on its third symbol
+    2. Verify no cache file exists but the first two symbols are checkpointed
+    3. Rerun and verify only the unfinished symbols are fetched
+    4. Verify the result equals an uninterrupted fetch and checkpoints are removed
+    5. Interrupt again, then rerun with force_refresh=True and verify every
+       symbol is fetched afresh
+
+    Expected: Reruns resume from the first unfinished symbol with identical
+    results; forced refreshes never reuse checkpoints
+    """
+    symbols = ["AAPL", "MSFT", "GOOGL", "BADSYM", "AMZN"]
+    start, end = date(2020, 1, 1), date(2020, 2, 28)
+
+    def dies_on_googl(symbol: str, *args: Any, **kwargs: Any) -> pd.DataFrame:
+        if symbol == "GOOGL":
+            raise RuntimeError("NDU restarted")
+        return fake_price_source(symbol, *args, **kwargs)
+
+    # Step 1: Interrupted run
+    with (
+        patch("momo.data.loader.bridge.fetch_price_data", side_effect=dies_on_googl),
+        pytest.raises(RuntimeError, match="NDU restarted"),
+    ):
+        load_universe(symbols, start, end, "resume", checkpoint=True)
+
+    # Step 2: Checkpoints only
+    assert not cache.get_cache_path("resume", start, end).exists()
+    assert list(cache.load_checkpoints("resume", start, end, symbols)) == ["AAPL", "MSFT"]
+
+    with patch("momo.data.loader.bridge.fetch_price_data", side_effect=fake_price_source):
+        # Step 3: Resume
+        fake_price_source.calls.clear()
+        resumed_df = load_universe(symbols, start, end, "resume", checkpoint=True)
+        assert [call[0] for call in fake_price_source.calls] == ["GOOGL", "BADSYM", "AMZN"]
+
+        # Step 4: Same as an uninterrupted fetch, checkpoints cleared
+        expected_df = load_universe(symbols, start, end, "plain")
+        pd.testing.assert_frame_equal(resumed_df, expected_df)
+        pd.testing.assert_frame_equal(cache.load_prices("resume", start, end), expected_df)
+        assert not cache.get_checkpoint_dir("resume", start, end).exists()
+
+    # Step 5: A forced refresh discards leftover checkpoints
+    with (
+        patch("momo.data.loader.bridge.fetch_price_data", side_effect=dies_on_googl),
+        pytest.raises(RuntimeError, match="NDU restarted"),
+    ):
+        load_universe(symbols, start, end, "forced", checkpoint=True)
+    assert list(cache.load_checkpoints("forced", start, end, symbols)) == ["AAPL", "MSFT"]
+    with patch("momo.data.loader.bridge.fetch_price_data", side_effect=fake_price_source):
+        fake_price_source.calls.clear()
+        forced_df = load_universe(
+            symbols, start, end, "forced", checkpoint=True, force_refresh=True
+        )
+    assert [call[0] for call in fake_price_source.calls] == symbols
+    pd.testing.assert_frame_equal(forced_df, expected_df)
+    assert not cache.get_checkpoint_dir("forced", start, end).exists()
@@ -0,0 +1,180 @@
+"""Test ID: 1.3-INT-015
+
+Integration test for staleness revalidation of cache hits in load_universe().
+"""
+
+from datetime import date
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from momo.data import cache
+from momo.data.loader import load_universe
+
+
+def _status(rows: list[tuple[str, str, str | None, float]]) -> pd.DataFrame:
+    """Build a bridge.fetch_price_status_batch() frame."""
+    status_df = pd.DataFrame(
+        rows, columns=["symbol", "last_quoted_date", "last_updated", "check_close"]
+    )
+    status_df["last_quoted_date"] = pd.to_datetime(status_df["last_quoted_date"])
+    status_df["last_updated"] = pd.to_datetime(status_df["last_updated"], utc=True)
+    return status_df
+
+
+def _last_close(prices_df: pd.DataFrame, symbol: str) -> float:
+    """Close on a symbol's last cached date."""
+    return float(prices_df.xs(symbol, level="symbol")["close"].iloc[-1])
+
+
+@pytest.mark.p1
+@pytest.mark.integration
+def test_1_3_int_015_revalidation(fake_price_source: Any, cache_workdir: Path) -> None:
+    """Test ID: 1.3-INT-015
+
+    Verify revalidation refetches exactly the symbols Norgate has changed.
+
+    Steps:
+    1. Cache a universe while GOOGL's quotes stop two weeks early
+    2. Revalidate with MSFT's history back-adjusted (its close on the last
+       cached date differs), GOOGL quoted to the end of the range, AAPL
+       unchanged and BADSYM failing the probe
+    3. Verify only MSFT and GOOGL are refetched over the whole range and the
+       file is rewritten with their new rows
+    4. Revalidate again after a nightly update that moved every last update
+       time but changed no history, and verify no price fetch
+    5. Verify a sub-range hit revalidates its covering file
+
+    Expected: One probe per revalidation; only stale symbols are refetched
+    """
+    symbols = ["AAPL", "MSFT", "GOOGL", "BADSYM"]
+    start, end = date(2020, 1, 1), date(2020, 2, 28)
+
+    def googl_lags(symbol: str, start_date: date, end_date: date, **kwargs: Any) -> pd.DataFrame:
+        if symbol == "GOOGL":
+            end_date = date(2020, 2, 14)
+        return fake_price_source(symbol, start_date, end_date, **kwargs)
+
+    def msft_adjusted(symbol: str, *args: Any, **kwargs: Any) -> pd.DataFrame:
+        symbol_df = fake_price_source(symbol, *args, **kwargs)
+        if symbol == "MSFT":
+            symbol_df["close"] -= 1.0
+        return symbol_df
+
+    # Step 1: Initial fetch (BADSYM has no data)
+    with patch("momo.data.loader.bridge.fetch_price_data", side_effect=googl_lags):
+        cached_df = load_universe(symbols, start, end, "nightly")
+    entry = cache.get_cache_entry("nightly", start, end)
+    assert entry is not None
+    written_at = pd.Timestamp(entry.created_at)
+    assert cached_df.xs("GOOGL", level="symbol").index.max() == pd.Timestamp("2020-02-14")
+
+    # Step 2: Revalidate
+    later = (written_at + pd.Timedelta(hours=1)).isoformat()
+    status = _status(
+        [
+            ("AAPL", "2020-03-31", later, _last_close(cached_df, "AAPL")),
+            ("MSFT", "2020-03-31", later, _last_close(cached_df, "MSFT") - 1.0),
+            ("GOOGL", "2020-03-31", None, _last_close(cached_df, "GOOGL")),
+        ]
+    )
+    with (
+        patch(
+            "momo.data.loader.bridge.fetch_price_status_batch",
+            return_value=(status, {"BADSYM": "ValueError: Symbol BADSYM not found"}),
+        ) as probe,
+        patch("momo.data.loader.bridge.fetch_price_data", side_effect=msft_adjusted),
+    ):
+        fake_price_source.calls.clear()
+        result = load_universe(symbols, start, end, "nightly", revalidate=True)
+
+    # Step 3: Only stale symbols refetched over the whole range
+    probe.assert_called_once_with(
+        ["AAPL", "MSFT", "GOOGL"],
+        check_dates={
+            "AAPL": date(2020, 2, 28),
+            "MSFT": date(2020, 2, 28),
+            "GOOGL": date(2020, 2, 14),
+        },
+        adjustment="TOTALRETURN",
+    )
+    assert fake_price_source.calls == [("MSFT", start, end), ("GOOGL", start, end)]
+    assert result.index.get_level_values("symbol").unique().tolist() == ["AAPL", "MSFT", "GOOGL"]
+    assert result.xs("GOOGL", level="symbol").index.max() == pd.Timestamp("2020-02-28")
+    pd.testing.assert_series_equal(
+        result.xs("MSFT", level="symbol")["close"],
+        cached_df.xs("MSFT", level="symbol")["close"] - 1.0,
+    )
+    pd.testing.assert_frame_equal(
+        result.xs("AAPL", level="symbol"), cached_df.xs("AAPL", level="symbol")
+    )
+    pd.testing.assert_frame_equal(cache.load_prices("nightly", start, end), result)
+
+    # Step 4: Update times moved past the rewrite, history did not change
+    rewritten_at = pd.Timestamp(cache.get_cache_entry("nightly", start, end).created_at)
+    assert rewritten_at > written_at
+    updated = (rewritten_at + pd.Timedelta(days=1)).isoformat()
+    unchanged = _status(
+        [
+            (symbol, "2020-02-28", updated, _last_close(result, symbol))
+            for symbol in ["AAPL", "MSFT", "GOOGL"]
+        ]
+    )
+    with (
+        patch(
+            "momo.data.loader.bridge.fetch_price_status_batch", return_value=(unchanged, {})
+        ) as probe,
+        patch("momo.data.loader.bridge.fetch_price_data", side_effect=fake_price_source),
+    ):
+        fake_price_source.calls.clear()
+        again = load_universe(symbols, start, end, "nightly", revalidate=True)
+
+        # Step 5: Sub-range hit probes the covering file
+        feb = load_universe(
+            symbols, date(2020, 2, 1), end, "nightly", revalidate=True, columns=["close"]
+        )
+    assert probe.call_count == 2
+    assert fake_price_source.calls == []
+    pd.testing.assert_frame_equal(again, result)
+    in_feb = result.index.get_level_values("date") >= pd.Timestamp("2020-02-01")
+    pd.testing.assert_frame_equal(feb, result.loc[in_feb, ["close"]])
+
+
+@pytest.mark.p1
+@pytest.mark.integration
+def test_1_3_int_015_revalidation_weekend_end(fake_price_source: Any, cache_workdir: Path) -> None:
+    """Test ID: 1.3-INT-015
+
+    Verify a range ending on a weekend is not stale once it holds the last
+    trading day's quotes.
+
+    Steps:
+    1. Cache December 2023 (the 31st is a Sunday; the last trading day is the 29th)
+    2. Revalidate with Norgate quoted past the range and unchanged closes
+    3. Verify nothing is refetched
+
+    Expected: The weekend end date is never expected as a quote date
+    """
+    start, end = date(2023, 12, 1), date(2023, 12, 31)
+    with patch("momo.data.loader.bridge.fetch_price_data", side_effect=fake_price_source):
+        cached_df = load_universe(["AAPL", "MSFT"], start, end, "month_end")
+    assert cached_df.index.get_level_values("date").max() == pd.Timestamp("2023-12-29")
+
+    unchanged = _status(
+        [
+            (symbol, "2024-01-05", None, _last_close(cached_df, symbol))
+            for symbol in ["AAPL", "MSFT"]
+        ]
+    )
+    with (
+        patch("momo.data.loader.bridge.fetch_price_status_batch", return_value=(unchanged, {})),
+        patch("momo.data.loader.bridge.fetch_price_data", side_effect=fake_price_source),
+    ):
+        fake_price_source.calls.clear()
+        result = load_universe(["AAPL", "MSFT"], start, end, "month_end", revalidate=True)
+
+    assert fake_price_source.calls == []
+    pd.testing.assert_frame_equal(result, cached_df)
@@ -65,6 +65,9 @@ def test_load_universe_fetches_via_bridge_on_cache_miss(
                     universe="test_universe",
                     start_date=start_date,
                     end_date=end_date,
+                    mmap=False,
+                    columns=None,
+                    compact=False,
                 )
 
                 # Verify result was saved to cache
@@ -87,6 +87,8 @@ def test_1_3_unit_004(sample_price_df: pd.DataFrame) -> None:
                 end_date=end,
                 adjustment="TOTALRETURN",
                 timeout=30,
+                transport="json",
+                worker=None,
             )
             assert (
                 expected_call in mock_fetch.call_args_list
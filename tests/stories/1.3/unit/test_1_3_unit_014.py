@@ -56,6 +56,9 @@ def test_load_universe_returns_cached_data_on_cache_hit(
                 universe="test_universe",
                 start_date=start_date,
                 end_date=end_date,
+                mmap=False,
+                columns=None,
+                compact=False,
             )
 
             # Step 5: Verify returned DataFrame matches cached data
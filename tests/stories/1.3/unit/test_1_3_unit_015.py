@@ -74,6 +74,8 @@ def test_force_refresh_bypasses_cache(sample_price_df: pd.DataFrame) -> None:
             end_date=end,
             adjustment="TOTALRETURN",
             timeout=30,
+            transport="json",
+            worker=None,
         )
 
         # Step 5: Verify cache.save_prices WAS called
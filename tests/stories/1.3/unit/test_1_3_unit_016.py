@@ -14,7 +14,7 @@ from momo.data.cache import invalidate, save_prices
 
 @pytest.mark.p1
 @pytest.mark.unit
-def test_1_3_unit_016(sample_price_df: pd.DataFrame, tmp_path: Path) -> None:
+def test_1_3_unit_016(sample_price_df: pd.DataFrame, cache_workdir: Path) -> None:
     """Test ID: 1.3-UNIT-016
 
     Verify invalidate() removes cache files for given universe.
@@ -34,33 +34,17 @@ def test_1_3_unit_016(sample_price_df: pd.DataFrame, tmp_path: Path) -> None:
     start_date = date(2020, 1, 1)
     end_date = date(2020, 1, 10)
 
-    # Monkey-patch get_cache_path to use tmp_path
-    import momo.data.cache as cache_module
+    # Step 1: Save DataFrame to cache
+    cache_path = save_prices(sample_price_df, universe, start_date, end_date)
 
-    original_get_cache_path = cache_module.get_cache_path
+    # Step 2: Verify cache file exists
+    assert cache_path.exists(), f"Cache file should exist at {cache_path}"
 
-    def patched_get_cache_path(universe: str, start_date: date, end_date: date) -> Path:
-        filename = f"{universe}_{start_date.isoformat()}_{end_date.isoformat()}.parquet"
-        return tmp_path / "data" / "cache" / "prices" / filename
+    # Step 3: Call invalidate()
+    invalidate(universe, start_date, end_date)
 
-    cache_module.get_cache_path = patched_get_cache_path
+    # Step 4: Verify cache file no longer exists
+    assert not cache_path.exists(), f"Cache file should be removed at {cache_path}"
 
-    try:
-        # Step 1: Save DataFrame to cache
-        cache_path = save_prices(sample_price_df, universe, start_date, end_date)
-
-        # Step 2: Verify cache file exists
-        assert cache_path.exists(), f"Cache file should exist at {cache_path}"
-
-        # Step 3: Call invalidate()
-        invalidate(universe, start_date, end_date)
-
-        # Step 4: Verify cache file no longer exists
-        assert not cache_path.exists(), f"Cache file should be removed at {cache_path}"
-
-        # Step 5: Call invalidate() again (idempotent - should not raise error)
-        invalidate(universe, start_date, end_date)  # Should not raise exception
-
-    finally:
-        # Restore original function
-        cache_module.get_cache_path = original_get_cache_path
+    # Step 5: Call invalidate() again (idempotent - should not raise error)
+    invalidate(universe, start_date, end_date)  # Should not raise exception
@@ -0,0 +1,61 @@
+"""Test ID: 1.3-UNIT-019
+
+Test that load_universe(batch_size=...) fetches through the batched bridge API
+and keeps partial-failure semantics.
+"""
+
+from datetime import date
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from momo.data.loader import load_universe
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_3_unit_019_batched_fetch(sample_price_df: pd.DataFrame) -> None:
+    """Test ID: 1.3-UNIT-019
+
+    Verify load_universe() uses bridge.fetch_price_data_batch() when batch_size is set.
+
+    Steps:
+    1. Mock cache miss and bridge.fetch_price_data_batch() returning 2 of 3 symbols
+    2. Call load_universe() with batch_size=50
+    3. Verify single-symbol fetch_price_data() is never called
+    4. Verify batch call received all symbols and batch size
+    5. Verify failed symbol is excluded and result has MultiIndex (date, symbol)
+
+    Expected: Batched fetch produces the same output shape as sequential fetch
+    """
+    # Bridge long format: date index, symbol column
+    batch_df = sample_price_df[
+        sample_price_df.index.get_level_values("symbol").isin(["AAPL", "MSFT"])
+    ].reset_index(level="symbol")
+
+    with (
+        patch("momo.data.loader.cache.load_prices", return_value=None),
+        patch(
+            "momo.data.loader.bridge.fetch_price_data_batch",
+            return_value=(batch_df, {"BADSYM": "ValueError: Symbol BADSYM not found"}),
+        ) as mock_batch,
+        patch("momo.data.loader.bridge.fetch_price_data") as mock_single,
+        patch("momo.data.loader.cache.save_prices") as mock_save,
+    ):
+        result_df = load_universe(
+            symbols=["AAPL", "BADSYM", "MSFT"],
+            start_date=date(2020, 1, 1),
+            end_date=date(2020, 1, 10),
+            universe="test_universe",
+            batch_size=50,
+        )
+
+    mock_single.assert_not_called()
+    assert mock_batch.call_args.kwargs["symbols"] == ["AAPL", "BADSYM", "MSFT"]
+    assert mock_batch.call_args.kwargs["batch_size"] == 50
+    mock_save.assert_called_once()
+
+    assert list(result_df.index.names) == ["date", "symbol"]
+    assert set(result_df.index.get_level_values("symbol")) == {"AAPL", "MSFT"}
+    assert len(result_df) == 20
@@ -0,0 +1,85 @@
+"""Test ID: 1.3-UNIT-020
+
+Test that load_universe(max_workers=...) fetches symbols concurrently while
+keeping deterministic symbol order and partial-failure semantics.
+"""
+
+import threading
+import time
+from datetime import date
+from typing import Any
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from momo.data import bridge
+from momo.data.loader import load_universe
+from momo.utils.exceptions import NorgateBridgeError
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_3_unit_020_parallel_fetch(sample_price_df: pd.DataFrame) -> None:
+    """Test ID: 1.3-UNIT-020
+
+    Verify parallel fetch mode of load_universe().
+
+    Steps:
+    1. Mock fetch_price_data() so earlier symbols finish last, and one symbol fails
+    2. Call load_universe() with max_workers=4
+    3. Verify fetches overlapped (more than one in flight)
+    4. Verify result symbol order follows the input order, failed symbol excluded
+    5. Verify the temporary worker pool was removed afterwards
+    6. Verify invalid max_workers combinations are rejected
+
+    Expected: Parallel fetch returns the same result as sequential fetch
+    """
+    symbols = ["GOOGL", "BADSYM", "MSFT", "AAPL"]
+    delays = {"GOOGL": 0.3, "BADSYM": 0.1, "MSFT": 0.2, "AAPL": 0.0}
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def fake_fetch(symbol: str, **kwargs: Any) -> pd.DataFrame:
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(delays[symbol])
+        with lock:
+            in_flight -= 1
+        if symbol == "BADSYM":
+            raise NorgateBridgeError("Symbol BADSYM not found")
+        symbol_rows = sample_price_df.index.get_level_values("symbol") == symbol
+        return sample_price_df[symbol_rows].reset_index(level="symbol")
+
+    with (
+        patch("momo.data.loader.cache.load_prices", return_value=None),
+        patch("momo.data.loader.bridge.fetch_price_data", side_effect=fake_fetch),
+        patch("momo.data.loader.cache.save_prices") as mock_save,
+    ):
+        result_df = load_universe(
+            symbols=symbols,
+            start_date=date(2020, 1, 1),
+            end_date=date(2020, 1, 10),
+            universe="test_universe",
+            max_workers=4,
+        )
+
+    assert max_in_flight > 1
+    mock_save.assert_called_once()
+    assert result_df.index.get_level_values("symbol").unique().tolist() == [
+        "GOOGL",
+        "MSFT",
+        "AAPL",
+    ]
+    assert len(result_df) == 30
+    assert bridge._persistent_worker is None
+
+    with pytest.raises(ValueError, match="max_workers"):
+        load_universe(symbols, date(2020, 1, 1), date(2020, 1, 10), "u", max_workers=0)
+    with pytest.raises(ValueError, match="cannot be combined"):
+        load_universe(
+            symbols, date(2020, 1, 1), date(2020, 1, 10), "u", max_workers=2, batch_size=10
+        )
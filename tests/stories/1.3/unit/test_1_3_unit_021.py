@@ -0,0 +1,64 @@
+"""Test ID: 1.3-UNIT-021
+
+Test cache.list_cached_ranges() discovery and atomic cache writes.
+"""
+
+from datetime import date
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from momo.data import cache
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_3_unit_021_cached_ranges_and_atomic_write(
+    sample_price_df: pd.DataFrame, cache_workdir: Path
+) -> None:
+    """Test ID: 1.3-UNIT-021
+
+    Verify cached range discovery and atomic replacement of cache files.
+
+    Steps:
+    1. Verify empty result before anything is cached
+    2. Save two ranges for one universe and one for a universe sharing its prefix
+    3. Verify only the universe's own ranges are listed, sorted
+    4. Make the Parquet write fail halfway through an overwrite
+    5. Verify the original file is intact and no temporary file remains
+
+    Expected: Range discovery is exact and writes never leave partial files
+    """
+    assert cache.list_cached_ranges("sp500") == []
+
+    cache.save_prices(sample_price_df, "sp500", date(2021, 1, 1), date(2021, 12, 31))
+    original_path = cache.save_prices(
+        sample_price_df, "sp500", date(2020, 1, 1), date(2020, 12, 31)
+    )
+    cache.save_prices(sample_price_df, "sp500_2", date(2019, 1, 1), date(2019, 12, 31))
+
+    assert cache.list_cached_ranges("sp500") == [
+        (date(2020, 1, 1), date(2020, 12, 31)),
+        (date(2021, 1, 1), date(2021, 12, 31)),
+    ]
+
+    original_bytes = original_path.read_bytes()
+
+    def failing_write(table: Any, where: Path, **kwargs: Any) -> None:
+        Path(where).write_bytes(b"PAR1 partial")
+        raise OSError("disk full")
+
+    with (
+        patch("momo.data.cache.pq.write_table", side_effect=failing_write),
+        pytest.raises(OSError, match="disk full"),
+    ):
+        cache.save_prices(sample_price_df.iloc[:3], "sp500", date(2020, 1, 1), date(2020, 12, 31))
+
+    assert original_path.read_bytes() == original_bytes
+    assert sorted(p.name for p in original_path.parent.iterdir() if p.name.startswith(".")) == []
+    pd.testing.assert_frame_equal(
+        cache.load_prices("sp500", date(2020, 1, 1), date(2020, 12, 31)), sample_price_df
+    )
@@ -0,0 +1,58 @@
+"""Test ID: 1.3-UNIT-022
+
+Test cache.load_prices() superset hits with date filtering.
+"""
+
+import shutil
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+import pytest
+
+from momo.data import cache
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_3_unit_022_superset_cache_hit(
+    sample_price_df: pd.DataFrame, cache_workdir: Path
+) -> None:
+    """Test ID: 1.3-UNIT-022
+
+    Verify a sub-range request is served from a cached file covering it.
+
+    Steps:
+    1. Cache the same data under a wide and a narrower covering range
+    2. Add a file whose name covers the request but whose metadata does not
+    3. Load a sub-range with no exact cache file
+    4. Verify only the requested rows are returned, read from the narrowest
+       covering file
+    5. Verify a range that no file covers is still a cache miss
+
+    Expected: Covering files are found via metadata and filtered on date
+    """
+    cache.save_prices(sample_price_df, "sp500", date(2019, 1, 1), date(2021, 12, 31))
+    narrow_path = cache.save_prices(sample_price_df, "sp500", date(2020, 1, 1), date(2020, 6, 30))
+
+    # Filename claims a tighter cover, but the metadata says 2020-01-04 onwards
+    mislabeled = cache.save_prices(sample_price_df, "sp500", date(2020, 1, 4), date(2020, 1, 31))
+    shutil.move(mislabeled, cache.get_cache_path("sp500", date(2020, 1, 1), date(2020, 1, 31)))
+
+    assert cache.find_covering_range("sp500", date(2020, 1, 3), date(2020, 1, 5)) == (
+        date(2020, 1, 1),
+        date(2020, 6, 30),
+    )
+
+    with patch("momo.data.cache.pq.read_table", wraps=pq.read_table) as read_table:
+        result = cache.load_prices("sp500", date(2020, 1, 3), date(2020, 1, 5))
+
+    # Read through an open handle of the narrow file (see Concurrent Access)
+    assert Path(read_table.call_args.args[0].name) == narrow_path
+    expected = sample_price_df.loc[pd.Timestamp("2020-01-03") : pd.Timestamp("2020-01-05")]
+    assert result is not None
+    pd.testing.assert_frame_equal(result, expected)
+
+    assert cache.load_prices("sp500", date(2018, 6, 1), date(2020, 1, 5)) is None
@@ -0,0 +1,54 @@
+"""Test ID: 1.3-UNIT-023
+
+Test the per-symbol partition store in the cache module.
+"""
+
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from momo.data import cache
+from momo.utils.exceptions import CacheError
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_3_unit_023_symbol_partitions(sample_price_df: pd.DataFrame, cache_workdir: Path) -> None:
+    """Test ID: 1.3-UNIT-023
+
+    Verify partitions round-trip per symbol and assemble in requested order.
+
+    Steps:
+    1. Save one partition per symbol, including a ticker needing URI encoding
+    2. Verify partition paths and recorded ranges
+    3. Load a date sub-range in a custom symbol order
+    4. Verify a frame with several symbols is rejected for a single partition
+
+    Expected: Partitions are independent, filtered on date and ordered by request
+    """
+    frames = dict(tuple(sample_price_df.groupby(level="symbol")))
+    frames["$SPX"] = frames.pop("GOOGL").rename(index={"GOOGL": "$SPX"}, level="symbol")
+
+    for symbol, symbol_df in frames.items():
+        cache.save_symbol_prices(symbol_df, symbol, date(2020, 1, 1), date(2020, 1, 10))
+
+    assert cache.get_partition_path("$SPX").parent.name == "symbol=%24SPX"
+    assert cache.get_partition_range("MSFT") == (date(2020, 1, 1), date(2020, 1, 10))
+    assert cache.get_partition_range("NFLX") is None
+
+    result = cache.load_symbol_prices(
+        ["MSFT", "$SPX", "NFLX", "AAPL"], date(2020, 1, 3), date(2020, 1, 4)
+    )
+    assert result is not None
+    assert list(result.index) == [
+        (pd.Timestamp(day), symbol)
+        for symbol in ["MSFT", "$SPX", "AAPL"]
+        for day in ["2020-01-03", "2020-01-04"]
+    ]
+    assert result.dtypes.equals(sample_price_df.dtypes)
+    assert cache.load_symbol_prices(["NFLX"], date(2020, 1, 1), date(2020, 1, 10)) is None
+
+    with pytest.raises(CacheError, match="other symbols"):
+        cache.save_symbol_prices(sample_price_df, "AAPL", date(2020, 1, 1), date(2020, 1, 10))
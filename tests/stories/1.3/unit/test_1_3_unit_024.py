@@ -0,0 +1,51 @@
+"""Test ID: 1.3-UNIT-024
+
+Test the memory-mapped Arrow tier of cache.load_prices().
+"""
+
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from momo.data import cache
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_3_unit_024_mmap_tier(sample_price_df: pd.DataFrame, cache_workdir: Path) -> None:
+    """Test ID: 1.3-UNIT-024
+
+    Verify mmap loads match Parquet loads and the tier tracks its source file.
+
+    Steps:
+    1. Save prices and load them with mmap=True
+    2. Verify the Arrow tier was built and the frame equals the Parquet load
+    3. Verify numeric columns are read-only views of the mapped file
+    4. Overwrite the cache entry and verify the next mmap load sees new data
+    5. Invalidate and verify the tier is removed with the cache file
+
+    Expected: mmap loads are equivalent to Parquet loads and never stale
+    """
+    start, end = date(2020, 1, 1), date(2020, 1, 10)
+    cache.save_prices(sample_price_df, "sp500", start, end)
+
+    result = cache.load_prices("sp500", start, end, mmap=True)
+
+    mmap_path = cache.get_mmap_path("sp500", start, end)
+    assert mmap_path.exists()
+    assert result is not None
+    pd.testing.assert_frame_equal(result, cache.load_prices("sp500", start, end))
+    assert not result["close"].to_numpy().flags.writeable
+
+    updated_df = sample_price_df.assign(close=sample_price_df["close"] + 1.0)
+    cache.save_prices(updated_df, "sp500", start, end)
+    assert not mmap_path.exists()
+    reloaded = cache.load_prices("sp500", start, end, mmap=True)
+    assert reloaded is not None
+    pd.testing.assert_frame_equal(reloaded, updated_df)
+
+    cache.invalidate("sp500", start, end)
+    assert not mmap_path.exists()
+    assert cache.load_prices("sp500", start, end, mmap=True) is None
@@ -0,0 +1,74 @@
+"""Test ID: 1.3-UNIT-025
+
+Test the in-memory LRU frame cache in front of cache.load_prices().
+"""
+
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from momo.data import cache
+from momo.data.frame_cache import FrameLRU
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_3_unit_025_memory_frame_cache(
+    sample_price_df: pd.DataFrame, cache_workdir: Path
+) -> None:
+    """Test ID: 1.3-UNIT-025
+
+    Verify byte-bounded LRU eviction, counters and read-only cached frames.
+
+    Steps:
+    1. Fill a FrameLRU past its budget and verify the least recently used
+       frame is evicted
+    2. Load the same cache entry twice and verify Parquet is decoded once
+    3. Verify in-place edits of a returned frame raise and do not leak
+    4. Rewrite the cache file and verify the next load sees the new data
+
+    Expected: Repeated loads are served from memory and can never go stale
+    """
+    frame_size = int(sample_price_df.memory_usage(index=True, deep=True).sum())
+    lru = FrameLRU(max_bytes=2 * frame_size)
+    lru.put("a", sample_price_df.copy())
+    lru.put("b", sample_price_df.copy())
+    assert lru.get("a") is not None  # "b" becomes least recently used
+    lru.put("c", sample_price_df.copy())
+    assert lru.get("b") is None
+    assert lru.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 1,
+        "entries": 2,
+        "bytes": 2 * frame_size,
+        "max_bytes": 2 * frame_size,
+    }
+
+    start, end = date(2020, 1, 1), date(2020, 1, 10)
+    cache.save_prices(sample_price_df, "sp500", start, end)
+    cache.clear_memory_cache()
+
+    with patch("momo.data.cache.pd.read_parquet", wraps=pd.read_parquet) as read_parquet:
+        first = cache.load_prices("sp500", start, end)
+        second = cache.load_prices("sp500", start, end)
+
+    assert read_parquet.call_count == 1
+    assert cache.memory_cache_stats()["hits"] == 1
+    assert first is not None and second is not None
+
+    with pytest.raises(ValueError, match="read-only"):
+        first.loc[first.index[0], "close"] = -1.0
+    second["signal"] = 1.0
+    third = cache.load_prices("sp500", start, end)
+    assert third is not None
+    pd.testing.assert_frame_equal(third, sample_price_df)
+
+    updated_df = sample_price_df.assign(close=sample_price_df["close"] * 2)
+    cache.save_prices(updated_df, "sp500", start, end)
+    reloaded = cache.load_prices("sp500", start, end)
+    assert reloaded is not None
+    pd.testing.assert_frame_equal(reloaded, updated_df)
@@ -0,0 +1,73 @@
+"""Test ID: 1.3-UNIT-026
+
+Test column projection in cache.load_prices() and load_universe().
+"""
+
+from datetime import date
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from momo.data import cache
+from momo.data.loader import load_universe
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_3_unit_026_column_projection(
+    sample_price_df: pd.DataFrame, fake_price_source: Any, cache_workdir: Path
+) -> None:
+    """Test ID: 1.3-UNIT-026
+
+    Verify every cache read path returns only the requested columns.
+
+    Steps:
+    1. Load exact, superset, mmap and partition reads with columns=[...]
+    2. Verify each equals the projection of a full load
+    3. Verify load_universe projects both fetched and cached results while
+       caching every column
+    4. Verify unknown columns are rejected before any fetch
+
+    Expected: Projected reads match full reads restricted to the columns
+    """
+    columns = ["dividend", "close"]
+    start, end = date(2020, 1, 1), date(2020, 1, 10)
+    cache.save_prices(sample_price_df, "sp500", start, end)
+    cache.save_symbol_prices(
+        sample_price_df.xs("AAPL", level="symbol", drop_level=False), "AAPL", start, end
+    )
+
+    sub_start, sub_end = date(2020, 1, 2), date(2020, 1, 5)
+    reads = {
+        "exact": cache.load_prices("sp500", start, end, columns=columns),
+        "mmap": cache.load_prices("sp500", start, end, mmap=True, columns=columns),
+        "superset": cache.load_prices("sp500", sub_start, sub_end, columns=columns),
+        "partition": cache.load_symbol_prices(["AAPL"], start, end, columns=columns),
+    }
+    expected = {
+        "exact": sample_price_df[columns],
+        "mmap": sample_price_df[columns],
+        "superset": sample_price_df.loc[pd.Timestamp(sub_start) : pd.Timestamp(sub_end), columns],
+        "partition": sample_price_df.xs("AAPL", level="symbol", drop_level=False)[columns],
+    }
+    for name, result in reads.items():
+        assert result is not None, name
+        pd.testing.assert_frame_equal(result, expected[name], obj=name)
+
+    with patch("momo.data.loader.bridge.fetch_price_data", side_effect=fake_price_source):
+        fetched = load_universe(["AAPL", "MSFT"], start, end, "pair", columns=["close"])
+        cached = load_universe(["AAPL", "MSFT"], start, end, "pair", columns=["close"])
+
+        assert list(fetched.columns) == ["close"]
+        pd.testing.assert_frame_equal(cached, fetched)
+        full = cache.load_prices("pair", start, end)
+        assert full is not None
+        assert list(full.columns) == cache.PRICE_COLUMNS
+
+        fake_price_source.calls.clear()
+        with pytest.raises(ValueError, match="Unknown price columns"):
+            load_universe(["AAPL"], start, end, "other", columns=["adj_close"])
+        assert fake_price_source.calls == []
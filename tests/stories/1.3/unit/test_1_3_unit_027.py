@@ -0,0 +1,83 @@
+"""Test ID: 1.3-UNIT-027
+
+Test streaming universe fetches (iter_universe) and cache writes (PriceWriter).
+"""
+
+from datetime import date
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pandas as pd
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+import pytest
+
+from momo.data import bridge, cache
+from momo.data.loader import iter_universe, load_universe, stream_universe_to_cache
+from momo.utils.exceptions import CacheError
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_3_unit_027_streaming_universe(
+    sample_price_df: pd.DataFrame, fake_price_source: Any, cache_workdir: Path
+) -> None:
+    """Test ID: 1.3-UNIT-027
+
+    Verify streamed fetches and writes match the in-memory load_universe() path.
+
+    Steps:
+    1. Iterate a universe sequentially and in parallel, skipping a failed symbol;
+       the parallel stream fetches on its own pool, not a process-wide worker
+    2. Stream the same universe to the cache, one row group per symbol
+    3. Verify the streamed file equals a load_universe() fetch and is served
+       by load_universe() without refetching
+    4. Verify a failing write or an all-failed universe leaves no cache file
+
+    Expected: Streaming yields per-symbol frames in order and writes the same
+    cache file as the in-memory path
+    """
+    symbols = ["AAPL", "BAD1", "MSFT", "GOOGL"]
+    start, end = date(2020, 1, 1), date(2020, 3, 31)
+
+    with patch(
+        "momo.data.loader.bridge.fetch_price_data", side_effect=fake_price_source
+    ) as mock_fetch:
+        sequential = list(iter_universe(symbols, start, end))
+        with patch("momo.data.loader.BridgeWorkerPool") as pool_cls:
+            stream = iter_universe(symbols, start, end, max_workers=2)
+            parallel = [next(stream)]
+            assert bridge._persistent_worker is None
+            parallel.extend(stream)
+        pool_cls.assert_called_once_with(size=2)
+        assert mock_fetch.call_args.kwargs["worker"] is pool_cls.return_value.__enter__.return_value
+
+        assert [df.index.get_level_values("symbol")[0] for df in sequential] == [
+            "AAPL",
+            "MSFT",
+            "GOOGL",
+        ]
+        for seq_df, par_df in zip(sequential, parallel, strict=True):
+            pd.testing.assert_frame_equal(seq_df, par_df)
+
+        path = stream_universe_to_cache(symbols, start, end, "streamed")
+        assert path == cache.get_cache_path("streamed", start, end)
+        assert pq.ParquetFile(path).num_row_groups == 3
+
+        expected = load_universe(symbols, start, end, "in_memory")
+        fake_price_source.calls.clear()
+        streamed = load_universe(symbols, start, end, "streamed")
+        assert fake_price_source.calls == []
+        pd.testing.assert_frame_equal(streamed, expected)
+        assert cache.read_cache_metadata(path)["momo:universe"] == "streamed"
+
+        with pytest.raises(ValueError, match="All 1 symbols failed"):
+            stream_universe_to_cache(["BAD2"], start, end, "all_bad")
+        assert not cache.get_cache_path("all_bad", start, end).exists()
+
+    writer = cache.PriceWriter("partial", start, end)
+    with pytest.raises(CacheError, match="dtype"), writer:
+        writer.write(sample_price_df)
+        writer.write(sample_price_df.astype({"volume": "float64"}))
+    assert not writer.path.exists()
+    assert [p.name for p in writer.path.parent.iterdir() if p.name.startswith(".")] == []
@@ -0,0 +1,80 @@
+"""Test ID: 1.3-UNIT-028
+
+Test cache write locking and reads concurrent with saves and invalidation.
+"""
+
+import fcntl
+import threading
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from momo.data import cache
+from momo.utils.exceptions import CacheError
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_3_unit_028_concurrent_cache_access(
+    sample_price_df: pd.DataFrame, cache_workdir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test ID: 1.3-UNIT-028
+
+    Verify writers respect the advisory lock and readers only see whole files.
+
+    Steps:
+    1. Hold a cache file's lock and verify save_prices() and invalidate() time
+       out without touching the file
+    2. Alternate saves of two frames in a thread while reading in a loop
+    3. Verify every read returns one of the two complete frames
+    4. Verify reads after invalidate() are clean cache misses
+
+    Expected: Writers serialize on the lock; readers never observe partial files
+    """
+    start, end = date(2020, 1, 1), date(2020, 1, 10)
+    small_df = sample_price_df.iloc[:6]
+    path = cache.save_prices(small_df, "sp500", start, end)
+    original_bytes = path.read_bytes()
+
+    # Step 1: Lock held elsewhere
+    monkeypatch.setattr(cache, "LOCK_TIMEOUT", 0.2)
+    with open(cache.get_lock_path(path), "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        with pytest.raises(CacheError, match="Timed out"):
+            cache.save_prices(sample_price_df, "sp500", start, end)
+        with pytest.raises(CacheError, match="Timed out"):
+            cache.invalidate("sp500", start, end)
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    assert path.read_bytes() == original_bytes
+
+    # Step 2: Concurrent saves and reads
+    stop = threading.Event()
+
+    def keep_saving() -> None:
+        while not stop.is_set():
+            cache.save_prices(sample_price_df, "sp500", start, end)
+            cache.save_prices(small_df, "sp500", start, end)
+
+    writer = threading.Thread(target=keep_saving)
+    writer.start()
+    try:
+        row_counts = set()
+        for _ in range(50):
+            result = cache.load_prices("sp500", start, end)
+            assert result is not None
+            row_counts.add(len(result))
+            # Step 3: Always a complete frame
+            expected = sample_price_df if len(result) == len(sample_price_df) else small_df
+            pd.testing.assert_frame_equal(result, expected)
+    finally:
+        stop.set()
+        writer.join()
+    assert row_counts <= {len(small_df), len(sample_price_df)}
+
+    # Step 4: Invalidated files are misses
+    cache.invalidate("sp500", start, end)
+    assert cache.load_prices("sp500", start, end) is None
+    assert cache.load_prices("sp500", start, end, mmap=True) is None
+    assert [p.name for p in path.parent.iterdir() if p.name.startswith(".")] == []
@@ -0,0 +1,71 @@
+"""Test ID: 1.3-UNIT-029
+
+Test the cache manifest kept by save/invalidate and its rebuild from disk.
+"""
+
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from momo.data import cache
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_3_unit_029_cache_manifest(sample_price_df: pd.DataFrame, cache_workdir: Path) -> None:
+    """Test ID: 1.3-UNIT-029
+
+    Verify the manifest records every cache file and answers lookups alone.
+
+    Steps:
+    1. Save two ranges, a streamed file and a partition
+    2. Verify recorded symbols, rows, sizes and metadata
+    3. Verify coverage and partition lookups read no Parquet footer
+    4. Invalidate one range and delete another file by hand
+    5. Delete the manifest and verify it is rebuilt with the same entries
+
+    Expected: The manifest mirrors the cache directory and stays in sync
+    """
+    jan, q1 = (date(2020, 1, 1), date(2020, 1, 31)), (date(2020, 1, 1), date(2020, 3, 31))
+    cache.save_prices(sample_price_df, "sp500", *jan)
+    q1_path = cache.save_prices(sample_price_df.iloc[:12], "sp500", *q1)
+    with cache.PriceWriter("streamed", *jan) as writer:
+        for _, symbol_df in sample_price_df.groupby(level="symbol", sort=False):
+            writer.write(symbol_df)
+    aapl_df = sample_price_df.xs("AAPL", level="symbol", drop_level=False)
+    cache.save_symbol_prices(aapl_df, "AAPL", *jan)
+
+    # Step 2: Recorded fields
+    entries = {(entry.name, entry.end_date): entry for entry in cache.list_cache_entries()}
+    assert list(entries) == [("sp500", jan[1]), ("sp500", q1[1]), ("streamed", jan[1])]
+    q1_entry = entries["sp500", q1[1]]
+    assert q1_entry.path == q1_path
+    assert q1_entry.symbols == ["AAPL", "MSFT", "GOOGL"]
+    assert q1_entry.row_count == 12
+    assert q1_entry.byte_size == q1_path.stat().st_size
+    metadata = cache.read_cache_metadata(q1_path)
+    assert q1_entry.created_at == metadata["momo:created_at"]
+    assert q1_entry.schema_version == "1.0"
+    assert entries["streamed", jan[1]].row_count == len(sample_price_df)
+    assert cache.get_cache_entry("sp500", *q1) == q1_entry
+
+    # Step 3: No footer reads
+    with patch("momo.data.cache.pq.read_schema", side_effect=AssertionError("footer read")):
+        assert cache.find_covering_range("sp500", date(2020, 1, 5), date(2020, 1, 20)) == jan
+        assert cache.get_partition_range("AAPL") == jan
+
+    # Step 4: Invalidate and hand deletion
+    cache.invalidate("sp500", *jan)
+    assert cache.get_cache_entry("sp500", *jan) is None
+    cache.get_cache_path("streamed", *jan).unlink()
+    assert [entry.path for entry in cache.list_cache_entries()] == [q1_path]
+
+    # Step 5: Rebuild
+    before = cache.list_cache_entries()
+    cache.get_manifest_path().unlink()
+    assert cache.list_cache_entries() == before
+    assert cache.get_partition_range("AAPL") == jan
+    assert cache.list_cached_ranges("sp500") == [q1]
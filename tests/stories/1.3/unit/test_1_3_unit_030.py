@@ -0,0 +1,95 @@
+"""Test ID: 1.3-UNIT-030
+
+Test cache compaction and size-budgeted LRU eviction (momo.data.maintenance).
+"""
+
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from momo.data import cache, maintenance
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_3_unit_030_cache_maintenance(
+    sample_price_df: pd.DataFrame, cache_workdir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test ID: 1.3-UNIT-030
+
+    Verify compaction merges overlapping ranges and eviction honours LRU order.
+
+    Steps:
+    1. Cache overlapping and adjacent ranges of one universe, plus a range with
+       other symbols that must not be merged
+    2. Compact and verify one merged file serves both overlapping ranges while
+       the adjacent range keeps its own file
+    3. Cache overlapping files whose shared rows disagree (re-adjusted prices)
+       and verify compaction leaves them alone
+    4. Read one universe so it becomes most recently used
+    5. Evict to a budget and verify least recently used files go first
+
+    Expected: Space is reclaimed without changing what loads return
+    """
+    monkeypatch.setattr(cache, "TOUCH_INTERVAL", 0.0)
+    first, second = sample_price_df.iloc[:15], sample_price_df.iloc[12:]
+    ranges = {
+        "first": (date(2020, 1, 1), date(2020, 1, 5)),
+        "overlap": (date(2020, 1, 5), date(2020, 1, 8)),
+        "adjacent": (date(2020, 1, 9), date(2020, 1, 10)),
+    }
+    cache.save_prices(first, "sp500", *ranges["first"])
+    cache.save_prices(sample_price_df.loc["2020-01-05":"2020-01-08"], "sp500", *ranges["overlap"])
+    cache.save_prices(second.loc["2020-01-09":], "sp500", *ranges["adjacent"])
+    msft_range = (date(2020, 1, 3), date(2020, 1, 6))
+    msft = sample_price_df.xs("MSFT", level="symbol", drop_level=False)
+    cache.save_prices(msft.loc["2020-01-03":"2020-01-06"], "sp500", *msft_range)
+
+    expected = {name: cache.load_prices("sp500", *dates) for name, dates in ranges.items()}
+
+    # Step 2: Compaction
+    dry = maintenance.compact(dry_run=True)
+    assert dry["files_removed"] == 2
+    assert dry["bytes_reclaimed"] == 0
+    assert len(cache.list_cached_ranges("sp500")) == 4
+
+    report = maintenance.compact("sp500")
+    assert report["files_removed"] == 2
+    assert report["bytes_reclaimed"] == report["bytes_before"] - report["bytes_after"]
+    # The MSFT-only file overlaps but holds other symbols, so it is kept; the
+    # adjacent file shares no rows with the others, so it is not merged either
+    assert cache.list_cached_ranges("sp500") == [
+        (date(2020, 1, 1), date(2020, 1, 8)),
+        msft_range,
+        ranges["adjacent"],
+    ]
+    for name, dates in ranges.items():
+        # Merged files use the universe fetch layout (symbol, then date)
+        result = cache.load_prices("sp500", *dates)
+        pd.testing.assert_frame_equal(result.sort_index(), expected[name].sort_index(), obj=name)
+
+    # Step 3: Overlapping files fetched before and after a back-adjustment
+    adjusted = sample_price_df.loc["2020-01-04":].copy()
+    adjusted[["open", "high", "low", "close"]] *= 0.98
+    cache.save_prices(sample_price_df.loc[:"2020-01-06"], "adj", date(2020, 1, 1), date(2020, 1, 6))
+    cache.save_prices(adjusted, "adj", date(2020, 1, 4), date(2020, 1, 10))
+    skipped = maintenance.compact("adj")
+    assert skipped["files_removed"] == 0
+    assert len(cache.list_cached_ranges("adj")) == 2
+
+    # Step 4: Two universes, one recently read
+    cache.save_prices(sample_price_df, "old", date(2020, 1, 1), date(2020, 1, 10))
+    cache.save_prices(sample_price_df, "recent", date(2020, 1, 1), date(2020, 1, 10))
+    cache.load_prices("sp500", *ranges["first"])
+    cache.load_prices("recent", date(2020, 1, 1), date(2020, 1, 10))
+
+    # Step 5: Eviction
+    usage = maintenance.cache_usage()
+    recent_bytes = cache.get_cache_entry("recent", date(2020, 1, 1), date(2020, 1, 10)).byte_size
+    evicted = maintenance.evict_to_budget(recent_bytes)
+    assert evicted["bytes_before"] == usage["bytes"]
+    assert evicted["bytes_after"] <= recent_bytes
+    assert [entry.name for entry in cache.list_cache_entries()] == ["recent"]
+    assert maintenance.cache_usage() == {"files": 1, "bytes": evicted["bytes_after"]}
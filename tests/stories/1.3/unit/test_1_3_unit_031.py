@@ -0,0 +1,108 @@
+"""Test ID: 1.3-UNIT-031
+
+Test wide date x symbol panels derived from universe cache files (load_panel).
+"""
+
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from momo.data import cache, derived
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_3_unit_031_wide_panels(sample_price_df: pd.DataFrame, cache_workdir: Path) -> None:
+    """Test ID: 1.3-UNIT-031
+
+    Verify panels are calendar-aligned, persisted, and follow their cache file.
+
+    Steps:
+    1. Cache 10 calendar days with distinct closes, an AAPL dividend and a
+       missing MSFT row
+    2. Load the close panel and verify NYSE alignment, NaN gaps and a
+       contiguous float64 array; reload without reading the long file
+    3. Verify the total return index compounds TOTALRETURN closes as they are
+       and adds the dividend back only for CAPITAL-adjusted closes
+    4. Verify a sub-range is a row slice of the covering file's panel
+    5. Rewrite and invalidate the cache file and verify panels follow
+
+    Expected: Panels equal the unstacked long frame on trading days, always
+    matching the current cache file
+    """
+    start, end = date(2020, 1, 1), date(2020, 1, 10)
+    df = sample_price_df.copy()
+    df["close"] = np.arange(100.0, 130.0)
+    df.loc[(pd.Timestamp("2020-01-07"), "AAPL"), "dividend"] = 1.5
+    df = df.drop(index=(pd.Timestamp("2020-01-08"), "MSFT"))
+    cache.save_prices(df, "sp500", start, end)
+
+    # Step 2: Close panel on the NYSE calendar (no New Year's Day, no weekend)
+    panel = derived.load_panel("sp500", start, end)
+    assert panel is not None
+    expected = df["close"].unstack("symbol")[["AAPL", "MSFT", "GOOGL"]]
+    expected = expected.drop(pd.to_datetime(["2020-01-01", "2020-01-04", "2020-01-05"]))
+    assert panel.symbols == ["AAPL", "MSFT", "GOOGL"]
+    assert panel.values.dtype == np.float64
+    assert panel.values.flags.c_contiguous
+    pd.testing.assert_frame_equal(panel.to_frame(), expected, check_names=False)
+    assert np.isnan(panel.to_frame().loc["2020-01-08", "MSFT"])
+    assert derived.get_panel_path("sp500", start, end, "close") in cache.list_derived_files(
+        "sp500", start, end
+    )
+
+    with patch("momo.data.cache.load_prices", side_effect=AssertionError("long read")):
+        reloaded = derived.load_panel("sp500", start, end)
+    assert reloaded is not None
+    np.testing.assert_array_equal(reloaded.values, panel.values)
+
+    weekdays = derived.load_panel("sp500", start, end, calendar="weekdays")
+    assert weekdays is not None and weekdays.dates[0] == pd.Timestamp("2020-01-01")
+
+    # Step 3: Total return index
+    total_return = derived.load_panel("sp500", start, end, field="total_return")
+    assert total_return is not None
+    aapl_close = df.xs("AAPL", level="symbol")["close"]
+    tr = total_return.to_frame()["AAPL"]
+    assert tr.loc["2020-01-02"] == pytest.approx(aapl_close.loc["2020-01-02"] / 100.0)
+    # TOTALRETURN closes already include the dividend
+    assert (
+        cache.read_cache_metadata(cache.get_cache_path("sp500", start, end))["momo:adjustment"]
+        == "TOTALRETURN"
+    )
+    assert tr.loc["2020-01-07"] / tr.loc["2020-01-06"] == pytest.approx(
+        aapl_close.loc["2020-01-07"] / aapl_close.loc["2020-01-06"]
+    )
+    cache.save_prices(df, "capital", start, end, adjustment="CAPITAL")
+    capital = derived.load_panel("capital", start, end, field="total_return")
+    assert capital is not None
+    capital_tr = capital.to_frame()["AAPL"]
+    assert capital_tr.loc["2020-01-07"] / capital_tr.loc["2020-01-06"] == pytest.approx(
+        (aapl_close.loc["2020-01-07"] + 1.5) / aapl_close.loc["2020-01-06"]
+    )
+    with pytest.raises(ValueError, match="Unknown panel field"):
+        derived.load_panel("sp500", start, end, field="volume")
+
+    # Step 4: Sub-range served from the covering file's panel
+    week = derived.load_panel("sp500", date(2020, 1, 6), date(2020, 1, 8))
+    assert week is not None
+    assert week.values.flags.c_contiguous
+    pd.testing.assert_frame_equal(week.to_frame(), panel.to_frame().loc["2020-01-06":"2020-01-08"])
+    assert derived.load_panel("other", start, end) is None
+
+    # Step 5: Writes keep panels consistent with the long store
+    df["close"] += 1000.0
+    cache.save_prices(df, "sp500", start, end)
+    assert cache.list_derived_files("sp500", start, end) == []
+    rewritten = derived.load_panel("sp500", start, end)
+    assert rewritten is not None
+    np.testing.assert_array_equal(rewritten.values, panel.values + 1000.0)
+
+    cache.invalidate("sp500", start, end)
+    assert cache.list_derived_files("sp500", start, end) == []
+    assert not derived.get_panel_path("sp500", start, end, "close").parent.exists()
+    assert derived.load_panel("sp500", start, end) is None
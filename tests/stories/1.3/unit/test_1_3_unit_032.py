@@ -0,0 +1,124 @@
+"""Test ID: 1.3-UNIT-032
+
+Test the month-end resampled dataset derived from universe cache files (load_monthly).
+"""
+
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from momo.data import cache, derived
+
+
+def _daily_prices() -> pd.DataFrame:
+    """Business days Jan 15 - Mar 31 2020 for two symbols; MSFT starts in February."""
+    dates = pd.bdate_range("2020-01-15", "2020-03-31", name="date")
+    frames = []
+    for symbol, first in [("AAPL", "2020-01-15"), ("MSFT", "2020-02-03")]:
+        symbol_dates = dates[dates >= first]
+        close = 100.0 + np.arange(len(symbol_dates), dtype="float64")
+        frames.append(
+            pd.DataFrame(
+                {
+                    "open": close,
+                    "high": close,
+                    "low": close,
+                    "close": close,
+                    "volume": 1000,
+                    "unadjusted_close": close,
+                    "dividend": 0.0,
+                },
+                index=pd.MultiIndex.from_product(
+                    [symbol_dates, [symbol]], names=["date", "symbol"]
+                ),
+            )
+        )
+    df = pd.concat(frames)
+    df.loc[(pd.Timestamp("2020-02-14"), "AAPL"), "dividend"] = 2.0
+    return df
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_3_unit_032_monthly_dataset(cache_workdir: Path) -> None:
+    """Test ID: 1.3-UNIT-032
+
+    Verify month-end closes, total returns and day counts, and that the
+    dataset follows its cache file.
+
+    Steps:
+    1. Cache 2.5 months of daily prices with an AAPL dividend in February and
+       MSFT starting in February
+    2. Verify the month-end rows against a per-symbol resample: TOTALRETURN
+       returns are month-end close ratios, CAPITAL returns add the dividend back
+    3. Reload without reading the daily file; verify a sub-range returns whole
+       months computed over the full file
+    4. Rewrite and invalidate the daily file and verify the dataset follows
+
+    Expected: Monthly data equals resampling from scratch and never outlives
+    the daily cache it came from
+    """
+    start, end = date(2020, 1, 1), date(2020, 3, 31)
+    df = _daily_prices()
+    cache.save_prices(df, "sp500", start, end)
+
+    # Step 2: Month-end rows
+    monthly_df = derived.load_monthly("sp500", start, end)
+    assert monthly_df is not None
+    assert list(monthly_df.columns) == derived.MONTHLY_COLUMNS
+    assert monthly_df.index.get_level_values("date").unique().tolist() == list(
+        pd.to_datetime(["2020-01-31", "2020-02-29", "2020-03-31"])
+    )
+    assert monthly_df.index.get_level_values("symbol").tolist() == [
+        "AAPL",
+        "AAPL",
+        "MSFT",
+        "AAPL",
+        "MSFT",
+    ]
+    assert str(monthly_df["trading_days"].dtype) == "int64"
+
+    for symbol in ["AAPL", "MSFT"]:
+        daily = df.xs(symbol, level="symbol")
+        month_ends = daily["close"].resample("ME").last()
+        result = monthly_df.xs(symbol, level="symbol")
+        np.testing.assert_array_equal(result["close"], month_ends)
+        np.testing.assert_array_equal(result["trading_days"], daily["close"].resample("ME").size())
+        # TOTALRETURN closes already include the February AAPL dividend
+        expected_returns = month_ends / month_ends.shift(1) - 1.0
+        assert np.isnan(result["total_return"].iloc[0])
+        np.testing.assert_allclose(result["total_return"].iloc[1:], expected_returns.iloc[1:])
+
+    cache.save_prices(df, "capital", start, end, adjustment="CAPITAL")
+    capital = derived.load_monthly("capital", start, end).xs("AAPL", level="symbol")
+    aapl_daily = df.xs("AAPL", level="symbol")["close"]
+    reinvested = (aapl_daily.loc["2020-02-14"] + 2.0) / aapl_daily.loc["2020-02-14"]
+    assert capital["total_return"].iloc[1] == pytest.approx(
+        capital["close"].iloc[1] / capital["close"].iloc[0] * reinvested - 1.0
+    )
+
+    # Step 3: Persisted; sub-ranges return whole months
+    assert cache.get_monthly_path("sp500", start, end) in cache.list_derived_files(
+        "sp500", start, end
+    )
+    with patch("momo.data.cache.load_prices", side_effect=AssertionError("daily read")):
+        reloaded = derived.load_monthly("sp500", start, end)
+        february = derived.load_monthly("sp500", date(2020, 2, 10), date(2020, 2, 20))
+    pd.testing.assert_frame_equal(reloaded, monthly_df)
+    pd.testing.assert_frame_equal(february, monthly_df.loc[["2020-02-29"]])
+    assert derived.load_monthly("other", start, end) is None
+
+    # Step 4: Daily writes invalidate the dataset
+    df["close"] *= 2.0
+    cache.save_prices(df, "sp500", start, end)
+    assert not cache.get_monthly_path("sp500", start, end).exists()
+    rewritten = derived.load_monthly("sp500", start, end)
+    np.testing.assert_allclose(rewritten["close"], monthly_df["close"] * 2.0)
+
+    cache.invalidate("sp500", start, end)
+    assert cache.list_derived_files("sp500", start, end) == []
+    assert derived.load_monthly("sp500", start, end) is None
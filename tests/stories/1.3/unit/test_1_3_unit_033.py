@@ -0,0 +1,92 @@
+"""Test ID: 1.3-UNIT-033
+
+Test the compact in-memory price representation (compact_prices, compact=True).
+"""
+
+from datetime import date
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from momo.data import cache
+from momo.data.cache import _validate_price_schema
+from momo.data.loader import load_universe
+from momo.utils.exceptions import CacheError
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_3_unit_033_compact_frames(
+    sample_price_df: pd.DataFrame, cache_workdir: Path, fake_price_source: Any
+) -> None:
+    """Test ID: 1.3-UNIT-033
+
+    Verify compact frames narrow dtypes only where precision is kept.
+
+    Steps:
+    1. Compact a frame and verify dtypes, categorical symbols, values and size
+    2. Verify columns that do not fit keep their full dtype
+    3. Verify schema validation accepts compact dtypes only in compact mode
+    4. Load compactly from the cache (exact, superset, projected) and through
+       load_universe() fetches; verify the cache file keeps the full schema
+
+    Expected: About half the memory with values within COMPACT_RTOL
+    """
+    df = sample_price_df.copy()
+    df["close"] = np.linspace(10.0, 500.0, len(df))
+
+    # Step 1: Dtypes, symbols, values
+    compact_df = cache.compact_prices(df)
+    assert {column: str(dtype) for column, dtype in compact_df.dtypes.items()} == (
+        cache.COMPACT_DTYPES
+    )
+    symbols = compact_df.index.get_level_values("symbol")
+    assert isinstance(symbols.dtype, pd.CategoricalDtype)
+    assert symbols.astype(str).tolist() == df.index.get_level_values("symbol").tolist()
+    np.testing.assert_allclose(compact_df["close"], df["close"], rtol=cache.COMPACT_RTOL)
+    assert compact_df.xs("MSFT", level="symbol").shape == (10, 7)
+    assert df["close"].dtype == np.float64  # Input untouched
+    full_bytes = df.memory_usage(index=False).sum()
+    assert compact_df.memory_usage(index=False).sum() <= 0.55 * full_bytes
+
+    # Step 2: Columns that do not fit
+    wide = df.copy()
+    wide["volume"] = np.int64(2**40)
+    wide["dividend"] = 1e-40  # float32 subnormal: precision lost
+    kept = cache.compact_prices(wide)
+    assert kept["volume"].dtype == np.int64
+    assert kept["dividend"].dtype == np.float64
+    assert kept["close"].dtype == np.float32
+
+    # Step 3: Schema validation
+    _validate_price_schema(compact_df, compact=True)
+    with pytest.raises(CacheError, match="expected float64, got float32"):
+        _validate_price_schema(compact_df)
+    with pytest.raises(CacheError, match="dtype"):
+        cache.save_prices(compact_df, "sp500", date(2020, 1, 1), date(2020, 1, 10))
+
+    # Step 4: Cache loads
+    start, end = date(2020, 1, 1), date(2020, 1, 10)
+    path = cache.save_prices(df, "sp500", start, end)
+    loaded = cache.load_prices("sp500", start, end, compact=True)
+    pd.testing.assert_frame_equal(loaded, compact_df)
+    assert cache.load_prices("sp500", start, end)["close"].dtype == np.float64
+    superset = cache.load_prices("sp500", date(2020, 1, 3), end, columns=["close"], compact=True)
+    assert list(superset.dtypes.astype(str)) == ["float32"]
+    assert len(superset) == 24
+    assert cache.load_prices("sp500", start, end, mmap=True, compact=True)["open"].dtype == (
+        np.float32
+    )
+    assert pd.read_parquet(path)["close"].dtype == np.float64
+
+    with patch("momo.data.loader.bridge.fetch_price_data", side_effect=fake_price_source):
+        fetched = load_universe(["AAPL", "MSFT"], start, end, "fetched", compact=True)
+        hit = load_universe(["AAPL", "MSFT"], start, end, "fetched", compact=True)
+    assert fetched["close"].dtype == np.float32
+    assert fetched["volume"].dtype == np.int32
+    pd.testing.assert_frame_equal(hit, fetched)
+    assert cache.load_prices("fetched", start, end)["volume"].dtype == np.int64
@@ -0,0 +1,84 @@
+"""Test ID: 1.4-UNIT-022
+
+Verify validate_prices() runs all checks vectorized over unsorted panels
+without copying the input.
+
+Steps:
+1. Build a panel with one issue per ticker and shuffle its rows
+2. Run validate_prices() with DataFrame.copy() disabled
+3. Verify every check reports exactly the planted issues
+4. Verify the input frame is unchanged
+5. Validate a 300-ticker, 10-year panel within a few seconds
+
+Expected: Same results regardless of row order, no copies, linear-time checks
+"""
+
+from datetime import date
+from time import perf_counter
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from momo.data.validation import validate_prices
+
+
+def _panel(symbols: list[str], dates: pd.DatetimeIndex) -> pd.DataFrame:
+    index = pd.MultiIndex.from_product([dates, symbols], names=["date", "symbol"])
+    close = np.full(len(index), 100.0)
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "volume": np.full(len(index), 1000, dtype="int64"),
+            "unadjusted_close": close,
+            "dividend": 0.0,
+        },
+        index=index,
+    )
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_4_unit_022() -> None:
+    """Test vectorized validation results, immutability and scale."""
+    # Step 1: One planted issue per ticker, rows shuffled
+    dates = pd.bdate_range("2020-01-01", "2020-06-30")
+    prices_df = _panel(["NAN", "GAP", "NEG", "JUMP", "DIV", "GONE", "OK"], dates)
+    symbol = prices_df.index.get_level_values("symbol")
+    day = prices_df.index.get_level_values("date")
+
+    prices_df.loc[(symbol == "NAN") & (day == "2020-02-03"), ["open", "close"]] = np.nan
+    prices_df = prices_df[~((symbol == "GAP") & (day > "2020-03-02") & (day < "2020-03-17"))]
+    symbol = prices_df.index.get_level_values("symbol")
+    day = prices_df.index.get_level_values("date")
+    prices_df.loc[(symbol == "NEG") & (day == "2020-04-01"), "close"] = -5.0
+    prices_df.loc[(symbol.isin(["JUMP", "DIV"])) & (day >= "2020-05-01"), "close"] = 160.0
+    prices_df.loc[(symbol == "DIV") & (day == "2020-05-01"), "dividend"] = 1.0
+    prices_df = prices_df[~((symbol == "GONE") & (day > "2020-04-30"))]
+    prices_df = prices_df.sample(frac=1.0, random_state=7)
+    original = prices_df.copy()
+
+    # Step 2: No frame copies allowed
+    with patch.object(pd.DataFrame, "copy", side_effect=AssertionError("copied")):
+        report = validate_prices(prices_df)
+
+    # Step 3: Exactly the planted issues
+    assert report.missing_data_counts == {"NAN": 2}
+    assert report.date_gaps == {"GAP": [(date(2020, 3, 2), date(2020, 3, 17))]}
+    assert sorted(report.adjustment_issues) == ["JUMP", "NEG"]
+    assert report.delisting_events == {"GONE": date(2020, 4, 30)}
+    assert report.total_tickers == 7
+
+    # Step 4: Input untouched
+    pd.testing.assert_frame_equal(prices_df, original)
+
+    # Step 5: Scale
+    large_df = _panel([f"S{i:03d}" for i in range(300)], pd.bdate_range("2010-01-01", periods=2520))
+    start = perf_counter()
+    large_report = validate_prices(large_df)
+    assert perf_counter() - start < 5.0
+    assert large_report.is_valid
@@ -0,0 +1,84 @@
+"""Test ID: 1.4-UNIT-023
+
+Verify trading calendars and calendar-aware date gap detection.
+
+Steps:
+1. Verify the built-in NYSE table against known holidays and closures
+2. Verify vectorized trading-day counts and custom calendar registration
+3. Build a panel that skips NYSE holidays around a long weekend
+4. Verify a low threshold flags nothing with the NYSE calendar but flags the
+   holiday with the weekday-only calendar
+5. Verify a real missing trading day is still flagged at threshold 2
+
+Expected: Holidays never count as gaps, so thresholds below 10 days are usable
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from momo.data.trading_calendar import (
+    TradingCalendar,
+    get_calendar,
+    nyse_holidays,
+    register_calendar,
+)
+from momo.data.validation import _check_date_gaps
+
+
+def _closes(days: pd.DatetimeIndex, symbol: str) -> pd.DataFrame:
+    index = pd.MultiIndex.from_arrays([days, [symbol] * len(days)], names=["date", "symbol"])
+    return pd.DataFrame({"close": np.full(len(days), 100.0)}, index=index)
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_4_unit_023() -> None:
+    """Test NYSE calendar table, custom calendars and holiday-aware gaps."""
+    # Step 1: Known NYSE holidays (2022 New Year's Day fell on a Saturday)
+    assert nyse_holidays(2022, 2022) == [
+        date(2022, 1, 17),
+        date(2022, 2, 21),
+        date(2022, 4, 15),
+        date(2022, 5, 30),
+        date(2022, 6, 20),
+        date(2022, 7, 4),
+        date(2022, 9, 5),
+        date(2022, 11, 24),
+        date(2022, 12, 26),
+    ]
+    nyse = get_calendar("NYSE")
+    assert len(nyse.trading_days(date(2023, 1, 1), date(2023, 12, 31))) == 250
+    assert not nyse.is_trading_day(date(2001, 9, 12))
+    # Presidential Election Days closed the exchange through 1980
+    for election_day in (date(1972, 11, 7), date(1976, 11, 2), date(1980, 11, 4)):
+        assert not nyse.is_trading_day(election_day)
+    assert nyse.is_trading_day(date(1984, 11, 6))
+
+    # Step 2: Vectorized counts and custom calendars
+    starts = np.array(["2020-07-02", "2020-11-25"], dtype="datetime64[D]")
+    ends = np.array(["2020-07-07", "2020-11-30"], dtype="datetime64[D]")
+    assert nyse.count_trading_days(starts, ends).tolist() == [2, 2]
+    register_calendar(TradingCalendar("test-exchange", holidays=[date(2020, 7, 6)]))
+    assert get_calendar("test-exchange").count_trading_days(starts, ends).tolist() == [2, 3]
+    with pytest.raises(ValueError, match="Unknown trading calendar"):
+        get_calendar("MOON")
+
+    # Step 3: Data over Thanksgiving and Christmas 2020, holidays skipped
+    days = nyse.trading_days(date(2020, 11, 20), date(2020, 12, 31))
+    prices_df = pd.concat([_closes(days, "FULL"), _closes(days.drop("2020-12-10"), "HOLE")])
+
+    # Step 4: Holidays are not gaps on the NYSE calendar
+    assert _check_date_gaps(prices_df, threshold_days=2, calendar="NYSE") == {
+        "HOLE": [(date(2020, 12, 9), date(2020, 12, 11))]
+    }
+    weekday_gaps = _check_date_gaps(prices_df, threshold_days=2, calendar="weekdays")
+    assert weekday_gaps["FULL"] == [
+        (date(2020, 11, 25), date(2020, 11, 27)),
+        (date(2020, 12, 24), date(2020, 12, 28)),
+    ]
+
+    # Step 5: Same data, default threshold: nothing suspicious
+    assert _check_date_gaps(prices_df) == {}
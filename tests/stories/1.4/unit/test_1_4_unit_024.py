@@ -0,0 +1,89 @@
+"""Test ID: 1.4-UNIT-024
+
+Test bulk point-in-time membership (universe.build_membership) with a mocked bridge.
+
+Story: 1.4 - Build Data Quality Validation Pipeline
+Priority: P1
+Test Level: Unit
+Risk Coverage: PERF-005 (Per-symbol, per-date constituent checks)
+"""
+
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from momo.data import cache
+from momo.data.universe import build_membership
+from momo.utils.exceptions import NorgateBridgeError
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_1_4_unit_024(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test ID: 1.4-UNIT-024
+
+    Verify bulk membership fetch, vectorized lookups and caching.
+
+    Steps:
+    1. Mock the batched bridge call with spells for AAPL (rejoins), MSFT, EXIT
+    2. Build membership once and look up many dates in a single call
+    3. Verify weekend dates take the prior trading day's membership
+    4. Verify a second build is served from data/cache/constituents/ without bridge
+    5. Verify lookups outside the covered range and non-"not found" errors raise
+
+    Expected: One bridge round trip answers membership for any list of dates
+    """
+    monkeypatch.chdir(tmp_path)
+    index_name = "Russell 1000 Current & Past"
+    symbols = ["AAPL", "MSFT", "EXIT", "NEVER", "XYZ"]
+
+    # Step 1: Spells as returned by fetch_index_membership_batch()
+    spells = pd.DataFrame(
+        {
+            "symbol": ["MSFT", "AAPL", "AAPL", "EXIT"],
+            "start": pd.to_datetime(["2010-01-04", "2010-01-04", "2010-03-01", "2010-01-04"]),
+            "end": pd.to_datetime([None, "2010-02-01", None, "2010-02-08"]),
+        }
+    )
+    errors = {"XYZ": "ValueError: Symbol XYZ not found"}
+
+    with patch("momo.data.universe.bridge.fetch_index_membership_batch") as mock_batch:
+        mock_batch.return_value = (spells.copy(), errors)
+
+        # Step 2: Build once, look up month ends in one call
+        membership = build_membership(
+            index_name, date(2010, 1, 1), date(2010, 12, 31), symbols=symbols
+        )
+        assert mock_batch.call_count == 1
+        assert mock_batch.call_args.args == (symbols, index_name)
+
+        month_ends = pd.date_range("2010-01-31", "2010-12-31", freq="ME")
+        matrix = membership.matrix(month_ends)
+        assert matrix.shape == (12, 3)
+        assert matrix.loc["2010-02-28"].to_dict() == {"AAPL": False, "EXIT": False, "MSFT": True}
+        assert matrix.loc["2010-12-31"].to_dict() == {"AAPL": True, "EXIT": False, "MSFT": True}
+
+        # Step 3: Saturday after EXIT's last member day (Friday 2010-02-05)
+        assert membership.members_at(date(2010, 2, 6)) == ["EXIT", "MSFT"]
+        assert membership.members_at(date(2010, 2, 8)) == ["MSFT"]
+
+        # Step 4: Cached table covers a narrower request with fewer symbols
+        assert cache.get_membership_path(index_name).exists()
+        cached = build_membership(index_name, date(2010, 6, 1), date(2010, 9, 30), ["AAPL", "EXIT"])
+        assert mock_batch.call_count == 1
+        assert cached.symbols == ["AAPL", "EXIT"]
+        pd.testing.assert_frame_equal(
+            cached.matrix(month_ends[5:9]), matrix.iloc[5:9][["AAPL", "EXIT"]]
+        )
+
+        # Step 5: Outside the covered range
+        with pytest.raises(ValueError, match="outside the membership range"):
+            membership.matrix([date(2011, 1, 3)])
+
+        # Transport-style per-symbol errors are not skipped
+        mock_batch.return_value = (spells.copy(), {"MSFT": "RuntimeError: pipe closed"})
+        with pytest.raises(NorgateBridgeError, match="MSFT"):
+            build_membership(index_name, date(2010, 1, 1), date(2010, 12, 31), symbols, True)
@@ -0,0 +1,105 @@
+"""Test ID: 1.5-UNIT-001
+
+Test the persistent membership interval store and its binary-search lookups.
+
+Story: 1.5 - Implement Point-in-Time Universe Construction
+Priority: P0
+Test Level: Unit
+Risk Coverage: PERF-005 (20 years of monthly universes in under 30 seconds)
+"""
+
+import time
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq  # type: ignore[import-untyped]
+import pytest
+
+from momo.data import cache
+from momo.data.universe import IndexMembership, build_membership
+
+
+def _random_spells(symbol_count: int, seed: int) -> pd.DataFrame:
+    """One to three non-overlapping membership spells per symbol over 2000-2019."""
+    rng = np.random.default_rng(seed)
+    first = np.datetime64("2000-01-03", "D")
+    span = int((np.datetime64("2020-01-01", "D") - first).astype(np.int64))
+    rows = []
+    for i in range(symbol_count):
+        bounds = np.sort(rng.choice(span, size=2 * rng.integers(1, 4), replace=False))
+        for start, end in bounds.reshape(-1, 2):
+            rows.append((f"S{i:04d}", first + start, first + end))
+    spells = pd.DataFrame(rows, columns=["symbol", "start", "end"])
+    spells["start"] = spells["start"].astype("datetime64[ns]")
+    spells["end"] = spells["end"].astype("datetime64[ns]")
+    return spells
+
+
+@pytest.mark.p0
+@pytest.mark.unit
+def test_1_5_unit_001(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test ID: 1.5-UNIT-001
+
+    Verify members_at/members_between against brute force and the 30 s budget.
+
+    Steps:
+    1. Build membership for 3000 symbols with random, gapped spells (mocked bridge)
+    2. Verify the persisted rows are (symbol, index_name, start, end) sorted by start
+    3. Verify members_at() equals a brute-force scan for 240 month ends
+    4. Verify members_between() equals a brute-force overlap scan for random ranges
+    5. Verify 20 years of monthly universes from the cached store take well under 30 s
+
+    Expected: Interval lookups match brute force and meet the Story 1.5 budget
+    """
+    monkeypatch.chdir(tmp_path)
+    index_name = "Russell 1000 Current & Past"
+    start, end = date(2000, 1, 1), date(2019, 12, 31)
+    spells = _random_spells(3000, seed=7)
+    symbols = sorted(spells["symbol"].unique())
+
+    # Step 1: Build through the batched bridge call
+    with patch("momo.data.universe.bridge.fetch_index_membership_batch") as mock_batch:
+        mock_batch.return_value = (spells.sample(frac=1.0, random_state=1), {})
+        membership = build_membership(index_name, start, end, symbols=symbols)
+
+    # Step 2: Persisted interval rows
+    stored = pq.read_table(cache.get_membership_path(index_name)).to_pandas()
+    assert list(stored.columns) == ["symbol", "index_name", "start", "end"]
+    assert (stored["index_name"] == index_name).all()
+    assert stored["start"].is_monotonic_increasing
+    assert len(stored) == len(spells)
+
+    # Step 3: Point lookups
+    month_ends = pd.date_range("2000-01-31", "2019-12-31", freq="ME")
+    for day in month_ends:
+        active = (spells["start"] <= day) & (spells["end"] > day)
+        assert membership.members_at(day.date()) == sorted(spells.loc[active, "symbol"])
+
+    # Step 4: Range lookups (inclusive on both ends)
+    rng = np.random.default_rng(3)
+    for first_offset, length in zip(
+        rng.integers(0, 7000, size=50), rng.integers(0, 400, size=50), strict=True
+    ):
+        first = pd.Timestamp(start) + pd.Timedelta(days=int(first_offset))
+        last = min(first + pd.Timedelta(days=int(length)), pd.Timestamp(end))
+        overlapping = (spells["start"] <= last) & (spells["end"] > first)
+        expected = sorted(spells.loc[overlapping, "symbol"].unique())
+        assert membership.members_between(first.date(), last.date()) == expected
+
+    with pytest.raises(ValueError, match="after"):
+        membership.members_between(end, start)
+    with pytest.raises(ValueError, match="outside"):
+        membership.members_at(date(2020, 6, 30))
+
+    # Step 5: Monthly universes from the persisted store, bridge not needed
+    began = time.perf_counter()
+    cached = build_membership(index_name, start, end, symbols=symbols)
+    universes = {day: cached.members_at(day.date()) for day in month_ends}
+    elapsed = time.perf_counter() - began
+
+    assert isinstance(cached, IndexMembership)
+    assert len(universes) == 240
+    assert elapsed < 5.0, f"20 years of monthly universes took {elapsed:.2f}s"